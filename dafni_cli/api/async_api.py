@@ -0,0 +1,235 @@
+###############################################################################
+# Asyncio API
+###############################################################################
+#
+# Awaitable versions of the functions in models_api, workflows_api,
+# datasets_api and minio_api for use from within an asyncio event loop.
+#
+# Requests are still sent through a DAFNISession (so share its token refresh,
+# connection pool and error handling), but are run in a bounded pool of
+# threads so that they don't block the event loop and many may be in flight
+# at once e.g.
+#
+#   async with AsyncDAFNISession(max_concurrency=20) as session:
+#       models = await asyncio.gather(
+#           *[get_model(session, version_id) for version_id in version_ids]
+#       )
+#
+###############################################################################
+
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import AsyncIterator, Awaitable, Callable, Iterable, Optional, TypeVar
+
+from dafni_cli.api import datasets_api, minio_api, models_api, workflows_api
+from dafni_cli.api.datasets_api import DATASETS_PAGE_SIZE
+from dafni_cli.api.session import DAFNISession
+from dafni_cli.consts import ASYNC_MAX_CONCURRENCY, REQUESTS_POOL_MAXSIZE
+
+T = TypeVar("T")
+
+
+class AsyncDAFNISession:
+    """Asyncio counterpart to DAFNISession
+
+    Runs functions taking a DAFNISession in a pool of at most
+    'max_concurrency' threads, returning awaitables for their results. Any
+    exceptions raised e.g. DAFNIError or EndpointNotFoundError are raised
+    when awaited.
+    """
+
+    def __init__(
+        self,
+        session: Optional[DAFNISession] = None,
+        max_concurrency: int = ASYNC_MAX_CONCURRENCY,
+    ):
+        """AsyncDAFNISession constructor
+
+        Args:
+            session (Optional[DAFNISession]): Session to send requests
+                            through. When None a new one will be created in
+                            the same way as DAFNISession() (and closed along
+                            with this one).
+            max_concurrency (int): Maximum number of requests to have in
+                            flight at once
+        """
+        self._owns_session = session is None
+        if session is None:
+            session = DAFNISession(
+                pool_maxsize=max(max_concurrency, REQUESTS_POOL_MAXSIZE)
+            )
+        self._session = session
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrency)
+
+    @property
+    def session(self) -> DAFNISession:
+        """Underlying DAFNISession requests are sent through"""
+        return self._session
+
+    @property
+    def username(self) -> str:
+        """Username associated with the current session"""
+        return self._session.username
+
+    async def _run_in_executor(self, func: Callable[..., T], *args, **kwargs) -> T:
+        """Runs a blocking function in the thread pool and returns its
+        result"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, functools.partial(func, *args, **kwargs)
+        )
+
+    async def run(self, func: Callable[..., T], *args, **kwargs) -> T:
+        """Runs a function taking a DAFNISession as its first parameter e.g.
+        one from models_api in the thread pool
+
+        Args:
+            func (Callable): Function to run
+            *args: Any further arguments to give the function
+            **kwargs: Any keyword arguments to give the function
+
+        Returns:
+            The value returned by the function
+        """
+        return await self._run_in_executor(func, self._session, *args, **kwargs)
+
+    async def iterate(
+        self, func: Callable[..., Iterable[T]], *args, **kwargs
+    ) -> AsyncIterator[T]:
+        """Iterates over the values returned by a function taking a
+        DAFNISession as its first parameter e.g. a generator such as
+        datasets_api.iter_dataset_pages, obtaining each value in the thread
+        pool as it's needed
+
+        Args:
+            func (Callable): Function to run
+            *args: Any further arguments to give the function
+            **kwargs: Any keyword arguments to give the function
+
+        Returns:
+            AsyncIterator: Each value returned by the function
+        """
+        iterator = iter(await self.run(func, *args, **kwargs))
+        end = object()
+        while True:
+            value = await self._run_in_executor(next, iterator, end)
+            if value is end:
+                return
+            yield value
+
+    async def get_request(self, *args, **kwargs):
+        """Awaitable version of DAFNISession.get_request"""
+        return await self._run_in_executor(self._session.get_request, *args, **kwargs)
+
+    async def post_request(self, *args, **kwargs):
+        """Awaitable version of DAFNISession.post_request"""
+        return await self._run_in_executor(self._session.post_request, *args, **kwargs)
+
+    async def put_request(self, *args, **kwargs):
+        """Awaitable version of DAFNISession.put_request"""
+        return await self._run_in_executor(self._session.put_request, *args, **kwargs)
+
+    async def patch_request(self, *args, **kwargs):
+        """Awaitable version of DAFNISession.patch_request"""
+        return await self._run_in_executor(self._session.patch_request, *args, **kwargs)
+
+    async def delete_request(self, *args, **kwargs):
+        """Awaitable version of DAFNISession.delete_request"""
+        return await self._run_in_executor(
+            self._session.delete_request, *args, **kwargs
+        )
+
+    def close(self):
+        """Stops the thread pool (cancelling anything not yet started and
+        waiting for anything still running) and then closes the underlying
+        session if it was created by this one"""
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        if self._owns_session:
+            self._session.close()
+
+    async def aclose(self):
+        """Awaitable version of close that doesn't block the event loop
+        while waiting for anything still running"""
+        await asyncio.to_thread(self.close)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.aclose()
+
+
+def _awaitable(module, name: str) -> Callable[..., Awaitable]:
+    """Returns an awaitable version of an API function taking a DAFNISession
+    as its first parameter, that instead takes an AsyncDAFNISession
+
+    Args:
+        module: Module containing the function e.g. models_api
+        name (str): Name of the function (looked up each time it's called)
+    """
+
+    @functools.wraps(getattr(module, name))
+    async def wrapper(session: AsyncDAFNISession, *args, **kwargs):
+        return await session.run(getattr(module, name), *args, **kwargs)
+
+    return wrapper
+
+
+# models_api
+get_all_models = _awaitable(models_api, "get_all_models")
+get_model = _awaitable(models_api, "get_model")
+validate_model_definition = _awaitable(models_api, "validate_model_definition")
+get_model_upload_urls = _awaitable(models_api, "get_model_upload_urls")
+model_version_ingest = _awaitable(models_api, "model_version_ingest")
+delete_model_version = _awaitable(models_api, "delete_model_version")
+
+# workflows_api
+get_all_workflows = _awaitable(workflows_api, "get_all_workflows")
+get_workflow = _awaitable(workflows_api, "get_workflow")
+get_workflow_instance = _awaitable(workflows_api, "get_workflow_instance")
+upload_workflow = _awaitable(workflows_api, "upload_workflow")
+delete_workflow_version = _awaitable(workflows_api, "delete_workflow_version")
+validate_parameter_set_definition = _awaitable(
+    workflows_api, "validate_parameter_set_definition"
+)
+upload_parameter_set = _awaitable(workflows_api, "upload_parameter_set")
+
+# datasets_api
+validate_metadata = _awaitable(datasets_api, "validate_metadata")
+get_all_datasets = _awaitable(datasets_api, "get_all_datasets")
+get_latest_dataset_metadata = _awaitable(datasets_api, "get_latest_dataset_metadata")
+upload_dataset_metadata = _awaitable(datasets_api, "upload_dataset_metadata")
+upload_dataset_metadata_version = _awaitable(
+    datasets_api, "upload_dataset_metadata_version"
+)
+delete_dataset = _awaitable(datasets_api, "delete_dataset")
+delete_dataset_version = _awaitable(datasets_api, "delete_dataset_version")
+
+
+async def iter_dataset_pages(
+    session: AsyncDAFNISession, filters: dict, page_size: int = DATASETS_PAGE_SIZE
+) -> AsyncIterator[dict]:
+    """Awaitable version of datasets_api.iter_dataset_pages
+
+    Args:
+        session (AsyncDAFNISession): User session
+        filters (dict): dict of filters to apply to the get datasets query
+        page_size (int): Maximum number of datasets to request at once
+
+    Returns:
+        AsyncIterator[dict]: Each page returned by the catalogue, with the
+                             datasets found under the 'metadata' key
+    """
+    async for page in session.iterate(
+        datasets_api.iter_dataset_pages, filters, page_size=page_size
+    ):
+        yield page
+
+
+# minio_api
+upload_file_to_minio = _awaitable(minio_api, "upload_file_to_minio")
+create_temp_bucket = _awaitable(minio_api, "create_temp_bucket")
+delete_temp_bucket = _awaitable(minio_api, "delete_temp_bucket")
+get_data_upload_urls = _awaitable(minio_api, "get_data_upload_urls")
+minio_get_request = _awaitable(minio_api, "minio_get_request")
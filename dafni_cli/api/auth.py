@@ -4,7 +4,7 @@ from typing import ClassVar, List, Optional
 from dafni_cli.api.parser import ParserBaseObject, ParserParam
 
 
-@dataclass
+@dataclass(slots=True)
 class Auth(ParserBaseObject):
     """Dataclass representing the access the user has for a DAFNI resource
        (found in models and workflows)
@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import Iterator, List, Optional
 
 import requests
 from requests import Response
@@ -10,9 +10,15 @@ from dafni_cli.api.exceptions import (
     ValidationError,
 )
 from dafni_cli.api.session import DAFNISession
-from dafni_cli.consts import NID_API_URL, SEARCH_AND_DISCOVERY_API_URL
+from dafni_cli.consts import (
+    DATASETS_CACHE_GROUP,
+    NID_API_URL,
+    RESPONSE_CACHE_TTL,
+    SEARCH_AND_DISCOVERY_API_URL,
+)
 
-MAX_DATASETS = 15000
+# Number of datasets to request from the catalogue at once
+DATASETS_PAGE_SIZE = 500
 
 
 # Validation function for validating the dataset-metadata
@@ -34,25 +40,68 @@ def validate_metadata(session: DAFNISession, metadata: dict):
         raise ValidationError(f"Dataset metadata validation failed. {err}")
 
 
-# TODO this should work with pagination - check
-def get_all_datasets(session: DAFNISession, filters: dict) -> List[dict]:
-    """Function to retrieve all datasets available to the user
+def iter_dataset_pages(
+    session: DAFNISession, filters: dict, page_size: int = DATASETS_PAGE_SIZE
+) -> Iterator[dict]:
+    """Function to retrieve all datasets available to the user one page at a
+    time
+
+    Each page is only requested once the previous one has been consumed, and
+    pages are requested until one is returned with no datasets in it. A page
+    may contain fewer than 'page_size' datasets without being the last, e.g.
+    if the catalogue limits the size of each page, so the next one starts
+    after however many were actually returned.
 
     Args:
         session (DAFNISession): User session
         filters (dict): dict of filters to apply to the get datasets query
+        page_size (int): Maximum number of datasets to request at once
 
     Returns:
-        List[dict]: List of available datasets
+        Iterator[dict]: Each page returned by the catalogue, with the datasets
+                        found under the 'metadata' key
     """
     url = f"{SEARCH_AND_DISCOVERY_API_URL}/catalogue/"
-    data = {
-        "offset": {"start": 0, "size": MAX_DATASETS},
-        "sort_by": "recent",
-        **filters,
-    }
+    start = 0
+
+    while True:
+        data = {
+            "offset": {"start": start, "size": page_size},
+            "sort_by": "recent",
+            **filters,
+        }
+        page = session.post_request(url=url, json=data, allow_redirect=True)
+        if not page["metadata"]:
+            # Still return the first page when there are no datasets at all
+            if start == 0:
+                yield page
+            return
+        yield page
+
+        start += len(page["metadata"])
+
+
+def get_all_datasets(
+    session: DAFNISession, filters: dict, page_size: int = DATASETS_PAGE_SIZE
+) -> dict:
+    """Function to retrieve all datasets available to the user
+
+    Args:
+        session (DAFNISession): User session
+        filters (dict): dict of filters to apply to the get datasets query
+        page_size (int): Maximum number of datasets to request at once
 
-    return session.post_request(url=url, json=data, allow_redirect=True)
+    Returns:
+        dict: Catalogue response containing all available datasets under
+              the 'metadata' key
+    """
+    response = None
+    for page in iter_dataset_pages(session, filters, page_size=page_size):
+        if response is None:
+            response = page
+        else:
+            response["metadata"].extend(page["metadata"])
+    return response
 
 
 def get_latest_dataset_metadata(session: DAFNISession, version_id: str) -> dict:
@@ -71,7 +120,14 @@ def get_latest_dataset_metadata(session: DAFNISession, version_id: str) -> dict:
     url = f"{NID_API_URL}/nid/metadata/{version_id}"
 
     try:
-        return session.get_request(url=url, allow_redirect=True)
+        # The metadata of a version may be updated, so only cache it for a
+        # limited time
+        return session.get_request(
+            url=url,
+            allow_redirect=True,
+            cache_ttl=RESPONSE_CACHE_TTL,
+            cache_group=DATASETS_CACHE_GROUP,
+        )
     except EndpointNotFoundError as err:
         # When the endpoint isn't found it means a dataset with the given id's
         # wasn't found
@@ -148,6 +204,7 @@ def upload_dataset_metadata(
         url=url,
         json=data,
         error_message_func=_upload_dataset_metadata_error_message_func(session),
+        invalidate_cache_group=DATASETS_CACHE_GROUP,
     )
 
 
@@ -181,6 +238,7 @@ def upload_dataset_metadata_version(
         url=url,
         json=data,
         error_message_func=_upload_dataset_metadata_error_message_func(session),
+        invalidate_cache_group=DATASETS_CACHE_GROUP,
     )
 
 
@@ -192,7 +250,7 @@ def delete_dataset(session: DAFNISession, dataset_id: str) -> Response:
         dataset_id (str): Dataset ID for the selected dataset
     """
     url = f"{NID_API_URL}/nid/dataset/{dataset_id}"
-    return session.delete_request(url)
+    return session.delete_request(url, invalidate_cache_group=DATASETS_CACHE_GROUP)
 
 
 def delete_dataset_version(session: DAFNISession, version_id: str) -> Response:
@@ -203,4 +261,4 @@ def delete_dataset_version(session: DAFNISession, version_id: str) -> Response:
         version_id (str): Dataset version ID for the selected dataset version
     """
     url = f"{NID_API_URL}/nid/version/{version_id}/"
-    return session.delete_request(url)
+    return session.delete_request(url, invalidate_cache_group=DATASETS_CACHE_GROUP)
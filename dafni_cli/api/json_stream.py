@@ -0,0 +1,140 @@
+import codecs
+import json
+import re
+from typing import Any, Iterable, Iterator, Union
+
+# Whitespace allowed between JSON values
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+# Characters that may follow a complete value inside an array or object
+_VALUE_END = " \t\n\r,]}"
+
+
+class _JSONStreamReader:
+    """Reads JSON values one at a time from chunks of a JSON document e.g.
+    the body of a streamed response, only keeping the data that hasn't been
+    parsed yet"""
+
+    def __init__(self, chunks: Iterable[Union[bytes, str]]):
+        """
+        Args:
+            chunks (Iterable[Union[bytes, str]]): Chunks of the document
+                                        (bytes are decoded as UTF-8)
+        """
+        self._chunks = iter(chunks)
+        self._text_decoder = codecs.getincrementaldecoder("utf-8")()
+        self._json_decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._position = 0
+        self._finished = False
+
+    def _read(self) -> bool:
+        """Adds the next chunk to the buffer, dropping anything already parsed
+
+        Returns:
+            bool: Whether there was another chunk to read
+        """
+        if self._finished:
+            return False
+
+        try:
+            chunk = next(self._chunks)
+        except StopIteration:
+            # Raises an error if the document ends part way through a character
+            self._text_decoder.decode(b"", final=True)
+            self._finished = True
+            return False
+
+        if isinstance(chunk, bytes):
+            chunk = self._text_decoder.decode(chunk)
+        self._buffer = self._buffer[self._position :] + chunk
+        self._position = 0
+        return True
+
+    def _peek(self) -> str:
+        """Skips any whitespace and returns the next character without
+        consuming it (or an empty string at the end of the document)"""
+        while True:
+            self._position = _WHITESPACE.match(self._buffer, self._position).end()
+            if self._position < len(self._buffer):
+                return self._buffer[self._position]
+            if not self._read():
+                return ""
+
+    def _expect(self, characters: str) -> str:
+        """Consumes the next character, which must be one of 'characters'
+
+        Raises:
+            json.JSONDecodeError: If the next character isn't one of
+                                  'characters'
+        """
+        character = self._peek()
+        if character == "" or character not in characters:
+            raise json.JSONDecodeError(
+                f"Expecting one of {characters!r}", self._buffer, self._position
+            )
+        self._position += 1
+        return character
+
+    def _decode_value(self) -> Any:
+        """Consumes and returns the next JSON value
+
+        Raises:
+            json.JSONDecodeError: If the next value isn't valid JSON
+        """
+        self._peek()
+        while True:
+            try:
+                value, end = self._json_decoder.raw_decode(self._buffer, self._position)
+            except json.JSONDecodeError:
+                # May just be incomplete
+                if not self._read():
+                    raise
+                continue
+
+            # A number may continue in the next chunk (e.g. "1" of "1.5")
+            if (
+                end == len(self._buffer) or self._buffer[end] not in _VALUE_END
+            ) and self._read():
+                continue
+
+            self._position = end
+            return value
+
+    def iter_array(self) -> Iterator[Any]:
+        """Yields each item of a JSON array, parsing each one as it is reached
+
+        Raises:
+            json.JSONDecodeError: If the document isn't a valid JSON array
+        """
+        self._expect("[")
+        if self._peek() == "]":
+            self._position += 1
+            return
+
+        while True:
+            yield self._decode_value()
+            if self._expect(",]") == "]":
+                return
+
+
+def iter_json_array(chunks: Iterable[Union[bytes, str]]) -> Iterator[Any]:
+    """Parses a JSON array one item at a time as its chunks are read e.g.
+
+    for item in iter_json_array(response.iter_content(chunk_size=65536)):
+        ...
+
+    Unlike json.loads, the whole document never needs to be held in memory
+    at once, only the chunk being read and the item being parsed.
+
+    Args:
+        chunks (Iterable[Union[bytes, str]]): Chunks of the JSON document
+                                    (bytes are decoded as UTF-8)
+
+    Returns:
+        Iterator[Any]: Each item in the array
+
+    Raises:
+        json.JSONDecodeError: If the document isn't a valid JSON array
+    """
+    return _JSONStreamReader(chunks).iter_array()
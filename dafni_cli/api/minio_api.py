@@ -19,6 +19,7 @@ def upload_file_to_minio(
     file_path: Path,
     file_name: Optional[str] = None,
     progress_bar=False,
+    progress_bar_position: Optional[int] = None,
 ) -> requests.Response:
     """Function to upload definition or image files to DAFNI
 
@@ -30,6 +31,8 @@ def upload_file_to_minio(
                   loading bar (if None will take it from the file path instead)
         progress_bar (bool): Whether to display a progress bar for the file
                              using tqdm
+        progress_bar_position (Optional[int]): Line to display the progress
+                             bar on when uploading multiple files at once
 
     Returns:
         Response: Response returned from the put request
@@ -40,6 +43,7 @@ def upload_file_to_minio(
             description=file_name if file_name is not None else file_path.name,
             total=file_path.stat().st_size,
             disable=not progress_bar,
+            position=progress_bar_position,
         ) as prog_bar:
             file_data = CallbackIOWrapper(prog_bar.update, file, "read")
 
@@ -49,12 +53,15 @@ def upload_file_to_minio(
                 file.seek(0)
                 prog_bar.reset()
 
-            return session.put_request(
-                url=url,
-                content_type=MINIO_UPLOAD_CT,
-                data=file_data,
-                retry_callback=retry_callback,
-            )
+            # Large files can take longer to upload than the access token
+            # lasts
+            with session.keep_tokens_refreshed():
+                return session.put_request(
+                    url=url,
+                    content_type=MINIO_UPLOAD_CT,
+                    data=file_data,
+                    retry_callback=retry_callback,
+                )
 
 
 def create_temp_bucket(session: DAFNISession) -> str:
@@ -110,7 +117,10 @@ def get_data_upload_urls(
 
 
 def minio_get_request(
-    session: DAFNISession, url: str, stream: bool = False
+    session: DAFNISession,
+    url: str,
+    stream: bool = False,
+    headers: Optional[dict] = None,
 ) -> Union[Dict, List[Dict], requests.Response]:
     """Get a data file from Minio
 
@@ -120,6 +130,8 @@ def minio_get_request(
         stream (bool): Whether to stream the request. In this case will
                        return the response object itself rather than the
                        json.
+        headers (Optional[dict]): Any additional headers to include in the
+                       request e.g. a Range header
     Returns:
         Dict: When 'stream' is False for endpoints returning one object
               e.g. /models/<version_id>
@@ -132,4 +144,5 @@ def minio_get_request(
         content_type="application/json",
         allow_redirect=False,
         stream=stream,
+        headers=headers,
     )
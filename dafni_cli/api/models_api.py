@@ -1,5 +1,5 @@
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Iterator, List, Optional, Tuple
 
 from requests import Response
 
@@ -8,8 +8,15 @@ from dafni_cli.api.exceptions import (
     ResourceNotFoundError,
     ValidationError,
 )
+from dafni_cli.api.json_stream import iter_json_array
 from dafni_cli.api.session import DAFNISession
-from dafni_cli.consts import NIMS_API_URL, VALIDATE_MODEL_CT
+from dafni_cli.consts import (
+    JSON_STREAM_CHUNK_SIZE,
+    MODELS_CACHE_GROUP,
+    NIMS_API_URL,
+    RESPONSE_CACHE_TTL,
+    VALIDATE_MODEL_CT,
+)
 
 
 def get_all_models(session: DAFNISession) -> List[dict]:
@@ -23,7 +30,29 @@ def get_all_models(session: DAFNISession) -> List[dict]:
         List[dict]: list of dictionaries with raw response from API
     """
     url = f"{NIMS_API_URL}/models/"
-    return session.get_request(url)
+    return session.get_request(
+        url, cache_ttl=RESPONSE_CACHE_TTL, cache_group=MODELS_CACHE_GROUP
+    )
+
+
+def iter_all_models(session: DAFNISession) -> Iterator[dict]:
+    """Function to call the "models_list" endpoint and return each of the
+    resulting dictionaries as it is received
+
+    Unlike get_all_models, the whole list is never held in memory at once
+    (and so is never cached either).
+
+    Args:
+        session (DAFNISession): User session
+
+    Returns:
+        Iterator[dict]: Each dictionary in the raw response from API
+    """
+    url = f"{NIMS_API_URL}/models/"
+    with session.get_request(url, stream=True) as response:
+        yield from iter_json_array(
+            response.iter_content(chunk_size=JSON_STREAM_CHUNK_SIZE)
+        )
 
 
 def get_model(session: DAFNISession, version_id: str) -> dict:
@@ -44,7 +73,12 @@ def get_model(session: DAFNISession, version_id: str) -> dict:
     url = f"{NIMS_API_URL}/models/{version_id}/"
 
     try:
-        return session.get_request(url)
+        # While the model itself can't be modified once created, the
+        # response includes e.g. its version history and permissions which
+        # can, so it is only cached for a while before being revalidated
+        return session.get_request(
+            url, cache_ttl=RESPONSE_CACHE_TTL, cache_group=MODELS_CACHE_GROUP
+        )
     except EndpointNotFoundError as err:
         # When the endpoint isn't found it means the model wasn't found
         raise ResourceNotFoundError(
@@ -120,7 +154,9 @@ def model_version_ingest(
     else:
         url = f"{NIMS_API_URL}/models/upload/{upload_id}/ingest/"
     data = {"version_message": version_message}
-    return session.post_request(url=url, json=data)
+    return session.post_request(
+        url=url, json=data, invalidate_cache_group=MODELS_CACHE_GROUP
+    )
 
 
 def delete_model_version(session: DAFNISession, version_id: str) -> Response:
@@ -131,4 +167,4 @@ def delete_model_version(session: DAFNISession, version_id: str) -> Response:
         version_id (str): Model version ID for selected model
     """
     url = f"{NIMS_API_URL}/models/{version_id}/"
-    return session.delete_request(url)
+    return session.delete_request(url, invalidate_cache_group=MODELS_CACHE_GROUP)
@@ -1,8 +1,12 @@
-from dataclasses import dataclass
-from typing import Callable, ClassVar, List, Optional, Union
+from dataclasses import MISSING, Field, dataclass, fields
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, Callable, ClassVar, List, Optional, Union
 
 from dateutil.parser import isoparse
 
+from dafni_cli.consts import DATETIME_CACHE_SIZE
+
 
 @dataclass
 class ParserParam:
@@ -48,11 +52,12 @@ class ParserBaseObject:
     Dataclasses that will be parsed from a dictionary should inherit from this
     and assign '_parser_params'. Any values that are Optional and are not
     necessarily assigned by the dict should be assigned with defaults in the
-    dataclass.
+    dataclass. They should also use @dataclass(slots=True), which makes each
+    instance slightly smaller.
 
     Attributes:
         _dict: Dictionary representation used to construct this object (useful
-               for outputs with --json options)
+               for outputs with --json options) or None if it wasn't kept
         _parser_params (List[ParserParam]): List of ParserParam structures -
                                 Each describes how to parse a dictionary to
                                 the subclass inheriting from this. This is
@@ -61,11 +66,173 @@ class ParserBaseObject:
                                 See ParserParams for more information/
     """
 
-    _dict: dict = {}
+    __slots__ = ("_dict",)
+
     _parser_params: ClassVar[List[ParserParam]] = []
 
+    # Parse functions compiled from _parser_params the first time each
+    # subclass is parsed (see _get_parser)
+    _compiled_parser: ClassVar[Optional[Callable[[dict], "ParserBaseObject"]]] = None
+    _compiled_parser_without_dict: ClassVar[
+        Optional[Callable[[dict], "ParserBaseObject"]]
+    ] = None
+    _compiled_lazy_parser: ClassVar[Optional[Callable[[dict], "ParserBaseObject"]]] = (
+        None
+    )
+    _compiled_lazy_parser_without_dict: ClassVar[
+        Optional[Callable[[dict], "ParserBaseObject"]]
+    ] = None
+
+    @staticmethod
+    def _get_parser(
+        dataclass_type: type, lazy: bool = False, keep_dict: bool = True
+    ) -> Callable[[dict], "ParserBaseObject"]:
+        """Returns the parse function for a subclass inheriting from
+        ParserBaseObject, compiling it if this is the first time it's needed
+
+        Args:
+            dataclass_type (Type[ParserBaseObject]): Dataclass type to obtain
+                                                     the parse function of
+            lazy (bool): Whether to obtain the lazy parse function (see
+                         parse_from_dict)
+            keep_dict (bool): Whether the parse function should keep the
+                              dictionary each object is parsed from
+        """
+        attribute = "_compiled_lazy_parser" if lazy else "_compiled_parser"
+        if not keep_dict:
+            attribute += "_without_dict"
+
+        # Only use a parser compiled for this exact class (not one inherited
+        # from a parent with different _parser_params)
+        parser = dataclass_type.__dict__.get(attribute)
+        if parser is None:
+            if lazy:
+                parser = ParserBaseObject._compile_lazy_parser(
+                    dataclass_type, keep_dict
+                )
+            else:
+                parser = ParserBaseObject._compile_parser(dataclass_type, keep_dict)
+            setattr(dataclass_type, attribute, parser)
+        return parser
+
+    @staticmethod
+    def _compile_parser(
+        dataclass_type: type, keep_dict: bool = True
+    ) -> Callable[[dict], "ParserBaseObject"]:
+        """Generates a function parsing a dictionary to a subclass inheriting
+        from ParserBaseObject as described by its _parser_params
+
+        Rather than interpreting each ParserParam every time an object is
+        parsed, the checks on their keys and datatypes are made once here to
+        generate straight line code that looks up each value and applies
+        only what is needed to it (see parse_from_dict for the behaviour).
+
+        Args:
+            dataclass_type (Type[ParserBaseObject]): Dataclass type to
+                                                     generate the function for
+            keep_dict (bool): Whether to keep the dictionary each object (and
+                              any nested object) is parsed from
+        """
+        namespace = {
+            "dataclass_type": dataclass_type,
+            "raise_missing_attribute_error": _raise_missing_attribute_error,
+        }
+        lines = ["def parse(dictionary):", "    parsed_params = {}"]
+
+        for index, param in enumerate(dataclass_type._parser_params):
+            # When keys is a list, we assume there is nesting of the
+            # dictionary and get the nested value
+            keys = param.keys if isinstance(param.keys, list) else [param.keys]
+            lines.append(f"    value = dictionary.get({keys[0]!r})")
+            for depth, key in enumerate(keys[1:], start=1):
+                lines.append(
+                    f"    {'    ' * (depth - 1)}if value is not None:\n"
+                    f"    {'    ' * depth}value = value.get({key!r})"
+                )
+
+            # Only assign the value if it is not None, allowing defaults
+            # defined in the dataclass to take effect
+            lines.append("    if value is not None:")
+            if param.datatype is not None:
+                if isinstance(param.datatype, type) and issubclass(
+                    param.datatype, ParserBaseObject
+                ):
+                    # Recursive parse (compiled when first needed)
+                    namespace[f"datatype_{index}"] = _nested_parser(
+                        param.datatype, keep_dict=keep_dict
+                    )
+                else:
+                    # Apply any constructor/function as required
+                    namespace[f"datatype_{index}"] = param.datatype
+                lines.append(f"        value = datatype_{index}(value)")
+            lines.append(f"        parsed_params[{param.name!r}] = value")
+
+        lines.extend(
+            [
+                "    try:",
+                "        parsed_obj = dataclass_type(**parsed_params)",
+                "    except TypeError as err:",
+                "        raise_missing_attribute_error(dataclass_type, err)",
+                f"    parsed_obj._dict = {'dictionary' if keep_dict else 'None'}",
+                "    return parsed_obj",
+            ]
+        )
+
+        exec("\n".join(lines), namespace)
+        parse = namespace["parse"]
+        parse.__qualname__ = (
+            f"{dataclass_type.__qualname__}."
+            f"{'_compiled_parser' if keep_dict else '_compiled_parser_without_dict'}"
+        )
+        return parse
+
     @staticmethod
-    def parse_from_dict(dataclass_type: type, dictionary: dict):
+    def _compile_lazy_parser(
+        dataclass_type: type, keep_dict: bool = True
+    ) -> Callable[[dict], "ParserBaseObject"]:
+        """Returns a function lazily parsing a dictionary to a subclass
+        inheriting from ParserBaseObject
+
+        The objects returned are instances of a subclass of 'dataclass_type'
+        (with the same name) in which each field is a _LazyField, decoding it
+        from the dictionary the first time it is accessed. Unlike its parent
+        this subclass doesn't use __slots__, so the decoded values are kept
+        in the instance's __dict__ along with the dictionary they are decoded
+        from ('_lazy_dict').
+
+        Args:
+            dataclass_type (Type[ParserBaseObject]): Dataclass type to
+                                                     generate the function for
+            keep_dict (bool): Whether to keep the dictionary each object (and
+                              any nested object) is parsed from as its '_dict'
+        """
+        params = {param.name: param for param in dataclass_type._parser_params}
+        namespace = {
+            "__module__": dataclass_type.__module__,
+            "__qualname__": dataclass_type.__qualname__,
+            "__doc__": dataclass_type.__doc__,
+        }
+        for field in fields(dataclass_type):
+            namespace[field.name] = _LazyField(
+                dataclass_type, field, params.get(field.name), keep_dict
+            )
+        lazy_type = type(dataclass_type.__name__, (dataclass_type,), namespace)
+
+        def parse(dictionary: dict):
+            parsed_obj = object.__new__(lazy_type)
+            parsed_obj._lazy_dict = dictionary
+            parsed_obj._dict = dictionary if keep_dict else None
+            return parsed_obj
+
+        return parse
+
+    @staticmethod
+    def parse_from_dict(
+        dataclass_type: type,
+        dictionary: dict,
+        lazy: bool = False,
+        keep_dict: bool = True,
+    ):
         """
         Parses a dictionary to a subclass inheriting from ParserBaseObject
         using its assigned _parser_params.
@@ -83,10 +250,29 @@ class ParserBaseObject:
         If any variables in the dataclass do not have default values and are
         not found in the dictionary this will give an error.
 
+        The _parser_params of each type are compiled into a parse function
+        the first time it is parsed, which is then reused.
+
+        When 'lazy' is True, nothing is parsed until it is used. Instead each
+        attribute is parsed from the dictionary the first time it is accessed
+        (and then kept), so that e.g. listing models doesn't spend time
+        parsing version histories it never displays. Any TypeError for a
+        missing attribute is then only raised when it is accessed.
+
+        When 'keep_dict' is False, the parsed object (and any nested in it)
+        don't keep a reference to their dictionary, so that it may be freed
+        once parsed. Their 'dictionary' will then be None. Lazily parsed
+        objects still hold on to it to parse the values not yet accessed, so
+        it is only freed along with them.
+
         Args:
             dataclass_type (Type[ParserBaseObject]): Dataclass type to parse
                                                      the dictionary to
             dictionary (dict): Dictionary containing the data to be parsed
+            lazy (bool): Whether to parse each attribute only when it is
+                         first accessed
+            keep_dict (bool): Whether to keep the dictionary in the parsed
+                              object
 
         Raises:
             TypeError: If a parameter is missing either in _parsed_params or
@@ -94,67 +280,15 @@ class ParserBaseObject:
                        corresponding attribute in the 'dataclass_type' does
                        not have a default value assigned.
         """
-
-        # To construct the dataclass - we want a dictionary containing all
-        # of the parsed parameters
-        parsed_params = {}
-
-        # Each ParserParam equates to one attribute in the dataclass
-        for param in dataclass_type._parser_params:
-            # When keys is a list, we assume there is nesting of the
-            # dictionary and get the nested value
-            if isinstance(param.keys, list):
-                parsed_param = dictionary
-                for key in param.keys:
-                    parsed_param = parsed_param.get(key)
-                    if parsed_param is None:
-                        break
-            else:
-                # No nesting
-                parsed_param = dictionary.get(param.keys)
-
-            # Only assign the value in parsed_params if it the value
-            # is not None - this allows defaults defined in the dataclass
-            # to take effect if the key was either not found in the dictionary
-            # or if the value parsed from the dictionary itself is None
-            if parsed_param is not None:
-                # Here we parse the value of the parameter (unless the
-                # datatype is None in which case we leave it as is)
-                if param.datatype is not None:
-                    # Recursive parse if the datatype is also a subclass
-                    if isinstance(param.datatype, type) and issubclass(
-                        param.datatype, ParserBaseObject
-                    ):
-                        # Automatically parse lists to lists of structures
-                        if isinstance(parsed_param, list):
-                            parsed_param = ParserBaseObject.parse_from_dict_list(
-                                param.datatype, parsed_param
-                            )
-                        else:
-                            parsed_param = ParserBaseObject.parse_from_dict(
-                                param.datatype, parsed_param
-                            )
-                    else:
-                        # Apply any constructor/function as required
-                        parsed_param = param.datatype(parsed_param)
-
-                parsed_params[param.name] = parsed_param
-
-        # Convert to the dataclass type
-        try:
-            parsed_obj = dataclass_type(**parsed_params)
-            parsed_obj._dict = dictionary
-            return parsed_obj
-        except TypeError as err:
-            # Slightly more descriptive error message
-            raise TypeError(
-                f"At least one class attribute in '{dataclass_type.__name__}' "
-                "was either missing from the dictionary or was parsed to be "
-                "'None' but doesn't have a default value."
-            ) from err
+        return ParserBaseObject._get_parser(dataclass_type, lazy, keep_dict)(dictionary)
 
     @staticmethod
-    def parse_from_dict_list(dataclass_type: type, dictionaries: List[dict]) -> List:
+    def parse_from_dict_list(
+        dataclass_type: type,
+        dictionaries: List[dict],
+        lazy: bool = False,
+        keep_dict: bool = True,
+    ) -> List:
         """Parses a list of dictionaries to a list of objects
 
         Args:
@@ -162,24 +296,147 @@ class ParserBaseObject:
                                                      the dictionary to
             dictionaries (dict): List of dictionaries containing the data to
                                  be parsed
+            lazy (bool): Whether to parse each attribute only when it is
+                         first accessed (see parse_from_dict)
+            keep_dict (bool): Whether to keep the dictionaries in the parsed
+                              objects (see parse_from_dict)
         """
-        return [
-            ParserBaseObject.parse_from_dict(dataclass_type, dictionary)
-            for dictionary in dictionaries
-        ]
+        parse = ParserBaseObject._get_parser(dataclass_type, lazy, keep_dict)
+        return [parse(dictionary) for dictionary in dictionaries]
 
     @property
-    def dictionary(self):
-        """Returns the dictionary used to assign the parameters in this object"""
-        return self._dict
+    def dictionary(self) -> Optional[dict]:
+        """Returns the dictionary used to assign the parameters in this object
+        (or None if it wasn't kept or the object wasn't parsed)"""
+        return getattr(self, "_dict", None)
+
+
+def _raise_missing_attribute_error(
+    dataclass_type: type, err: Optional[TypeError] = None
+):
+    """Raises a slightly more descriptive error when a dataclass couldn't be
+    constructed from the parameters parsed for it"""
+    raise TypeError(
+        f"At least one class attribute in '{dataclass_type.__name__}' "
+        "was either missing from the dictionary or was parsed to be "
+        "'None' but doesn't have a default value."
+    ) from err
+
+
+def _nested_parser(
+    dataclass_type: type, lazy: bool = False, keep_dict: bool = True
+) -> Callable[[Union[dict, list]], Any]:
+    """Returns a function parsing a nested dictionary to a subclass of
+    ParserBaseObject, or a list of dictionaries to a list of them"""
+
+    parse = None
+
+    def parse_nested(value: Union[dict, list]):
+        # Obtained when first used, as the type may refer back to the one
+        # being compiled
+        nonlocal parse
+        if parse is None:
+            parse = ParserBaseObject._get_parser(dataclass_type, lazy, keep_dict)
+
+        # Automatically parse lists to lists of structures
+        if isinstance(value, list):
+            return [parse(dictionary) for dictionary in value]
+        return parse(value)
+
+    return parse_nested
+
+
+class _LazyField:
+    """Descriptor parsing a field of a lazily parsed object from its
+    dictionary the first time it is accessed
+
+    As this only defines __get__, once the value has been stored on the
+    instance it is found there directly without calling this again.
+    """
+
+    def __init__(
+        self,
+        dataclass_type: type,
+        field: Field,
+        param: Optional[ParserParam],
+        keep_dict: bool = True,
+    ):
+        """
+        Args:
+            dataclass_type (Type[ParserBaseObject]): Dataclass type the field
+                                                     belongs to
+            field (Field): The dataclass field
+            param (Optional[ParserParam]): ParserParam describing how to parse
+                                           the field (if any)
+            keep_dict (bool): Whether any objects nested in the field should
+                              keep their dictionary
+        """
+        self._dataclass_type = dataclass_type
+        self._field = field
+        self._keys = []
+        self._datatype = None
+        if param is not None:
+            self._keys = param.keys if isinstance(param.keys, list) else [param.keys]
+            self._datatype = param.datatype
+            if isinstance(param.datatype, type) and issubclass(
+                param.datatype, ParserBaseObject
+            ):
+                self._datatype = _nested_parser(
+                    param.datatype, lazy=True, keep_dict=keep_dict
+                )
+
+    def _get_default(self) -> Any:
+        """Returns the default value of the field
+
+        Raises:
+            TypeError: If the field doesn't have a default value
+        """
+        if self._field.default is not MISSING:
+            return self._field.default
+        if self._field.default_factory is not MISSING:
+            return self._field.default_factory()
+        _raise_missing_attribute_error(self._dataclass_type)
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            # Accessed on the class itself e.g. for a default value
+            if self._field.default is MISSING:
+                raise AttributeError(self._field.name)
+            return self._field.default
+
+        value = instance._lazy_dict if self._keys else None
+        for key in self._keys:
+            value = value.get(key)
+            if value is None:
+                break
+
+        if value is None:
+            value = self._get_default()
+        elif self._datatype is not None:
+            value = self._datatype(value)
+
+        instance.__dict__[self._field.name] = value
+        return value
 
 
 # Below follows some utility functions for parsing types
 
 
-def parse_datetime(value: str):
-    """Converts a datetime string to a datetime object using isoparse"""
-    return isoparse(value)
+@lru_cache(maxsize=DATETIME_CACHE_SIZE)
+def parse_datetime(value: str) -> datetime:
+    """Converts a datetime string to a datetime object
+
+    The ISO 8601 formats returned by DAFNI are parsed using the much faster
+    datetime.fromisoformat, only falling back on isoparse for anything else.
+    As datetimes are immutable, the most recent results are also memoised.
+    """
+    try:
+        # fromisoformat only accepts 'Z' from Python 3.11
+        return datetime.fromisoformat(
+            f"{value[:-1]}+00:00" if value.endswith("Z") else value
+        )
+    except ValueError:
+        return isoparse(value)
 
 
 def parse_dict_retaining_keys(dataclass_type: type) -> Callable[[dict], dict]:
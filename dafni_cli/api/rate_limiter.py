@@ -0,0 +1,192 @@
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, replace
+from typing import Dict, Iterator, Optional
+from urllib.parse import urlsplit
+
+from dafni_cli.consts import REQUEST_RATE_LIMIT_DEFAULT, REQUEST_RATE_LIMITS
+
+
+@dataclass
+class RateLimit:
+    """Dataclass representing the limits on the requests sent to a service
+
+    Attributes:
+        requests_per_second (Optional[float]): Average number of requests
+                            that may be started each second (None for no
+                            limit)
+        burst (int): Number of requests that may be started at once after not
+                     sending any for a while
+        max_in_flight (Optional[int]): Maximum number of requests that may be
+                     waiting for a response at once (None for no limit)
+    """
+
+    requests_per_second: Optional[float] = None
+    burst: int = 1
+    max_in_flight: Optional[int] = None
+
+
+@dataclass
+class RateLimiterStats:
+    """Dataclass representing the requests that have been sent to a service
+    through a RateLimiter
+
+    Attributes:
+        requests (int): Number of requests sent
+        total_wait (float): Total time requests spent waiting before being
+                            sent (seconds)
+        max_wait (float): Longest time a single request waited (seconds)
+    """
+
+    requests: int = 0
+    total_wait: float = 0
+    max_wait: float = 0
+
+
+class _ServiceLimiter:
+    """Token bucket and semaphore limiting the requests sent to a single
+    service"""
+
+    def __init__(self, rate_limit: RateLimit):
+        self._rate_limit = rate_limit
+        self._lock = threading.Lock()
+        self._tokens = float(rate_limit.burst)
+        self._updated = time.monotonic()
+        self._semaphore = (
+            None
+            if rate_limit.max_in_flight is None
+            else threading.BoundedSemaphore(rate_limit.max_in_flight)
+        )
+        self.stats = RateLimiterStats()
+
+    def _take_token(self):
+        """Takes a token from the bucket, waiting until one is available"""
+        rate = self._rate_limit.requests_per_second
+        if rate is None:
+            return
+
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self._tokens + (now - self._updated) * rate, self._rate_limit.burst
+            )
+            self._updated = now
+            # Reserve a token even if there isn't one yet, so that requests
+            # waiting at the same time are each given their own turn
+            self._tokens -= 1
+            wait = -self._tokens / rate if self._tokens < 0 else 0
+
+        if wait > 0:
+            time.sleep(wait)
+
+    @contextmanager
+    def acquire(self) -> Iterator[None]:
+        """Waits until a request may be sent, holding a place in flight until
+        exited"""
+        start = time.monotonic()
+        if self._semaphore is not None:
+            self._semaphore.acquire()
+        try:
+            self._take_token()
+            wait = time.monotonic() - start
+            with self._lock:
+                self.stats.requests += 1
+                self.stats.total_wait += wait
+                self.stats.max_wait = max(self.stats.max_wait, wait)
+            yield
+        finally:
+            if self._semaphore is not None:
+                self._semaphore.release()
+
+    def get_stats(self) -> RateLimiterStats:
+        """Returns a copy of the current stats"""
+        with self._lock:
+            return replace(self.stats)
+
+
+class RateLimiter:
+    """Limits the rate at which requests are started, and the number in
+    flight at once, separately for each DAFNI service
+
+    Shared by all threads sending requests through the same DAFNISession.
+    Requests to a URL starting with one of the configured base URLs are
+    limited by its RateLimit, while those to any other host (e.g. MinIO) are
+    limited per host by the default.
+    """
+
+    def __init__(
+        self,
+        rate_limits: Optional[Dict[str, RateLimit]] = None,
+        default_rate_limit: Optional[RateLimit] = None,
+    ):
+        """
+        Args:
+            rate_limits (Optional[Dict[str, RateLimit]]): Limits indexed by
+                            the base URL they apply to. When None uses
+                            REQUEST_RATE_LIMITS.
+            default_rate_limit (Optional[RateLimit]): Limit applied to each
+                            host that isn't covered by rate_limits. When None
+                            uses REQUEST_RATE_LIMIT_DEFAULT.
+        """
+        if rate_limits is None:
+            rate_limits = {
+                base_url: RateLimit(**rate_limit)
+                for base_url, rate_limit in REQUEST_RATE_LIMITS.items()
+            }
+        if default_rate_limit is None:
+            default_rate_limit = RateLimit(**REQUEST_RATE_LIMIT_DEFAULT)
+
+        self._default_rate_limit = default_rate_limit
+        # Longest base URLs first so the most specific is used
+        self._base_urls = sorted(rate_limits, key=len, reverse=True)
+        self._limiters = {
+            base_url: _ServiceLimiter(rate_limit)
+            for base_url, rate_limit in rate_limits.items()
+        }
+        self._lock = threading.Lock()
+
+    def _get_limiter(self, url: str) -> _ServiceLimiter:
+        """Returns the limiter for the service a URL belongs to"""
+        for base_url in self._base_urls:
+            if url.startswith(base_url):
+                return self._limiters[base_url]
+
+        split_url = urlsplit(url)
+        host_url = f"{split_url.scheme}://{split_url.netloc}"
+        with self._lock:
+            if host_url not in self._limiters:
+                self._limiters[host_url] = _ServiceLimiter(self._default_rate_limit)
+            return self._limiters[host_url]
+
+    @contextmanager
+    def limit(self, url: str) -> Iterator[None]:
+        """Waits until a request to a URL may be sent, holding its place in
+        flight until exited e.g.
+
+        with rate_limiter.limit(url):
+            response = requests.get(url)
+
+        Args:
+            url (str): URL the request is being sent to
+        """
+        with self._get_limiter(url).acquire():
+            yield
+
+    def get_stats(self) -> Dict[str, RateLimiterStats]:
+        """Returns the stats of the requests sent so far
+
+        Returns:
+            Dict[str, RateLimiterStats]: Stats indexed by the base URL of each
+                                         service requests have been sent to
+        """
+        with self._lock:
+            limiters = dict(self._limiters)
+        stats = {
+            base_url: limiter.get_stats() for base_url, limiter in limiters.items()
+        }
+        return {
+            base_url: service_stats
+            for base_url, service_stats in stats.items()
+            if service_stats.requests > 0
+        }
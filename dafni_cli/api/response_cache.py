@@ -0,0 +1,238 @@
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Optional
+
+from dafni_cli.consts import RESPONSE_CACHE_MAX_SIZE
+
+
+@dataclass
+class CachedResponse:
+    """Dataclass representing a response found in a ResponseCache
+
+    Attributes:
+        response (Any): The JSON response
+        expired (bool): Whether the response has expired (expired responses
+                        are only returned when they can be revalidated)
+        etag (Optional[str]): ETag header of the response
+        last_modified (Optional[str]): Last-Modified header of the response
+    """
+
+    response: Any
+    expired: bool = False
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+    @property
+    def conditional_headers(self) -> dict:
+        """Headers to send to only receive the response again if it has
+        changed"""
+        headers = {}
+        if self.etag is not None:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified is not None:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ResponseCache:
+    """Persistent cache of the JSON responses of GET requests, keyed by user
+    and URL
+
+    Each response is stored in its own file under a directory for each user,
+    and within that for each group of responses that may change together so
+    that they can be removed at once (see DAFNISession.get_request). Once the
+    cache grows beyond its maximum size the least recently used
+    responses are removed. To avoid going through every response each time
+    one is cached, the total size is only found the first time, and then
+    kept track of until it appears to exceed the maximum.
+
+    Any ETag or Last-Modified validators are stored alongside each response
+    so that once expired it can be revalidated using a conditional request.
+    """
+
+    def __init__(self, directory: Path, max_size: int = RESPONSE_CACHE_MAX_SIZE):
+        """
+        Args:
+            directory (Path): Directory to store the cache in
+            max_size (int): Maximum total size of the cached responses (bytes)
+        """
+        self._directory = directory
+        self._max_size = max_size
+        # Total size of the cached responses (bytes), or None until found.
+        # This may be an overestimate as it ignores any that are removed.
+        self._size: Optional[int] = None
+
+    @staticmethod
+    def _hash(value: str) -> str:
+        """Returns a hash of a value suitable for use in a file name"""
+        return hashlib.sha256(value.encode("utf-8")).hexdigest()
+
+    def _get_user_directory(self, username: str) -> Path:
+        """Returns the directory a user's responses are stored in"""
+        return self._directory / ResponseCache._hash(username)
+
+    def _get_group_directory(self, username: str, group: str) -> Path:
+        """Returns the directory a user's responses in a group are stored in"""
+        return self._get_user_directory(username) / ResponseCache._hash(group)
+
+    def _get_entry_path(
+        self, username: str, url: str, group: Optional[str] = None
+    ) -> Path:
+        """Returns the path a response is stored at
+
+        Args:
+            username (str): User the response was returned to
+            url (str): URL of the request
+            group (Optional[str]): Group the response belongs to (or None if
+                                   it's in a group of its own)
+        """
+        return (
+            self._get_group_directory(username, url if group is None else group)
+            / f"{ResponseCache._hash(url)}.json"
+        )
+
+    def get(
+        self, username: str, url: str, group: Optional[str] = None
+    ) -> Optional[CachedResponse]:
+        """Returns a cached response
+
+        Args:
+            username (str): User the response was returned to
+            url (str): URL of the request
+            group (Optional[str]): Group the response was cached in
+
+        Returns:
+            Optional[CachedResponse]: The cached response or None if there
+                            isn't one, or it has expired and has no
+                            validators to revalidate it with
+        """
+        path = self._get_entry_path(username, url, group)
+        try:
+            entry = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+
+        if not isinstance(entry, dict) or entry.get("url") != url:
+            return None
+
+        cached_response = CachedResponse(
+            response=entry.get("response"),
+            expired=time.time() >= entry.get("expires", 0),
+            etag=entry.get("etag"),
+            last_modified=entry.get("last_modified"),
+        )
+        if cached_response.expired and not cached_response.conditional_headers:
+            path.unlink(missing_ok=True)
+            return None
+
+        # Mark as recently used
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return cached_response
+
+    def set(
+        self,
+        username: str,
+        url: str,
+        response: Any,
+        ttl: float,
+        group: Optional[str] = None,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ):
+        """Caches a response (failing silently if unable to write it)
+
+        Args:
+            username (str): User the response was returned to
+            url (str): URL of the request
+            response (Any): JSON serialisable response to cache
+            ttl (float): Time to keep the response for (seconds)
+            group (Optional[str]): Group of responses that may change along
+                                   with this one (or None if it's in a group
+                                   of its own)
+            etag (Optional[str]): ETag header of the response
+            last_modified (Optional[str]): Last-Modified header of the
+                         response
+        """
+        path = self._get_entry_path(username, url, group)
+        entry = {
+            "url": url,
+            "expires": time.time() + ttl,
+            "etag": etag,
+            "last_modified": last_modified,
+            "response": response,
+        }
+
+        temp_path = None
+        try:
+            try:
+                replaced_size = path.stat().st_size
+            except OSError:
+                replaced_size = 0
+            path.parent.mkdir(parents=True, exist_ok=True)
+
+            # Write to a temporary file first so that other processes never
+            # read a partially written response
+            file_descriptor, temp_path = tempfile.mkstemp(
+                dir=path.parent, suffix=".tmp"
+            )
+            with os.fdopen(file_descriptor, "w", encoding="utf-8") as file:
+                json.dump(entry, file)
+            os.replace(temp_path, path)
+            size = path.stat().st_size
+        except OSError:
+            if temp_path is not None:
+                Path(temp_path).unlink(missing_ok=True)
+            return
+
+        if self._size is not None:
+            self._size += size - replaced_size
+        if self._size is None or self._size > self._max_size:
+            self._evict()
+
+    def invalidate(self, username: str, group: str):
+        """Removes all of a user's cached responses in a group
+
+        Args:
+            username (str): User to remove the responses of
+            group (str): Group of responses to remove (or the URL of a
+                         response that's in a group of its own)
+        """
+        shutil.rmtree(self._get_group_directory(username, group), ignore_errors=True)
+
+    def clear(self, username: str):
+        """Removes all of a user's cached responses
+
+        Args:
+            username (str): User to remove the responses of
+        """
+        shutil.rmtree(self._get_user_directory(username), ignore_errors=True)
+
+    def _evict(self):
+        """Finds the total size of the cached responses, removing the least
+        recently used ones until it is no larger than the maximum size"""
+        entries = []
+        total_size = 0
+        for path in self._directory.glob("*/*/*.json"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+            total_size += stat.st_size
+
+        if total_size > self._max_size:
+            for _, size, path in sorted(entries):
+                if total_size <= self._max_size:
+                    break
+                path.unlink(missing_ok=True)
+                total_size -= size
+        self._size = total_size
@@ -0,0 +1,184 @@
+import email.utils
+import random
+import threading
+import time
+from typing import Iterable, Optional
+
+import requests
+
+from dafni_cli.consts import (
+    REQUEST_ERROR_RETRY_ATTEMPTS,
+    REQUEST_ERROR_RETRY_WAIT,
+    REQUEST_RETRY_BUDGET_RATIO,
+    REQUEST_RETRY_BUDGET_RESERVE,
+    REQUEST_RETRY_MAX_WAIT,
+    REQUEST_RETRY_NON_IDEMPOTENT_STATUS_CODES,
+    REQUEST_RETRY_STATUS_CODES,
+)
+
+
+class RetryBudget:
+    """Limits the number of retries sent by a session to a fraction of the
+    requests it sends
+
+    Every request adds 'ratio' to the budget (up to 'reserve') and every
+    retry takes 1 from it, so that when a service is failing the requests
+    sent to it are not multiplied by the number of retries allowed for each.
+    """
+
+    def __init__(
+        self,
+        ratio: float = REQUEST_RETRY_BUDGET_RATIO,
+        reserve: float = REQUEST_RETRY_BUDGET_RESERVE,
+    ):
+        """
+        Args:
+            ratio (float): Number of retries allowed for each request sent
+            reserve (float): Maximum number of retries that can be saved up
+                             (this is also the number available initially)
+        """
+        self._ratio = ratio
+        self._reserve = reserve
+        self._balance = reserve
+        self._lock = threading.Lock()
+
+    def deposit(self):
+        """Records a request being sent"""
+        with self._lock:
+            self._balance = min(self._balance + self._ratio, self._reserve)
+
+    def withdraw(self) -> bool:
+        """Attempts to take a retry from the budget
+
+        Returns:
+            bool: Whether a retry is allowed
+        """
+        with self._lock:
+            if self._balance < 1:
+                return False
+            self._balance -= 1
+            return True
+
+
+class RetryPolicy:
+    """Decides whether and when to retry a failed request
+
+    Retries are made after exceptions e.g. an SSLError (see
+    https://github.com/dafnifacility/cli/issues/113), and after responses
+    with any of the given status codes (or for non-idempotent methods such as
+    POST, only those saying the request wasn't processed). The time waited
+    before each retry is chosen at random up to a limit that doubles after
+    each attempt (so that many clients failing at once don't all retry at
+    once), unless the response gives a Retry-After header in which case that
+    is used instead. Requests asked to wait longer than the maximum wait
+    aren't retried.
+    """
+
+    # Methods that can safely be sent more than once
+    IDEMPOTENT_METHODS = frozenset(["get", "head", "options", "put", "delete"])
+
+    def __init__(
+        self,
+        max_retries: int = REQUEST_ERROR_RETRY_ATTEMPTS,
+        base_wait: float = REQUEST_ERROR_RETRY_WAIT,
+        max_wait: float = REQUEST_RETRY_MAX_WAIT,
+        status_codes: Iterable[int] = REQUEST_RETRY_STATUS_CODES,
+        non_idempotent_status_codes: Iterable[
+            int
+        ] = REQUEST_RETRY_NON_IDEMPOTENT_STATUS_CODES,
+        budget: Optional[RetryBudget] = None,
+    ):
+        """
+        Args:
+            max_retries (int): Maximum number of times to retry a request
+            base_wait (float): Maximum time to wait before the first retry
+                               (seconds)
+            max_wait (float): Maximum time to wait before any retry (seconds)
+            status_codes (Iterable[int]): Response status codes to retry
+                               requests after
+            non_idempotent_status_codes (Iterable[int]): Response status
+                               codes to retry requests using non-idempotent
+                               methods (e.g. POST) after
+            budget (Optional[RetryBudget]): Budget limiting the total number
+                               of retries made (None for no limit)
+        """
+        self.max_retries = max_retries
+        self.base_wait = base_wait
+        self.max_wait = max_wait
+        self.status_codes = frozenset(status_codes)
+        self.non_idempotent_status_codes = frozenset(non_idempotent_status_codes)
+        self.budget = budget
+
+    def on_request(self):
+        """Called whenever a request is first sent (not for retries)"""
+        if self.budget is not None:
+            self.budget.deposit()
+
+    def should_retry_response(
+        self, response: requests.Response, method: str = "get"
+    ) -> bool:
+        """Returns whether a request should be retried because of the status
+        code of its response (ignoring the number of attempts)
+
+        Args:
+            response (requests.Response): Response to the request
+            method (str): Method of the request e.g. "get" or "post"
+        """
+        if method.lower() in RetryPolicy.IDEMPOTENT_METHODS:
+            status_codes = self.status_codes
+        else:
+            status_codes = self.non_idempotent_status_codes
+        if response.status_code not in status_codes:
+            return False
+
+        # Give up rather than waiting for longer than allowed
+        retry_after = RetryPolicy._parse_retry_after(response)
+        return retry_after is None or retry_after <= self.max_wait
+
+    def allow_retry(self, retries: int) -> bool:
+        """Returns whether another retry may be made
+
+        Args:
+            retries (int): Number of retries already made for this request
+        """
+        if retries >= self.max_retries:
+            return False
+        return self.budget is None or self.budget.withdraw()
+
+    def get_wait(
+        self, retries: int, response: Optional[requests.Response] = None
+    ) -> float:
+        """Returns the time to wait before retrying a request
+
+        Args:
+            retries (int): Number of retries already made for this request
+            response (Optional[requests.Response]): Response that caused the
+                               retry (if any)
+
+        Returns:
+            float: Time to wait (seconds)
+        """
+        if response is not None:
+            retry_after = RetryPolicy._parse_retry_after(response)
+            if retry_after is not None:
+                return min(retry_after, self.max_wait)
+
+        # Exponential backoff with 'full jitter'
+        return random.uniform(0, min(self.max_wait, self.base_wait * 2**retries))
+
+    @staticmethod
+    def _parse_retry_after(response: requests.Response) -> Optional[float]:
+        """Returns the time to wait given by a response's Retry-After header
+        (which is either a number of seconds or a date) if it has one"""
+        value = response.headers.get("Retry-After")
+        if value is None:
+            return None
+        try:
+            return max(float(value), 0)
+        except ValueError:
+            pass
+        try:
+            retry_date = email.utils.parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        return max(retry_date.timestamp() - time.time(), 0)
@@ -1,34 +1,75 @@
 import datetime
 import json
 import os
+import threading
 import time
+import weakref
+from contextlib import ExitStack, contextmanager, nullcontext
 from dataclasses import dataclass
 from io import BufferedReader
 from pathlib import Path
-from typing import BinaryIO, Callable, Dict, List, Literal, Optional, Union
+from typing import BinaryIO, Callable, Dict, Iterator, List, Literal, Optional, Union
 
 import click
 import requests
 from requests import HTTPError
+from requests.adapters import HTTPAdapter
 
 from dafni_cli.api.exceptions import DAFNIError, EndpointNotFoundError, LoginError
 from dafni_cli.api.notifications_api import get_notifications
+from dafni_cli.api.rate_limiter import RateLimiter
+from dafni_cli.api.response_cache import ResponseCache
+from dafni_cli.api.retry_policy import RetryBudget, RetryPolicy
 from dafni_cli.consts import (
     LOGIN_API_ENDPOINT,
     LOGOUT_API_ENDPOINT,
-    REQUEST_ERROR_RETRY_ATTEMPTS,
-    REQUEST_ERROR_RETRY_WAIT,
+    REQUESTS_POOL_CONNECTIONS,
+    REQUESTS_POOL_MAXSIZE,
     REQUESTS_TIMEOUT,
+    RESPONSE_CACHE_DIR,
     SENDER_TYPE,
     SESSION_COOKIE,
+    SESSION_LOCK_FILE,
     SESSION_SAVE_FILE,
     TOKEN_EXPIRE_OFFSET,
+    TOKEN_REFRESH_CHECK_INTERVAL,
+    TOKEN_REFRESH_RETRY_WAIT,
+    UPLOAD_CHUNK_SIZE,
     URLS_REQUIRING_COOKIE_AUTHENTICATION,
     VERIFY,
 )
+from dafni_cli.file_lock import FileLock
 from dafni_cli.utils import dataclass_from_dict, get_current_messages
 
 
+class BlocksizeHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter that sets the size of the blocks request bodies are read
+    and sent in
+
+    urllib3 defaults to 16 KB, which for large file uploads means a very large
+    number of reads and progress bar updates per file.
+    """
+
+    def __init__(self, blocksize: int, **kwargs):
+        """
+        Args:
+            blocksize (int): Size of the blocks to send request bodies in
+                             (bytes)
+            **kwargs: Any other arguments to pass to HTTPAdapter
+        """
+        # Needed by init_poolmanager which is called by HTTPAdapter.__init__
+        self._blocksize = blocksize
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs["blocksize"] = self._blocksize
+        super().init_poolmanager(*args, **kwargs)
+
+    def proxy_manager_for(self, proxy, **proxy_kwargs):
+        proxy_kwargs["blocksize"] = self._blocksize
+        return super().proxy_manager_for(proxy, **proxy_kwargs)
+
+
 @dataclass
 class LoginResponse:
     """Dataclass for storing the response from logging in"""
@@ -99,7 +140,56 @@ class DAFNISession:
     # instead of through the CLI)
     _use_session_data_file: bool = False
 
-    def __init__(self, session_data: Optional[SessionData] = None):
+    # Underlying requests session shared by all authenticated requests (keeps
+    # connections to each host alive between requests)
+    _http_session: requests.Session
+
+    # Local cache of GET responses (None when not caching)
+    _response_cache: Optional[ResponseCache] = None
+
+    # Whether cached responses are revalidated before every use rather than
+    # only once expired
+    _revalidate_response_cache: bool = False
+
+    # Decides whether and when to retry failed requests
+    _retry_policy: RetryPolicy
+
+    # Limits the requests sent to each service (shared by all threads using
+    # this session)
+    _rate_limiter: RateLimiter
+
+    # Held while refreshing tokens so that when several threads find they
+    # need refreshing at once only one of them does so
+    _token_lock: threading.RLock
+
+    # Held while asking the user to login again after the refresh token has
+    # expired (without holding the other locks, so that others aren't
+    # blocked while waiting for the user) so that they are only asked once
+    _login_lock: threading.Lock
+
+    # Held while modifying the session file so that separate processes
+    # don't modify it (or refresh the tokens it contains) at the same time
+    _session_file_lock: FileLock
+
+    # Background thread refreshing the tokens before they expire during long
+    # transfers (None when not running), the event used to stop it and the
+    # number of transfers currently using it
+    _token_refresher: Optional[threading.Thread] = None
+    _token_refresher_stop: Optional[threading.Event] = None
+    _token_refresher_users: int = 0
+    _token_refresher_lock: threading.Lock
+
+    def __init__(
+        self,
+        session_data: Optional[SessionData] = None,
+        pool_connections: int = REQUESTS_POOL_CONNECTIONS,
+        pool_maxsize: int = REQUESTS_POOL_MAXSIZE,
+        upload_chunk_size: int = UPLOAD_CHUNK_SIZE,
+        use_response_cache: bool = False,
+        revalidate_response_cache: bool = False,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+    ):
         """DAFNISession constructor
 
         Args:
@@ -107,18 +197,131 @@ class DAFNISession:
                             information obtained after login. When None will
                             attempt to load the last session from a file or
                             otherwise will request the user to login.
+            pool_connections (int): Number of hosts to keep a pool of
+                            connections open for
+            pool_maxsize (int): Maximum number of connections to keep alive in
+                            the pool for each host (should be at least the
+                            number of threads sharing this session)
+            upload_chunk_size (int): Size of the blocks to read and send
+                            request bodies e.g. uploaded files in (bytes)
+            use_response_cache (bool): Whether to cache the responses of GET
+                            requests that allow it in a directory alongside
+                            the session file
+            revalidate_response_cache (bool): Whether to check any cached
+                            response is still current with DAFNI each time
+                            it's used, even if it hasn't expired (for
+                            commands that modify what they've requested)
+            retry_policy (Optional[RetryPolicy]): Policy deciding whether and
+                            when to retry failed requests. When None uses the
+                            default RetryPolicy with its own RetryBudget.
+            rate_limiter (Optional[RateLimiter]): Limits the rate of requests
+                            and the number in flight for each service. When
+                            None uses the default RateLimiter.
         """
+        self._pool_connections = pool_connections
+        self._pool_maxsize = pool_maxsize
+        self._upload_chunk_size = upload_chunk_size
+        self._http_session = DAFNISession._create_http_session(
+            pool_connections, pool_maxsize, upload_chunk_size
+        )
+        self._retry_policy = (
+            RetryPolicy(budget=RetryBudget()) if retry_policy is None else retry_policy
+        )
+        self._rate_limiter = RateLimiter() if rate_limiter is None else rate_limiter
+        self._token_lock = threading.RLock()
+        self._login_lock = threading.Lock()
+        self._session_file_lock = FileLock(DAFNISession._get_session_lock_path())
+        self._token_refresher_lock = threading.Lock()
+        if use_response_cache:
+            self._response_cache = ResponseCache(
+                DAFNISession._get_response_cache_path()
+            )
+        self._revalidate_response_cache = revalidate_response_cache
+
         if session_data is None:
             self._use_session_data_file = True
             self._obtain_session_data()
         else:
             self._session_data = session_data
 
+    @staticmethod
+    def _create_http_session(
+        pool_connections: int, pool_maxsize: int, upload_chunk_size: int
+    ) -> requests.Session:
+        """Returns a requests Session that reuses keep-alive connections to
+        each host rather than opening a new one for every request
+
+        Args:
+            pool_connections (int): Number of hosts to keep a pool of
+                            connections open for
+            pool_maxsize (int): Maximum number of connections to keep alive in
+                            the pool for each host
+            upload_chunk_size (int): Size of the blocks to read and send
+                            request bodies in (bytes)
+        """
+        http_session = requests.Session()
+        adapter = BlocksizeHTTPAdapter(
+            blocksize=upload_chunk_size,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+        )
+        http_session.mount("https://", adapter)
+        http_session.mount("http://", adapter)
+        return http_session
+
+    def ensure_pool_maxsize(self, pool_maxsize: int):
+        """Ensures at least a given number of connections can be kept alive
+        for each host, so that none are discarded when that many threads
+        share this session
+
+        Any connections already open are closed if the pool needs to grow,
+        so this should be called before the threads start.
+
+        Args:
+            pool_maxsize (int): Minimum number of connections to keep alive
+                                in the pool for each host
+        """
+        if pool_maxsize > self._pool_maxsize:
+            self._pool_maxsize = pool_maxsize
+            self._http_session.close()
+            self._http_session = DAFNISession._create_http_session(
+                self._pool_connections, pool_maxsize, self._upload_chunk_size
+            )
+
+    @property
+    def rate_limiter(self) -> RateLimiter:
+        """RateLimiter limiting the requests sent through this session (e.g.
+        to obtain stats on the time spent waiting from)"""
+        return self._rate_limiter
+
+    def close(self):
+        """Closes any connections held open by this session (and stops
+        refreshing its tokens in the background)"""
+        self._stop_token_refresher(force=True)
+        self._http_session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
     @staticmethod
     def _get_login_save_path():
         """Returns the filepath to save login responses to"""
         return Path().home() / SESSION_SAVE_FILE
 
+    @staticmethod
+    def _get_session_lock_path():
+        """Returns the filepath of the lock held while modifying the session
+        file"""
+        return Path().home() / SESSION_LOCK_FILE
+
+    @staticmethod
+    def _get_response_cache_path():
+        """Returns the path of the directory to cache responses in"""
+        return Path().home() / RESPONSE_CACHE_DIR
+
     @staticmethod
     def has_session_file():
         """Returns whether the session file exists and hence whether the user's
@@ -131,17 +334,35 @@ class DAFNISession:
         """Username associated with the current session"""
         return self._session_data.username
 
+    def _lock_session_file(self):
+        """Returns a context manager holding the session file lock (if the
+        session file is being used)"""
+        if self._use_session_data_file:
+            return self._session_file_lock
+        return nullcontext()
+
     def _save_session_data(self):
-        """Saves the SessionData instance to a storage file to persist the session"""
-        with open(DAFNISession._get_login_save_path(), "w", encoding="utf-8") as file:
-            file.write(json.dumps(self._session_data.__dict__))
+        """Saves the SessionData instance to a storage file to persist the session
+
+        The file is replaced in one step so that other processes never read a
+        partially written session.
+        """
+        path = DAFNISession._get_login_save_path()
+        temp_path = path.with_name(f"{path.name}.tmp")
+        with self._session_file_lock:
+            with open(temp_path, "w", encoding="utf-8") as file:
+                file.write(json.dumps(self._session_data.__dict__))
+            temp_path.replace(path)
 
     def _assign_session_data(self, username: str, login_response: LoginResponse):
         """Assigns and if _use_session_data_file is True, saves session data
         obtained from a successful login response"""
-        self._session_data = SessionData.from_login_response(username, login_response)
-        if self._use_session_data_file:
-            self._save_session_data()
+        with self._token_lock:
+            self._session_data = SessionData.from_login_response(
+                username, login_response
+            )
+            if self._use_session_data_file:
+                self._save_session_data()
 
     def _load_session_data(self) -> bool:
         """Attempts to load a SessionData instance from the storage file
@@ -169,15 +390,96 @@ class DAFNISession:
             # Couldn't so request a login
             self.attempt_login()
 
-    def _refresh_tokens(self):
+    def _load_refreshed_session_data(self) -> bool:
+        """Loads the session data from the storage file if another process has
+        already refreshed the tokens it contains
+
+        Returns:
+            bool: Whether refreshed session data was loaded
+        """
+        path = DAFNISession._get_login_save_path()
+        if not path.is_file():
+            return False
+
+        try:
+            with open(path, "r", encoding="utf-8") as file:
+                session_data = dataclass_from_dict(SessionData, json.loads(file.read()))
+        except (OSError, ValueError, TypeError):
+            return False
+
+        if (
+            session_data.username != self._session_data.username
+            or session_data.access_token == self._session_data.access_token
+            or datetime.datetime.now().timestamp() >= session_data.timestamp_to_refresh
+        ):
+            return False
+
+        self._session_data = session_data
+        return True
+
+    def _refresh_tokens(
+        self, access_token: Optional[str] = None, allow_login: bool = True
+    ):
         """Obtains a new access token and stores it
 
         Will attempt to request one using the currently stored refresh token,
         but in the case it has expired will ask the user to login again.
 
+        Only one thread or process refreshes the tokens at once. Any others
+        wait and then use the new tokens, rather than requesting their own.
+        The user is asked to login again without holding any locks, so that
+        others aren't blocked while waiting for them.
+
+        Args:
+            access_token (Optional[str]): Access token found to need
+                            refreshing. When given, nothing is done if
+                            another thread has already replaced it.
+            allow_login (bool): Whether to ask the user to login again if the
+                            refresh token has expired (otherwise raises a
+                            LoginError)
+
         Raises:
             LoginError: If unable to login or gain a new refresh token
         """
+        with self._token_lock, self._lock_session_file():
+            if (
+                access_token is not None
+                and access_token != self._session_data.access_token
+            ):
+                return
+
+            if self._use_session_data_file and self._load_refreshed_session_data():
+                return
+
+            if self._request_refreshed_tokens():
+                return
+
+            if not allow_login:
+                raise LoginError("Unable to refresh login as it has expired.")
+            expired_access_token = self._session_data.access_token
+
+        with self._login_lock:
+            # Another thread or process may have logged in while waiting
+            with self._token_lock, self._lock_session_file():
+                if self._session_data.access_token != expired_access_token or (
+                    self._use_session_data_file and self._load_refreshed_session_data()
+                ):
+                    return
+
+            # Saves the new tokens once logged in (acquiring the locks again)
+            self.attempt_login()
+
+    def _request_refreshed_tokens(self) -> bool:
+        """Requests a new access token using the current refresh token and
+        stores it
+
+        Returns:
+            bool: Whether the tokens were refreshed, or False if the refresh
+                  token has expired and so the user needs to login again
+
+        Raises:
+            LoginError: If unable to gain a new refresh token
+        """
 
         # Request a new refresh token
         response = requests.post(
@@ -193,21 +495,22 @@ class DAFNISession:
 
         if response.status_code == 400 and response.json()["error"] == "invalid_grant":
             # This means the refresh token has expired, so login again
-            self.attempt_login()
-        else:
-            response.raise_for_status()
+            return False
 
-            login_response = dataclass_from_dict(LoginResponse, response.json())
+        response.raise_for_status()
 
-            if not login_response.was_successful():
-                raise LoginError("Unable to refresh login.")
+        login_response = dataclass_from_dict(LoginResponse, response.json())
 
-            self._session_data = SessionData.from_login_response(
-                self._session_data.username, login_response
-            )
+        if not login_response.was_successful():
+            raise LoginError("Unable to refresh login.")
 
-            if self._use_session_data_file:
-                self._save_session_data()
+        self._session_data = SessionData.from_login_response(
+            self._session_data.username, login_response
+        )
+
+        if self._use_session_data_file:
+            self._save_session_data()
+        return True
 
     def _check_and_refresh_tokens(self):
         """Checks whether the current stored token will expire soon, and if
@@ -216,12 +519,91 @@ class DAFNISession:
         Raises:
             LoginError: If unable to login or gain a new refresh token
         """
-        if (
-            datetime.datetime.now().timestamp()
-            >= self._session_data.timestamp_to_refresh
-        ):
+        session_data = self._session_data
+        if datetime.datetime.now().timestamp() >= session_data.timestamp_to_refresh:
             # Need a refresh
-            self._refresh_tokens()
+            self._refresh_tokens(session_data.access_token)
+
+    def _run_token_refresher(self, stop: threading.Event):
+        """Refreshes the tokens shortly before they expire until 'stop' is set
+        (run by the background token refresher)
+
+        Stops early if the tokens can't be refreshed without the user logging
+        in again, leaving that to the next request made. After any other
+        error it waits before trying again, as the thread would otherwise die
+        leaving the tokens to expire during the transfer.
+
+        Args:
+            stop (threading.Event): Event set when the refresher should stop
+        """
+        while not stop.is_set():
+            session_data = self._session_data
+            wait = (
+                session_data.timestamp_to_refresh - datetime.datetime.now().timestamp()
+            )
+            if wait > 0:
+                stop.wait(min(wait, TOKEN_REFRESH_CHECK_INTERVAL))
+                continue
+
+            try:
+                self._refresh_tokens(session_data.access_token, allow_login=False)
+            except LoginError:
+                return
+            except Exception:
+                stop.wait(TOKEN_REFRESH_RETRY_WAIT)
+
+    def _start_token_refresher(self):
+        """Starts the background token refresher if it isn't already
+        running"""
+        with self._token_refresher_lock:
+            self._token_refresher_users += 1
+            if self._token_refresher is None:
+                self._token_refresher_stop = threading.Event()
+                self._token_refresher = threading.Thread(
+                    target=self._run_token_refresher,
+                    args=(self._token_refresher_stop,),
+                    name="dafni-token-refresher",
+                    daemon=True,
+                )
+                self._token_refresher.start()
+
+    def _stop_token_refresher(self, force: bool = False):
+        """Stops the background token refresher once it is no longer being
+        used by any transfer
+
+        Args:
+            force (bool): Whether to stop it even if still being used
+        """
+        with self._token_refresher_lock:
+            self._token_refresher_users = (
+                0 if force else max(self._token_refresher_users - 1, 0)
+            )
+            if self._token_refresher_users > 0 or self._token_refresher is None:
+                return
+            token_refresher = self._token_refresher
+            self._token_refresher = None
+            self._token_refresher_stop.set()
+        token_refresher.join()
+
+    @contextmanager
+    def keep_tokens_refreshed(self) -> Iterator[None]:
+        """Refreshes the tokens in a background thread shortly before they
+        expire until exited e.g.
+
+        with session.keep_tokens_refreshed():
+            upload_large_file()
+
+        This avoids long transfers (and the requests made after them) finding
+        the access token has expired, which would otherwise only be noticed
+        by an authentication failure that requires retrying the request.
+        May be nested or used by several threads at once, in which case the
+        refresher stops once they have all exited.
+        """
+        self._start_token_refresher()
+        try:
+            yield
+        finally:
+            self._stop_token_refresher()
 
     def logout(self):
         """Logs out of keycloak"""
@@ -244,6 +626,7 @@ class DAFNISession:
 
         if self._use_session_data_file:
             self._get_login_save_path().unlink()
+            ResponseCache(DAFNISession._get_response_cache_path()).clear(self.username)
 
     @staticmethod
     def _login(username: str, password: str) -> LoginResponse:
@@ -375,8 +758,7 @@ class DAFNISession:
         allow_redirect: bool,
         stream: Optional[bool] = None,
         retry_callback: Optional[Callable] = None,
-        auth_recursion_level: int = 0,
-        retry_recursion_level: int = 0,
+        invalidate_cache_group: Optional[str] = None,
     ) -> requests.Response:
         """Performs an authenticated request from the DAFNI API
 
@@ -393,15 +775,14 @@ class DAFNISession:
                              initial request is sent or if there is an SSLError.
                              Particularly useful for file uploads that may need to
                              be reset.
-            auth_recursion_level (int): Number of times this method has
-                             been recursively called due to an authentication
-                             issue (Used to avoid infinite loops)
-            retry_recursion_level (int): Number of times this method has
-                             been recursively called due to an error
-                             (Used to avoid infinite loops)
+            invalidate_cache_group (Optional[str]): Group of cached responses
+                             the request may change, which are removed before
+                             it is sent (see get_request)
 
         Returns:
-            requests.Response: Response from the requests library
+            requests.Response: Response from the requests library (this may
+                               still have a status code that the retry policy
+                               retries after if it ran out of retries)
 
         Raises:
             LoginError: If unable to login or refresh tokens to authenticate
@@ -409,86 +790,71 @@ class DAFNISession:
                           (See https://github.com/dafnifacility/cli/issues/113)
         """
 
-        # Before doing anything check whether the current token will expire
-        # soon and refresh if so
-        self._check_and_refresh_tokens()
-
-        # Should we retry the request for any reason
-        retry = False
+        if invalidate_cache_group is not None and self._response_cache is not None:
+            self._response_cache.invalidate(self.username, invalidate_cache_group)
 
         # Add Sender-Type to all headers sent
         headers["Sender-Type"] = SENDER_TYPE
 
-        try:
-            # Switch to cookie based authentication only for those that require it
-            if any(
-                url_requiring_cookie in url
-                for url_requiring_cookie in URLS_REQUIRING_COOKIE_AUTHENTICATION
-            ):
-                response = requests.request(
+        self._retry_policy.on_request()
+
+        # Number of times the tokens have been refreshed due to an
+        # authentication error, and number of retries due to any other error
+        auth_retries = 0
+        retries = 0
+
+        while True:
+            # Before doing anything check whether the current token will
+            # expire soon and refresh if so
+            self._check_and_refresh_tokens()
+
+            access_token = self._session_data.access_token
+            try:
+                response = self._send_authenticated_request(
                     method,
                     url=url,
                     headers=headers,
                     data=data,
                     json=json,
-                    allow_redirects=allow_redirect,
+                    allow_redirect=allow_redirect,
                     stream=stream,
-                    timeout=REQUESTS_TIMEOUT,
-                    cookies={SESSION_COOKIE: self._session_data.access_token},
-                    verify=VERIFY,
+                    access_token=access_token,
                 )
+            except Exception as err:
+                if not self._retry_policy.allow_retry(retries):
+                    raise RuntimeError(
+                        f"Could not connect due to an error after retrying {retries} times"
+                    ) from err
+                time.sleep(self._retry_policy.get_wait(retries))
+                retries += 1
             else:
-                response = requests.request(
-                    method,
-                    url=url,
-                    headers={
-                        "Authorization": f"Bearer {self._session_data.access_token}",
-                        **headers,
-                    },
-                    data=data,
-                    json=json,
-                    allow_redirects=allow_redirect,
-                    stream=stream,
-                    timeout=REQUESTS_TIMEOUT,
-                    verify=VERIFY,
-                )
-
-            # Check for any kind of authentication error, or an attempted redirect
-            # (this covers a case during file upload where a 302 is returned rather
-            # than an actual authentication error)
-            if response.status_code == 403 or (
-                response.status_code == 302 and not allow_redirect
-            ):
-                # Try again, but only once
-                if auth_recursion_level > 1:
-                    # Provide further details from the response (if there is
-                    # anything) - one place this occurs is running out of
-                    # temporary buckets during upload
-                    message = response.content.decode()
-                    raise LoginError(f"Could not authenticate request: {message}")
+                # Check for any kind of authentication error, or an attempted
+                # redirect (this covers a case during file upload where a 302
+                # is returned rather than an actual authentication error)
+                if response.status_code == 403 or (
+                    response.status_code == 302 and not allow_redirect
+                ):
+                    # Try again, but only once
+                    if auth_retries >= 1:
+                        # Provide further details from the response (if there
+                        # is anything) - one place this occurs is running out
+                        # of temporary buckets during upload
+                        message = response.content.decode()
+                        response.close()
+                        raise LoginError(f"Could not authenticate request: {message}")
+                    response.close()
+                    self._refresh_tokens(access_token)
+                    auth_retries += 1
+                elif self._retry_policy.should_retry_response(
+                    response, method
+                ) and self._retry_policy.allow_retry(retries):
+                    wait = self._retry_policy.get_wait(retries, response)
+                    response.close()
+                    time.sleep(wait)
+                    retries += 1
                 else:
-                    self._refresh_tokens()
-
-                    retry = True
-                    auth_recursion_level += 1
-        # Pass through in case of auth error
-        except LoginError:
-            raise
-        except Exception as err:
-            # Retry a if below the maximum number of retires
-            if retry_recursion_level >= REQUEST_ERROR_RETRY_ATTEMPTS:
-                raise RuntimeError(
-                    f"Could not connect due to an error after retrying {REQUEST_ERROR_RETRY_ATTEMPTS} times"
-                ) from err
-            else:
-                # Workaround for https://github.com/dafnifacility/cli/issues/113
-                # Retry up to ERROR_RETRY_ATTEMPTS times, waiting for
-                # ERROR_RETRY_WAIT seconds between each attempt
-                retry = True
-                retry_recursion_level += 1
-                time.sleep(REQUEST_ERROR_RETRY_WAIT)
-
-        if retry:
+                    return response
+
             # It seems in the event we need to retry the request, requests
             # still reads at least a small part of any file being uploaded -
             # this for example can result in  the validation of some metadata
@@ -504,20 +870,58 @@ class DAFNISession:
             if retry_callback is not None:
                 retry_callback()
 
-            response = self._authenticated_request(
+    def _send_authenticated_request(
+        self,
+        method: Literal["get", "post", "put", "patch", "delete"],
+        url: str,
+        headers: dict,
+        data: Union[dict, BinaryIO],
+        json,
+        allow_redirect: bool,
+        stream: Optional[bool],
+        access_token: str,
+    ) -> requests.Response:
+        """Sends a single request with an access token once allowed by the
+        rate limiter (see _authenticated_request for the other parameters)
+
+        The request holds its place in flight until the response has been
+        received, or when streamed, until the response is closed.
+        """
+
+        # Switch to cookie based authentication only for those that require it
+        if any(
+            url_requiring_cookie in url
+            for url_requiring_cookie in URLS_REQUIRING_COOKIE_AUTHENTICATION
+        ):
+            authentication = {
+                "headers": headers,
+                "cookies": {SESSION_COOKIE: access_token},
+            }
+        else:
+            authentication = {
+                "headers": {
+                    "Authorization": f"Bearer {access_token}",
+                    **headers,
+                },
+            }
+
+        with ExitStack() as stack:
+            stack.enter_context(self._rate_limiter.limit(url))
+            response = self._http_session.request(
                 method,
                 url=url,
-                headers=headers,
                 data=data,
                 json=json,
+                allow_redirects=allow_redirect,
                 stream=stream,
-                allow_redirect=allow_redirect,
-                retry_callback=retry_callback,
-                auth_recursion_level=auth_recursion_level,
-                retry_recursion_level=retry_recursion_level,
+                timeout=REQUESTS_TIMEOUT,
+                verify=VERIFY,
+                **authentication,
             )
-
-        return response
+            if stream:
+                # The body is still to be downloaded
+                _release_when_closed(response, stack.pop_all().close)
+            return response
 
     def get_error_message(self, response: requests.Response) -> Optional[str]:
         """Attempts to find an error message from a failed request response
@@ -609,6 +1013,9 @@ class DAFNISession:
             Callable[[requests.Response], Optional[str]]
         ] = None,
         retry_callback: Optional[Callable] = None,
+        headers: Optional[dict] = None,
+        cache_ttl: Optional[float] = None,
+        cache_group: Optional[str] = None,
     ) -> Union[Dict, List[Dict], requests.Response]:
         """Performs a GET request from the DAFNI API
 
@@ -630,6 +1037,21 @@ class DAFNISession:
                              request is retried e.g. after a token refresh
                              or if there is an SSLError. Particularly useful
                              for file uploads that may need to be reset.
+            headers (Optional[dict]): Any additional headers to include in
+                             the request e.g. a Range header
+            cache_ttl (Optional[float]): Time the response may be cached for
+                             (seconds). When None (or when streaming or given
+                             headers) the response is never cached. Once
+                             expired (or every time when the session was
+                             created with 'revalidate_response_cache'), a
+                             cached response with an ETag or Last-Modified
+                             header is revalidated using a conditional
+                             request and reused if a 304 is returned.
+            cache_group (Optional[str]): Group of cached responses the
+                             response belongs to e.g. MODELS_CACHE_GROUP.
+                             The whole group is removed by any request given
+                             it as its 'invalidate_cache_group'. When None
+                             the response is in a group of its own.
 
         Returns:
             Dict: When 'stream' is False for endpoints returning one object
@@ -644,21 +1066,69 @@ class DAFNISession:
             HTTPError: If any other error occurs without an error message from
                        DAFNI
         """
+        use_cache = (
+            cache_ttl is not None
+            and self._response_cache is not None
+            and not stream
+            and not headers
+        )
+        cached_response = None
+        request_headers = {"Content-Type": content_type, **(headers or {})}
+        if use_cache:
+            cached_response = self._response_cache.get(self.username, url, cache_group)
+            if cached_response is not None:
+                if not (cached_response.expired or self._revalidate_response_cache):
+                    return cached_response.response
+
+                # Only receive it again if it has changed
+                request_headers.update(cached_response.conditional_headers)
+
         response = self._authenticated_request(
             method="get",
             url=url,
-            headers={"Content-Type": content_type},
+            headers=request_headers,
             data=None,
             json=None,
             allow_redirect=allow_redirect,
             stream=stream,
             retry_callback=retry_callback,
         )
-        self._check_response(url, response, error_message_func=error_message_func)
 
-        if stream:
-            return response
-        return response.json()
+        if cached_response is not None and response.status_code == 304:
+            # Not modified, so keep using the cached copy
+            response_json = cached_response.response
+            etag = response.headers.get("ETag", cached_response.etag)
+            last_modified = response.headers.get(
+                "Last-Modified", cached_response.last_modified
+            )
+        else:
+            try:
+                self._check_response(
+                    url, response, error_message_func=error_message_func
+                )
+            except Exception:
+                # Release any streamed response as it won't be returned
+                response.close()
+                raise
+
+            if stream:
+                return response
+
+            response_json = response.json()
+            etag = response.headers.get("ETag")
+            last_modified = response.headers.get("Last-Modified")
+
+        if use_cache:
+            self._response_cache.set(
+                self.username,
+                url,
+                response_json,
+                cache_ttl,
+                group=cache_group,
+                etag=etag,
+                last_modified=last_modified,
+            )
+        return response_json
 
     def post_request(
         self,
@@ -671,6 +1141,7 @@ class DAFNISession:
             Callable[[requests.Response], Optional[str]]
         ] = None,
         retry_callback: Optional[Callable] = None,
+        invalidate_cache_group: Optional[str] = None,
     ) -> Dict:
         """Performs a POST request to the DAFNI API
 
@@ -691,6 +1162,10 @@ class DAFNISession:
                              request is retried e.g. after a token refresh
                              or if there is an SSLError. Particularly useful
                              for file uploads that may need to be reset.
+            invalidate_cache_group (Optional[str]): Group of cached responses
+                             the request may change e.g. MODELS_CACHE_GROUP,
+                             which are removed before it is sent (see
+                             get_request)
 
         Returns:
             Dict: The decoded json response
@@ -709,6 +1184,7 @@ class DAFNISession:
             json=json,
             allow_redirect=allow_redirect,
             retry_callback=retry_callback,
+            invalidate_cache_group=invalidate_cache_group,
         )
 
         self._check_response(url, response, error_message_func=error_message_func)
@@ -726,6 +1202,7 @@ class DAFNISession:
             Callable[[requests.Response], Optional[str]]
         ] = None,
         retry_callback: Optional[Callable] = None,
+        invalidate_cache_group: Optional[str] = None,
     ) -> requests.Response:
         """Performs a PUT request to the DAFNI API
 
@@ -746,6 +1223,10 @@ class DAFNISession:
                              request is retried e.g. after a token refresh
                              or if there is an SSLError. Particularly useful
                              for file uploads that may need to be reset.
+            invalidate_cache_group (Optional[str]): Group of cached responses
+                             the request may change e.g. MODELS_CACHE_GROUP,
+                             which are removed before it is sent (see
+                             get_request)
 
         Returns:
             requests.Response: The response object
@@ -764,6 +1245,7 @@ class DAFNISession:
             json=json,
             allow_redirect=allow_redirect,
             retry_callback=retry_callback,
+            invalidate_cache_group=invalidate_cache_group,
         )
 
         self._check_response(url, response, error_message_func=error_message_func)
@@ -781,6 +1263,7 @@ class DAFNISession:
             Callable[[requests.Response], Optional[str]]
         ] = None,
         retry_callback: Optional[Callable] = None,
+        invalidate_cache_group: Optional[str] = None,
     ) -> Dict:
         """Performs a PATCH request to the DAFNI API
 
@@ -801,6 +1284,10 @@ class DAFNISession:
                              request is retried e.g. after a token refresh
                              or if there is an SSLError. Particularly useful
                              for file uploads that may need to be reset.
+            invalidate_cache_group (Optional[str]): Group of cached responses
+                             the request may change e.g. MODELS_CACHE_GROUP,
+                             which are removed before it is sent (see
+                             get_request)
 
         Returns:
             Dict: The decoded json response
@@ -819,6 +1306,7 @@ class DAFNISession:
             json=json,
             allow_redirect=allow_redirect,
             retry_callback=retry_callback,
+            invalidate_cache_group=invalidate_cache_group,
         )
 
         self._check_response(url, response, error_message_func=error_message_func)
@@ -833,6 +1321,7 @@ class DAFNISession:
             Callable[[requests.Response], Optional[str]]
         ] = None,
         retry_callback: Optional[Callable] = None,
+        invalidate_cache_group: Optional[str] = None,
     ) -> requests.Response:
         """Performs a DELETE request to the DAFNI API
 
@@ -852,6 +1341,10 @@ class DAFNISession:
                              request is retried e.g. after a token refresh
                              or if there is an SSLError. Particularly useful
                              for file uploads that may need to be reset.
+            invalidate_cache_group (Optional[str]): Group of cached responses
+                             the request may change e.g. MODELS_CACHE_GROUP,
+                             which are removed before it is sent (see
+                             get_request)
 
         Returns:
             requests.Response: The response object
@@ -870,8 +1363,29 @@ class DAFNISession:
             json=None,
             allow_redirect=allow_redirect,
             retry_callback=retry_callback,
+            invalidate_cache_group=invalidate_cache_group,
         )
 
         self._check_response(url, response, error_message_func=error_message_func)
 
         return response
+
+
+def _release_when_closed(response: requests.Response, release: Callable[[], None]):
+    """Calls a function once a streamed response is closed (e.g. on leaving
+    'with response:'), or if it is garbage collected without being closed
+
+    Args:
+        response (requests.Response): The streamed response
+        release (Callable[[], None]): Function to call only once
+    """
+    finalizer = weakref.finalize(response, release)
+    close = response.close
+
+    def close_and_release():
+        try:
+            close()
+        finally:
+            finalizer()
+
+    response.close = close_and_release
@@ -9,7 +9,7 @@
 
 import json
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Iterator, List, Optional, Tuple
 
 import requests
 from requests import Response
@@ -20,8 +20,14 @@ from dafni_cli.api.exceptions import (
     ResourceNotFoundError,
     ValidationError,
 )
+from dafni_cli.api.json_stream import iter_json_array
 from dafni_cli.api.session import DAFNISession
-from dafni_cli.consts import NIMS_API_URL
+from dafni_cli.consts import (
+    JSON_STREAM_CHUNK_SIZE,
+    NIMS_API_URL,
+    RESPONSE_CACHE_TTL,
+    WORKFLOWS_CACHE_GROUP,
+)
 from dafni_cli.utils import construct_validation_errors_from_dict
 
 
@@ -35,7 +41,29 @@ def get_all_workflows(session: DAFNISession) -> List[dict]:
         List[dict]: List of dictionaries with raw response from API
     """
     url = f"{NIMS_API_URL}/workflows/"
-    return session.get_request(url)
+    return session.get_request(
+        url, cache_ttl=RESPONSE_CACHE_TTL, cache_group=WORKFLOWS_CACHE_GROUP
+    )
+
+
+def iter_all_workflows(session: DAFNISession) -> Iterator[dict]:
+    """Function to retrieve all workflows available to the user, returning
+    each one as it is received
+
+    Unlike get_all_workflows, the whole list is never held in memory at once
+    (and so is never cached either).
+
+    Args:
+        session (DAFNISession): User session
+
+    Returns:
+        Iterator[dict]: Each dictionary in the raw response from API
+    """
+    url = f"{NIMS_API_URL}/workflows/"
+    with session.get_request(url, stream=True) as response:
+        yield from iter_json_array(
+            response.iter_content(chunk_size=JSON_STREAM_CHUNK_SIZE)
+        )
 
 
 def get_workflow(session: DAFNISession, version_id: str) -> dict:
@@ -55,7 +83,12 @@ def get_workflow(session: DAFNISession, version_id: str) -> dict:
     url = f"{NIMS_API_URL}/workflows/{version_id}/"
 
     try:
-        return session.get_request(url)
+        # While the workflow itself can't be modified once created, the
+        # response includes e.g. its version history and instances
+        # which can, so it is only cached for a while before being revalidated
+        return session.get_request(
+            url, cache_ttl=RESPONSE_CACHE_TTL, cache_group=WORKFLOWS_CACHE_GROUP
+        )
     except EndpointNotFoundError as err:
         # When the endpoint isn't found it means the workflow wasn't found
         raise ResourceNotFoundError(
@@ -114,7 +147,9 @@ def upload_workflow(
     with open(file_path, "r", encoding="utf-8") as file:
         workflow_definition = json.load(file)
         data = {"version_message": version_message, "definition": workflow_definition}
-        return session.post_request(url=url, json=data)
+        return session.post_request(
+            url=url, json=data, invalidate_cache_group=WORKFLOWS_CACHE_GROUP
+        )
 
 
 def delete_workflow_version(session: DAFNISession, version_id: str) -> Response:
@@ -126,7 +161,7 @@ def delete_workflow_version(session: DAFNISession, version_id: str) -> Response:
         version_id (str): version ID of workflow to be deleted
     """
     url = f"{NIMS_API_URL}/workflows/{version_id}/"
-    return session.delete_request(url)
+    return session.delete_request(url, invalidate_cache_group=WORKFLOWS_CACHE_GROUP)
 
 
 def _validate_parameter_set_definition_error_message_func(session: DAFNISession):
@@ -222,4 +257,6 @@ def upload_parameter_set(
             error_message_func=_validate_parameter_set_definition_error_message_func(
                 session
             ),
+            # Parameter sets are listed in the details of their workflow
+            invalidate_cache_group=WORKFLOWS_CACHE_GROUP,
         )
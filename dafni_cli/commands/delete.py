@@ -1,4 +1,5 @@
-from typing import Callable, List, Tuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Callable, Dict, List, Tuple
 
 import click
 from click import Context
@@ -8,10 +9,12 @@ from dafni_cli.api.models_api import delete_model_version
 from dafni_cli.api.session import DAFNISession
 from dafni_cli.api.workflows_api import delete_workflow_version
 from dafni_cli.commands.helpers import (
-    cli_get_latest_dataset_metadata,
-    cli_get_model,
-    cli_get_workflow,
+    cli_get_latest_datasets_metadata,
+    cli_get_models,
+    cli_get_workflows,
 )
+from dafni_cli.commands.options import parallel_option
+from dafni_cli.consts import PARALLEL_REQUESTS
 from dafni_cli.datasets.dataset_metadata import DatasetMetadata, parse_dataset_metadata
 from dafni_cli.models.model import Model, parse_model
 from dafni_cli.utils import argument_confirmation
@@ -30,14 +33,97 @@ def delete(ctx: Context):
         ctx (Context): Context containing the user session.
     """
     ctx.ensure_object(dict)
-    ctx.obj["session"] = DAFNISession()
+    # Anything used to decide what to change is checked with DAFNI first
+    ctx.obj["session"] = DAFNISession(
+        use_response_cache=ctx.obj.get("use_response_cache", True),
+        revalidate_response_cache=True,
+    )
+
+
+def _delete_all(
+    delete_function: Callable[[str], Any],
+    ids: List[str],
+    max_workers: int,
+    description: str,
+):
+    """Deletes several entities at once, continuing when any fail and then
+    printing a summary of those that couldn't be deleted
+
+    Args:
+        delete_function (Callable[[str], Any]): Function that deletes the
+                            entity with a given ID
+        ids (List[str]): IDs of the entities to delete (any given more than
+                         once are only deleted once)
+        max_workers (int): Maximum number of entities to delete at once
+        description (str): Plural description of the entities being deleted
+                           e.g. 'Model versions'
+
+    Raises:
+        SystemExit(1): If any of the entities couldn't be deleted
+    """
+    ids = list(dict.fromkeys(ids))
+    deleted = []
+    errors = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(delete_function, entity_id): entity_id for entity_id in ids
+        }
+        try:
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                    deleted.append(futures[future])
+                except Exception as err:
+                    # Includes running out of retries or failing to login
+                    # again, which may not affect the rest
+                    errors[futures[future]] = err
+        except BaseException:
+            # Don't delete anything else when interrupted, but still show
+            # what was deleted before then
+            executor.shutdown(wait=False, cancel_futures=True)
+            _echo_delete_summary(ids, deleted, errors, description)
+            raise
+
+    _echo_delete_summary(ids, deleted, errors, description)
+    if errors:
+        raise SystemExit(1)
+
+
+def _echo_delete_summary(
+    ids: List[str], deleted: List[str], errors: Dict[str, Exception], description: str
+):
+    """Prints how many of the given entities were deleted and why any
+    couldn't be
+
+    Args:
+        ids (List[str]): IDs of all the entities that were to be deleted
+        deleted (List[str]): IDs of the entities that were deleted
+        errors (Dict[str, Exception]): Error raised for each entity that
+                                       couldn't be deleted
+        description (str): Plural description of the entities being deleted
+                           e.g. 'Model versions'
+    """
+    if len(deleted) == len(ids):
+        click.echo(f"{description} deleted")
+        return
+
+    summary = f"{description} deleted: {len(deleted)}, failed: {len(errors)}"
+    interrupted = len(ids) - len(deleted) - len(errors)
+    if interrupted:
+        summary += f", interrupted: {interrupted}"
+    click.echo(summary)
+    for entity_id in ids:
+        if entity_id in errors:
+            click.echo(f"Failed to delete '{entity_id}': {errors[entity_id]}")
 
 
 ###############################################################################
 # Models
 ###############################################################################
 def collate_model_version_details(
-    session: DAFNISession, version_ids: Tuple[str]
+    session: DAFNISession,
+    version_ids: Tuple[str],
+    max_workers: int = PARALLEL_REQUESTS,
 ) -> List[str]:
     """For each given model version, checks for destroy privileges for the
     user and produces a list of the version details of each model to be
@@ -46,46 +132,61 @@ def collate_model_version_details(
     Args:
         session (DAFNISession): User session
         version_ids (Tuple[str]): Tuple of the version IDs of each model to be deleted
+        max_workers (int): Maximum number of models to get at once
 
     Returns:
         List[str]: List of the model details to be displayed during deletion confirmation
     """
     model_version_details_list = []
-    for vid in version_ids:
-        # Find details of each model version that will be deleted
-        model_ver: Model = parse_model(cli_get_model(session, vid))
-        # Exit if user doesn't have necessary permissions
-        if not model_ver.auth.destroy:
+    forbidden_details_list = []
+    # Find details of each model version that will be deleted
+    for model_dictionary in cli_get_models(session, version_ids, max_workers):
+        model_ver: Model = parse_model(model_dictionary)
+        if model_ver.auth.destroy:
+            model_version_details_list.append(model_ver.get_version_details())
+        else:
+            forbidden_details_list.append(model_ver.get_version_details())
+
+    # Exit if user doesn't have necessary permissions for any of them
+    if forbidden_details_list:
+        for details in forbidden_details_list:
             click.echo(
                 "You do not have sufficient permissions to delete model version:"
             )
-            click.echo(model_ver.get_version_details())
-            raise SystemExit(1)
-        model_version_details_list.append(model_ver.get_version_details())
+            click.echo(details)
+        raise SystemExit(1)
     return model_version_details_list
 
 
 @delete.command(help="Delete one or more model versions")
 @click.argument("version-ids", nargs=-1, required=True, type=str)
+@parallel_option(
+    help="Maximum number of model versions to check or delete at once.",
+    default=PARALLEL_REQUESTS,
+)
 @click.pass_context
-def model_version(ctx: Context, version_ids: List[str]):
+def model_version(ctx: Context, version_ids: List[str], parallel: int):
     """
     Delete one or more version(s) of model(s) from DAFNI.
 
     Args:
         ctx (context): contains user session for authentication
         version_ids (Tuple[str]): ID(s) of the model version(s) to be deleted
+        parallel (int): Maximum number of model versions to check or delete
+                        at once
     """
     model_version_details_list = collate_model_version_details(
-        ctx.obj["session"], version_ids
+        ctx.obj["session"], version_ids, max_workers=parallel
     )
     argument_confirmation(
         [], "Confirm deletion of model versions?", model_version_details_list
     )
-    for vid in version_ids:
-        delete_model_version(ctx.obj["session"], vid)
-    # Confirm action
-    click.echo("Model versions deleted")
+    _delete_all(
+        lambda vid: delete_model_version(ctx.obj["session"], vid),
+        version_ids,
+        max_workers=parallel,
+        description="Model versions",
+    )
 
 
 ###############################################################################
@@ -96,6 +197,7 @@ def _collate_dataset_details(
     version_ids: Tuple[str],
     obtain_details: Callable[[DatasetMetadata], str],
     permissions_message: str,
+    max_workers: int,
 ) -> Tuple[List[str], List[str]]:
     """For each given dataset version, checks for destroy privileges for the
     user and produces a list of the details of each dataset to be deleted
@@ -110,7 +212,7 @@ def _collate_dataset_details(
         permissions_message (str): Message to display to the user if they
                             don't have permissions to delete a particular
                             dataset
-
+        max_workers (int): Maximum number of datasets to get at once
 
     Returns:
         List[str]: List of the dataset details to be displayed during deletion
@@ -119,24 +221,30 @@ def _collate_dataset_details(
     """
     dataset_details_list = []
     dataset_ids = []
-    for vid in version_ids:
-        # Find details of each dataset that will be deleted
-        dataset_meta: DatasetMetadata = parse_dataset_metadata(
-            cli_get_latest_dataset_metadata(session, vid)
-        )
+    forbidden_details_list = []
+    # Find details of each dataset that will be deleted
+    for metadata in cli_get_latest_datasets_metadata(session, version_ids, max_workers):
+        dataset_meta: DatasetMetadata = parse_dataset_metadata(metadata)
         details = obtain_details(dataset_meta)
-        # Exit if user doesn't have necessary permissions
-        if not dataset_meta.auth.destroy:
+        if dataset_meta.auth.destroy:
+            dataset_details_list.append(details)
+            dataset_ids.append(dataset_meta.dataset_id)
+        else:
+            forbidden_details_list.append(details)
+
+    # Exit if user doesn't have necessary permissions for any of them
+    if forbidden_details_list:
+        for details in forbidden_details_list:
             click.echo(permissions_message)
             click.echo(details)
-            raise SystemExit(1)
-        dataset_details_list.append(details)
-        dataset_ids.append(dataset_meta.dataset_id)
+        raise SystemExit(1)
     return dataset_details_list, dataset_ids
 
 
 def collate_dataset_details(
-    session: DAFNISession, version_ids: List[str]
+    session: DAFNISession,
+    version_ids: List[str],
+    max_workers: int = PARALLEL_REQUESTS,
 ) -> Tuple[List[str], List[str]]:
     """For each given dataset, checks for destroy privileges for the
     user and produces a list of the details of each dataset to be deleted
@@ -145,6 +253,7 @@ def collate_dataset_details(
         session (DAFNISession): User session
         version_ids (Tuple[str]): Tuple of the dataset version IDs of each
                                   dataset to be deleted
+        max_workers (int): Maximum number of datasets to get at once
 
     Returns:
         List[str]: List of the dataset details to be displayed during deletion
@@ -156,19 +265,25 @@ def collate_dataset_details(
         version_ids=version_ids,
         obtain_details=lambda dataset_meta: dataset_meta.get_details(),
         permissions_message="You do not have sufficient permissions to delete dataset:",
+        max_workers=max_workers,
     )
 
 
 @delete.command(help="Delete one or more datasets")
 @click.argument("version-ids", nargs=-1, required=True, type=str)
+@parallel_option(
+    help="Maximum number of datasets to check or delete at once.",
+    default=PARALLEL_REQUESTS,
+)
 @click.pass_context
-def dataset(ctx: Context, version_ids: Tuple[str]):
+def dataset(ctx: Context, version_ids: Tuple[str], parallel: int):
     """
     Delete one or more dataset(s) from DAFNI.
 
     Args:
         ctx (context): contains user session for authentication
         version_ids (Tuple[str]): Version ID(s) of the datasets to be deleted
+        parallel (int): Maximum number of datasets to check or delete at once
     """
 
     # We need the version id to get the metadata, but the dataset id for the
@@ -176,17 +291,21 @@ def dataset(ctx: Context, version_ids: Tuple[str]):
     # version id and obtain both the id and metadata once
 
     dataset_details_list, dataset_ids = collate_dataset_details(
-        ctx.obj["session"], version_ids
+        ctx.obj["session"], version_ids, max_workers=parallel
     )
     argument_confirmation([], "Confirm deletion of datasets?", dataset_details_list)
-    for dataset_id in dataset_ids:
-        delete_dataset(ctx.obj["session"], dataset_id)
-    # Confirm action
-    click.echo("Datasets deleted")
+    _delete_all(
+        lambda dataset_id: delete_dataset(ctx.obj["session"], dataset_id),
+        dataset_ids,
+        max_workers=parallel,
+        description="Datasets",
+    )
 
 
 def collate_dataset_version_details(
-    session: DAFNISession, version_ids: Tuple[str]
+    session: DAFNISession,
+    version_ids: Tuple[str],
+    max_workers: int = PARALLEL_REQUESTS,
 ) -> Tuple[List[str], List[str]]:
     """For each given dataset version, checks for destroy privileges for the
     user and produces a list of the version details of each dataset version to
@@ -196,6 +315,7 @@ def collate_dataset_version_details(
         session (DAFNISession): User session
         version_ids (Tuple[str]): Tuple of the dataset version IDs of each
                                   dataset to be deleted
+        max_workers (int): Maximum number of datasets to get at once
 
     Returns:
         List[str]: List of the dataset details to be displayed during deletion
@@ -207,38 +327,49 @@ def collate_dataset_version_details(
         version_ids=version_ids,
         obtain_details=lambda dataset_meta: dataset_meta.get_version_details(),
         permissions_message="You do not have sufficient permissions to delete dataset version:",
+        max_workers=max_workers,
     )
 
 
 @delete.command(help="Delete one or more dataset versions")
 @click.argument("version-ids", nargs=-1, required=True, type=str)
+@parallel_option(
+    help="Maximum number of dataset versions to check or delete at once.",
+    default=PARALLEL_REQUESTS,
+)
 @click.pass_context
-def dataset_version(ctx: Context, version_ids: Tuple[str]):
+def dataset_version(ctx: Context, version_ids: Tuple[str], parallel: int):
     """
     Delete one or more dataset version(s) from DAFNI.
 
     Args:
         ctx (context): contains user session for authentication
         version_ids (str): Version ID(s) of the datasets to be deleted
+        parallel (int): Maximum number of dataset versions to check or delete
+                        at once
     """
 
     dataset_details_list, _ = collate_dataset_version_details(
-        ctx.obj["session"], version_ids
+        ctx.obj["session"], version_ids, max_workers=parallel
     )
     argument_confirmation(
         [], "Confirm deletion of dataset versions?", dataset_details_list
     )
-    for vid in version_ids:
-        delete_dataset_version(ctx.obj["session"], version_id=vid)
-    # Confirm action
-    click.echo("Dataset versions deleted")
+    _delete_all(
+        lambda vid: delete_dataset_version(ctx.obj["session"], version_id=vid),
+        version_ids,
+        max_workers=parallel,
+        description="Dataset versions",
+    )
 
 
 ###############################################################################
 # Workflows
 ###############################################################################
 def collate_workflow_version_details(
-    session: DAFNISession, version_ids: Tuple[str]
+    session: DAFNISession,
+    version_ids: Tuple[str],
+    max_workers: int = PARALLEL_REQUESTS,
 ) -> List[str]:
     """
     Checks for destroy privileges for the user, and produces a list of the version details
@@ -247,43 +378,58 @@ def collate_workflow_version_details(
     Args:
         session (DAFNISession): User session
         version_ids (Tuple[str]): List of the version IDs of each workflow to be deleted
+        max_workers (int): Maximum number of workflows to get at once
 
     Returns:
         List[str]: List of the workflow  details to be displayed during deletion confirmation
     """
     workflow_version_details_list = []
-    for vid in version_ids:
-        # Find details of each workflow version that will be deleted
-        workflow_ver = parse_workflow(cli_get_workflow(session, vid))
-        # Exit if user doesn't have necessary permissions
-        if not workflow_ver.auth.destroy:
+    forbidden_details_list = []
+    # Find details of each workflow version that will be deleted
+    for workflow_dictionary in cli_get_workflows(session, version_ids, max_workers):
+        workflow_ver = parse_workflow(workflow_dictionary)
+        if workflow_ver.auth.destroy:
+            workflow_version_details_list.append(workflow_ver.get_version_details())
+        else:
+            forbidden_details_list.append(workflow_ver.get_version_details())
+
+    # Exit if user doesn't have necessary permissions for any of them
+    if forbidden_details_list:
+        for details in forbidden_details_list:
             click.echo(
                 "You do not have sufficient permissions to delete workflow version:"
             )
-            click.echo(workflow_ver.get_version_details())
-            raise SystemExit(1)
-        workflow_version_details_list.append(workflow_ver.get_version_details())
+            click.echo(details)
+        raise SystemExit(1)
     return workflow_version_details_list
 
 
 @delete.command(help="Delete one or more workflow versions")
 @click.argument("version-ids", nargs=-1, required=True, type=str)
+@parallel_option(
+    help="Maximum number of workflow versions to check or delete at once.",
+    default=PARALLEL_REQUESTS,
+)
 @click.pass_context
-def workflow_version(ctx: Context, version_ids: List[str]):
+def workflow_version(ctx: Context, version_ids: List[str], parallel: int):
     """
     Delete one or more version(s) of workflow(s) from DAFNI.
 
     Args:
         ctx (context): contains user session for authentication
         version_ids (Tuple[str]): ID(s) of the workflow version(s) to be deleted
+        parallel (int): Maximum number of workflow versions to check or
+                        delete at once
     """
     workflow_version_details_list = collate_workflow_version_details(
-        ctx.obj["session"], version_ids
+        ctx.obj["session"], version_ids, max_workers=parallel
     )
     argument_confirmation(
         [], "Confirm deletion of workflow versions?", workflow_version_details_list
     )
-    for vid in version_ids:
-        delete_workflow_version(ctx.obj["session"], vid)
-    # Confirm action
-    click.echo("Workflow versions deleted")
+    _delete_all(
+        lambda vid: delete_workflow_version(ctx.obj["session"], vid),
+        version_ids,
+        max_workers=parallel,
+        description="Workflow versions",
+    )
@@ -9,7 +9,10 @@ from dafni_cli.commands.helpers import (
     cli_get_latest_dataset_metadata,
     cli_select_dataset_files,
 )
-from dafni_cli.commands.options import click_optional_tuple_none_callback
+from dafni_cli.commands.options import (
+    click_optional_tuple_none_callback,
+    parallel_option,
+)
 from dafni_cli.datasets.dataset_download import download_dataset
 from dafni_cli.datasets.dataset_metadata import parse_dataset_metadata
 
@@ -23,7 +26,9 @@ def download(ctx: Context):
         ctx (Context): Context containing the user session.
     """
     ctx.ensure_object(dict)
-    ctx.obj["session"] = DAFNISession()
+    ctx.obj["session"] = DAFNISession(
+        use_response_cache=ctx.obj.get("use_response_cache", True)
+    )
 
 
 @download.command(help="Download all dataset files for a given version")
@@ -40,12 +45,29 @@ def download(ctx: Context):
     type=str,
     callback=click_optional_tuple_none_callback,
 )
+@parallel_option(help="Maximum number of files to download at once.")
+@click.option(
+    "--segments",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="Maximum number of byte ranges to download each large file in at once. Files downloaded in several ranges start again from the beginning if interrupted.",
+)
+@click.option(
+    "--sync",
+    is_flag=True,
+    default=False,
+    help="Only download files that are missing or have changed in the directory.",
+)
 @click.pass_context
 def dataset(
     ctx: Context,
     version_id: List[str],
     directory: Optional[Path],
     files: Optional[List[str]],
+    parallel: int,
+    segments: int,
+    sync: bool,
 ):
     """Download all files associated with the given Dataset Version.
 
@@ -56,6 +78,11 @@ def dataset(
                                     will use the current working directory)
         files (Optional[List[str]]): List of specific files to download (allows
                                      glob-like wildcards)
+        parallel (int): Maximum number of files to download at once
+        segments (int): Maximum number of byte ranges to download each large
+                        file in at once
+        sync (bool): Whether to skip files that have already been downloaded
+                     to the directory and are unchanged
     """
     metadata = parse_dataset_metadata(
         cli_get_latest_dataset_metadata(ctx.obj["session"], version_id)
@@ -64,7 +91,14 @@ def dataset(
     if len(metadata.files) > 0:
         selected_files = cli_select_dataset_files(metadata, files=files)
         if len(selected_files) > 0:
-            download_dataset(ctx.obj["session"], selected_files, directory)
+            download_dataset(
+                ctx.obj["session"],
+                selected_files,
+                directory,
+                max_workers=parallel,
+                segments=segments,
+                sync=sync,
+            )
         else:
             click.echo("No files selected to download")
     else:
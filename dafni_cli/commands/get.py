@@ -1,26 +1,39 @@
 from datetime import datetime
+from functools import partial
 from typing import List, Optional
 
 import click
 from click import Context
 
-from dafni_cli.api.datasets_api import get_all_datasets
-from dafni_cli.api.models_api import get_all_models
+from dafni_cli.api.datasets_api import (
+    DATASETS_PAGE_SIZE,
+    get_all_datasets,
+    iter_dataset_pages,
+)
+from dafni_cli.api.models_api import get_all_models, iter_all_models
 from dafni_cli.api.session import DAFNISession
-from dafni_cli.api.workflows_api import get_all_workflows
+from dafni_cli.api.workflows_api import get_all_workflows, iter_all_workflows
 from dafni_cli.commands.helpers import (
     cli_get_latest_dataset_metadata,
-    cli_get_model,
+    cli_get_models,
     cli_get_workflow,
     cli_get_workflow_instance,
     cli_get_workflow_parameter_set,
+    cli_get_workflows,
+)
+from dafni_cli.commands.options import (
+    filter_flag_option,
+    json_option,
+    parallel_option,
+    stream_option,
+    wrap_option,
 )
-from dafni_cli.commands.options import filter_flag_option, json_option
 from dafni_cli.consts import (
     DATE_INPUT_FORMAT,
     DATE_INPUT_FORMAT_VERBOSE,
     DATE_TIME_INPUT_FORMAT,
     DATE_TIME_INPUT_FORMAT_VERBOSE,
+    PARALLEL_REQUESTS,
     TABLE_ACCESS_HEADER,
     TABLE_DISPLAY_NAME_MAX_COLUMN_WIDTH,
     TABLE_FINISHED_HEADER,
@@ -30,6 +43,7 @@ from dafni_cli.consts import (
     TABLE_PUBLICATION_DATE_HEADER,
     TABLE_STARTED_HEADER,
     TABLE_STATUS_HEADER,
+    TABLE_STREAM_SAMPLE_SIZE,
     TABLE_SUMMARY_HEADER,
     TABLE_SUMMARY_MAX_COLUMN_WIDTH,
     TABLE_VERSION_ID_HEADER,
@@ -42,13 +56,14 @@ from dafni_cli.filtering import (
     creation_date_filter,
     end_filter,
     filter_multiple,
+    filter_multiple_iter,
     publication_date_filter,
     start_filter,
     status_filter,
     text_filter,
 )
 from dafni_cli.models.model import parse_model, parse_models
-from dafni_cli.utils import format_table, print_json
+from dafni_cli.utils import print_json, print_json_list, print_table
 from dafni_cli.workflows.instance import parse_workflow_instance
 from dafni_cli.workflows.workflow import parse_workflow, parse_workflows
 
@@ -63,7 +78,9 @@ def get(ctx: Context):
         ctx (Context): Context containing the user session.
     """
     ctx.ensure_object(dict)
-    ctx.obj["session"] = DAFNISession()
+    ctx.obj["session"] = DAFNISession(
+        use_response_cache=ctx.obj.get("use_response_cache", True)
+    )
 
 
 ###############################################################################
@@ -88,6 +105,8 @@ def get(ctx: Context):
     help=f"Filter for models published since given date. Format: {DATE_INPUT_FORMAT_VERBOSE}",
     type=click.DateTime(formats=[DATE_INPUT_FORMAT]),
 )
+@stream_option
+@wrap_option
 @json_option
 @click.pass_context
 def models(
@@ -95,6 +114,8 @@ def models(
     search: Optional[str],
     creation_date: datetime,
     publication_date: datetime,
+    stream: bool,
+    wrap: bool,
     json: bool,
 ):
     """Displays list of model details with other options allowing
@@ -107,11 +128,11 @@ def models(
                              DATE_INPUT_FORMAT_VERBOSE
         publication_date (datetime): for filtering by publication date. Format:
                                 DATE_INPUT_FORMAT_VERBOSE
+        stream (bool): Whether to parse the models as they are received
+                       rather than all at once
+        wrap (bool): Whether to wrap long values in the table
         json (bool): whether to print the raw json returned by the DAFNI API
     """
-    model_dict_list = get_all_models(ctx.obj["session"])
-    model_list = parse_models(model_dict_list)
-
     # Apply filtering
     filters = []
     if search:
@@ -121,38 +142,53 @@ def models(
     if publication_date:
         filters.append(publication_date_filter(publication_date))
 
-    filtered_models, filtered_model_dicts = filter_multiple(
-        filters, model_list, model_dict_list
-    )
+    if stream:
+        # Parsed lazily as only the fields shown in the table (or used for
+        # filtering) are needed, without keeping their dictionaries as they
+        # are already yielded for --json
+        filtered = filter_multiple_iter(
+            filters,
+            iter_all_models(ctx.obj["session"]),
+            partial(parse_model, lazy=True, keep_dict=False),
+        )
+        # Only one of these is consumed below
+        filtered_models = (model_inst for model_inst, _ in filtered)
+        filtered_model_dicts = (model_dict for _, model_dict in filtered)
+    else:
+        model_dict_list = get_all_models(ctx.obj["session"])
+        # Parsed lazily as only the fields shown in the table (or used for
+        # filtering) are needed
+        model_list = parse_models(model_dict_list, lazy=True)
+        filtered_models, filtered_model_dicts = filter_multiple(filters, model_list)
 
     # Output
     if json:
-        print_json(filtered_model_dicts)
+        if stream:
+            print_json_list(filtered_model_dicts)
+        else:
+            print_json(filtered_model_dicts)
     else:
-        # Print brief details in a table
-        rows = []
-        for model_inst in filtered_models:
-            rows.append(model_inst.get_brief_details())
-        click.echo(
-            format_table(
-                headers=[
-                    TABLE_NAME_HEADER,
-                    TABLE_VERSION_ID_HEADER,
-                    TABLE_STATUS_HEADER,
-                    TABLE_ACCESS_HEADER,
-                    TABLE_PUBLICATION_DATE_HEADER,
-                    TABLE_SUMMARY_HEADER,
-                ],
-                rows=rows,
-                max_column_widths=[
-                    TABLE_DISPLAY_NAME_MAX_COLUMN_WIDTH,
-                    None,
-                    None,
-                    None,
-                    None,
-                    TABLE_SUMMARY_MAX_COLUMN_WIDTH,
-                ],
-            )
+        # Print brief details in a table, as they are received when streaming
+        print_table(
+            headers=[
+                TABLE_NAME_HEADER,
+                TABLE_VERSION_ID_HEADER,
+                TABLE_STATUS_HEADER,
+                TABLE_ACCESS_HEADER,
+                TABLE_PUBLICATION_DATE_HEADER,
+                TABLE_SUMMARY_HEADER,
+            ],
+            rows=(model_inst.get_brief_details() for model_inst in filtered_models),
+            max_column_widths=[
+                TABLE_DISPLAY_NAME_MAX_COLUMN_WIDTH,
+                None,
+                None,
+                None,
+                None,
+                TABLE_SUMMARY_MAX_COLUMN_WIDTH,
+            ],
+            wrap=wrap,
+            sample_size=TABLE_STREAM_SAMPLE_SIZE if stream else None,
         )
 
 
@@ -164,21 +200,32 @@ def models(
     default=False,
     help="Whether to display the version history of a model instead of the metadata. Default -m",
 )
+@parallel_option(
+    help="Maximum number of models to get at once.", default=PARALLEL_REQUESTS
+)
 @json_option
 @click.pass_context
-def model(ctx: Context, version_id: List[str], version_history: bool, json: bool):
+def model(
+    ctx: Context,
+    version_id: List[str],
+    version_history: bool,
+    parallel: int,
+    json: bool,
+):
     """Displays the metadata for one or more model versions
 
     Args:
         ctx (Context): contains user session for authentication
         version_id (list[str]): List of version IDs of the models to be displayed
         version_history (bool): Whether to display version_history instead of metadata
+        parallel (int): Maximum number of models to get at once
         json (bool): Whether to output raw json from API or pretty print metadata/version history. Defaults to False.
     """
-    for vid in version_id:
-        # Attempt to get the model
-        model_dictionary = cli_get_model(ctx.obj["session"], vid)
-
+    # Get all of the models at once (any that can't be found are reported
+    # together at the end)
+    for model_dictionary in cli_get_models(
+        ctx.obj["session"], version_id, max_workers=parallel
+    ):
         if version_history:
             if json:
                 for version_json in model_dictionary["version_history"]:
@@ -216,6 +263,13 @@ def model(ctx: Context, version_id: List[str], version_history: bool, json: bool
     help=f"Filter for datasets with a end date up to given date. Format: {DATE_INPUT_FORMAT_VERBOSE}",
     type=click.DateTime(formats=[DATE_INPUT_FORMAT]),
 )
+@click.option(
+    "--page-size",
+    default=DATASETS_PAGE_SIZE,
+    show_default=True,
+    help="Number of datasets to request at once.",
+    type=click.IntRange(min=1),
+)
 @json_option
 @click.pass_context
 def datasets(
@@ -223,6 +277,7 @@ def datasets(
     search: Optional[str],
     start_date: Optional[datetime],
     end_date: Optional[datetime],
+    page_size: int,
     json: Optional[bool],
 ):
     """
@@ -236,17 +291,20 @@ def datasets(
                             since given date. Format: DATE_INPUT_FORMAT_VERBOSE
         end_date (Optional[datetime]): Filter for datasets with an end date up
                             to given date. Format: DATE_INPUT_FORMAT_VERBOSE
+        page_size (int): Number of datasets to request at once
         json (Optional[bool]): Whether to output raw json from API or pretty
                                print information. Defaults to False.
     """
     filters = dataset_filtering.process_datasets_filters(search, start_date, end_date)
-    dataset_dict_list = get_all_datasets(ctx.obj["session"], filters)
     if json:
-        print_json(dataset_dict_list)
+        print_json(get_all_datasets(ctx.obj["session"], filters, page_size=page_size))
     else:
-        dataset_list = parse_datasets(dataset_dict_list)
-        for dataset_inst in dataset_list:
-            dataset_inst.output_brief_details()
+        # Output each page as soon as it arrives
+        for dataset_dict_list in iter_dataset_pages(
+            ctx.obj["session"], filters, page_size=page_size
+        ):
+            for dataset_inst in parse_datasets(dataset_dict_list):
+                dataset_inst.output_brief_details()
 
 
 @get.command(help="Display metadata or version history of a particular dataset version")
@@ -322,6 +380,8 @@ def dataset(
     help=f"Filter for workflows published since given date. Format: {DATE_INPUT_FORMAT_VERBOSE}",
     type=click.DateTime(formats=[DATE_INPUT_FORMAT]),
 )
+@stream_option
+@wrap_option
 @json_option
 @click.pass_context
 def workflows(
@@ -329,6 +389,8 @@ def workflows(
     search: Optional[str],
     creation_date: Optional[datetime],
     publication_date: Optional[datetime],
+    stream: bool,
+    wrap: bool,
     json: bool,
 ):
     """
@@ -342,11 +404,11 @@ def workflows(
                                             Format: DATE_INPUT_FORMAT_VERBOSE
         publication_date (Optional[datetime]): For filtering by publication date.
                                             Format: DATE_INPUT_FORMAT_VERBOSE
+        stream (bool): Whether to parse the workflows as they are received
+                       rather than all at once
+        wrap (bool): Whether to wrap long values in the table
         json (bool): whether to print the raw json returned by the DAFNI API
     """
-    workflow_dict_list = get_all_workflows(ctx.obj["session"])
-    workflow_list = parse_workflows(workflow_dict_list)
-
     # Apply filtering
     filters = []
     if search:
@@ -356,34 +418,54 @@ def workflows(
     if publication_date:
         filters.append(publication_date_filter(publication_date))
 
-    filtered_workflows, filtered_workflow_dicts = filter_multiple(
-        filters, workflow_list, workflow_dict_list
-    )
+    if stream:
+        # Parsed lazily as only the fields shown in the table (or used for
+        # filtering) are needed, without keeping their dictionaries as they
+        # are already yielded for --json
+        filtered = filter_multiple_iter(
+            filters,
+            iter_all_workflows(ctx.obj["session"]),
+            partial(parse_workflow, lazy=True, keep_dict=False),
+        )
+        # Only one of these is consumed below
+        filtered_workflows = (workflow_inst for workflow_inst, _ in filtered)
+        filtered_workflow_dicts = (workflow_dict for _, workflow_dict in filtered)
+    else:
+        workflow_dict_list = get_all_workflows(ctx.obj["session"])
+        # Parsed lazily as only the fields shown in the table (or used for
+        # filtering) are needed
+        workflow_list = parse_workflows(workflow_dict_list, lazy=True)
+        filtered_workflows, filtered_workflow_dicts = filter_multiple(
+            filters, workflow_list
+        )
 
     # Output
     if json:
-        print_json(filtered_workflow_dicts)
+        if stream:
+            print_json_list(filtered_workflow_dicts)
+        else:
+            print_json(filtered_workflow_dicts)
     else:
-        # Print brief details in a table
-        rows = []
-        for workflow_inst in filtered_workflows:
-            rows.append(workflow_inst.get_brief_details())
-        click.echo(
-            format_table(
-                headers=[
-                    TABLE_NAME_HEADER,
-                    TABLE_VERSION_ID_HEADER,
-                    TABLE_PUBLICATION_DATE_HEADER,
-                    TABLE_SUMMARY_HEADER,
-                ],
-                rows=rows,
-                max_column_widths=[
-                    TABLE_DISPLAY_NAME_MAX_COLUMN_WIDTH,
-                    None,
-                    None,
-                    TABLE_SUMMARY_MAX_COLUMN_WIDTH,
-                ],
-            )
+        # Print brief details in a table, as they are received when streaming
+        print_table(
+            headers=[
+                TABLE_NAME_HEADER,
+                TABLE_VERSION_ID_HEADER,
+                TABLE_PUBLICATION_DATE_HEADER,
+                TABLE_SUMMARY_HEADER,
+            ],
+            rows=(
+                workflow_inst.get_brief_details()
+                for workflow_inst in filtered_workflows
+            ),
+            max_column_widths=[
+                TABLE_DISPLAY_NAME_MAX_COLUMN_WIDTH,
+                None,
+                None,
+                TABLE_SUMMARY_MAX_COLUMN_WIDTH,
+            ],
+            wrap=wrap,
+            sample_size=TABLE_STREAM_SAMPLE_SIZE if stream else None,
         )
 
 
@@ -395,9 +477,18 @@ def workflows(
     default=False,
     help="Whether to display the version history of a workflow instead of the metadata. Default -m",
 )
+@parallel_option(
+    help="Maximum number of workflows to get at once.", default=PARALLEL_REQUESTS
+)
 @json_option
 @click.pass_context
-def workflow(ctx: Context, version_id: List[str], version_history: bool, json: bool):
+def workflow(
+    ctx: Context,
+    version_id: List[str],
+    version_history: bool,
+    parallel: int,
+    json: bool,
+):
     """
     Displays the metadata for a workflow, for one or more versions of that workflow
     from its version history.
@@ -406,12 +497,14 @@ def workflow(ctx: Context, version_id: List[str], version_history: bool, json: b
         ctx (Context): contains user session for authentication
         version_id (list[str]): List of version IDs of the workflows to be displayed
         version_history (bool): Whether to display version_history instead of metadata
+        parallel (int): Maximum number of workflows to get at once
         json (bool): Whether to output raw json from API or pretty print metadata/version history. Defaults to False.
     """
-    for vid in version_id:
-        # Attempt to get the workflow
-        workflow_dictionary = cli_get_workflow(ctx.obj["session"], vid)
-
+    # Get all of the workflows at once (any that can't be found are reported
+    # together at the end)
+    for workflow_dictionary in cli_get_workflows(
+        ctx.obj["session"], version_id, max_workers=parallel
+    ):
         if version_history:
             if json:
                 for version_json in workflow_dictionary["version_history"]:
@@ -453,6 +546,7 @@ def workflow(ctx: Context, version_id: List[str], version_history: bool, json: b
 @filter_flag_option("--omitted", help="Filters instances with an 'Omitted' status.")
 @filter_flag_option("--pending", help="Filters instances with a 'Pending' status.")
 @filter_flag_option("--running", help="Filters instances with a 'Running' status.")
+@wrap_option
 @json_option
 @click.pass_context
 def workflow_instances(
@@ -467,6 +561,7 @@ def workflow_instances(
     pending: bool,
     running: bool,
     succeeded: bool,
+    wrap: bool,
     json: bool,
 ):
     """Display attributes of all workflows instances for a particular workflow
@@ -487,6 +582,7 @@ def workflow_instances(
         error (bool): Whether to filter instances with an error status
         running (bool): Whether to filter instances with a running status
         succeeded (bool): Whether to filter instances with a successful status
+        wrap (bool): Whether to wrap long values in the table
         json (bool): Whether to print the raw json returned by the DAFNI API
     """
     workflow_dict = cli_get_workflow(ctx.obj["session"], version_id)
@@ -514,30 +610,29 @@ def workflow_instances(
         filters.append(status_filter("Succeeded"))
 
     filtered_instances, filtered_instance_dicts = filter_multiple(
-        filters, workflow_inst.instances, workflow_dict["instances"]
+        filters, workflow_inst.instances
     )
 
     # Output
     if json:
         print_json(filtered_instance_dicts)
     else:
-        click.echo(
-            format_table(
-                headers=[
-                    TABLE_ID_HEADER,
-                    TABLE_WORKFLOW_VERSION_ID_HEADER,
-                    TABLE_PARAMETER_SET_HEADER,
-                    TABLE_STARTED_HEADER,
-                    TABLE_FINISHED_HEADER,
-                    TABLE_STATUS_HEADER,
-                ],
-                rows=[
-                    instance.get_brief_details()
-                    for instance in sorted(
-                        filtered_instances, key=lambda inst: inst.finished_time
-                    )
-                ],
-            )
+        print_table(
+            headers=[
+                TABLE_ID_HEADER,
+                TABLE_WORKFLOW_VERSION_ID_HEADER,
+                TABLE_PARAMETER_SET_HEADER,
+                TABLE_STARTED_HEADER,
+                TABLE_FINISHED_HEADER,
+                TABLE_STATUS_HEADER,
+            ],
+            rows=(
+                instance.get_brief_details()
+                for instance in sorted(
+                    filtered_instances, key=lambda inst: inst.finished_time
+                )
+            ),
+            wrap=wrap,
         )
 
 
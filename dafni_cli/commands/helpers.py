@@ -1,5 +1,6 @@
 import fnmatch
-from typing import List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterator, List, Optional, Tuple
 
 import click
 
@@ -29,6 +30,65 @@ def cli_get_model(session: DAFNISession, version_id: str) -> dict:
         raise SystemExit(1) from err
 
 
+def _cli_get_many(
+    session: DAFNISession,
+    get_function: Callable[[DAFNISession, str], dict],
+    version_ids: List[str],
+    max_workers: int,
+) -> Iterator[dict]:
+    """Gets several entities at once, yielding them in the order of the
+    given version ids as they become available and then printing nice CLI
+    error messages for any that weren't found
+
+    Args:
+        session (DAFNISession): DAFNISession
+        get_function (Callable[[DAFNISession, str], dict]): Function to get
+                                 each entity with e.g. get_model
+        version_ids (List[str]): Version ids of the entities to get
+        max_workers (int): Maximum number of requests to send at once
+    """
+
+    def get_entity(version_id: str):
+        try:
+            return get_function(session, version_id)
+        except ResourceNotFoundError as err:
+            return err
+
+    errors = []
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        try:
+            for result in executor.map(get_entity, version_ids):
+                if isinstance(result, ResourceNotFoundError):
+                    errors.append(result)
+                else:
+                    yield result
+        except BaseException:
+            # Don't send any more requests when one has failed
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+
+    if errors:
+        for error in errors:
+            click.echo(error)
+        raise SystemExit(1)
+
+
+def cli_get_models(
+    session: DAFNISession, version_ids: List[str], max_workers: int
+) -> Iterator[dict]:
+    """Attempts to get several models from their version ids at once,
+    yielding each in the order given and then printing nice CLI error
+    messages for any that weren't found
+
+    Args:
+        session (DAFNISession): DAFNISession
+        version_ids (List[str]): Model version ids
+        max_workers (int): Maximum number of requests to send at once
+    """
+
+    return _cli_get_many(session, get_model, version_ids, max_workers)
+
+
 def cli_get_latest_dataset_metadata(session: DAFNISession, version_id: str) -> dict:
     """Attempts to get a dataset's metadata from a version id with a nice CLI
     error message if it's not found
@@ -45,6 +105,22 @@ def cli_get_latest_dataset_metadata(session: DAFNISession, version_id: str) -> d
         raise SystemExit(1) from err
 
 
+def cli_get_latest_datasets_metadata(
+    session: DAFNISession, version_ids: List[str], max_workers: int
+) -> Iterator[dict]:
+    """Attempts to get several datasets' metadata from their version ids at
+    once, yielding each in the order given and then printing nice CLI error
+    messages for any that weren't found
+
+    Args:
+        session (DAFNISession): DAFNISession
+        version_ids (List[str]): Dataset version ids
+        max_workers (int): Maximum number of requests to send at once
+    """
+
+    return _cli_get_many(session, get_latest_dataset_metadata, version_ids, max_workers)
+
+
 def cli_select_dataset_files(
     dataset_metadata: DatasetMetadata,
     files: Optional[List[str]],
@@ -87,6 +163,22 @@ def cli_get_workflow(session: DAFNISession, version_id: str) -> dict:
         raise SystemExit(1) from err
 
 
+def cli_get_workflows(
+    session: DAFNISession, version_ids: List[str], max_workers: int
+) -> Iterator[dict]:
+    """Attempts to get several workflows from their version ids at once,
+    yielding each in the order given and then printing nice CLI error
+    messages for any that weren't found
+
+    Args:
+        session (DAFNISession): DAFNISession
+        version_ids (List[str]): Workflow version ids
+        max_workers (int): Maximum number of requests to send at once
+    """
+
+    return _cli_get_many(session, get_workflow, version_ids, max_workers)
+
+
 def cli_get_workflow_instance(session: DAFNISession, instance_id: str) -> dict:
     """Attempts to get a workflow instance from an instance id with a nice CLI
     error message if it's not found
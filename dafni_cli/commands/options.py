@@ -291,6 +291,31 @@ def filter_flag_option(*param_decls: str, help: str):
     return decorator
 
 
+def parallel_option(help: str, default: int = 1):
+    """Decorator function for adding a --parallel click option for the
+    maximum number of files to transfer or requests to send at once
+
+    Option will be named 'parallel' and will be an integer >= 1
+
+    Args:
+        help (str): Help text to pass to click.option
+        default (int): Default value (one at a time unless given)
+    """
+
+    def decorator(function):
+        function = click.option(
+            "--parallel",
+            type=click.IntRange(min=1),
+            default=default,
+            show_default=True,
+            help=help,
+        )(function)
+
+        return function
+
+    return decorator
+
+
 def json_option(function):
     """Decorator function for adding a --json click option for printing
     json output
@@ -308,6 +333,38 @@ def json_option(function):
     return function
 
 
+def stream_option(function):
+    """Decorator function for adding a --stream click option for parsing a
+    list response as it is received rather than all at once
+
+    Flag will be named 'stream' and will be True or False
+    """
+    function = click.option(
+        "--stream",
+        is_flag=True,
+        default=False,
+        help="Parse the list as it is received rather than all at once. Uses less memory for long lists, but the list is never cached.",
+        type=bool,
+    )(function)
+
+    return function
+
+
+def wrap_option(function):
+    """Decorator function for adding a --wrap/--no-wrap click option for
+    choosing whether to wrap long values in a table
+
+    Flag will be named 'wrap' and will be True or False
+    """
+    function = click.option(
+        "--wrap/--no-wrap",
+        default=True,
+        help="Whether to wrap long values in the table onto multiple lines. --no-wrap keeps each row on a single line and is faster for long lists. Default --wrap",
+    )(function)
+
+    return function
+
+
 def confirmation_skip_option(function):
     """Decorator function for adding a -y click option for skipping
     any confirmation prompts
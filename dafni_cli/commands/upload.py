@@ -12,11 +12,14 @@ from dafni_cli.commands.options import (
     confirmation_skip_option,
     dataset_metadata_common_options,
     json_option,
+    parallel_option,
 )
 from dafni_cli.datasets.dataset_metadata import parse_dataset_metadata
 from dafni_cli.datasets.dataset_upload import (
+    diff_dataset_files,
     modify_dataset_metadata_for_upload,
     parse_file_names_from_paths,
+    print_dataset_version_diff,
     upload_dataset,
     upload_dataset_metadata_version,
 )
@@ -37,7 +40,11 @@ def upload(ctx: Context):
         ctx (Context): Context containing the user session.
     """
     ctx.ensure_object(dict)
-    ctx.obj["session"] = DAFNISession()
+    # Anything used to decide what to change is checked with DAFNI first
+    ctx.obj["session"] = DAFNISession(
+        use_response_cache=ctx.obj.get("use_response_cache", True),
+        revalidate_response_cache=True,
+    )
 
 
 ###############################################################################
@@ -140,6 +147,19 @@ WILDCARD_HELP_TEXT = (
     required=True,
     type=click.Path(exists=True, path_type=Path),
 )
+@parallel_option(help="Maximum number of files to upload at once.")
+@click.option(
+    "--journal",
+    type=click.Path(exists=False, dir_okay=False, path_type=Path),
+    default=None,
+    help="When given will record the files uploaded in a journal saved to the specified file (which must not already exist), and keep them if the upload fails so it can be resumed using --resume.",
+)
+@click.option(
+    "--resume",
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+    default=None,
+    help="Journal saved by a previous failed upload using --journal. The same files must be given, and only those that were not uploaded (or have been modified since) will be uploaded.",
+)
 @confirmation_skip_option
 @json_option
 @click.pass_context
@@ -147,6 +167,9 @@ def dataset(
     ctx: Context,
     metadata_path: Path,
     paths: List[Path],
+    parallel: int,
+    journal: Optional[Path],
+    resume: Optional[Path],
     yes: bool,
     json: bool,
 ):
@@ -156,14 +179,29 @@ def dataset(
         ctx (Context): contains user session for authentication
         metadata_path (Path): Dataset metadata file path
         paths (List[Path]): Dataset file/folder paths
+        parallel (int): Maximum number of files to upload at once
+        journal (Optional[Path]): Path to save a journal of the uploaded files
+                                  to, allowing a failed upload to be resumed
+        resume (Optional[Path]): Path of a journal saved by a previous failed
+                                 upload to resume
         yes (bool): Used to skip confirmations before they are displayed
         json (bool): Whether to print the raw json returned by the DAFNI API
     """
+    if journal is not None and resume is not None:
+        raise click.UsageError("Only one of --journal and --resume may be given")
+    if journal is not None and journal.exists():
+        raise click.UsageError(
+            f"The journal '{journal}' already exists, use --resume to resume the "
+            "upload it records"
+        )
+
     # Confirm upload details
     arguments = [("Dataset metadata file path", metadata_path)] + [
         ("Dataset file name", file_name)
         for file_name in parse_file_names_from_paths(paths).keys()
     ]
+    if resume is not None:
+        arguments.append(("Resuming from journal", resume))
     confirmation_message = "Confirm dataset upload?"
     argument_confirmation(arguments, confirmation_message, skip=yes or json)
 
@@ -172,7 +210,15 @@ def dataset(
         metadata = json_lib.load(metadata_file)
 
     # Upload the dataset
-    upload_dataset(ctx.obj["session"], metadata, paths, json=json)
+    upload_dataset(
+        ctx.obj["session"],
+        metadata,
+        paths,
+        json=json,
+        max_workers=parallel,
+        journal_path=resume or journal,
+        resume=resume is not None,
+    )
 
 
 ###############################################################################
@@ -200,6 +246,13 @@ def dataset(
     help="When given will only save the existing metadata to the specified file allowing it to be modified.",
 )
 @dataset_metadata_common_options(all_optional=True)
+@parallel_option(help="Maximum number of files to upload at once.")
+@click.option(
+    "--diff",
+    is_flag=True,
+    default=False,
+    help="Compare the files against those in the existing version and display the changes before uploading. All of the files are still re-uploaded, as DAFNI can't reuse files from an existing version, unless neither the files nor the metadata have changed in which case no new version is created.",
+)
 @confirmation_skip_option
 @json_option
 @click.pass_context
@@ -232,6 +285,8 @@ def dataset_version(
     funding: Optional[str],
     project: Optional[Tuple[str, str]],
     version_message: Optional[str],
+    parallel: int,
+    diff: bool,
     yes: bool,
     json: bool,
 ):
@@ -244,6 +299,10 @@ def dataset_version(
         paths (List[Path]): Dataset file/folder paths
         metadata (Optional[Path]): Dataset metadata file
         save (Optional[Path]): Path to save existing metadata in for editing
+        parallel (int): Maximum number of files to upload at once
+        diff (bool): Whether to compare the files against those in the
+                     existing version before uploading, skipping the upload
+                     when neither they nor the metadata have changed
         yes (bool): Used to skip confirmations before they are displayed
         json (bool): Whether to print the raw json returned by the DAFNI API
 
@@ -254,14 +313,14 @@ def dataset_version(
     # dataset id for the actual upload - instead of requiring both, we look up
     # dataset with the version_id here and obtain both the id and existing
     # metadata once
-    dataset_metadata_dict = cli_get_latest_dataset_metadata(
+    existing_dataset_metadata_dict = cli_get_latest_dataset_metadata(
         ctx.obj["session"], existing_version_id
     )
-    dataset_metadata_obj = parse_dataset_metadata(dataset_metadata_dict)
+    dataset_metadata_obj = parse_dataset_metadata(existing_dataset_metadata_dict)
 
     # Load/modify the existing metadata according to the user input
     dataset_metadata_dict = modify_dataset_metadata_for_upload(
-        existing_metadata=dataset_metadata_dict,
+        existing_metadata=existing_dataset_metadata_dict,
         metadata_path=metadata,
         title=title,
         description=description,
@@ -294,15 +353,45 @@ def dataset_version(
 
         click.echo(f"Saved existing dataset metadata to {save}")
     else:
-        # Confirm upload details
+        file_names_and_paths = parse_file_names_from_paths(paths)
+
+        if diff:
+            version_diff = diff_dataset_files(
+                dataset_metadata_obj.files, file_names_and_paths
+            )
+            if not json:
+                print_dataset_version_diff(version_diff)
+            if not version_diff.has_changes:
+                # Only skip the upload if it wouldn't change the metadata
+                # either
+                if dataset_metadata_dict == modify_dataset_metadata_for_upload(
+                    existing_metadata=existing_dataset_metadata_dict
+                ):
+                    click.echo(
+                        "The files and metadata are the same as those in the "
+                        "existing version, so no new version has been uploaded",
+                        err=json,
+                    )
+                    return
+                if not json:
+                    click.echo(
+                        "Only the metadata has changed, but all of the files "
+                        "will still be uploaded. To update just the metadata "
+                        "use 'dafni upload dataset-metadata' instead."
+                    )
+
+        # Confirm upload details (when comparing against the existing version
+        # the changes have already been displayed instead of every file)
         arguments = [
             ("Dataset Title", dataset_metadata_obj.title),
             ("Dataset ID", dataset_metadata_obj.dataset_id),
             ("Dataset Version ID", dataset_metadata_obj.version_id),
-        ] + [
-            ("Dataset file name", filename)
-            for filename in parse_file_names_from_paths(paths).keys()
         ]
+        if not diff:
+            arguments += [
+                ("Dataset file name", filename)
+                for filename in file_names_and_paths.keys()
+            ]
 
         if metadata:
             arguments.append(("Dataset metadata file path", metadata))
@@ -317,6 +406,7 @@ def dataset_version(
             metadata=dataset_metadata_dict,
             paths=paths,
             json=json,
+            max_workers=parallel,
         )
 
 
@@ -389,14 +479,14 @@ def dataset_metadata(
     # dataset id for the actual upload - instead of requiring both, we look up
     # dataset with the version_id here and obtain both the id and existing
     # metadata once
-    dataset_metadata_dict = cli_get_latest_dataset_metadata(
+    existing_dataset_metadata_dict = cli_get_latest_dataset_metadata(
         ctx.obj["session"], existing_version_id
     )
-    dataset_metadata_obj = parse_dataset_metadata(dataset_metadata_dict)
+    dataset_metadata_obj = parse_dataset_metadata(existing_dataset_metadata_dict)
 
     # Load/modify the existing metadata according to the user input
     dataset_metadata_dict = modify_dataset_metadata_for_upload(
-        existing_metadata=dataset_metadata_dict,
+        existing_metadata=existing_dataset_metadata_dict,
         metadata_path=metadata,
         title=title,
         description=description,
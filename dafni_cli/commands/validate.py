@@ -24,7 +24,11 @@ def validate(ctx: Context):
         yes (bool): Used to skip confirmations before they are displayed
     """
     ctx.ensure_object(dict)
-    ctx.obj["session"] = DAFNISession()
+    # Anything used to decide what to change is checked with DAFNI first
+    ctx.obj["session"] = DAFNISession(
+        use_response_cache=ctx.obj.get("use_response_cache", True),
+        revalidate_response_cache=True,
+    )
 
 
 ###############################################################################
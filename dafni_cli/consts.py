@@ -33,12 +33,38 @@ LOGOUT_API_ENDPOINT = (
 
 # Authentication
 SESSION_SAVE_FILE = ".dafni-cli"
+# Lock held while modifying SESSION_SAVE_FILE (stored alongside it)
+SESSION_LOCK_FILE = ".dafni-cli.lock"
 SESSION_COOKIE = "__Secure-dafni"
 
+# Local cache of responses from GET requests (stored alongside
+# SESSION_SAVE_FILE in the home directory)
+RESPONSE_CACHE_DIR = ".dafni-cli-cache"
+# Time to keep responses that may change e.g. lists of models (seconds)
+RESPONSE_CACHE_TTL = 5 * 60
+# Maximum total size of the cache before the least recently used responses
+# are removed (bytes)
+RESPONSE_CACHE_MAX_SIZE = 100 * 1024 * 1024  # 100 MB
+# Groups of cached responses that are removed together whenever anything in
+# them may have changed e.g. uploading a new version of a model changes the
+# version history of all of its other versions
+MODELS_CACHE_GROUP = "models"
+WORKFLOWS_CACHE_GROUP = "workflows"
+DATASETS_CACHE_GROUP = "datasets"
+
 # Time before a token expires that we should refresh the token regardless
 # of any authentication errors (seconds) - 60 matches VueKeyCloak
 TOKEN_EXPIRE_OFFSET = 60
 
+# Longest time the background token refresher waits before checking again
+# whether the tokens need refreshing, in case they have been refreshed
+# elsewhere (seconds)
+TOKEN_REFRESH_CHECK_INTERVAL = 60
+
+# Time the background token refresher waits before trying again after
+# failing to refresh the tokens (seconds)
+TOKEN_REFRESH_RETRY_WAIT = 10
+
 # Content types
 MINIO_UPLOAD_CT = "multipart/form-data"
 VALIDATE_MODEL_CT = "application/yaml"
@@ -105,6 +131,10 @@ TABLE_DESCRIPTION_MAX_COLUMN_WIDTH = 80
 TABLE_DISPLAY_NAME_MAX_COLUMN_WIDTH = 40
 TABLE_SUMMARY_MAX_COLUMN_WIDTH = 60
 
+# Number of rows used to find the column widths of a table that is printed
+# as its rows are received (see utils.iter_table)
+TABLE_STREAM_SAMPLE_SIZE = 1000
+
 
 CONSOLE_WIDTH = 120
 
@@ -118,16 +148,99 @@ TAB_SPACE = "    "
 # small enough to fit in memory and give a reasonable loading bar scale
 DOWNLOAD_CHUNK_SIZE = 1024 * 1024  # 1 MB
 
+# Size of the blocks files are read and sent in when uploading (in bytes)
+# Large enough to avoid a large number of small reads and progress bar updates
+# for large files (the default used by urllib3 is 16 KB)
+UPLOAD_CHUNK_SIZE = 1024 * 1024  # 1 MB
+
+# Suffixes given to files while they are being downloaded (the partially
+# downloaded file, and a state file allowing the download to be resumed later
+# if interrupted)
+DOWNLOAD_PART_FILE_SUFFIX = ".part"
+DOWNLOAD_STATE_FILE_SUFFIX = ".part.json"
+
+# Minimum size of each byte range when downloading a single file in multiple
+# ranges at once (smaller files are downloaded using fewer ranges)
+DOWNLOAD_SEGMENT_MIN_SIZE = 64 * 1024 * 1024  # 64 MB
+
+# Size of the blocks long list responses are read and parsed in when
+# streaming them (in bytes)
+JSON_STREAM_CHUNK_SIZE = 64 * 1024  # 64 KB
+
+# Number of recently parsed timestamps to remember, as the same ones often
+# appear many times in a listing (e.g. those of a shared parent or version)
+DATETIME_CACHE_SIZE = 4096
+
+# Size of the blocks files are read in when computing their checksums to
+# compare them against those of dataset files (in bytes)
+CHECKSUM_CHUNK_SIZE = 1024 * 1024  # 1 MB
+
 # Maximum number of times to retry requests that have failed due to an error
 REQUEST_ERROR_RETRY_ATTEMPTS = 3
 
-# Time to wait between retry attempts when an error occurs during a
-# request (seconds)
+# Maximum time to wait before the first retry when an error occurs during a
+# request (seconds) - this doubles after each attempt up to
+# REQUEST_RETRY_MAX_WAIT, and the actual time is chosen at random up to it
 REQUEST_ERROR_RETRY_WAIT = 1
+REQUEST_RETRY_MAX_WAIT = 30
+
+# Response status codes that requests are retried after (unless a
+# Retry-After header says otherwise, waiting in the same way as for errors)
+REQUEST_RETRY_STATUS_CODES = (429, 502, 503, 504)
+
+# Response status codes that non-idempotent requests (e.g. POST) are retried
+# after - only those saying the request wasn't processed, as one that fails
+# with a 502 or 504 may still have been carried out
+REQUEST_RETRY_NON_IDEMPOTENT_STATUS_CODES = (429, 503)
+
+# Limits the retries made by a session to this many per request sent, plus a
+# reserve that allows a few retries before many requests have been sent
+REQUEST_RETRY_BUDGET_RATIO = 0.2
+REQUEST_RETRY_BUDGET_RESERVE = 10
 
 # Sets whether certificates need validating for the request
 VERIFY = True
 
+# Connection pooling for requests sent through a DAFNISession - the number of
+# hosts to keep pools of connections for (one for each of NIMS, NID, SnD, DSS
+# and MinIO), and the maximum number of connections to keep alive per host
+REQUESTS_POOL_CONNECTIONS = 10
+REQUESTS_POOL_MAXSIZE = 10
+
+# Limits on the requests sent through a DAFNISession to each DAFNI service
+# (shared by all threads using the session) - the average number of requests
+# started per second, the number that may be started at once after being
+# idle, and the maximum number waiting for a response at once
+REQUEST_RATE_LIMITS = {
+    base_url: {"requests_per_second": 20, "burst": 20, "max_in_flight": 10}
+    for base_url in [
+        DSS_API_URL,
+        NIMS_API_URL,
+        NID_API_URL,
+        SEARCH_AND_DISCOVERY_API_URL,
+    ]
+}
+# Limits applied to each other host e.g. MinIO (allowing more in flight for
+# large numbers of file uploads or downloads at once)
+REQUEST_RATE_LIMIT_DEFAULT = {
+    "requests_per_second": 20,
+    "burst": 20,
+    "max_in_flight": 32,
+}
+
+# Maximum number of connections to open at once when downloading a dataset
+# (one for each byte range of each file being downloaded). This is kept within
+# the number allowed in flight to MinIO, as each file being downloaded in
+# ranges holds on to its first while waiting for the rest.
+DOWNLOAD_MAX_CONNECTIONS = REQUEST_RATE_LIMIT_DEFAULT["max_in_flight"]
+
+# Default maximum number of requests to send at once when given several
+# version ids e.g. in 'dafni get model' or 'dafni delete model-version'
+PARALLEL_REQUESTS = REQUESTS_POOL_MAXSIZE
+
+# Default maximum number of requests an AsyncDAFNISession has in flight at once
+ASYNC_MAX_CONCURRENCY = 10
+
 # Number of upload attempts to make when there is a problem during dataset upload
 DATASET_UPLOAD_FILE_RETRY_ATTEMPTS = 3
 
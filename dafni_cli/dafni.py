@@ -1,4 +1,5 @@
 import click
+from click import Context
 
 from dafni_cli.commands.create import create
 from dafni_cli.commands.delete import delete
@@ -10,10 +11,24 @@ from dafni_cli.commands.validate import validate
 from dafni_cli.version import DAFNI_CLI_VERSION
 
 
-@click.group()
+@click.group(help="DAFNI CLI")
 @click.version_option(version=DAFNI_CLI_VERSION)
-def dafni():
-    pass
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    default=False,
+    help="Don't use or update the local cache of responses from DAFNI.",
+)
+@click.pass_context
+def dafni(ctx: Context, no_cache: bool):
+    """DAFNI CLI
+
+    Args:
+        ctx (Context): CLI context
+        no_cache (bool): Whether to avoid using the local cache of responses
+    """
+    ctx.ensure_object(dict)
+    ctx.obj["use_response_cache"] = not no_cache
 
 
 dafni.add_command(login)
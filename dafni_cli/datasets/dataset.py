@@ -9,7 +9,7 @@ from dafni_cli.consts import CONSOLE_WIDTH, TAB_SPACE
 from dafni_cli.utils import format_data_format, format_datetime, prose_print
 
 
-@dataclass
+@dataclass(slots=True)
 class Dataset(ParserBaseObject):
     """Dataclass representing a DAFNI dataset (As returned from the catalogue)
 
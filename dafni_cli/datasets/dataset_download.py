@@ -1,20 +1,476 @@
+import json
+import math
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 import click
+import requests
 from tqdm import tqdm
 
+from dafni_cli.api.exceptions import DAFNIError
 from dafni_cli.api.minio_api import minio_get_request
 from dafni_cli.api.session import DAFNISession
-from dafni_cli.consts import DOWNLOAD_CHUNK_SIZE
+from dafni_cli.consts import (
+    DOWNLOAD_CHUNK_SIZE,
+    DOWNLOAD_MAX_CONNECTIONS,
+    DOWNLOAD_PART_FILE_SUFFIX,
+    DOWNLOAD_SEGMENT_MIN_SIZE,
+    DOWNLOAD_STATE_FILE_SUFFIX,
+)
 from dafni_cli.datasets.dataset_metadata import DataFile
-from dafni_cli.utils import OverallFileProgressBar
+from dafni_cli.utils import (
+    OverallFileProgressBar,
+    ProgressBarPositions,
+    create_file_progress_bar,
+    format_file_size,
+)
+
+
+def _is_range_not_satisfiable(err: Exception) -> bool:
+    """Returns whether an error raised by a request was due to a 416 (Range
+    Not Satisfiable) response
+
+    Args:
+        err (Exception): Error raised by DAFNISession.get_request
+
+    Returns:
+        bool: Whether the error was caused by a 416 response
+    """
+    # DAFNIError's are raised from the original HTTPError
+    http_error = err if isinstance(err, requests.HTTPError) else err.__cause__
+    return (
+        isinstance(http_error, requests.HTTPError)
+        and http_error.response is not None
+        and http_error.response.status_code == 416
+    )
+
+
+def _get_download_state_paths(file_save_path: Path) -> Tuple[Path, Path]:
+    """Returns the paths of the files used while downloading a file
+
+    Args:
+        file_save_path (Path): Path the file will be saved to once downloaded
+
+    Returns:
+        Path: Path of the partially downloaded file
+        Path: Path of the state file for resuming the download
+    """
+    return (
+        file_save_path.with_name(file_save_path.name + DOWNLOAD_PART_FILE_SUFFIX),
+        file_save_path.with_name(file_save_path.name + DOWNLOAD_STATE_FILE_SUFFIX),
+    )
+
+
+def _load_download_state(state_path: Path, file: DataFile) -> Optional[dict]:
+    """Loads the state of a previously interrupted download of a file
+
+    Args:
+        state_path (Path): Path of the state file
+        file (DataFile): The file being downloaded
+
+    Returns:
+        Optional[dict]: The saved state, or None if there isn't one or it
+                        belongs to a different file
+    """
+    try:
+        state = json.loads(state_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+    if not isinstance(state, dict) or state.get("name") != file.name:
+        return None
+    return state
+
+
+def _save_download_state(
+    state_path: Path, file: DataFile, download_response: requests.Response
+):
+    """Saves the state needed to resume the download of a file later
+
+    Args:
+        state_path (Path): Path of the state file
+        file (DataFile): The file being downloaded
+        download_response (requests.Response): Response of the request
+                                    downloading the whole file
+    """
+    state_path.write_text(
+        json.dumps(
+            {
+                "name": file.name,
+                "size": int(download_response.headers.get("content-length", 0)),
+                # Used in an If-Range header when resuming so that the whole
+                # file is downloaded again if it has changed since
+                "validator": download_response.headers.get("ETag")
+                or download_response.headers.get("Last-Modified"),
+            }
+        ),
+        encoding="utf-8",
+    )
+
+
+def _download_file(
+    session: DAFNISession,
+    file: DataFile,
+    directory: Path,
+    progress_bar_position: Optional[int] = None,
+) -> int:
+    """Downloads a single file from a dataset
+
+    The file is first downloaded to a '.part' file alongside a small state
+    file. If the download is interrupted, calling this again will continue
+    from the last byte written using a Range request, falling back to
+    downloading the whole file again if the server ignores it. Any '.part'
+    file without a state file, larger than the file's recorded size or that
+    the server can't continue from (416) is discarded and the whole file is
+    downloaded again.
+
+    Args:
+        session (DAFNISession): User session
+        file (DataFile): The file to download
+        directory (Path): Directory to download the file to
+        progress_bar_position (Optional[int]): Line to display the progress
+                                    bar on when downloading multiple files at
+                                    once
+
+    Returns:
+        int: Size of the downloaded file
+    """
+    file_save_path = directory / file.name
+    file_save_path.parent.mkdir(exist_ok=True, parents=True)
+    part_path, state_path = _get_download_state_paths(file_save_path)
+
+    # Check for a previously interrupted download
+    resume_from = 0
+    state = _load_download_state(state_path, file)
+    if part_path.exists():
+        resume_from = part_path.stat().st_size
+        # Can't tell what any data without a state belongs to, and can't
+        # continue from beyond the end of the file
+        size = 0 if state is None else state.get("size", 0)
+        if state is None or 0 < size < resume_from:
+            _discard_download(part_path, state_path)
+            state = None
+            resume_from = 0
+
+    # May have been interrupted after downloading everything but before
+    # moving into place
+    already_downloaded = state is not None and 0 < state.get("size", 0) <= resume_from
+
+    if not already_downloaded:
+        headers = {}
+        if resume_from > 0:
+            headers["Range"] = f"bytes={resume_from}-"
+            if state.get("validator") is not None:
+                headers["If-Range"] = state["validator"]
+
+        # Stream the file download
+        try:
+            response = minio_get_request(
+                session, file.download_url, stream=True, headers=headers
+            )
+        except (requests.HTTPError, DAFNIError) as err:
+            if resume_from == 0 or not _is_range_not_satisfiable(err):
+                raise
+            # The data already downloaded doesn't fit the file e.g. it has
+            # since been replaced by a smaller one
+            _discard_download(part_path, state_path)
+            resume_from = 0
+            response = minio_get_request(
+                session, file.download_url, stream=True, headers={}
+            )
+
+        with response as download_response:
+            # Full file size
+            file_size = int(download_response.headers.get("content-length", 0))
+
+            if resume_from > 0 and download_response.status_code == 206:
+                # Continue on from the existing data
+                file_size += resume_from
+                mode = "ab"
+            else:
+                # Either a new download or the server has ignored the Range
+                # header and is sending the whole file
+                resume_from = 0
+                mode = "wb"
+                _save_download_state(state_path, file, download_response)
+
+            with open(part_path, mode) as original_file:
+                # Allow tqdm to handle the progress bar based on the data saved
+                with tqdm.wrapattr(
+                    original_file,
+                    "write",
+                    desc=file.name,
+                    miniters=1,
+                    total=file_size,
+                    initial=resume_from,
+                    position=progress_bar_position,
+                    leave=progress_bar_position is None,
+                ) as save_file:
+                    # Download and save file in chunks
+                    for chunk in download_response.iter_content(
+                        chunk_size=DOWNLOAD_CHUNK_SIZE
+                    ):
+                        save_file.write(chunk)
+
+    # Completed, so move into place and remove the state
+    file_size = part_path.stat().st_size
+    part_path.replace(file_save_path)
+    state_path.unlink(missing_ok=True)
+
+    return file_size
+
+
+def _discard_download(part_path: Path, state_path: Path):
+    """Removes the files left behind by an interrupted download so that it
+    starts again from the beginning
+
+    Args:
+        part_path (Path): Path of the partially downloaded file
+        state_path (Path): Path of the state file for resuming the download
+    """
+    part_path.unlink(missing_ok=True)
+    state_path.unlink(missing_ok=True)
+
+
+def _plan_segments(start: int, end: int, segments: int) -> List[Tuple[int, int]]:
+    """Splits a range of bytes into roughly equal segments
+
+    Args:
+        start (int): First byte of the range
+        end (int): Last byte of the range (inclusive)
+        segments (int): Number of segments to split the range into
+
+    Returns:
+        List[Tuple[int, int]]: First and last bytes (inclusive) of each
+                               segment
+    """
+    segment_size = max(1, math.ceil((end - start + 1) / segments))
+    return [
+        (segment_start, min(segment_start + segment_size, end + 1) - 1)
+        for segment_start in range(start, end + 1, segment_size)
+    ]
+
+
+def _parse_content_range(
+    download_response: requests.Response,
+) -> Optional[Tuple[int, int, int]]:
+    """Parses the Content-Range header of a response to a Range request
+
+    Args:
+        download_response (requests.Response): The response
+
+    Returns:
+        Optional[Tuple[int, int, int]]: First and last bytes (inclusive) of
+                                        the range returned and the total size
+                                        of the file, or None if not given
+    """
+    match = re.fullmatch(
+        r"bytes (\d+)-(\d+)/(\d+)",
+        download_response.headers.get("Content-Range", "").strip(),
+    )
+    if match is None:
+        return None
+    return int(match[1]), int(match[2]), int(match[3])
+
+
+def _write_segment(
+    download_response: requests.Response,
+    part_path: Path,
+    start: int,
+    progress_bar: tqdm,
+    progress_bar_lock: threading.Lock,
+):
+    """Writes the content of a response for a segment of a file into its
+    place in a preallocated file
+
+    Args:
+        download_response (requests.Response): Streamed response for the
+                                    segment
+        part_path (Path): Path of the preallocated file
+        start (int): Offset of the segment in the file
+        progress_bar (tqdm): Progress bar for the whole file
+        progress_bar_lock (threading.Lock): Lock for updating the progress bar
+    """
+    with open(part_path, "r+b") as part_file:
+        part_file.seek(start)
+        for chunk in download_response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+            part_file.write(chunk)
+            with progress_bar_lock:
+                progress_bar.update(len(chunk))
+
+
+def _download_segment(
+    session: DAFNISession,
+    url: str,
+    part_path: Path,
+    segment: Tuple[int, int],
+    progress_bar: tqdm,
+    progress_bar_lock: threading.Lock,
+):
+    """Downloads a segment of a file into its place in a preallocated file
+
+    Args:
+        session (DAFNISession): User session
+        url (str): Download URL of the file
+        part_path (Path): Path of the preallocated file
+        segment (Tuple[int, int]): First and last bytes (inclusive) of the
+                                   segment
+        progress_bar (tqdm): Progress bar for the whole file
+        progress_bar_lock (threading.Lock): Lock for updating the progress bar
+
+    Raises:
+        RuntimeError: If the server doesn't return the requested range
+    """
+    start, end = segment
+    with minio_get_request(
+        session, url, stream=True, headers={"Range": f"bytes={start}-{end}"}
+    ) as download_response:
+        if download_response.status_code != 206:
+            raise RuntimeError(
+                f"Server did not return the requested bytes {start}-{end}"
+            )
+        _write_segment(
+            download_response, part_path, start, progress_bar, progress_bar_lock
+        )
+
+
+def _download_file_segmented(
+    session: DAFNISession,
+    file: DataFile,
+    directory: Path,
+    segments: int,
+    progress_bar_position: Optional[int] = None,
+) -> int:
+    """Downloads a single file from a dataset by splitting it into byte
+    ranges that are downloaded at once and written into place in a
+    preallocated file
+
+    The first range is requested on its own to find the actual size of the
+    file before planning the rest. If the server doesn't support Range
+    requests this falls back to _download_file.
+
+    Unlike _download_file, the progress of each range isn't recorded so an
+    interrupted segmented download starts again from the beginning. An
+    interrupted download left by _download_file is continued by it instead.
+
+    Args:
+        session (DAFNISession): User session
+        file (DataFile): The file to download
+        directory (Path): Directory to download the file to
+        segments (int): Number of ranges to split the file into
+        progress_bar_position (Optional[int]): Line to display the progress
+                                    bar on when downloading multiple files at
+                                    once
+
+    Returns:
+        int: Size of the downloaded file
+    """
+    file_save_path = directory / file.name
+    file_save_path.parent.mkdir(exist_ok=True, parents=True)
+    part_path, state_path = _get_download_state_paths(file_save_path)
+
+    # Continue a previously interrupted download that wasn't segmented rather
+    # than discarding what it has downloaded
+    if _load_download_state(state_path, file) is not None and part_path.exists():
+        return _download_file(
+            session, file, directory, progress_bar_position=progress_bar_position
+        )
+
+    start_time = time.perf_counter()
+
+    # Use the approximate size from the metadata to plan the first range
+    first_start, first_end = _plan_segments(0, file.size - 1, segments)[0]
+    with minio_get_request(
+        session,
+        file.download_url,
+        stream=True,
+        headers={"Range": f"bytes={first_start}-{first_end}"},
+    ) as download_response:
+        content_range = _parse_content_range(download_response)
+        segmented = download_response.status_code == 206 and content_range is not None
+
+        if segmented:
+            _, first_end, file_size = content_range
+            remaining_segments = (
+                _plan_segments(first_end + 1, file_size - 1, segments - 1)
+                if first_end + 1 < file_size
+                else []
+            )
+
+            # Preallocate the whole file so each range can be written at its
+            # offset (replacing any left by an interrupted segmented download,
+            # which can't be continued, along with any state left without it)
+            with open(part_path, "wb") as part_file:
+                part_file.truncate(file_size)
+            state_path.unlink(missing_ok=True)
+
+            progress_bar_lock = threading.Lock()
+            with create_file_progress_bar(
+                description=file.name,
+                total=file_size,
+                position=progress_bar_position,
+            ) as progress_bar:
+                with ThreadPoolExecutor(
+                    max_workers=len(remaining_segments) + 1
+                ) as executor:
+                    futures = [
+                        executor.submit(
+                            _write_segment,
+                            download_response,
+                            part_path,
+                            0,
+                            progress_bar,
+                            progress_bar_lock,
+                        )
+                    ] + [
+                        executor.submit(
+                            _download_segment,
+                            session,
+                            file.download_url,
+                            part_path,
+                            segment,
+                            progress_bar,
+                            progress_bar_lock,
+                        )
+                        for segment in remaining_segments
+                    ]
+                    try:
+                        for future in as_completed(futures):
+                            future.result()
+                    except BaseException:
+                        executor.shutdown(wait=False, cancel_futures=True)
+                        raise
+
+    if not segmented:
+        # Server doesn't support Range requests so download it normally
+        return _download_file(
+            session, file, directory, progress_bar_position=progress_bar_position
+        )
+
+    part_path.replace(file_save_path)
+
+    # Report the combined throughput of all the ranges
+    elapsed = max(time.perf_counter() - start_time, 1e-6)
+    tqdm.write(
+        f"Downloaded {file.name} ({format_file_size(file_size)}) in "
+        f"{elapsed:.1f}s using {len(remaining_segments) + 1} connections "
+        f"({format_file_size(file_size / elapsed)}/s)"
+    )
+
+    return file_size
 
 
 def download_dataset(
     session: DAFNISession,
     files: List[DataFile],
     directory: Optional[Path],
+    max_workers: int = 1,
+    segments: int = 1,
+    sync: bool = False,
 ):
     """Function to download a list of files found within a dataset
 
@@ -23,50 +479,108 @@ def download_dataset(
         files (List[DataFile]): The files to download
         directory (Optional[path]): Directory to download files to (when None
                                     will use the current working directory)
+        max_workers (int): Maximum number of files to download at once
+        segments (int): Maximum number of byte ranges to download each file
+                        in at once. Only files of at least
+                        DOWNLOAD_SEGMENT_MIN_SIZE for each range are split.
+        sync (bool): Whether to skip any files already in the directory with
+                     the same size and checksum (when available)
+
+    No more than DOWNLOAD_MAX_CONNECTIONS are opened at once, so when
+    'max_workers' multiplied by 'segments' exceeds this, both are reduced.
     """
     # Use current working directory by default
     if not directory:
         directory = Path.cwd()
 
+    # Each range of each file has its own connection
+    if max_workers * segments > DOWNLOAD_MAX_CONNECTIONS:
+        max_workers = min(max_workers, DOWNLOAD_MAX_CONNECTIONS)
+        segments = max(DOWNLOAD_MAX_CONNECTIONS // max_workers, 1)
+        click.echo(
+            f"Downloading at most {max_workers} file(s) in {segments} range(s) "
+            f"at once to stay within {DOWNLOAD_MAX_CONNECTIONS} connections"
+        )
+    session.ensure_pool_maxsize(max_workers * segments)
+
+    if sync:
+        unchanged_files = []
+        changed_files = []
+        for file in files:
+            if file.matches_file(directory / file.name):
+                unchanged_files.append(file)
+            else:
+                changed_files.append(file)
+        files = changed_files
+
+        if len(unchanged_files) > 0:
+            skipped_size = sum(file.size for file in unchanged_files)
+            click.echo(
+                f"Skipping {len(unchanged_files)} unchanged file(s) "
+                f"({format_file_size(skipped_size)})"
+            )
+        if len(files) == 0:
+            click.echo(f"All files in '{directory}' are already up to date")
+            return
+
     # For an indication of the overall download progress - need approximate
     # file size for all files
     total_file_size = sum(file.size for file in files)
 
+    # Each file being downloaded at once gets its own line for its progress
+    # bar (when downloading one at a time they are left where they are instead)
+    progress_bar_positions = (
+        ProgressBarPositions(max_workers) if max_workers > 1 else None
+    )
+
+    def download_file(file: DataFile, progress_bar_position: Optional[int]) -> int:
+        file_segments = min(segments, file.size // DOWNLOAD_SEGMENT_MIN_SIZE)
+        if file_segments > 1:
+            return _download_file_segmented(
+                session,
+                file,
+                directory,
+                file_segments,
+                progress_bar_position=progress_bar_position,
+            )
+        return _download_file(
+            session, file, directory, progress_bar_position=progress_bar_position
+        )
+
+    def download_file_with_progress_bar(file: DataFile) -> int:
+        if progress_bar_positions is None:
+            return download_file(file, progress_bar_position=None)
+        with progress_bar_positions.acquire() as position:
+            return download_file(file, progress_bar_position=position)
+
     # Download each file separately (not zipped on backend)
     click.echo("Downloading files...")
     click.echo()
 
     # Progress bar keeping track of all files being downloaded
     with OverallFileProgressBar(len(files), total_file_size) as overall_progress_bar:
-        # Each file downloaded individually with its own progress bar
-        for file in files:
-            file_save_path = directory / file.name
-            file_save_path.parent.mkdir(exist_ok=True, parents=True)
-
-            # Stream the file download
-            with minio_get_request(
-                session, file.download_url, stream=True
-            ) as download_response:
-                # Full file size
-                file_size = int(download_response.headers.get("content-length", 0))
-
-                with open(file_save_path, "wb") as original_file:
-                    # Allow tqdm to handle the progress bar based on the data saved
-                    with tqdm.wrapattr(
-                        original_file,
-                        "write",
-                        desc=file.name,
-                        miniters=1,
-                        total=file_size,
-                    ) as save_file:
-                        # Download and save file in chunks
-                        for chunk in download_response.iter_content(
-                            chunk_size=DOWNLOAD_CHUNK_SIZE
-                        ):
-                            save_file.write(chunk)
-
-            # Completed a file download, update the overall status to reflect
-            overall_progress_bar.update(file.size)
+        # Each file downloaded individually with its own progress bar (and
+        # downloading everything can take longer than the access token lasts)
+        with (
+            session.keep_tokens_refreshed(),
+            ThreadPoolExecutor(max_workers=max_workers) as executor,
+        ):
+            futures = {
+                executor.submit(download_file_with_progress_bar, file): file
+                for file in files
+            }
+            try:
+                for future in as_completed(futures):
+                    # Completed a file download, update the overall status to
+                    # reflect the number of bytes actually downloaded (the
+                    # size in the metadata is only approximate)
+                    overall_progress_bar.update(
+                        future.result(), expected_file_size=futures[future].size
+                    )
+            except BaseException:
+                # Don't start downloading anything else when one has failed
+                executor.shutdown(wait=False, cancel_futures=True)
+                raise
 
     click.echo()
     click.echo(f"Downloaded files to '{directory}'")
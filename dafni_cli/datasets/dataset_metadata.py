@@ -1,5 +1,7 @@
+import hashlib
 from dataclasses import dataclass, field
 from datetime import datetime
+from pathlib import Path
 from typing import ClassVar, List, Optional
 
 import click
@@ -8,6 +10,7 @@ from tabulate import tabulate
 from dafni_cli.api.auth import Auth
 from dafni_cli.api.parser import ParserBaseObject, ParserParam, parse_datetime
 from dafni_cli.consts import (
+    CHECKSUM_CHUNK_SIZE,
     CONSOLE_WIDTH,
     TABLE_PUBLICATION_DATE_HEADER,
     TABLE_VERSION_ID_HEADER,
@@ -293,7 +296,32 @@ DATASET_METADATA_LANGUAGES = [
 ]
 
 
-@dataclass
+@dataclass(slots=True)
+class DataFileChecksum(ParserBaseObject):
+    """Dataclass representing the checksum of a DAFNI dataset file
+
+    Attributes:
+        algorithm (str): Algorithm used e.g. spdx:checksumAlgorithm_sha256
+        value (str): Hex encoded value of the checksum
+    """
+
+    algorithm: str
+    value: str
+
+    _parser_params: ClassVar[List[ParserParam]] = [
+        ParserParam("algorithm", "spdx:algorithm", str),
+        ParserParam("value", "spdx:checksumValue", str),
+    ]
+
+    @property
+    def hashlib_name(self) -> Optional[str]:
+        """Returns the name of the algorithm as used by hashlib, or None if
+        it isn't supported"""
+        name = self.algorithm.rsplit("_", 1)[-1].replace("-", "").lower()
+        return name if name in hashlib.algorithms_available else None
+
+
+@dataclass(slots=True)
 class DataFile(ParserBaseObject):
     """Dataclass representing a DAFNI dataset file
 
@@ -306,12 +334,14 @@ class DataFile(ParserBaseObject):
         format (str): File format (Defaults to OUTPUT_UNKNOWN_FORMAT if not
                       known)
         download_url (str): File download url
+        checksum (Optional[DataFileChecksum]): File checksum (if known)
     """
 
     name: str
     size: int
     format: str = None
     download_url: str = None
+    checksum: Optional[DataFileChecksum] = None
 
     _parser_params: ClassVar[List[ParserParam]] = [
         ParserParam("name", "spdx:fileName", str),
@@ -322,10 +352,33 @@ class DataFile(ParserBaseObject):
             str,
         ),
         ParserParam("download_url", "dcat:downloadURL", str),
+        ParserParam("checksum", "spdx:checksum", DataFileChecksum),
     ]
 
+    def matches_file(self, path: Path) -> bool:
+        """Returns whether a local file has the same size as this one and,
+        when the checksum is known, the same checksum
+
+        Args:
+            path (Path): Path of the local file to compare against
+
+        Returns:
+            bool: Whether the local file matches
+        """
+        if not path.is_file() or path.stat().st_size != self.size:
+            return False
+
+        if self.checksum is None or self.checksum.hashlib_name is None:
+            return True
+
+        file_hash = hashlib.new(self.checksum.hashlib_name)
+        with open(path, "rb") as file:
+            for chunk in iter(lambda: file.read(CHECKSUM_CHUNK_SIZE), b""):
+                file_hash.update(chunk)
+        return file_hash.hexdigest() == self.checksum.value.lower()
+
 
-@dataclass
+@dataclass(slots=True)
 class Creator(ParserBaseObject):
     """Dataclass representing a creator listed in a dataset's metadata
 
@@ -346,7 +399,7 @@ class Creator(ParserBaseObject):
     ]
 
 
-@dataclass
+@dataclass(slots=True)
 class Contact(ParserBaseObject):
     """Dataclass representing the contact listed in a dataset's metadata
 
@@ -378,7 +431,7 @@ class Contact(ParserBaseObject):
             return "N/A"
 
 
-@dataclass
+@dataclass(slots=True)
 class Location(ParserBaseObject):
     """Dataclass representing the location listed in a dataset's metadata
 
@@ -399,7 +452,7 @@ class Location(ParserBaseObject):
     ]
 
 
-@dataclass
+@dataclass(slots=True)
 class Publisher(ParserBaseObject):
     """Dataclass representing the publisher listed in a dataset's metadata
 
@@ -426,7 +479,7 @@ class Publisher(ParserBaseObject):
         return f"{self.name}"
 
 
-@dataclass
+@dataclass(slots=True)
 class Standard(ParserBaseObject):
     """Dataclass representing the standard listed in a dataset's metadata
 
@@ -454,7 +507,7 @@ class Standard(ParserBaseObject):
             return f"{self.label}"
 
 
-@dataclass
+@dataclass(slots=True)
 class DatasetVersion(ParserBaseObject):
     """Dataclass containing information on a historic version of a dataset
 
@@ -478,7 +531,7 @@ class DatasetVersion(ParserBaseObject):
     ]
 
 
-@dataclass
+@dataclass(slots=True)
 class DatasetMetadata(ParserBaseObject):
     """Dataclass representing a DAFNI dataset's metadata
 
@@ -1,5 +1,7 @@
 import json
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from copy import deepcopy
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
@@ -16,14 +18,21 @@ from dafni_cli.api.minio_api import (
     upload_file_to_minio,
 )
 from dafni_cli.api.session import DAFNISession
-from dafni_cli.consts import DATASET_UPLOAD_FILE_RETRY_ATTEMPTS
+from dafni_cli.consts import DATASET_UPLOAD_FILE_RETRY_ATTEMPTS, TAB_SPACE
 from dafni_cli.datasets.dataset_metadata import (
     DATASET_METADATA_LANGUAGES,
     DATASET_METADATA_SUBJECTS,
     DATASET_METADATA_THEMES,
     DATASET_METADATA_UPDATE_FREQUENCIES,
+    DataFile,
+)
+from dafni_cli.datasets.dataset_upload_journal import DatasetUploadJournal
+from dafni_cli.utils import (
+    OverallFileProgressBar,
+    ProgressBarPositions,
+    optional_echo,
+    print_json,
 )
-from dafni_cli.utils import OverallFileProgressBar, optional_echo, print_json
 
 # Keys inside dataset metadata returned from the API that are invalid for
 # uploading
@@ -82,6 +91,86 @@ def parse_file_names_from_paths(
     return expanded_files_dict
 
 
+@dataclass
+class DatasetVersionDiff:
+    """Dataclass describing how a set of local files to upload as a new
+    dataset version differ from the files in an existing version
+
+    Attributes:
+        new (List[str]): Names of files not in the existing version
+        changed (List[str]): Names of files whose size or checksum differ from
+                             those in the existing version
+        unchanged (List[str]): Names of files that match those in the
+                               existing version
+        removed (List[str]): Names of files in the existing version that
+                             aren't in the local files
+    """
+
+    new: List[str] = field(default_factory=list)
+    changed: List[str] = field(default_factory=list)
+    unchanged: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+
+    @property
+    def has_changes(self) -> bool:
+        """Whether the local files differ from the existing version at all"""
+        return len(self.new) > 0 or len(self.changed) > 0 or len(self.removed) > 0
+
+
+def diff_dataset_files(
+    existing_files: List[DataFile], file_names_and_paths: Dict[str, Path]
+) -> DatasetVersionDiff:
+    """Compares local files to upload against those in an existing dataset
+    version
+
+    Files are matched by name and compared using their size and, when the
+    existing version includes one, their checksum.
+
+    Args:
+        existing_files (List[DataFile]): Files in the existing version
+        file_names_and_paths (Dict[str, Path]): Names and paths of the local
+                            files as returned by parse_file_names_from_paths
+
+    Returns:
+        DatasetVersionDiff: The differences found
+    """
+    existing_files_by_name = {file.name: file for file in existing_files}
+
+    diff = DatasetVersionDiff()
+    for file_name, file_path in file_names_and_paths.items():
+        existing_file = existing_files_by_name.get(file_name)
+        if existing_file is None:
+            diff.new.append(file_name)
+        elif existing_file.matches_file(file_path):
+            diff.unchanged.append(file_name)
+        else:
+            diff.changed.append(file_name)
+    diff.removed = [
+        file_name
+        for file_name in existing_files_by_name
+        if file_name not in file_names_and_paths
+    ]
+    return diff
+
+
+def print_dataset_version_diff(diff: DatasetVersionDiff):
+    """Prints the differences found between local files to upload and an
+    existing dataset version
+
+    Args:
+        diff (DatasetVersionDiff): The differences to print
+    """
+    click.echo("Changes compared to the existing version:")
+    for label, file_names in [
+        ("New", diff.new),
+        ("Changed", diff.changed),
+        ("Removed", diff.removed),
+    ]:
+        for file_name in file_names:
+            click.echo(f"{TAB_SPACE}{label}: {file_name}")
+    click.echo(f"{TAB_SPACE}Unchanged: {len(diff.unchanged)} file(s)")
+
+
 def remove_dataset_metadata_invalid_for_upload(metadata: dict):
     """Function to remove metadata for a dataset that is given when getting it
     but are not valid during upload
@@ -305,11 +394,69 @@ def modify_dataset_metadata_for_upload(
     return metadata
 
 
+def _upload_file_with_retries(
+    session: DAFNISession,
+    temp_bucket_id: str,
+    file_name: str,
+    file_path: Path,
+    upload_url: str,
+    progress_bar: bool,
+    progress_bar_position: Optional[int] = None,
+):
+    """Uploads a single file to a temporary bucket, retrying with a new upload
+    URL for only this file if the upload fails
+
+    Args:
+        session (DAFNISession): User session
+        temp_bucket_id (str): Minio temporary bucket ID to upload the file to
+        file_name (str): Name of the file in the bucket
+        file_path (Path): Path to the file to upload
+        upload_url (str): Upload URL obtained for the file
+        progress_bar (bool): Whether to display a progress bar for the file
+        progress_bar_position (Optional[int]): Line to display the progress
+                                    bar on when uploading multiple files at
+                                    once
+
+    Raises:
+        RuntimeError: If the upload fails DATASET_UPLOAD_FILE_RETRY_ATTEMPTS
+                      times
+    """
+    upload_attempts = 0
+
+    # Try and upload, but if fails for any reason - retry with a new upload URL
+    while True:
+        try:
+            upload_file_to_minio(
+                session,
+                upload_url,
+                file_path,
+                file_name=file_name,
+                progress_bar=progress_bar,
+                progress_bar_position=progress_bar_position,
+            )
+            return
+        except RuntimeError as err:
+            upload_attempts += 1
+
+            if upload_attempts == DATASET_UPLOAD_FILE_RETRY_ATTEMPTS:
+                # Completely broken
+                raise RuntimeError(
+                    f"Attempted to upload file {DATASET_UPLOAD_FILE_RETRY_ATTEMPTS} times but failed repeatedly"
+                ) from err
+
+            # Get a new url for only this file before retrying
+            upload_url = get_data_upload_urls(session, temp_bucket_id, [file_name])[
+                "urls"
+            ][file_name]
+
+
 def upload_files(
     session: DAFNISession,
     temp_bucket_id: str,
     paths: List[Path],
     json: bool = False,
+    max_workers: int = 1,
+    journal: Optional[DatasetUploadJournal] = None,
 ):
     """Function to upload all given files to a temporary bucket via the Minio
     API
@@ -323,16 +470,76 @@ def upload_files(
         temp_bucket_id (str): Minio temporary bucket ID to upload files to
         paths (List[Path]): List of paths to dataset data files/folders
         json (bool): Whether to print the raw json returned by the DAFNI API
+        max_workers (int): Maximum number of files to upload at once
+        journal (Optional[DatasetUploadJournal]): Journal to record each
+                                    uploaded file in. Any files it shows have
+                                    already been uploaded and not modified
+                                    since will be skipped.
 
     Raises:
         RuntimeError: If unable to upload the file for some reason
     """
     file_names_and_paths = parse_file_names_from_paths(paths=paths)
 
+    if journal is not None:
+        uploaded_file_names = [
+            file_name
+            for file_name, file_path in file_names_and_paths.items()
+            if journal.is_uploaded(file_name, file_path)
+        ]
+        if uploaded_file_names:
+            optional_echo(
+                f"Skipping {len(uploaded_file_names)} file(s) already uploaded",
+                json,
+            )
+        for file_name in uploaded_file_names:
+            del file_names_and_paths[file_name]
+
+        if not file_names_and_paths:
+            # Everything was uploaded before, so can go straight to committing
+            return
+
     optional_echo("Uploading files", json)
 
-    # For an indication of the overall upload progress
-    total_file_size = sum(file_path.stat().st_size for file_path in paths)
+    # For an indication of the overall upload progress (these are also
+    # recorded in any journal, so are obtained before uploading in case a file
+    # is modified during its upload)
+    file_stats = {
+        file_name: file_path.stat()
+        for file_name, file_path in file_names_and_paths.items()
+    }
+    total_file_size = sum(stat.st_size for stat in file_stats.values())
+
+    # Each file being uploaded at once gets its own line for its progress bar
+    # (when uploading one at a time they are left where they are instead)
+    progress_bar_positions = (
+        ProgressBarPositions(max_workers) if max_workers > 1 else None
+    )
+
+    def upload_file(file_name: str, upload_url: str):
+        if progress_bar_positions is None:
+            _upload_file_with_retries(
+                session,
+                temp_bucket_id,
+                file_name,
+                file_names_and_paths[file_name],
+                upload_url,
+                progress_bar=not json,
+            )
+        else:
+            with progress_bar_positions.acquire() as position:
+                _upload_file_with_retries(
+                    session,
+                    temp_bucket_id,
+                    file_name,
+                    file_names_and_paths[file_name],
+                    upload_url,
+                    progress_bar=not json,
+                    progress_bar_position=position,
+                )
+
+    # Each file being uploaded at once has its own connection
+    session.ensure_pool_maxsize(max_workers)
 
     # Progress bar keeping track of all files being uploaded
     with OverallFileProgressBar(
@@ -342,37 +549,44 @@ def upload_files(
         file_names = list(file_names_and_paths.keys())
         upload_urls = get_data_upload_urls(session, temp_bucket_id, file_names)["urls"]
 
-        # Loop through and attempt upload of each file
-        for file_name in file_names:
-            upload_attempts = 0
-
-            # Try and upload, but if fails for any reason - retry with a new upload URL
-            while upload_attempts < DATASET_UPLOAD_FILE_RETRY_ATTEMPTS:
-                try:
-                    upload_file_to_minio(
-                        session,
-                        upload_urls[file_name],
-                        file_names_and_paths[file_name],
-                        file_name=file_name,
-                        progress_bar=not json,
-                    )
-                    break
-                except RuntimeError as err:
-                    upload_attempts += 1
-
-                    if upload_attempts == DATASET_UPLOAD_FILE_RETRY_ATTEMPTS:
-                        # Completely broken
-                        raise RuntimeError(
-                            f"Attempted to upload file {DATASET_UPLOAD_FILE_RETRY_ATTEMPTS} times but failed repeatedly"
-                        ) from err
-
-                    # Get new urls before retrying
-                    upload_urls = get_data_upload_urls(
-                        session, temp_bucket_id, file_names
-                    )["urls"]
-
-            # Completed a file download, update the overall status to reflect
-            overall_progress_bar.update(file_names_and_paths[file_name].stat().st_size)
+        # Uploading everything can take longer than the access token lasts
+        with (
+            session.keep_tokens_refreshed(),
+            ThreadPoolExecutor(max_workers=max_workers) as executor,
+        ):
+            futures = {
+                executor.submit(upload_file, file_name, upload_urls[file_name]): (
+                    file_name
+                )
+                for file_name in file_names
+            }
+            pending = set(futures)
+
+            def complete_upload(future: Future):
+                # Completed a file upload, update the overall status to
+                # reflect
+                pending.remove(future)
+                file_name = futures[future]
+                overall_progress_bar.update(file_stats[file_name].st_size)
+                if journal is not None:
+                    journal.record_upload(file_name, file_stats[file_name])
+
+            try:
+                for future in as_completed(futures):
+                    future.result()
+                    complete_upload(future)
+            except BaseException:
+                # Don't start uploading anything else when one has failed
+                executor.shutdown(wait=False, cancel_futures=True)
+
+                # Still record any already being uploaded that go on to
+                # finish so they aren't uploaded again when resuming (those
+                # cancelled before starting are never completed)
+                started = [future for future in pending if not future.cancelled()]
+                for future in as_completed(started):
+                    if future.exception() is None:
+                        complete_upload(future)
+                raise
 
 
 def _commit_metadata(
@@ -417,6 +631,9 @@ def upload_dataset(
     paths: List[Path],
     dataset_id: Optional[str] = None,
     json: bool = False,
+    max_workers: int = 1,
+    journal_path: Optional[Path] = None,
+    resume: bool = False,
 ) -> None:
     """Function to upload a Dataset
 
@@ -424,6 +641,12 @@ def upload_dataset(
     parse_file_names_from_paths such that their new file names will include
     the directory structure as well
 
+    When given a journal_path, the files uploaded are recorded in a journal
+    at that path and the temporary bucket is kept if the upload fails. When
+    resuming, the upload recorded in the existing journal is continued
+    instead, uploading only the files that are missing from the temporary
+    bucket it records.
+
     Args:
         session (DAFNISession): User session
         metadata (dict): Metadata to upload
@@ -431,6 +654,12 @@ def upload_dataset(
         dataset_id (Optional[str]): ID of an existing dataset to add a version
                                     to. Creates a new dataset if None.
         json (bool): Whether to print the raw json returned by the DAFNI API
+        max_workers (int): Maximum number of files to upload at once
+        journal_path (Optional[Path]): Path of a journal to record uploaded
+                                    files in, or resume the upload from
+        resume (bool): Whether to resume the upload recorded in the existing
+                       journal at journal_path (which must be for the same
+                       files)
     """
     optional_echo("Validating metadata", json)
     try:
@@ -440,22 +669,66 @@ def upload_dataset(
         raise SystemExit(1) from err
     optional_echo("Metadata validation successful", json)
 
-    optional_echo("\nRetrieving temporary bucket ID", json)
-    temp_bucket_id = create_temp_bucket(session)
+    journal = None
+    if resume:
+        try:
+            journal = DatasetUploadJournal.load(journal_path)
+        except ValueError as err:
+            click.echo(err)
+            raise SystemExit(1) from err
+        # Anything else in the temporary bucket would be committed too
+        if not journal.matches(list(parse_file_names_from_paths(paths).keys())):
+            click.echo(
+                f"The files given don't match those being uploaded in the "
+                f"journal '{journal_path}'"
+            )
+            raise SystemExit(1)
+        optional_echo(
+            f"\nResuming upload to temporary bucket {journal.temp_bucket_id}", json
+        )
+        temp_bucket_id = journal.temp_bucket_id
+    else:
+        optional_echo("\nRetrieving temporary bucket ID", json)
+        temp_bucket_id = create_temp_bucket(session)
+        if journal_path is not None:
+            journal = DatasetUploadJournal(
+                path=journal_path,
+                temp_bucket_id=temp_bucket_id,
+                file_names=list(parse_file_names_from_paths(paths).keys()),
+            )
+            journal.save()
 
     # If any exception happens now, we want to make sure we delete the
-    # temporary bucket to prevent a build up in the user's quota
+    # temporary bucket to prevent a build up in the user's quota (unless
+    # the upload is to be resumed later)
     try:
         # Upload all files
-        upload_files(session, temp_bucket_id, paths, json=json)
+        upload_files(
+            session,
+            temp_bucket_id,
+            paths,
+            json=json,
+            max_workers=max_workers,
+            journal=journal,
+        )
         details = _commit_metadata(
             session, metadata, temp_bucket_id, dataset_id=dataset_id, json=json
         )
     except BaseException:
-        optional_echo("Deleting temporary bucket", json)
-        delete_temp_bucket(session, temp_bucket_id)
+        if journal is None:
+            optional_echo("Deleting temporary bucket", json)
+            delete_temp_bucket(session, temp_bucket_id)
+        else:
+            click.echo(
+                f"\nUpload failed. The files uploaded so far have been kept and "
+                f"the upload may be resumed using --resume {journal_path}"
+            )
         raise
 
+    # No longer needed
+    if journal_path is not None:
+        journal_path.unlink(missing_ok=True)
+
     # Output details
     if json:
         print_json(details)
@@ -0,0 +1,127 @@
+import json
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List
+
+
+@dataclass
+class DatasetUploadJournal:
+    """Journal of the files that have been uploaded to a temporary bucket
+    during a dataset upload, allowing a failed upload to be resumed later
+    without uploading them again
+
+    The journal is saved as JSON lines, the first giving the temporary bucket
+    and the names of all the files being uploaded, followed by one for each
+    file as it is uploaded so that recording a file doesn't require
+    rewriting the whole journal.
+
+    Attributes:
+        path (Path): Path the journal is saved to
+        temp_bucket_id (str): ID of the temporary bucket the files are being
+                              uploaded to
+        file_names (List[str]): Names of all the files being uploaded
+        files (Dict[str, Dict[str, int]]): Size and modification time (in
+                              nanoseconds) of each file uploaded from just
+                              before it was uploaded, indexed by file name
+    """
+
+    path: Path
+    temp_bucket_id: str
+    file_names: List[str]
+    files: Dict[str, Dict[str, int]] = field(default_factory=dict)
+
+    @staticmethod
+    def load(path: Path) -> "DatasetUploadJournal":
+        """Loads a journal saved by a previous upload
+
+        Args:
+            path (Path): Path of the journal
+
+        Returns:
+            DatasetUploadJournal: The loaded journal
+
+        Raises:
+            ValueError: If the file isn't a valid journal
+        """
+        try:
+            with open(path, "r", encoding="utf-8") as file:
+                lines = file.read().splitlines()
+            header = json.loads(lines[0])
+            journal = DatasetUploadJournal(
+                path=path,
+                temp_bucket_id=header["temp_bucket_id"],
+                file_names=list(header["file_names"]),
+            )
+            for index, line in enumerate(lines[1:], start=2):
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    # The last file may have been partially recorded when the
+                    # upload was interrupted
+                    if index == len(lines):
+                        break
+                    raise
+                journal.files[entry["file_name"]] = {
+                    "size": entry["size"],
+                    "mtime": entry["mtime"],
+                }
+            return journal
+        except (ValueError, KeyError, TypeError, IndexError) as err:
+            raise ValueError(f"'{path}' is not a valid dataset upload journal") from err
+
+    def save(self):
+        """Saves the whole journal (replacing the file in one step so that it
+        can't be left partially written)"""
+        temp_path = self.path.with_name(f"{self.path.name}.tmp")
+        with open(temp_path, "w", encoding="utf-8") as file:
+            file.write(
+                json.dumps(
+                    {
+                        "temp_bucket_id": self.temp_bucket_id,
+                        "file_names": self.file_names,
+                    }
+                )
+                + "\n"
+            )
+            for file_name, uploaded in self.files.items():
+                file.write(json.dumps({"file_name": file_name, **uploaded}) + "\n")
+        os.replace(temp_path, self.path)
+
+    def matches(self, file_names: List[str]) -> bool:
+        """Returns whether the journal records an upload of the given files
+
+        Args:
+            file_names (List[str]): Names of the files being uploaded
+        """
+        return sorted(self.file_names) == sorted(file_names)
+
+    def is_uploaded(self, file_name: str, file_path: Path) -> bool:
+        """Returns whether a file has already been uploaded and has not been
+        modified since
+
+        Args:
+            file_name (str): Name of the file in the bucket
+            file_path (Path): Path of the local file
+        """
+        uploaded = self.files.get(file_name)
+        if uploaded is None:
+            return False
+        stat = file_path.stat()
+        return uploaded == {"size": stat.st_size, "mtime": stat.st_mtime_ns}
+
+    def record_upload(self, file_name: str, stat: os.stat_result):
+        """Records a file as having been uploaded, appending it to the saved
+        journal
+
+        Args:
+            file_name (str): Name of the file in the bucket
+            stat (os.stat_result): Status of the local file taken before it
+                                   was uploaded (so that if it was modified
+                                   during the upload it will be uploaded
+                                   again)
+        """
+        uploaded = {"size": stat.st_size, "mtime": stat.st_mtime_ns}
+        self.files[file_name] = uploaded
+        with open(self.path, "a", encoding="utf-8") as file:
+            file.write(json.dumps({"file_name": file_name, **uploaded}) + "\n")
@@ -0,0 +1,84 @@
+import os
+import threading
+from pathlib import Path
+
+if os.name == "nt":
+    import msvcrt
+else:
+    import fcntl
+
+
+class FileLock:
+    """Exclusive lock on a file shared between processes e.g. to stop several
+    CLI commands run at once from modifying the same file at the same time
+
+    The lock is re-entrant for the thread holding it, while other threads
+    using the same FileLock wait in the same way as other processes.
+    """
+
+    def __init__(self, path: Path):
+        """
+        Args:
+            path (Path): Path of the file to lock (created if it doesn't
+                         exist). This should be separate to the file being
+                         protected so that it may be replaced while locked.
+        """
+        self._path = path
+        self._thread_lock = threading.RLock()
+        self._depth = 0
+        self._file_descriptor = None
+
+    def _lock_file(self):
+        """Blocks until the lock on the file is acquired"""
+        if os.name == "nt":
+            # LK_LOCK only retries for a few seconds before raising an error
+            while True:
+                try:
+                    msvcrt.locking(self._file_descriptor, msvcrt.LK_LOCK, 1)
+                    return
+                except OSError:
+                    continue
+        else:
+            fcntl.flock(self._file_descriptor, fcntl.LOCK_EX)
+
+    def _unlock_file(self):
+        """Releases the lock on the file"""
+        if os.name == "nt":
+            msvcrt.locking(self._file_descriptor, msvcrt.LK_UNLCK, 1)
+        else:
+            fcntl.flock(self._file_descriptor, fcntl.LOCK_UN)
+
+    def acquire(self):
+        """Blocks until the lock is acquired"""
+        self._thread_lock.acquire()
+        if self._depth == 0:
+            try:
+                self._file_descriptor = os.open(
+                    self._path, os.O_RDWR | os.O_CREAT, 0o600
+                )
+                self._lock_file()
+            except BaseException:
+                if self._file_descriptor is not None:
+                    os.close(self._file_descriptor)
+                    self._file_descriptor = None
+                self._thread_lock.release()
+                raise
+        self._depth += 1
+
+    def release(self):
+        """Releases the lock"""
+        self._depth -= 1
+        if self._depth == 0:
+            try:
+                self._unlock_file()
+            finally:
+                os.close(self._file_descriptor)
+                self._file_descriptor = None
+        self._thread_lock.release()
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.release()
@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import Any, Callable, List, Union
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Tuple, Union
 
 from dateutil.tz import tzutc
 
@@ -9,8 +9,10 @@ from dafni_cli.workflows.workflow import Workflow
 
 
 def filter_multiple(
-    filters: List[Callable[[Any], bool]], instances: List[Any], dictionaries: List[dict]
-) -> List[Any]:
+    filters: List[Callable[[Any], bool]],
+    instances: List[Any],
+    dictionaries: Optional[List[dict]] = None,
+) -> Tuple[List[Any], List[dict]]:
     """Filters a list of objects given a list of functions that must all return
     True
 
@@ -21,9 +23,12 @@ def filter_multiple(
                  otherwise.
         instances (List[Any]): List of parsed DAFNI object instances e.g.
                                Workflow's These will be passed to the filters.
-        dictionaries (List[dict]): List of dictionaries that were parsed into
-                                   the instances. Ensures filtering can be
-                                   applied for commands using --json.
+        dictionaries (Optional[List[dict]]): List of dictionaries that were
+                                   parsed into the instances. Ensures
+                                   filtering can be applied for commands
+                                   using --json. When None the 'dictionary'
+                                   each instance was parsed from is used
+                                   instead.
 
     Returns:
         List[Any]: Filtered list of DAFNI object instances
@@ -31,6 +36,9 @@ def filter_multiple(
                     filtered DAFNI object instances
     """
 
+    if dictionaries is None:
+        dictionaries = [instance.dictionary for instance in instances]
+
     # Skip filtering if unnecessary
     if len(filters) == 0:
         return instances, dictionaries
@@ -44,6 +52,34 @@ def filter_multiple(
     return filtered_instances, filtered_dictionaries
 
 
+def filter_multiple_iter(
+    filters: List[Callable[[Any], bool]],
+    dictionaries: Iterable[dict],
+    parse_function: Callable[[dict], Any],
+) -> Iterator[Tuple[Any, dict]]:
+    """Parses and filters objects one at a time as their dictionaries are
+    read e.g. from a streamed response, given a list of functions that must
+    all return True
+
+    Args:
+        filters (List[Callable[[Any], bool]]): List of filters that each
+                 receive a parsed instance and should return true if it
+                 should be kept or false otherwise.
+        dictionaries (Iterable[dict]): Dictionaries of the DAFNI objects
+        parse_function (Callable[[dict], Any]): Function parsing a single
+                 dictionary into a DAFNI object instance e.g. parse_model
+
+    Returns:
+        Iterator[Tuple[Any, dict]]: Each DAFNI object instance that passes
+                                    the filters, along with the dictionary it
+                                    was parsed from
+    """
+    for dictionary in dictionaries:
+        instance = parse_function(dictionary)
+        if all(filter_func(instance) for filter_func in filters):
+            yield instance, dictionary
+
+
 # Methods to create filters for use with DAFNI objects
 def creation_date_filter(
     oldest_creation_date: datetime,
@@ -18,7 +18,7 @@ from dafni_cli.consts import (
 from dafni_cli.utils import format_table
 
 
-@dataclass
+@dataclass(slots=True)
 class ModelDataslot(ParserBaseObject):
     """Dataclass representing an input dataslot for a DAFNI
        model
@@ -46,7 +46,7 @@ class ModelDataslot(ParserBaseObject):
     ]
 
 
-@dataclass
+@dataclass(slots=True)
 class ModelParameter(ParserBaseObject):
     """Dataclass representing an input parameter for a DAFNI model
 
@@ -82,7 +82,7 @@ class ModelParameter(ParserBaseObject):
     ]
 
 
-@dataclass
+@dataclass(slots=True)
 class ModelInputs(ParserBaseObject):
     """Dataclass representing inputs for a DAFNI model
 
@@ -20,7 +20,7 @@ from dafni_cli.models.outputs import ModelOutputs
 from dafni_cli.utils import format_datetime, format_table, prose_print
 
 
-@dataclass
+@dataclass(slots=True)
 class ModelMetadata(ParserBaseObject):
     """Dataclass representing a DAFNI model's metadata
 
@@ -93,7 +93,7 @@ class ModelMetadata(ParserBaseObject):
         return self.STATUS_STRINGS.get(self.status, "Unknown")
 
 
-@dataclass
+@dataclass(slots=True)
 class ModelSpec(ParserBaseObject):
     """Dataclass representing the specification of a model (containing
        the image url and inputs)
@@ -115,7 +115,7 @@ class ModelSpec(ParserBaseObject):
     ]
 
 
-@dataclass
+@dataclass(slots=True)
 class ModelVersion(ParserBaseObject):
     """Dataclass containing information on a historic version of a model
 
@@ -139,7 +139,7 @@ class ModelVersion(ParserBaseObject):
     ]
 
 
-@dataclass
+@dataclass(slots=True)
 class Model(ParserBaseObject):
     """Dataclass representing a DAFNI model
 
@@ -377,13 +377,15 @@ class Model(ParserBaseObject):
 
 # The following methods mostly exists to get round current python limitations
 # with typing (see https://stackoverflow.com/questions/33533148/how-do-i-type-hint-a-method-with-the-type-of-the-enclosing-class)
-def parse_models(model_dictionary_list: List[dict]) -> List[Model]:
+def parse_models(model_dictionary_list: List[dict], lazy: bool = False) -> List[Model]:
     """Parses the output of get_all_models and returns a list of Model
     instances"""
-    return ParserBaseObject.parse_from_dict_list(Model, model_dictionary_list)
+    return ParserBaseObject.parse_from_dict_list(Model, model_dictionary_list, lazy)
 
 
-def parse_model(model_dictionary: dict) -> Model:
+def parse_model(
+    model_dictionary: dict, lazy: bool = False, keep_dict: bool = True
+) -> Model:
     """Parses the output of get_model and returns a list of Model
     instances"""
-    return ParserBaseObject.parse_from_dict(Model, model_dictionary)
+    return ParserBaseObject.parse_from_dict(Model, model_dictionary, lazy, keep_dict)
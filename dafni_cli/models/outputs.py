@@ -11,7 +11,7 @@ from dafni_cli.consts import (
 from dafni_cli.utils import format_table
 
 
-@dataclass
+@dataclass(slots=True)
 class ModelOutputDataset(ParserBaseObject):
     """Dataclass containing information on an output dataset from a model
 
@@ -32,7 +32,7 @@ class ModelOutputDataset(ParserBaseObject):
     ]
 
 
-@dataclass
+@dataclass(slots=True)
 class ModelOutputs(ParserBaseObject):
     """Dataclass representing outputs for a DAFNI model
 
@@ -0,0 +1,236 @@
+import asyncio
+import threading
+import time
+from unittest import IsolatedAsyncioTestCase
+from unittest.mock import MagicMock, call, patch
+
+from dafni_cli.api import async_api
+from dafni_cli.api.async_api import AsyncDAFNISession
+from dafni_cli.api.exceptions import ResourceNotFoundError
+
+
+class TestAsyncDAFNISession(IsolatedAsyncioTestCase):
+    """Test class to test the AsyncDAFNISession class"""
+
+    @patch("dafni_cli.api.async_api.DAFNISession")
+    async def test_init_creates_session(self, mock_session):
+        """Tests that a DAFNISession is created (with a connection pool large
+        enough for the concurrency) and closed when none is given"""
+
+        # CALL
+        async with AsyncDAFNISession(max_concurrency=20) as session:
+            pass
+
+        # ASSERT
+        mock_session.assert_called_once_with(pool_maxsize=20)
+        self.assertEqual(session.session, mock_session.return_value)
+        mock_session.return_value.close.assert_called_once()
+
+    async def test_close_leaves_given_session_open(self):
+        """Tests that a DAFNISession given to the constructor isn't closed"""
+
+        # SETUP
+        dafni_session = MagicMock()
+
+        # CALL
+        async with AsyncDAFNISession(session=dafni_session):
+            pass
+
+        # ASSERT
+        dafni_session.close.assert_not_called()
+
+    async def test_run(self):
+        """Tests that run calls the function with the DAFNISession and any
+        arguments given"""
+
+        # SETUP
+        dafni_session = MagicMock()
+        func = MagicMock()
+
+        # CALL
+        async with AsyncDAFNISession(session=dafni_session) as session:
+            result = await session.run(func, "arg", key="value")
+
+        # ASSERT
+        func.assert_called_once_with(dafni_session, "arg", key="value")
+        self.assertEqual(result, func.return_value)
+
+    async def test_iterate(self):
+        """Tests that iterate yields each value returned by the function
+        given the DAFNISession and any arguments given, obtaining each in the
+        thread pool"""
+
+        # SETUP
+        dafni_session = MagicMock()
+        thread_ids = []
+
+        def func(session, stop, step=1):
+            for value in range(0, stop, step):
+                thread_ids.append(threading.get_ident())
+                yield value
+            yield None
+
+        # CALL
+        async with AsyncDAFNISession(session=dafni_session) as session:
+            result = [value async for value in session.iterate(func, 6, step=2)]
+
+        # ASSERT
+        self.assertEqual(result, [0, 2, 4, None])
+        self.assertNotIn(threading.get_ident(), thread_ids)
+
+    async def test_close_waits_for_running_functions(self):
+        """Tests that exiting waits for any functions still running before
+        closing the DAFNISession it created"""
+
+        # SETUP
+        events = []
+
+        def func(session):
+            time.sleep(0.05)
+            events.append("finished")
+
+        # CALL
+        with patch("dafni_cli.api.async_api.DAFNISession") as mock_session:
+            mock_session.return_value.close.side_effect = lambda: events.append(
+                "closed"
+            )
+            async with AsyncDAFNISession() as session:
+                task = asyncio.ensure_future(session.run(func))
+                await asyncio.sleep(0.01)
+
+        # ASSERT
+        self.assertEqual(events, ["finished", "closed"])
+        await task
+
+    async def test_get_request(self):
+        """Tests that get_request calls the DAFNISession's get_request"""
+
+        # SETUP
+        dafni_session = MagicMock()
+
+        # CALL
+        async with AsyncDAFNISession(session=dafni_session) as session:
+            result = await session.get_request(url="some_url")
+
+        # ASSERT
+        dafni_session.get_request.assert_called_once_with(url="some_url")
+        self.assertEqual(result, dafni_session.get_request.return_value)
+
+    async def test_run_limits_concurrency(self):
+        """Tests that no more than max_concurrency functions are run at
+        once"""
+
+        # SETUP
+        lock = threading.Lock()
+        running = 0
+        max_running = 0
+
+        def func(session, value):
+            nonlocal running, max_running
+            with lock:
+                running += 1
+                max_running = max(max_running, running)
+            time.sleep(0.02)
+            with lock:
+                running -= 1
+            return value
+
+        # CALL
+        async with AsyncDAFNISession(session=MagicMock(), max_concurrency=3) as session:
+            result = await asyncio.gather(
+                *[session.run(func, value) for value in range(10)]
+            )
+
+        # ASSERT
+        self.assertEqual(result, list(range(10)))
+        self.assertEqual(max_running, 3)
+
+
+class TestAsyncAPI(IsolatedAsyncioTestCase):
+    """Test class to test the awaitable API functions"""
+
+    def setUp(self) -> None:
+        super().setUp()
+
+        self.dafni_session = MagicMock()
+        self.session = AsyncDAFNISession(session=self.dafni_session)
+        self.addCleanup(self.session.close)
+
+    @patch("dafni_cli.api.async_api.models_api.get_model")
+    async def test_get_model(self, mock_get_model):
+        """Tests that get_model calls models_api.get_model with the
+        underlying DAFNISession"""
+
+        # CALL
+        result = await async_api.get_model(self.session, "version_id")
+
+        # ASSERT
+        mock_get_model.assert_called_once_with(self.dafni_session, "version_id")
+        self.assertEqual(result, mock_get_model.return_value)
+
+    async def test_get_model_raises_errors(self):
+        """Tests that errors raised by the underlying function are raised
+        when awaited"""
+
+        # SETUP
+        self.dafni_session.get_request.side_effect = ResourceNotFoundError(
+            "Unable to find a model with version_id 'version_id'"
+        )
+
+        # CALL
+        with self.assertRaises(ResourceNotFoundError) as err:
+            await async_api.get_model(self.session, "version_id")
+
+        # ASSERT
+        self.assertEqual(
+            str(err.exception), "Unable to find a model with version_id 'version_id'"
+        )
+
+    @patch("dafni_cli.api.async_api.datasets_api.iter_dataset_pages")
+    async def test_iter_dataset_pages(self, mock_iter_dataset_pages):
+        """Tests that iter_dataset_pages yields each page returned by
+        datasets_api.iter_dataset_pages"""
+
+        # SETUP
+        pages = [{"metadata": [1, 2]}, {"metadata": [3]}]
+        mock_iter_dataset_pages.return_value = iter(pages)
+        filters = {"some": "filter"}
+
+        # CALL
+        result = [
+            page
+            async for page in async_api.iter_dataset_pages(
+                self.session, filters, page_size=2
+            )
+        ]
+
+        # ASSERT
+        mock_iter_dataset_pages.assert_called_once_with(
+            self.dafni_session, filters, page_size=2
+        )
+        self.assertEqual(result, pages)
+
+    @patch("dafni_cli.api.async_api.minio_api.delete_temp_bucket")
+    @patch("dafni_cli.api.async_api.minio_api.create_temp_bucket")
+    async def test_concurrent_requests(
+        self, mock_create_temp_bucket, mock_delete_temp_bucket
+    ):
+        """Tests that several API functions can be awaited together"""
+
+        # SETUP
+        mock_create_temp_bucket.side_effect = ["bucket_1", "bucket_2"]
+
+        # CALL
+        result = await asyncio.gather(
+            async_api.create_temp_bucket(self.session),
+            async_api.create_temp_bucket(self.session),
+            async_api.delete_temp_bucket(self.session, "bucket_3"),
+        )
+
+        # ASSERT
+        self.assertCountEqual(result[:2], ["bucket_1", "bucket_2"])
+        self.assertEqual(
+            mock_create_temp_bucket.call_args_list,
+            [call(self.dafni_session), call(self.dafni_session)],
+        )
+        mock_delete_temp_bucket.assert_called_once_with(self.dafni_session, "bucket_3")
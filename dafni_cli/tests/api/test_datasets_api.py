@@ -1,5 +1,5 @@
 from unittest import TestCase
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, call, patch
 
 import requests
 
@@ -10,7 +10,12 @@ from dafni_cli.api.exceptions import (
     ResourceNotFoundError,
     ValidationError,
 )
-from dafni_cli.consts import NID_API_URL, SEARCH_AND_DISCOVERY_API_URL
+from dafni_cli.consts import (
+    DATASETS_CACHE_GROUP,
+    NID_API_URL,
+    RESPONSE_CACHE_TTL,
+    SEARCH_AND_DISCOVERY_API_URL,
+)
 from dafni_cli.tests.fixtures.session import create_mock_metadata_errors_response
 
 
@@ -45,8 +50,9 @@ class TestDatasetsAPI(TestCase):
         with self.assertRaises(ValidationError):
             datasets_api.validate_metadata(session, metadata)
 
-    def test_get_all_datasets(self):
-        """Tests that get_all_datasets works as expected"""
+    def test_iter_dataset_pages(self):
+        """Tests that iter_dataset_pages requests each page in turn until
+        one is empty, even if an earlier one isn't full"""
 
         # SETUP
         session = MagicMock()
@@ -54,21 +60,99 @@ class TestDatasetsAPI(TestCase):
             "search_text": "Some search text",
             "date_range": {"begin": "Start Date", "end": "End Date"},
         }
+        pages = [
+            {"metadata": ["dataset1", "dataset2"]},
+            {"metadata": ["dataset3"]},
+            {"metadata": ["dataset4", "dataset5"]},
+        ]
+        session.post_request.side_effect = pages + [{"metadata": []}]
+
+        # CALL
+        result = datasets_api.iter_dataset_pages(session, filters, page_size=2)
+
+        # ASSERT
+        # Nothing should be requested until the first page is needed
+        session.post_request.assert_not_called()
+        self.assertEqual(list(result), pages)
+        self.assertEqual(
+            session.post_request.call_args_list,
+            [
+                call(
+                    url=f"{SEARCH_AND_DISCOVERY_API_URL}/catalogue/",
+                    json={
+                        "offset": {"start": start, "size": 2},
+                        "sort_by": "recent",
+                        **filters,
+                    },
+                    allow_redirect=True,
+                )
+                for start in [0, 2, 3, 5]
+            ],
+        )
+
+    def test_iter_dataset_pages_default_page_size(self):
+        """Tests that iter_dataset_pages uses DATASETS_PAGE_SIZE by default"""
+
+        # SETUP
+        session = MagicMock()
+        session.post_request.return_value = {"metadata": []}
 
         # CALL
-        result = datasets_api.get_all_datasets(session, filters)
+        result = list(datasets_api.iter_dataset_pages(session, {}))
 
         # ASSERT
         session.post_request.assert_called_once_with(
             url=f"{SEARCH_AND_DISCOVERY_API_URL}/catalogue/",
             json={
-                "offset": {"start": 0, "size": datasets_api.MAX_DATASETS},
+                "offset": {"start": 0, "size": datasets_api.DATASETS_PAGE_SIZE},
                 "sort_by": "recent",
-                **filters,
             },
             allow_redirect=True,
         )
-        self.assertEqual(result, session.post_request.return_value)
+        self.assertEqual(result, [session.post_request.return_value])
+
+    def test_iter_dataset_pages_when_none_found(self):
+        """Tests that iter_dataset_pages still returns the first page when
+        there are no datasets"""
+
+        # SETUP
+        session = MagicMock()
+        page = {"metadata": [], "filters": {"sources": {}}}
+        session.post_request.return_value = page
+
+        # CALL
+        result = list(datasets_api.iter_dataset_pages(session, {}, page_size=2))
+
+        # ASSERT
+        session.post_request.assert_called_once()
+        self.assertEqual(result, [page])
+
+    @patch("dafni_cli.api.datasets_api.iter_dataset_pages")
+    def test_get_all_datasets(self, mock_iter_dataset_pages):
+        """Tests that get_all_datasets combines the datasets from every page"""
+
+        # SETUP
+        session = MagicMock()
+        filters = {"search_text": "Some search text"}
+        mock_iter_dataset_pages.return_value = iter(
+            [
+                {"metadata": ["dataset1", "dataset2"], "filters": {"sources": {}}},
+                {"metadata": ["dataset3"], "filters": {"sources": {}}},
+            ]
+        )
+
+        # CALL
+        result = datasets_api.get_all_datasets(session, filters, page_size=2)
+
+        # ASSERT
+        mock_iter_dataset_pages.assert_called_once_with(session, filters, page_size=2)
+        self.assertEqual(
+            result,
+            {
+                "metadata": ["dataset1", "dataset2", "dataset3"],
+                "filters": {"sources": {}},
+            },
+        )
 
     def test_get_latest_dataset_metadata(self):
         """Tests that get_latest_dataset_metadata works as expected"""
@@ -84,6 +168,8 @@ class TestDatasetsAPI(TestCase):
         session.get_request.assert_called_once_with(
             url=f"{NID_API_URL}/nid/metadata/{version_id}",
             allow_redirect=True,
+            cache_ttl=RESPONSE_CACHE_TTL,
+            cache_group=DATASETS_CACHE_GROUP,
         )
         self.assertEqual(result, session.get_request.return_value)
 
@@ -186,6 +272,7 @@ class TestDatasetsAPI(TestCase):
             url=f"{NID_API_URL}/nid/dataset/",
             json={"bucketId": temp_bucket_id, "metadata": metadata},
             error_message_func=mock_error_message_func.return_value,
+            invalidate_cache_group=DATASETS_CACHE_GROUP,
         )
         self.assertEqual(result, session.post_request.return_value)
 
@@ -211,6 +298,7 @@ class TestDatasetsAPI(TestCase):
             url=f"{NID_API_URL}/nid/dataset/{dataset_id}",
             json={"bucketId": temp_bucket_id, "metadata": metadata},
             error_message_func=mock_error_message_func.return_value,
+            invalidate_cache_group=DATASETS_CACHE_GROUP,
         )
         self.assertEqual(result, session.post_request.return_value)
 
@@ -236,6 +324,7 @@ class TestDatasetsAPI(TestCase):
             url=f"{NID_API_URL}/nid/metadata/{dataset_id}/{version_id}",
             json={"metadata": metadata},
             error_message_func=mock_error_message_func.return_value,
+            invalidate_cache_group=DATASETS_CACHE_GROUP,
         )
         self.assertEqual(result, session.post_request.return_value)
 
@@ -252,6 +341,7 @@ class TestDatasetsAPI(TestCase):
         # ASSERT
         session.delete_request.assert_called_once_with(
             f"{NID_API_URL}/nid/dataset/{dataset_id}",
+            invalidate_cache_group=DATASETS_CACHE_GROUP,
         )
         self.assertEqual(result, session.delete_request.return_value)
 
@@ -268,5 +358,6 @@ class TestDatasetsAPI(TestCase):
         # ASSERT
         session.delete_request.assert_called_once_with(
             f"{NID_API_URL}/nid/version/{version_id}/",
+            invalidate_cache_group=DATASETS_CACHE_GROUP,
         )
         self.assertEqual(result, session.delete_request.return_value)
@@ -0,0 +1,97 @@
+import json
+from unittest import TestCase
+
+from dafni_cli.api.json_stream import iter_json_array
+
+TEST_DOCUMENT = json.dumps(
+    [
+        {"id": "model-1", "name": 'Some "model" [1]', "tags": ["a", "b"]},
+        12345,
+        -1.5e3,
+        "Some text with unicode é中",
+        None,
+        True,
+        [],
+        {},
+    ],
+    indent=2,
+    ensure_ascii=False,
+)
+
+
+def split_chunks(document: bytes, chunk_size: int):
+    """Splits a document into chunks of the given size"""
+    return [
+        document[start : start + chunk_size]
+        for start in range(0, len(document), chunk_size)
+    ]
+
+
+class TestIterJSONArray(TestCase):
+    """Test class to test the iter_json_array function"""
+
+    def test_parses_every_item_regardless_of_chunk_size(self):
+        """Tests that the items are the same as json.loads gives wherever the
+        document is split (including within numbers and characters)"""
+
+        # SETUP
+        document = TEST_DOCUMENT.encode("utf-8")
+
+        for chunk_size in [1, 2, 3, 7, 64, len(document)]:
+            with self.subTest(chunk_size=chunk_size):
+                # CALL
+                result = list(iter_json_array(split_chunks(document, chunk_size)))
+
+                # ASSERT
+                self.assertEqual(result, json.loads(TEST_DOCUMENT))
+
+    def test_parses_str_chunks(self):
+        """Tests that chunks may already be decoded"""
+
+        # CALL
+        result = list(iter_json_array(['[1, {"a"', ": 2}]"]))
+
+        # ASSERT
+        self.assertEqual(result, [1, {"a": 2}])
+
+    def test_empty_array(self):
+        """Tests that an empty array yields nothing"""
+
+        for chunks in [[b"[]"], [b" [ ", b" ] "]]:
+            with self.subTest(chunks=chunks):
+                # CALL
+                result = list(iter_json_array(chunks))
+
+                # ASSERT
+                self.assertEqual(result, [])
+
+    def test_items_yielded_as_chunks_are_read(self):
+        """Tests that each item is yielded before reading further than the
+        chunk it ends in"""
+
+        # SETUP
+        chunks_read = []
+
+        def chunks():
+            for chunk in [b"[1,", b" 2,", b" 3]"]:
+                chunks_read.append(chunk)
+                yield chunk
+
+        # CALL
+        items = iter_json_array(chunks())
+
+        # ASSERT
+        self.assertEqual(next(items), 1)
+        self.assertEqual(len(chunks_read), 1)
+        self.assertEqual(next(items), 2)
+        self.assertEqual(len(chunks_read), 2)
+
+    def test_invalid_documents_raise_error(self):
+        """Tests that a JSONDecodeError is raised for documents that aren't
+        valid JSON arrays"""
+
+        for document in [b"", b'{"a": 1}', b"[1, 2", b"[1 2]", b"[1, }"]:
+            with self.subTest(document=document):
+                # CALL & ASSERT
+                with self.assertRaises(json.JSONDecodeError):
+                    list(iter_json_array(split_chunks(document, 2)))
@@ -52,6 +52,7 @@ class TestMinioAPI(TestCase):
             description=file_path.name,
             total=file_path.stat().st_size,
             disable=False,
+            position=None,
         )
         mock_CallbackIOWrapper.assert_called_once_with(
             mock_progress_bar.update, open_mock.return_value, "read"
@@ -62,6 +63,7 @@ class TestMinioAPI(TestCase):
             data=mock_CallbackIOWrapper.return_value,
             retry_callback=ANY,
         )
+        session.keep_tokens_refreshed.assert_called_once()
 
         # retry_callback
         open_mock.return_value.seek.assert_called_once_with(0)
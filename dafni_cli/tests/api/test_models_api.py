@@ -8,7 +8,13 @@ from dafni_cli.api.exceptions import (
     ResourceNotFoundError,
     ValidationError,
 )
-from dafni_cli.consts import NIMS_API_URL, VALIDATE_MODEL_CT
+from dafni_cli.consts import (
+    JSON_STREAM_CHUNK_SIZE,
+    MODELS_CACHE_GROUP,
+    NIMS_API_URL,
+    RESPONSE_CACHE_TTL,
+    VALIDATE_MODEL_CT,
+)
 from dafni_cli.tests.fixtures.session import create_mock_response
 
 TEST_MODELS_UPLOAD_RESPONSE = {
@@ -35,9 +41,30 @@ class TestModelsAPI(TestCase):
         # ASSERT
         session.get_request.assert_called_once_with(
             f"{NIMS_API_URL}/models/",
+            cache_ttl=RESPONSE_CACHE_TTL,
+            cache_group=MODELS_CACHE_GROUP,
         )
         self.assertEqual(result, session.get_request.return_value)
 
+    def test_iter_all_models(self):
+        """Tests that iter_all_models parses the models as the response is
+        streamed"""
+
+        # SETUP
+        session = MagicMock()
+        response = session.get_request.return_value.__enter__.return_value
+        response.iter_content.return_value = [b'[{"id": "mod', b'el-1"}, {"id": 2}]']
+
+        # CALL
+        result = list(models_api.iter_all_models(session))
+
+        # ASSERT
+        session.get_request.assert_called_once_with(
+            f"{NIMS_API_URL}/models/", stream=True
+        )
+        response.iter_content.assert_called_once_with(chunk_size=JSON_STREAM_CHUNK_SIZE)
+        self.assertEqual(result, [{"id": "model-1"}, {"id": 2}])
+
     def test_get_model(self):
         """Tests that get_model works as expected"""
 
@@ -51,6 +78,8 @@ class TestModelsAPI(TestCase):
         # ASSERT
         session.get_request.assert_called_once_with(
             f"{NIMS_API_URL}/models/{version_id}/",
+            cache_ttl=RESPONSE_CACHE_TTL,
+            cache_group=MODELS_CACHE_GROUP,
         )
         self.assertEqual(result, session.get_request.return_value)
 
@@ -178,6 +207,7 @@ class TestModelsAPI(TestCase):
         session.post_request.assert_called_once_with(
             url=f"{NIMS_API_URL}/models/upload/{upload_id}/ingest/",
             json={"version_message": version_message},
+            invalidate_cache_group=MODELS_CACHE_GROUP,
         )
         self.assertEqual(result, session.post_request.return_value)
 
@@ -203,6 +233,7 @@ class TestModelsAPI(TestCase):
         session.post_request.assert_called_once_with(
             url=f"{NIMS_API_URL}/models/{model_id}/upload/{upload_id}/ingest/",
             json={"version_message": version_message},
+            invalidate_cache_group=MODELS_CACHE_GROUP,
         )
         self.assertEqual(result, session.post_request.return_value)
 
@@ -219,5 +250,6 @@ class TestModelsAPI(TestCase):
         # ASSERT
         session.delete_request.assert_called_once_with(
             f"{NIMS_API_URL}/models/{version_id}/",
+            invalidate_cache_group=MODELS_CACHE_GROUP,
         )
         self.assertEqual(result, session.delete_request.return_value)
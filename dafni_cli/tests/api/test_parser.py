@@ -1,7 +1,8 @@
 from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
 from typing import ClassVar, List, Optional
 from unittest import TestCase
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, call, patch
 
 from dafni_cli.api.parser import (
     ParserBaseObject,
@@ -65,6 +66,26 @@ class TestDataclassDefault(ParserBaseObject):
     ]
 
 
+@dataclass
+class TestDataclassNestedKeys(ParserBaseObject):
+    """Dataclass for testing parsing values nested under multiple keys"""
+
+    value1: Optional[str] = None
+
+    _parser_params: ClassVar[List[ParserParam]] = [
+        ParserParam("value1", ["value4", "value4", "value"], str),
+    ]
+
+
+@dataclass
+class TestDataclassSubclass(TestDataclassNestedKeys):
+    """Subclass of a dataclass with different _parser_params"""
+
+    _parser_params: ClassVar[List[ParserParam]] = [
+        ParserParam("value1", "value2"),
+    ]
+
+
 TEST_DICT_DATA: dict = {
     "value1": 10,
     "value2": "24/04/2023",
@@ -109,7 +130,8 @@ class TestParser(TestCase):
         parsed_obj = ParserBaseObject.parse_from_dict(
             TestDataclassEmpty, TEST_DICT_DATA
         )
-        self.assertEqual(parsed_obj.__dict__, {"_dict": TEST_DICT_DATA})
+        self.assertEqual(parsed_obj.__dict__, {})
+        self.assertEqual(parsed_obj.dictionary, TEST_DICT_DATA)
 
     def test_parse_from_dict(self):
         """Tests that parse_from_dict parses basic data"""
@@ -249,14 +271,266 @@ class TestParser(TestCase):
         )
         self.assertEqual(parsed_obj, TestDataclassDefault(value1="test", value2=None))
 
+    def test_parse_from_dict_nested_keys(self):
+        """Tests that parse_from_dict parses values nested under multiple
+        keys, using the default when any of them are missing"""
+        self.assertEqual(
+            ParserBaseObject.parse_from_dict(TestDataclassNestedKeys, TEST_DICT_DATA),
+            TestDataclassNestedKeys(value1="test_value"),
+        )
+        self.assertEqual(
+            ParserBaseObject.parse_from_dict(
+                TestDataclassNestedKeys, {"value4": {"value3": {}}}
+            ),
+            TestDataclassNestedKeys(value1=None),
+        )
+
+    def test_parser_compiled_once_for_each_class(self):
+        """Tests that the parse function of each class is compiled once and
+        then reused, with subclasses using their own _parser_params"""
+
+        # SETUP
+        @dataclass
+        class TestDataclassCompiled(ParserBaseObject):
+            value1: str
+
+            _parser_params: ClassVar[List[ParserParam]] = [
+                ParserParam("value1", "value1", str),
+            ]
+
+        @dataclass
+        class TestDataclassCompiledSubclass(TestDataclassCompiled):
+            _parser_params: ClassVar[List[ParserParam]] = [
+                ParserParam("value1", "value2"),
+            ]
+
+        with patch.object(
+            ParserBaseObject,
+            "_compile_parser",
+            wraps=ParserBaseObject._compile_parser,
+        ) as mock_compile_parser:
+            # CALL
+            parsed_objs = ParserBaseObject.parse_from_dict_list(
+                TestDataclassCompiled, TEST_DICT_DATA_LIST
+            )
+            parsed_obj = ParserBaseObject.parse_from_dict(
+                TestDataclassCompiled, TEST_DICT_DATA
+            )
+            parsed_subclass_obj = ParserBaseObject.parse_from_dict(
+                TestDataclassCompiledSubclass, TEST_DICT_DATA
+            )
+
+        # ASSERT
+        self.assertEqual(
+            mock_compile_parser.call_args_list,
+            [
+                call(TestDataclassCompiled, True),
+                call(TestDataclassCompiledSubclass, True),
+            ],
+        )
+        self.assertEqual(
+            parsed_objs, [TestDataclassCompiled("10"), TestDataclassCompiled("20")]
+        )
+        self.assertEqual(parsed_obj, TestDataclassCompiled("10"))
+        self.assertEqual(
+            parsed_subclass_obj, TestDataclassCompiledSubclass("24/04/2023")
+        )
+
+    def test_parse_from_dict_without_dict(self):
+        """Tests that parse_from_dict with keep_dict=False doesn't keep the
+        dictionary of the object or of any nested in it"""
+
+        # CALL
+        parsed_obj = ParserBaseObject.parse_from_dict(
+            TestDataclass2, TEST_DICT_DATA, keep_dict=False
+        )
+
+        # ASSERT
+        self.assertEqual(
+            parsed_obj, ParserBaseObject.parse_from_dict(TestDataclass2, TEST_DICT_DATA)
+        )
+        self.assertIsNone(parsed_obj.dictionary)
+        self.assertIsNone(parsed_obj.value4.dictionary)
+
+    def test_parse_from_dict_lazy_without_dict(self):
+        """Tests that parse_from_dict with lazy=True and keep_dict=False still
+        parses values when accessed, but doesn't keep the dictionary of the
+        object or of any nested in it"""
+
+        # CALL
+        parsed_obj = ParserBaseObject.parse_from_dict(
+            TestDataclass2, TEST_DICT_DATA, lazy=True, keep_dict=False
+        )
+
+        # ASSERT
+        self.assertNotIn("value4", vars(parsed_obj))
+        self.assertEqual(
+            repr(parsed_obj),
+            repr(ParserBaseObject.parse_from_dict(TestDataclass2, TEST_DICT_DATA)),
+        )
+        self.assertIsNone(parsed_obj.dictionary)
+        self.assertIsNone(parsed_obj.value4.dictionary)
+
+    def test_parse_from_dict_slots(self):
+        """Tests that parsing a dataclass using slots works, and that lazily
+        parsing one still keeps the values decoded"""
+
+        # SETUP
+        @dataclass(slots=True)
+        class TestDataclassSlots(ParserBaseObject):
+            value1: str
+            value2: Optional[str] = None
+
+            _parser_params: ClassVar[List[ParserParam]] = [
+                ParserParam("value1", "value1", str),
+                ParserParam("value2", "value2"),
+            ]
+
+        # CALL
+        parsed_obj = ParserBaseObject.parse_from_dict(
+            TestDataclassSlots, TEST_DICT_DATA
+        )
+        lazy_parsed_obj = ParserBaseObject.parse_from_dict(
+            TestDataclassSlots, TEST_DICT_DATA, lazy=True
+        )
+
+        # ASSERT
+        self.assertFalse(hasattr(parsed_obj, "__dict__"))
+        self.assertEqual(parsed_obj, TestDataclassSlots("10", "24/04/2023"))
+        self.assertEqual(parsed_obj.dictionary, TEST_DICT_DATA)
+        self.assertEqual(lazy_parsed_obj.value1, "10")
+        self.assertEqual(vars(lazy_parsed_obj)["value1"], "10")
+        self.assertEqual(lazy_parsed_obj.dictionary, TEST_DICT_DATA)
+
+    def test_parse_from_dict_lazy(self):
+        """Tests that parse_from_dict with lazy=True only parses each value
+        when it is first accessed, and then keeps it"""
+
+        # SETUP
+        mock_parse_value1 = MagicMock()
+        mock_parse_value2 = MagicMock()
+
+        @dataclass
+        class TestDataclassLazy(ParserBaseObject):
+            value1: str
+            value2: str
+
+            _parser_params: ClassVar[List[ParserParam]] = [
+                ParserParam("value1", "value1", mock_parse_value1),
+                ParserParam("value2", "value2", mock_parse_value2),
+            ]
+
+        # CALL
+        parsed_obj = ParserBaseObject.parse_from_dict(
+            TestDataclassLazy, TEST_DICT_DATA, lazy=True
+        )
+
+        # ASSERT
+        self.assertIsInstance(parsed_obj, TestDataclassLazy)
+        self.assertEqual(parsed_obj._dict, TEST_DICT_DATA)
+        mock_parse_value1.assert_not_called()
+
+        self.assertEqual(parsed_obj.value1, mock_parse_value1.return_value)
+        self.assertEqual(parsed_obj.value1, mock_parse_value1.return_value)
+        mock_parse_value1.assert_called_once_with(10)
+        mock_parse_value2.assert_not_called()
+
+    def test_parse_from_dict_lazy_nested_data(self):
+        """Tests that parse_from_dict with lazy=True parses nested
+        structures lazily, giving the same values as parsing them eagerly"""
+
+        # CALL
+        parsed_obj = ParserBaseObject.parse_from_dict(
+            TestDataclass2, TEST_DICT_DATA, lazy=True
+        )
+
+        # ASSERT
+        self.assertIsInstance(parsed_obj.value4, TestDataclass1)
+        self.assertNotIn("value1", vars(parsed_obj.value4))
+        self.assertEqual(
+            repr(parsed_obj),
+            repr(ParserBaseObject.parse_from_dict(TestDataclass2, TEST_DICT_DATA)),
+        )
+
+    def test_parse_from_dict_list_lazy(self):
+        """Tests that parse_from_dict_list with lazy=True works correctly"""
+
+        # CALL
+        parsed_objs = ParserBaseObject.parse_from_dict_list(
+            TestDataclassNestedKeys,
+            [TEST_DICT_DATA, {"value4": {"value3": {}}}],
+            lazy=True,
+        )
+
+        # ASSERT
+        self.assertEqual(
+            [parsed_obj.value1 for parsed_obj in parsed_objs], ["test_value", None]
+        )
+
+    def test_parse_from_dict_lazy_default_values(self):
+        """Tests that parse_from_dict with lazy=True uses the default of a
+        value that is missing from the dictionary, and only throws an error
+        when a required one is accessed"""
+
+        # CALL
+        parsed_obj = ParserBaseObject.parse_from_dict(
+            TestDataclassDefault, {}, lazy=True
+        )
+
+        # ASSERT
+        self.assertIsNone(parsed_obj.value2)
+        with self.assertRaises(TypeError) as err:
+            parsed_obj.value1
+        self.assertEqual(
+            str(err.exception),
+            (
+                "At least one class attribute in 'TestDataclassDefault' was "
+                "either missing from the dictionary or was parsed to be 'None' "
+                "but doesn't have a default value."
+            ),
+        )
+
 
 class TestParseFunctions(TestCase):
     @patch("dafni_cli.api.parser.isoparse")
     def test_parse_datetime(self, mock_isoparse):
-        """Tests parse_datetime functions correctly"""
+        """Tests parse_datetime functions correctly for the formats returned
+        by DAFNI without needing isoparse"""
+
+        # SETUP
+        expected_datetimes = {
+            "2023-04-24T12:34:56Z": datetime(
+                2023, 4, 24, 12, 34, 56, tzinfo=timezone.utc
+            ),
+            "2023-04-24T12:34:56.123Z": datetime(
+                2023, 4, 24, 12, 34, 56, 123000, tzinfo=timezone.utc
+            ),
+            "2023-04-24T12:34:56.123456Z": datetime(
+                2023, 4, 24, 12, 34, 56, 123456, tzinfo=timezone.utc
+            ),
+            "2023-04-24T12:34:56+01:00": datetime(
+                2023, 4, 24, 12, 34, 56, tzinfo=timezone(timedelta(hours=1))
+            ),
+        }
+
+        for date_string, expected_datetime in expected_datetimes.items():
+            with self.subTest(date_string=date_string):
+                # CALL
+                result = parse_datetime(date_string)
+
+                # ASSERT
+                self.assertEqual(result, expected_datetime)
+                self.assertEqual(result.utcoffset(), expected_datetime.utcoffset())
+        mock_isoparse.assert_not_called()
+
+    @patch("dafni_cli.api.parser.isoparse")
+    def test_parse_datetime_other_formats(self, mock_isoparse):
+        """Tests parse_datetime falls back on isoparse for formats
+        datetime.fromisoformat can't parse"""
 
         # SETUP
-        date_string = MagicMock()
+        parse_datetime.cache_clear()
+        date_string = "Not an ISO 8601 datetime"
 
         # CALL
         result = parse_datetime(date_string)
@@ -265,6 +539,21 @@ class TestParseFunctions(TestCase):
         mock_isoparse.assert_called_once_with(date_string)
         self.assertEqual(result, mock_isoparse.return_value)
 
+    def test_parse_datetime_memoised(self):
+        """Tests parse_datetime reuses the result for a datetime string it
+        has recently parsed"""
+
+        # SETUP
+        parse_datetime.cache_clear()
+
+        # CALL
+        result1 = parse_datetime("2023-04-24T12:34:56Z")
+        result2 = parse_datetime("2023-04-24T12:34:56Z")
+
+        # ASSERT
+        self.assertIs(result1, result2)
+        self.assertEqual(parse_datetime.cache_info().hits, 1)
+
     @patch.object(ParserBaseObject, "parse_from_dict")
     def test_parse_dict_retaining_keys(self, mock_parse_from_dict):
         """Tests parse_dict_retaining_keys functions correctly"""
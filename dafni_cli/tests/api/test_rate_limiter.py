@@ -0,0 +1,180 @@
+import threading
+import time
+from unittest import TestCase
+from unittest.mock import call, patch
+
+from dafni_cli.api.rate_limiter import RateLimit, RateLimiter, RateLimiterStats
+from dafni_cli.consts import NIMS_API_URL, REQUEST_RATE_LIMITS
+
+
+class TestRateLimiter(TestCase):
+    """Test class to test the RateLimiter class"""
+
+    def test_default_rate_limits(self):
+        """Tests that the limits in consts are used by default"""
+
+        # CALL
+        rate_limiter = RateLimiter()
+
+        # ASSERT
+        self.assertEqual(
+            rate_limiter._get_limiter(f"{NIMS_API_URL}/models/")._rate_limit,
+            RateLimit(**REQUEST_RATE_LIMITS[NIMS_API_URL]),
+        )
+
+    def test_get_limiter_by_base_url(self):
+        """Tests that URLs are limited by the most specific base URL they
+        start with, and otherwise separately for each host"""
+
+        # SETUP
+        rate_limiter = RateLimiter(
+            rate_limits={
+                "https://service.com": RateLimit(),
+                "https://service.com/api": RateLimit(),
+            },
+            default_rate_limit=RateLimit(),
+        )
+
+        # CALL
+        service = rate_limiter._get_limiter("https://service.com/endpoint")
+        service_api = rate_limiter._get_limiter("https://service.com/api/endpoint")
+        host_1 = rate_limiter._get_limiter("https://host-1.com/some/file?a=b")
+        host_1_again = rate_limiter._get_limiter("https://host-1.com/other/file")
+        host_2 = rate_limiter._get_limiter("https://host-2.com/some/file")
+
+        # ASSERT
+        self.assertIs(service, rate_limiter._limiters["https://service.com"])
+        self.assertIs(service_api, rate_limiter._limiters["https://service.com/api"])
+        self.assertIs(host_1, rate_limiter._limiters["https://host-1.com"])
+        self.assertIs(host_1, host_1_again)
+        self.assertIs(host_2, rate_limiter._limiters["https://host-2.com"])
+
+    @patch("dafni_cli.api.rate_limiter.time")
+    def test_limit_waits_for_tokens(self, mock_time):
+        """Tests that requests are only delayed once the burst has been used
+        up, and then wait for the next token to become available"""
+
+        # SETUP
+        mock_time.monotonic.return_value = 100
+        rate_limiter = RateLimiter(
+            rate_limits={
+                "https://service.com": RateLimit(requests_per_second=2, burst=2)
+            }
+        )
+
+        # CALL
+        for _ in range(4):
+            with rate_limiter.limit("https://service.com/endpoint"):
+                pass
+
+        # ASSERT
+        # Each request after the first 2 reserves the next token
+        self.assertEqual(mock_time.sleep.call_args_list, [call(0.5), call(1.0)])
+
+    @patch("dafni_cli.api.rate_limiter.time")
+    def test_limit_refills_tokens(self, mock_time):
+        """Tests that tokens are added to the bucket over time"""
+
+        # SETUP
+        mock_time.monotonic.return_value = 100
+        rate_limiter = RateLimiter(
+            rate_limits={
+                "https://service.com": RateLimit(requests_per_second=2, burst=1)
+            }
+        )
+        with rate_limiter.limit("https://service.com/endpoint"):
+            pass
+
+        # CALL
+        mock_time.monotonic.return_value = 100.5
+        with rate_limiter.limit("https://service.com/endpoint"):
+            pass
+
+        # ASSERT
+        mock_time.sleep.assert_not_called()
+
+    def test_limit_max_in_flight(self):
+        """Tests that no more than max_in_flight requests are in flight at
+        once"""
+
+        # SETUP
+        rate_limiter = RateLimiter(
+            rate_limits={"https://service.com": RateLimit(max_in_flight=2)}
+        )
+        lock = threading.Lock()
+        in_flight = 0
+        max_in_flight = 0
+
+        def send_request():
+            nonlocal in_flight, max_in_flight
+            with rate_limiter.limit("https://service.com/endpoint"):
+                with lock:
+                    in_flight += 1
+                    max_in_flight = max(max_in_flight, in_flight)
+                time.sleep(0.02)
+                with lock:
+                    in_flight -= 1
+
+        # CALL
+        threads = [threading.Thread(target=send_request) for _ in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # ASSERT
+        self.assertEqual(max_in_flight, 2)
+        stats = rate_limiter.get_stats()["https://service.com"]
+        self.assertEqual(stats.requests, 6)
+        self.assertGreater(stats.max_wait, 0)
+        self.assertGreaterEqual(stats.total_wait, stats.max_wait)
+
+    def test_limit_releases_after_error(self):
+        """Tests that a place in flight is released when a request raises an
+        error"""
+
+        # SETUP
+        rate_limiter = RateLimiter(
+            rate_limits={"https://service.com": RateLimit(max_in_flight=1)}
+        )
+
+        # CALL
+        with self.assertRaises(ValueError):
+            with rate_limiter.limit("https://service.com/endpoint"):
+                raise ValueError("Some error")
+
+        # ASSERT
+        with rate_limiter.limit("https://service.com/endpoint"):
+            pass
+
+    @patch("dafni_cli.api.rate_limiter.time")
+    def test_get_stats(self, mock_time):
+        """Tests that get_stats returns the number of requests and time
+        waited only for services requests have been sent to"""
+
+        # SETUP
+        mock_time.monotonic.side_effect = [0, 0, 0, 0, 0, 0, 0.5, 1]
+        rate_limiter = RateLimiter(
+            rate_limits={
+                "https://service.com": RateLimit(requests_per_second=1, burst=1),
+                "https://other-service.com": RateLimit(),
+            },
+            default_rate_limit=RateLimit(),
+        )
+
+        # CALL
+        with rate_limiter.limit("https://service.com/endpoint"):
+            pass
+        with rate_limiter.limit("https://service.com/endpoint"):
+            pass
+        result = rate_limiter.get_stats()
+
+        # ASSERT
+        self.assertEqual(
+            result,
+            {
+                "https://service.com": RateLimiterStats(
+                    requests=2, total_wait=1, max_wait=1
+                )
+            },
+        )
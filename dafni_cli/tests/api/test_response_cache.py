@@ -0,0 +1,226 @@
+import os
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from unittest.mock import patch
+
+from dafni_cli.api.response_cache import CachedResponse, ResponseCache
+
+
+class TestResponseCache(TestCase):
+    """Test class to test the ResponseCache class"""
+
+    def setUp(self) -> None:
+        super().setUp()
+
+        temp_dir = TemporaryDirectory("test")
+        self.addCleanup(temp_dir.cleanup)
+        self.directory = Path(temp_dir.name)
+
+        self.cache = ResponseCache(self.directory)
+
+    def _get_response(self, username: str, url: str):
+        """Returns the response cached for a user and URL (or None if there
+        isn't one)"""
+        cached_response = self.cache.get(username, url)
+        return None if cached_response is None else cached_response.response
+
+    def test_get_when_not_cached(self):
+        """Tests that get returns None when nothing has been cached"""
+        self.assertIsNone(self._get_response("user", "url"))
+
+    def test_set_and_get(self):
+        """Tests that a cached response can be retrieved only by the same
+        user for the same URL"""
+
+        # CALL
+        self.cache.set("user", "url", {"key": "value"}, ttl=60)
+
+        # ASSERT
+        self.assertEqual(self._get_response("user", "url"), {"key": "value"})
+        self.assertIsNone(self._get_response("other_user", "url"))
+        self.assertIsNone(self._get_response("user", "other_url"))
+
+    @patch("dafni_cli.api.response_cache.time")
+    def test_get_when_expired(self, mock_time):
+        """Tests that responses are only returned until they expire"""
+
+        # SETUP
+        mock_time.time.return_value = 1000
+        self.cache.set("user", "url", ["expiring"], ttl=60)
+
+        # CALL & ASSERT
+        mock_time.time.return_value = 1059
+        self.assertEqual(self._get_response("user", "url"), ["expiring"])
+
+        mock_time.time.return_value = 1060
+        self.assertIsNone(self._get_response("user", "url"))
+
+    @patch("dafni_cli.api.response_cache.time")
+    def test_get_when_expired_with_validators(self, mock_time):
+        """Tests that expired responses are still returned when they have
+        validators that can be used to revalidate them"""
+
+        # SETUP
+        mock_time.time.return_value = 1000
+        self.cache.set("user", "url", ["etag"], ttl=60, etag='"etag"')
+        self.cache.set(
+            "user",
+            "other_url",
+            ["last_modified"],
+            ttl=60,
+            last_modified="Wed, 21 Oct 2015 07:28:00 GMT",
+        )
+
+        # CALL
+        result = self.cache.get("user", "url")
+        mock_time.time.return_value = 1060
+        expired_results = [
+            self.cache.get("user", "url"),
+            self.cache.get("user", "other_url"),
+        ]
+
+        # ASSERT
+        self.assertEqual(
+            result,
+            CachedResponse(response=["etag"], expired=False, etag='"etag"'),
+        )
+        self.assertEqual(
+            expired_results,
+            [
+                CachedResponse(response=["etag"], expired=True, etag='"etag"'),
+                CachedResponse(
+                    response=["last_modified"],
+                    expired=True,
+                    last_modified="Wed, 21 Oct 2015 07:28:00 GMT",
+                ),
+            ],
+        )
+        self.assertEqual(
+            [
+                cached_response.conditional_headers
+                for cached_response in expired_results
+            ],
+            [
+                {"If-None-Match": '"etag"'},
+                {"If-Modified-Since": "Wed, 21 Oct 2015 07:28:00 GMT"},
+            ],
+        )
+
+    def test_get_when_invalid(self):
+        """Tests that get ignores a file that isn't a valid cached response"""
+
+        # SETUP
+        self.cache.set("user", "url", {"key": "value"}, ttl=60)
+        (path,) = self.directory.glob("*/*/*.json")
+        path.write_text("not json", encoding="utf-8")
+
+        # CALL & ASSERT
+        self.assertIsNone(self._get_response("user", "url"))
+
+    def test_set_and_get_in_group(self):
+        """Tests that a response cached in a group can only be retrieved from
+        that group"""
+
+        # CALL
+        self.cache.set("user", "url", "response", ttl=60, group="group")
+
+        # ASSERT
+        self.assertEqual(self.cache.get("user", "url", "group").response, "response")
+        self.assertIsNone(self.cache.get("user", "url", "other_group"))
+        self.assertIsNone(self.cache.get("user", "url"))
+
+    def test_invalidate(self):
+        """Tests that invalidate removes all of a user's responses in a group,
+        or for a single URL that isn't in one"""
+
+        # SETUP
+        self.cache.set("user", "url1", "response1", ttl=60, group="group")
+        self.cache.set("user", "url2", "response2", ttl=60, group="group")
+        self.cache.set("user", "url3", "response3", ttl=60, group="other_group")
+        self.cache.set("user", "url4", "response4", ttl=60)
+        self.cache.set("user", "url5", "response5", ttl=60)
+        self.cache.set("other_user", "url1", "other_response", ttl=60, group="group")
+
+        # CALL
+        self.cache.invalidate("user", "group")
+        self.cache.invalidate("user", "url4")
+
+        # ASSERT
+        self.assertIsNone(self.cache.get("user", "url1", "group"))
+        self.assertIsNone(self.cache.get("user", "url2", "group"))
+        self.assertEqual(
+            self.cache.get("user", "url3", "other_group").response, "response3"
+        )
+        self.assertIsNone(self._get_response("user", "url4"))
+        self.assertEqual(self._get_response("user", "url5"), "response5")
+        self.assertEqual(
+            self.cache.get("other_user", "url1", "group").response, "other_response"
+        )
+
+    def test_clear(self):
+        """Tests that clear removes all of a user's responses"""
+
+        # SETUP
+        self.cache.set("user", "url", "response", ttl=60)
+        self.cache.set("user", "other_url", "other_response", ttl=60)
+        self.cache.set("other_user", "url", "other_response", ttl=60)
+
+        # CALL
+        self.cache.clear("user")
+
+        # ASSERT
+        self.assertIsNone(self._get_response("user", "url"))
+        self.assertIsNone(self._get_response("user", "other_url"))
+        self.assertEqual(self._get_response("other_user", "url"), "other_response")
+
+    def test_least_recently_used_evicted(self):
+        """Tests that the least recently used responses are removed once the
+        cache is larger than its maximum size"""
+
+        # SETUP
+        response = "x" * 100
+        self.cache.set("user", "url1", response, ttl=60)
+        self.cache.set("user", "url2", response, ttl=60)
+        entry_size = next(self.directory.glob("*/*/*.json")).stat().st_size
+        # Allow for the expiry times written differing slightly in length
+        self.cache = ResponseCache(self.directory, max_size=entry_size * 5 // 2)
+
+        # Make url1 the oldest, and then use it so url2 is least recently used
+        for index, url in enumerate(["url1", "url2"]):
+            os.utime(
+                self.cache._get_entry_path("user", url),
+                (index, index),
+            )
+        self.assertEqual(self._get_response("user", "url1"), response)
+
+        # CALL
+        self.cache.set("user", "url3", response, ttl=60)
+
+        # ASSERT
+        self.assertEqual(self._get_response("user", "url1"), response)
+        self.assertIsNone(self._get_response("user", "url2"))
+        self.assertEqual(self._get_response("user", "url3"), response)
+
+    def test_only_finds_size_when_needed(self):
+        """Tests that the cached responses are only gone through to find
+        their total size the first time one is cached, and then only once
+        the size kept track of exceeds the maximum"""
+
+        # SETUP
+        response = "x" * 100
+        self.cache.set("user", "url1", response, ttl=60)
+        entry_size = next(self.directory.glob("*/*/*.json")).stat().st_size
+        self.cache = ResponseCache(self.directory, max_size=entry_size * 5 // 2)
+
+        with patch.object(self.cache, "_evict", wraps=self.cache._evict) as mock_evict:
+            # CALL
+            self.cache.set("user", "url2", response, ttl=60)
+            self.cache.set("user", "url2", response, ttl=60)
+            evict_calls_within_size = mock_evict.call_count
+            self.cache.set("user", "url3", response, ttl=60)
+
+        # ASSERT
+        self.assertEqual(evict_calls_within_size, 1)
+        self.assertEqual(mock_evict.call_count, 2)
+        self.assertEqual(len(list(self.directory.glob("*/*/*.json"))), 2)
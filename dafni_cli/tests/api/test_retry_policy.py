@@ -0,0 +1,209 @@
+from unittest import TestCase
+from unittest.mock import MagicMock, patch
+
+from dafni_cli.api.retry_policy import RetryBudget, RetryPolicy
+
+
+class TestRetryBudget(TestCase):
+    """Test class to test the RetryBudget class"""
+
+    def test_withdraw_limited_by_reserve(self):
+        """Tests that only 'reserve' retries are initially available"""
+
+        # SETUP
+        budget = RetryBudget(ratio=0.5, reserve=2)
+
+        # CALL & ASSERT
+        self.assertTrue(budget.withdraw())
+        self.assertTrue(budget.withdraw())
+        self.assertFalse(budget.withdraw())
+
+    def test_deposit(self):
+        """Tests that each request sent adds 'ratio' retries to the budget
+        (up to the reserve)"""
+
+        # SETUP
+        budget = RetryBudget(ratio=0.5, reserve=2)
+        budget.withdraw()
+        budget.withdraw()
+
+        # CALL
+        budget.deposit()
+
+        # ASSERT
+        self.assertFalse(budget.withdraw())
+        budget.deposit()
+        self.assertTrue(budget.withdraw())
+
+        for _ in range(10):
+            budget.deposit()
+        self.assertTrue(budget.withdraw())
+        self.assertTrue(budget.withdraw())
+        self.assertFalse(budget.withdraw())
+
+
+class TestRetryPolicy(TestCase):
+    """Test class to test the RetryPolicy class"""
+
+    def test_should_retry_response(self):
+        """Tests that only responses with the given status codes are
+        retried"""
+
+        # SETUP
+        policy = RetryPolicy(status_codes=[429, 503])
+
+        for status_code, expected in [(429, True), (503, True), (500, False)]:
+            with self.subTest(status_code=status_code):
+                response = MagicMock()
+                response.status_code = status_code
+
+                # CALL & ASSERT
+                self.assertEqual(policy.should_retry_response(response), expected)
+
+    def test_should_retry_response_non_idempotent(self):
+        """Tests that requests using non-idempotent methods are only retried
+        after responses with the non-idempotent status codes"""
+
+        # SETUP
+        policy = RetryPolicy(
+            status_codes=[429, 502, 503], non_idempotent_status_codes=[429, 503]
+        )
+
+        for method, status_code, expected in [
+            ("post", 429, True),
+            ("post", 503, True),
+            ("post", 502, False),
+            ("patch", 502, False),
+            ("get", 502, True),
+            ("put", 502, True),
+            ("delete", 502, True),
+        ]:
+            with self.subTest(method=method, status_code=status_code):
+                response = MagicMock()
+                response.status_code = status_code
+                response.headers = {}
+
+                # CALL & ASSERT
+                self.assertEqual(
+                    policy.should_retry_response(response, method), expected
+                )
+
+    def test_should_retry_response_retry_after_too_long(self):
+        """Tests that requests aren't retried when the Retry-After header
+        asks to wait for longer than max_wait"""
+
+        # SETUP
+        policy = RetryPolicy(max_wait=30, status_codes=[503])
+
+        for retry_after, expected in [("30", True), ("31", False), ("3600", False)]:
+            with self.subTest(retry_after=retry_after):
+                response = MagicMock()
+                response.status_code = 503
+                response.headers = {"Retry-After": retry_after}
+
+                # CALL & ASSERT
+                self.assertEqual(policy.should_retry_response(response), expected)
+
+    def test_allow_retry(self):
+        """Tests that retries are allowed up to max_retries"""
+
+        # SETUP
+        policy = RetryPolicy(max_retries=2)
+
+        # CALL & ASSERT
+        self.assertTrue(policy.allow_retry(0))
+        self.assertTrue(policy.allow_retry(1))
+        self.assertFalse(policy.allow_retry(2))
+
+    def test_allow_retry_uses_budget(self):
+        """Tests that retries are only allowed while the budget allows"""
+
+        # SETUP
+        policy = RetryPolicy(max_retries=5, budget=RetryBudget(ratio=1, reserve=1))
+
+        # CALL & ASSERT
+        self.assertTrue(policy.allow_retry(0))
+        self.assertFalse(policy.allow_retry(1))
+        policy.on_request()
+        self.assertTrue(policy.allow_retry(0))
+
+    @patch("dafni_cli.api.retry_policy.random")
+    def test_get_wait_exponential_backoff(self, mock_random):
+        """Tests that the wait is chosen at random up to a limit that doubles
+        with each retry up to max_wait"""
+
+        # SETUP
+        policy = RetryPolicy(base_wait=1, max_wait=5)
+
+        for retries, expected_limit in [(0, 1), (1, 2), (2, 4), (3, 5), (10, 5)]:
+            with self.subTest(retries=retries):
+                mock_random.reset_mock()
+
+                # CALL
+                result = policy.get_wait(retries)
+
+                # ASSERT
+                mock_random.uniform.assert_called_once_with(0, expected_limit)
+                self.assertEqual(result, mock_random.uniform.return_value)
+
+    def test_get_wait_retry_after_seconds(self):
+        """Tests that a Retry-After header giving a number of seconds is
+        used as the wait"""
+
+        # SETUP
+        policy = RetryPolicy(max_wait=30)
+        response = MagicMock()
+        response.headers = {"Retry-After": "20"}
+
+        # CALL
+        result = policy.get_wait(0, response)
+
+        # ASSERT
+        self.assertEqual(result, 20)
+
+    def test_get_wait_retry_after_limited_to_max_wait(self):
+        """Tests that the wait given by a Retry-After header is limited to
+        max_wait"""
+
+        # SETUP
+        policy = RetryPolicy(max_wait=30)
+        response = MagicMock()
+        response.headers = {"Retry-After": "120"}
+
+        # CALL
+        result = policy.get_wait(0, response)
+
+        # ASSERT
+        self.assertEqual(result, 30)
+
+    @patch("dafni_cli.api.retry_policy.time")
+    def test_get_wait_retry_after_date(self, mock_time):
+        """Tests that a Retry-After header giving a date waits until that
+        date"""
+
+        # SETUP
+        policy = RetryPolicy()
+        response = MagicMock()
+        response.headers = {"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"}
+        mock_time.time.return_value = 1445412480 - 30
+
+        # CALL
+        result = policy.get_wait(0, response)
+
+        # ASSERT
+        self.assertEqual(result, 30)
+
+    @patch("dafni_cli.api.retry_policy.random")
+    def test_get_wait_invalid_retry_after(self, mock_random):
+        """Tests that an invalid Retry-After header is ignored"""
+
+        # SETUP
+        policy = RetryPolicy()
+        response = MagicMock()
+        response.headers = {"Retry-After": "soon"}
+
+        # CALL
+        result = policy.get_wait(0, response)
+
+        # ASSERT
+        self.assertEqual(result, mock_random.uniform.return_value)
@@ -1,7 +1,10 @@
 import json
 import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from io import BufferedReader
 from pathlib import Path
+from tempfile import TemporaryDirectory
 from unittest import TestCase
 from unittest.mock import ANY, MagicMock, call, mock_open, patch
 
@@ -9,15 +12,25 @@ import requests
 from requests import HTTPError
 
 from dafni_cli.api.exceptions import DAFNIError, EndpointNotFoundError
-from dafni_cli.api.session import DAFNISession, LoginError
+from dafni_cli.api.response_cache import ResponseCache
+from dafni_cli.api.retry_policy import RetryBudget, RetryPolicy
+from dafni_cli.api.session import (
+    BlocksizeHTTPAdapter,
+    DAFNISession,
+    LoginError,
+    SessionData,
+)
 from dafni_cli.consts import (
     LOGIN_API_ENDPOINT,
     LOGOUT_API_ENDPOINT,
     REQUEST_ERROR_RETRY_ATTEMPTS,
     REQUEST_ERROR_RETRY_WAIT,
     REQUESTS_TIMEOUT,
+    RESPONSE_CACHE_DIR,
     SENDER_TYPE,
     SESSION_COOKIE,
+    TOKEN_REFRESH_CHECK_INTERVAL,
+    TOKEN_REFRESH_RETRY_WAIT,
     URLS_REQUIRING_COOKIE_AUTHENTICATION,
 )
 from dafni_cli.tests.fixtures.session import (
@@ -47,6 +60,13 @@ class TestDAFNISession(TestCase):
         # Unpatch all exceptions to avoid TypeErrors in except blocks
         self.mock_requests.exceptions = requests.exceptions
 
+        # Pooled session all authenticated requests should be sent through
+        self.mock_http_session = self.mock_requests.Session.return_value
+
+        # Avoid locking or replacing the actual session file
+        self.mock_file_lock = patch("dafni_cli.api.session.FileLock").start()
+        self.mock_replace = patch.object(Path, "replace").start()
+
         self.addCleanup(patch.stopall)
 
     def create_mock_session(self, use_file: bool, return_mock_file=False):
@@ -80,6 +100,71 @@ class TestDAFNISession(TestCase):
             mock_is_file.return_value = True
             self.assertEqual(session.has_session_file(), True)
 
+    @patch("dafni_cli.api.session.BlocksizeHTTPAdapter")
+    def test_http_session_uses_connection_pool(self, mock_http_adapter):
+        """Tests the session creates a single pooled requests Session to
+        send all requests through"""
+
+        # CALL
+        session = DAFNISession(
+            TEST_SESSION_DATA,
+            pool_connections=5,
+            pool_maxsize=20,
+            upload_chunk_size=4096,
+        )
+
+        # ASSERT
+        self.mock_requests.Session.assert_called_once_with()
+        mock_http_adapter.assert_called_once_with(
+            blocksize=4096, pool_connections=5, pool_maxsize=20
+        )
+        self.mock_http_session.mount.assert_has_calls(
+            [
+                call("https://", mock_http_adapter.return_value),
+                call("http://", mock_http_adapter.return_value),
+            ]
+        )
+        self.assertEqual(session._http_session, self.mock_http_session)
+
+    def test_requests_share_http_session(self):
+        """Tests all requests are sent through the same pooled requests
+        Session"""
+
+        # SETUP
+        session = self.create_mock_session(True)
+        session._check_response = MagicMock()
+
+        # CALL
+        session.get_request(url="some_test_url")
+        session.post_request(url="some_test_url")
+        session.put_request(url="some_test_url")
+        session.patch_request(url="some_test_url")
+        session.delete_request(url="some_test_url")
+
+        # ASSERT
+        self.mock_requests.Session.assert_called_once_with()
+        self.assertEqual(
+            [
+                request_call.args[0]
+                for request_call in self.mock_http_session.request.call_args_list
+            ],
+            ["get", "post", "put", "patch", "delete"],
+        )
+        self.mock_requests.request.assert_not_called()
+
+    def test_close(self):
+        """Tests closing the session closes the pooled requests Session"""
+
+        # SETUP
+        session = self.create_mock_session(True)
+
+        # CALL
+        with session:
+            pass
+
+        # ASSERT
+        self.mock_http_session.close.assert_called_once_with()
+
     def test_load(
         self,
     ):
@@ -308,7 +393,8 @@ class TestDAFNISession(TestCase):
             json.dumps(session._session_data.__dict__)
         )
 
-    def test_logout(self):
+    @patch("dafni_cli.api.session.ResponseCache")
+    def test_logout(self, mock_ResponseCache):
         """Tests can load existing session from a file"""
 
         # Load session from file data
@@ -319,6 +405,10 @@ class TestDAFNISession(TestCase):
             session.logout()
             mock_unlink.assert_called_once_with()
 
+        # Any cached responses should be removed
+        mock_ResponseCache.assert_called_once_with(Path.home() / RESPONSE_CACHE_DIR)
+        mock_ResponseCache.return_value.clear.assert_called_once_with(session.username)
+
         # Ensure appropriate logout endpoint is called
         self.mock_requests.post.assert_called_once_with(
             LOGOUT_API_ENDPOINT,
@@ -485,7 +575,7 @@ class TestDAFNISession(TestCase):
         )
 
         # ASSERT
-        self.mock_requests.request.assert_called_once_with(
+        self.mock_http_session.request.assert_called_once_with(
             "get",
             url="test_url",
             headers={
@@ -500,6 +590,96 @@ class TestDAFNISession(TestCase):
             verify=True,
         )
 
+    @patch("dafni_cli.api.session.DAFNISession._create_http_session")
+    def test_ensure_pool_maxsize(self, mock_create_http_session):
+        """Tests that ensure_pool_maxsize only replaces the requests Session
+        when it needs a larger connection pool"""
+
+        # SETUP
+        session = DAFNISession(
+            TEST_SESSION_DATA, pool_connections=5, pool_maxsize=10, upload_chunk_size=1
+        )
+        http_session = session._http_session
+        mock_create_http_session.reset_mock()
+
+        # CALL
+        session.ensure_pool_maxsize(10)
+        mock_create_http_session.assert_not_called()
+        session.ensure_pool_maxsize(20)
+
+        # ASSERT
+        http_session.close.assert_called_once()
+        mock_create_http_session.assert_called_once_with(5, 20, 1)
+        self.assertEqual(session._http_session, mock_create_http_session.return_value)
+
+    def test_authenticated_request_rate_limited(self):
+        """Tests sending a request via the DAFNISession waits for the rate
+        limiter and holds its place in flight while the request is sent"""
+
+        # SETUP
+        session = self.create_mock_session(True)
+        rate_limiter = MagicMock()
+        session._rate_limiter = rate_limiter
+
+        def request(*args, **kwargs):
+            # Should only be sent once allowed by the rate limiter
+            rate_limiter.limit.return_value.__enter__.assert_called_once()
+            rate_limiter.limit.return_value.__exit__.assert_not_called()
+            return create_mock_success_response()
+
+        self.mock_http_session.request.side_effect = request
+
+        # CALL
+        session._authenticated_request(
+            "get",
+            url="test_url",
+            headers={"Sender-Type": SENDER_TYPE},
+            data=None,
+            json=None,
+            allow_redirect=False,
+            stream=None,
+        )
+
+        # ASSERT
+        rate_limiter.limit.assert_called_once_with("test_url")
+        rate_limiter.limit.return_value.__enter__.assert_called_once()
+        rate_limiter.limit.return_value.__exit__.assert_called_once()
+        self.mock_http_session.request.assert_called_once()
+
+    def test_authenticated_request_rate_limited_until_streamed_response_closed(
+        self,
+    ):
+        """Tests that a streamed request holds its place in flight until its
+        response is closed, and only releases it once"""
+
+        # SETUP
+        session = self.create_mock_session(True)
+        rate_limiter = MagicMock()
+        session._rate_limiter = rate_limiter
+        response = create_mock_success_response()
+        close = response.close
+        self.mock_http_session.request.return_value = response
+
+        # CALL
+        result = session._authenticated_request(
+            "get",
+            url="test_url",
+            headers={"Sender-Type": SENDER_TYPE},
+            data=None,
+            json=None,
+            allow_redirect=False,
+            stream=True,
+        )
+
+        # ASSERT
+        self.assertEqual(result, response)
+        rate_limiter.limit.return_value.__exit__.assert_not_called()
+        result.close()
+        rate_limiter.limit.return_value.__exit__.assert_called_once()
+        result.close()
+        rate_limiter.limit.return_value.__exit__.assert_called_once()
+        close.assert_called()
+
     def _test_authenticated_request_cookie_auth(self, url: str):
         """Helper function that tests sending a request via the DAFNISession
         uses cookie authentication for a specific URL"""
@@ -516,7 +696,7 @@ class TestDAFNISession(TestCase):
             stream=None,
         )
 
-        self.mock_requests.request.assert_called_once_with(
+        self.mock_http_session.request.assert_called_once_with(
             "get",
             url=url,
             headers={"Sender-Type": SENDER_TYPE},
@@ -547,7 +727,7 @@ class TestDAFNISession(TestCase):
         result = session.get_request(url="some_test_url", content_type="content_type")
 
         # ASSERT
-        self.mock_requests.request.assert_called_once_with(
+        self.mock_http_session.request.assert_called_once_with(
             "get",
             url="some_test_url",
             headers={
@@ -564,12 +744,141 @@ class TestDAFNISession(TestCase):
         )
         session._check_response.assert_called_once_with(
             "some_test_url",
-            self.mock_requests.request.return_value,
+            self.mock_http_session.request.return_value,
             error_message_func=None,
         )
         self.assertEqual(
-            result, self.mock_requests.request.return_value.json.return_value
+            result, self.mock_http_session.request.return_value.json.return_value
+        )
+
+    def test_get_request_with_headers(self):
+        """Tests sending a get request via the DAFNISession with additional
+        headers"""
+
+        # SETUP
+        session = self.create_mock_session(True)
+        session._check_response = MagicMock()
+
+        # CALL
+        session.get_request(
+            url="some_test_url",
+            content_type="content_type",
+            headers={"Range": "bytes=10-"},
+        )
+
+        # ASSERT
+        self.mock_http_session.request.assert_called_once_with(
+            "get",
+            url="some_test_url",
+            headers={
+                "Sender-Type": SENDER_TYPE,
+                "Authorization": f"Bearer {TEST_ACCESS_TOKEN}",
+                "Content-Type": "content_type",
+                "Range": "bytes=10-",
+            },
+            data=None,
+            json=None,
+            allow_redirects=False,
+            stream=False,
+            timeout=REQUESTS_TIMEOUT,
+            verify=True,
+        )
+
+    def test_get_request_uses_response_cache(self):
+        """Tests that a get request given a cache_ttl returns a cached
+        response when one is available"""
+
+        # SETUP
+        session = self.create_mock_session(True)
+        session._check_response = MagicMock()
+        self.mock_http_session.request.return_value.json.return_value = {"key": "value"}
+        self.mock_http_session.request.return_value.headers = {}
+
+        with TemporaryDirectory("test") as temp_dir:
+            session._response_cache = ResponseCache(Path(temp_dir))
+
+            # CALL
+            results = [
+                session.get_request(url="some_test_url", cache_ttl=60) for _ in range(3)
+            ]
+
+        # ASSERT
+        self.mock_http_session.request.assert_called_once()
+        self.assertEqual(results, [{"key": "value"}] * 3)
+
+    def test_get_request_without_cache_ttl_ignores_response_cache(self):
+        """Tests that a get request isn't cached when not given a
+        cache_ttl, or when given headers"""
+
+        # SETUP
+        session = self.create_mock_session(True)
+        session._check_response = MagicMock()
+        session._response_cache = MagicMock()
+
+        # CALL
+        session.get_request(url="some_test_url")
+        session.get_request(
+            url="some_test_url", cache_ttl=60, headers={"Range": "bytes=10-"}
+        )
+
+        # ASSERT
+        self.assertEqual(self.mock_http_session.request.call_count, 2)
+        session._response_cache.get.assert_not_called()
+        session._response_cache.set.assert_not_called()
+
+    def test_response_cache_disabled_by_default(self):
+        """Tests that the response cache is only created when requested"""
+
+        # SETUP
+        with patch.object(
+            DAFNISession, "_get_response_cache_path"
+        ) as mock_get_response_cache_path:
+            mock_get_response_cache_path.return_value = Path("cache")
+
+            # CALL
+            session = DAFNISession(TEST_SESSION_DATA)
+            cached_session = DAFNISession(TEST_SESSION_DATA, use_response_cache=True)
+
+        # ASSERT
+        self.assertIsNone(session._response_cache)
+        self.assertIsInstance(cached_session._response_cache, ResponseCache)
+
+    def test_request_invalidates_response_cache_group(self):
+        """Tests that a request given an invalidate_cache_group removes the
+        cached responses in that group, and that others don't remove any"""
+
+        # SETUP
+        session = self.create_mock_session(True)
+        session._check_response = MagicMock()
+        session._response_cache = MagicMock()
+
+        # CALL
+        session.post_request(url="some_test_url")
+        session.put_request(url="some_test_url")
+        session.delete_request(url="some_test_url", invalidate_cache_group="group")
+
+        # ASSERT
+        session._response_cache.invalidate.assert_called_once_with(
+            session.username, "group"
         )
+        session._response_cache.clear.assert_not_called()
+
+    def test_get_request_when_stream_true_closes_response_on_error(self):
+        """Tests that a streamed response is closed when it isn't returned
+        due to an error"""
+
+        # SETUP
+        session = self.create_mock_session(True)
+        session._check_response = MagicMock(side_effect=HTTPError())
+        response = MagicMock()
+        session._authenticated_request = MagicMock(return_value=response)
+
+        # CALL
+        with self.assertRaises(HTTPError):
+            session.get_request(url="some_test_url", stream=True)
+
+        # ASSERT
+        response.close.assert_called_once()
 
     def test_get_request_when_stream_true_and_given_error_message_func(self):
         """Tests sending a get request via the DAFNISession when stream=True
@@ -589,7 +898,7 @@ class TestDAFNISession(TestCase):
         )
 
         # ASSERT
-        self.mock_requests.request.assert_called_once_with(
+        self.mock_http_session.request.assert_called_once_with(
             "get",
             url="some_test_url",
             headers={
@@ -606,10 +915,10 @@ class TestDAFNISession(TestCase):
         )
         session._check_response.assert_called_once_with(
             "some_test_url",
-            self.mock_requests.request.return_value,
+            self.mock_http_session.request.return_value,
             error_message_func=error_message_func,
         )
-        self.assertEqual(result, self.mock_requests.request.return_value)
+        self.assertEqual(result, self.mock_http_session.request.return_value)
 
     def test_post_request(self):
         """Tests sending a post request via the DAFNISession"""
@@ -622,7 +931,7 @@ class TestDAFNISession(TestCase):
         result = session.post_request(url="some_test_url", content_type="content_type")
 
         # ASSERT
-        self.mock_requests.request.assert_called_once_with(
+        self.mock_http_session.request.assert_called_once_with(
             "post",
             url="some_test_url",
             headers={
@@ -639,11 +948,11 @@ class TestDAFNISession(TestCase):
         )
         session._check_response.assert_called_once_with(
             "some_test_url",
-            self.mock_requests.request.return_value,
+            self.mock_http_session.request.return_value,
             error_message_func=None,
         )
         self.assertEqual(
-            result, self.mock_requests.request.return_value.json.return_value
+            result, self.mock_http_session.request.return_value.json.return_value
         )
 
     def test_post_request_when_given_error_message_func(self):
@@ -663,7 +972,7 @@ class TestDAFNISession(TestCase):
         )
 
         # ASSERT
-        self.mock_requests.request.assert_called_once_with(
+        self.mock_http_session.request.assert_called_once_with(
             "post",
             url="some_test_url",
             headers={
@@ -680,10 +989,10 @@ class TestDAFNISession(TestCase):
         )
         session._check_response.assert_called_once_with(
             "some_test_url",
-            self.mock_requests.request.return_value,
+            self.mock_http_session.request.return_value,
             error_message_func=error_message_func,
         )
-        self.assertEqual(result, self.mock_requests.request.return_value.json())
+        self.assertEqual(result, self.mock_http_session.request.return_value.json())
 
     def test_put_request(self):
         """Tests sending a put request via the DAFNISession"""
@@ -696,7 +1005,7 @@ class TestDAFNISession(TestCase):
         result = session.put_request(url="some_test_url", content_type="content_type")
 
         # ASSERT
-        self.mock_requests.request.assert_called_once_with(
+        self.mock_http_session.request.assert_called_once_with(
             "put",
             url="some_test_url",
             headers={
@@ -713,10 +1022,10 @@ class TestDAFNISession(TestCase):
         )
         session._check_response.assert_called_once_with(
             "some_test_url",
-            self.mock_requests.request.return_value,
+            self.mock_http_session.request.return_value,
             error_message_func=None,
         )
-        self.assertEqual(result, self.mock_requests.request.return_value)
+        self.assertEqual(result, self.mock_http_session.request.return_value)
 
     def test_put_request_when_given_error_message_func(self):
         """Tests sending a put request via the DAFNISession when given an error
@@ -735,7 +1044,7 @@ class TestDAFNISession(TestCase):
         )
 
         # ASSERT
-        self.mock_requests.request.assert_called_once_with(
+        self.mock_http_session.request.assert_called_once_with(
             "put",
             url="some_test_url",
             headers={
@@ -752,10 +1061,10 @@ class TestDAFNISession(TestCase):
         )
         session._check_response.assert_called_once_with(
             "some_test_url",
-            self.mock_requests.request.return_value,
+            self.mock_http_session.request.return_value,
             error_message_func=error_message_func,
         )
-        self.assertEqual(result, self.mock_requests.request.return_value)
+        self.assertEqual(result, self.mock_http_session.request.return_value)
 
     def test_patch_request(self):
         """Tests sending a patch request via the DAFNISession"""
@@ -768,7 +1077,7 @@ class TestDAFNISession(TestCase):
         result = session.patch_request(url="some_test_url", content_type="content_type")
 
         # ASSERT
-        self.mock_requests.request.assert_called_once_with(
+        self.mock_http_session.request.assert_called_once_with(
             "patch",
             url="some_test_url",
             headers={
@@ -785,11 +1094,11 @@ class TestDAFNISession(TestCase):
         )
         session._check_response.assert_called_once_with(
             "some_test_url",
-            self.mock_requests.request.return_value,
+            self.mock_http_session.request.return_value,
             error_message_func=None,
         )
         self.assertEqual(
-            result, self.mock_requests.request.return_value.json.return_value
+            result, self.mock_http_session.request.return_value.json.return_value
         )
 
     def test_patch_request_when_given_error_message_func(self):
@@ -809,7 +1118,7 @@ class TestDAFNISession(TestCase):
         )
 
         # ASSERT
-        self.mock_requests.request.assert_called_once_with(
+        self.mock_http_session.request.assert_called_once_with(
             "patch",
             url="some_test_url",
             headers={
@@ -826,10 +1135,10 @@ class TestDAFNISession(TestCase):
         )
         session._check_response.assert_called_once_with(
             "some_test_url",
-            self.mock_requests.request.return_value,
+            self.mock_http_session.request.return_value,
             error_message_func=error_message_func,
         )
-        self.assertEqual(result, self.mock_requests.request.return_value.json())
+        self.assertEqual(result, self.mock_http_session.request.return_value.json())
 
     def test_delete_request(self):
         """Tests sending a delete request via the DAFNISession"""
@@ -842,7 +1151,7 @@ class TestDAFNISession(TestCase):
         result = session.delete_request(url="some_test_url")
 
         # ASSERT
-        self.mock_requests.request.assert_called_once_with(
+        self.mock_http_session.request.assert_called_once_with(
             "delete",
             url="some_test_url",
             headers={
@@ -858,10 +1167,10 @@ class TestDAFNISession(TestCase):
         )
         session._check_response.assert_called_once_with(
             "some_test_url",
-            self.mock_requests.request.return_value,
+            self.mock_http_session.request.return_value,
             error_message_func=None,
         )
-        self.assertEqual(result, self.mock_requests.request.return_value)
+        self.assertEqual(result, self.mock_http_session.request.return_value)
 
     def test_delete_request_when_given_error_message_func(self):
         """Tests sending a delete request via the DAFNISession when given an
@@ -878,7 +1187,7 @@ class TestDAFNISession(TestCase):
         )
 
         # ASSERT
-        self.mock_requests.request.assert_called_once_with(
+        self.mock_http_session.request.assert_called_once_with(
             "delete",
             url="some_test_url",
             headers={
@@ -894,10 +1203,10 @@ class TestDAFNISession(TestCase):
         )
         session._check_response.assert_called_once_with(
             "some_test_url",
-            self.mock_requests.request.return_value,
+            self.mock_http_session.request.return_value,
             error_message_func=error_message_func,
         )
-        self.assertEqual(result, self.mock_requests.request.return_value)
+        self.assertEqual(result, self.mock_http_session.request.return_value)
 
     def test_refresh(self):
         """Tests token refreshing on an authentication failure"""
@@ -909,7 +1218,7 @@ class TestDAFNISession(TestCase):
 
         # To trigger a refresh need a response with a 403 status code, then
         # should be successful when retried
-        self.mock_requests.request.side_effect = [
+        self.mock_http_session.request.side_effect = [
             create_mock_token_expiry_response(),
             create_mock_success_response(),
         ]
@@ -942,7 +1251,7 @@ class TestDAFNISession(TestCase):
 
         # Ensure get request is attempted again (should be successful the
         # second time here)
-        self.assertEqual(self.mock_requests.request.call_count, 2)
+        self.assertEqual(self.mock_http_session.request.call_count, 2)
 
     def test_refresh_when_uploading_file(self):
         """Tests token refreshing on an authentication failure while trying
@@ -957,7 +1266,7 @@ class TestDAFNISession(TestCase):
 
         # To trigger a refresh need a response with a 403 status code, then
         # should be successful when retried
-        self.mock_requests.request.side_effect = [
+        self.mock_http_session.request.side_effect = [
             create_mock_token_expiry_response(),
             create_mock_success_response(),
         ]
@@ -1002,7 +1311,7 @@ class TestDAFNISession(TestCase):
 
         # Ensure get request is attempted again (should be successful the
         # second time here)
-        self.assertEqual(self.mock_requests.request.call_count, 2)
+        self.assertEqual(self.mock_http_session.request.call_count, 2)
 
     def test_refresh_from_redirect(self):
         """Tests token refreshing on an authentication failure where we
@@ -1016,7 +1325,7 @@ class TestDAFNISession(TestCase):
 
         # To trigger a refresh need a response with a 403 status code, then
         # should be successful when retried
-        self.mock_requests.request.side_effect = [
+        self.mock_http_session.request.side_effect = [
             create_mock_token_expiry_redirect_response(),
             create_mock_success_response(),
         ]
@@ -1049,7 +1358,7 @@ class TestDAFNISession(TestCase):
 
         # Ensure get request is attempted again (should be successful the
         # second time here)
-        self.assertEqual(self.mock_requests.request.call_count, 2)
+        self.assertEqual(self.mock_http_session.request.call_count, 2)
 
     def test_refresh_login_error(self):
         """Tests a LoginError is raised when refreshing a token fails to
@@ -1062,7 +1371,9 @@ class TestDAFNISession(TestCase):
 
         # To trigger a refresh need a response with a 403 status code, then
         # should be successful when retried - here we keep it failing
-        self.mock_requests.request.return_value = create_mock_token_expiry_response()
+        self.mock_http_session.request.return_value = (
+            create_mock_token_expiry_response()
+        )
 
         # No new token
         self.mock_requests.post.return_value = create_mock_invalid_login_response()()
@@ -1086,7 +1397,9 @@ class TestDAFNISession(TestCase):
 
         # To trigger a refresh need a response with a 403 status code, then
         # should be successful when retried - here we keep it failing
-        self.mock_requests.request.return_value = create_mock_token_expiry_response()
+        self.mock_http_session.request.return_value = (
+            create_mock_token_expiry_response()
+        )
 
         # New token
         self.mock_requests.post.return_value = create_mock_access_token_response()
@@ -1101,7 +1414,7 @@ class TestDAFNISession(TestCase):
         self.assertEqual(
             str(error.exception),
             "Could not authenticate request: "
-            f"{self.mock_requests.request.return_value.content.decode.return_value}",
+            f"{self.mock_http_session.request.return_value.content.decode.return_value}",
         )
 
     @patch("click.prompt")
@@ -1115,7 +1428,7 @@ class TestDAFNISession(TestCase):
 
         # To trigger a refresh need a response with a 403 status code, then
         # should be successful when retried
-        self.mock_requests.request.side_effect = [
+        self.mock_http_session.request.side_effect = [
             create_mock_token_expiry_response(),
             create_mock_success_response(),
         ]
@@ -1173,7 +1486,7 @@ class TestDAFNISession(TestCase):
 
         # Ensure get request is attempted again (should be successful the
         # second time here)
-        self.assertEqual(self.mock_requests.request.call_count, 2)
+        self.assertEqual(self.mock_http_session.request.call_count, 2)
 
     def test_refresh_when_close_to_expiry(self):
         """Tests token refreshing occurs when close to the token expiry time"""
@@ -1184,7 +1497,7 @@ class TestDAFNISession(TestCase):
         # Here will test only on the get request as the logic is handled by
         # the base function called by all requests anyway
 
-        self.mock_requests.request.side_effect = [
+        self.mock_http_session.request.side_effect = [
             create_mock_success_response(),
         ]
 
@@ -1215,18 +1528,344 @@ class TestDAFNISession(TestCase):
         )
 
         # Should only try request once as refreshes before called in this case
-        self.assertEqual(self.mock_requests.request.call_count, 1)
+        self.assertEqual(self.mock_http_session.request.call_count, 1)
+
+    def test_refresh_once_for_concurrent_requests(self):
+        """Tests that when several threads find the tokens need refreshing
+        at once, only one of them refreshes them"""
+
+        # SETUP
+        session = self.create_mock_session(True)
+        session._session_data.timestamp_to_refresh = 0
+        new_token_response = create_mock_access_token_response()
+        new_token_response.json.return_value["access_token"] = "new_access_token"
+        self.mock_requests.post.return_value = new_token_response
+
+        # CALL
+        with (
+            patch.object(Path, "is_file") as mock_is_file,
+            patch("builtins.open", new_callable=mock_open),
+        ):
+            mock_is_file.return_value = False
+            threads = [
+                threading.Thread(target=session._check_and_refresh_tokens)
+                for _ in range(5)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        # ASSERT
+        self.mock_requests.post.assert_called_once()
+        self.assertEqual(session._session_data.access_token, "new_access_token")
+
+    def test_refresh_skipped_when_already_refreshed(self):
+        """Tests that refreshing is skipped when the access token found to
+        need refreshing has already been replaced"""
+
+        # SETUP
+        session = self.create_mock_session(True)
+
+        # CALL
+        session._refresh_tokens("old_access_token")
+
+        # ASSERT
+        self.mock_requests.post.assert_not_called()
+        self.assertEqual(session._session_data.access_token, TEST_ACCESS_TOKEN)
+
+    def test_refresh_uses_tokens_refreshed_by_another_process(self):
+        """Tests that tokens already refreshed and saved by another process
+        are used rather than requesting new ones"""
+
+        # SETUP
+        session = self.create_mock_session(True)
+        session._session_data.timestamp_to_refresh = 0
+        refreshed_session_file = json.dumps(
+            {
+                **TEST_SESSION_DATA.__dict__,
+                "access_token": "new_access_token",
+                "timestamp_to_refresh": 1e12,
+            }
+        )
+
+        # CALL
+        with (
+            patch.object(Path, "is_file") as mock_is_file,
+            patch(
+                "builtins.open",
+                new_callable=mock_open,
+                read_data=refreshed_session_file,
+            ),
+        ):
+            mock_is_file.return_value = True
+            session._check_and_refresh_tokens()
+
+        # ASSERT
+        self.mock_requests.post.assert_not_called()
+        self.mock_file_lock.return_value.__enter__.assert_called_once()
+        self.assertEqual(session._session_data.access_token, "new_access_token")
+
+    def test_save_session_data_replaces_file(self):
+        """Tests that the session file is written to a temporary file which
+        then replaces it"""
+
+        # SETUP
+        session = self.create_mock_session(True)
+        save_path = DAFNISession._get_login_save_path()
+
+        # CALL
+        with patch("builtins.open", new_callable=mock_open) as mock_file:
+            session._save_session_data()
+
+        # ASSERT
+        mock_file.assert_called_once_with(
+            save_path.with_name(f"{save_path.name}.tmp"), "w", encoding="utf-8"
+        )
+        self.mock_replace.assert_called_once_with(save_path)
+        self.mock_file_lock.return_value.__enter__.assert_called_once()
+
+    def test_refresh_without_login(self):
+        """Tests that refreshing without allowing the user to login again
+        raises a LoginError when the refresh token has expired"""
+
+        # SETUP
+        session = self.create_mock_session(True)
+        session.attempt_login = MagicMock()
+        self.mock_requests.post.return_value = (
+            create_mock_refresh_token_expiry_response()
+        )
+
+        # CALL
+        with self.assertRaises(LoginError):
+            session._refresh_tokens(allow_login=False)
+
+        # ASSERT
+        session.attempt_login.assert_not_called()
+
+    def test_refresh_expiry_logs_in_without_holding_locks(self):
+        """Tests that when the refresh token has expired the user is asked to
+        login again without holding the token or session file locks"""
+
+        # SETUP
+        session = self.create_mock_session(True)
+        mock_file_lock = self.mock_file_lock.return_value
+        self.mock_requests.post.return_value = (
+            create_mock_refresh_token_expiry_response()
+        )
+        locks_held = []
+
+        def attempt_login():
+            # Another thread should be able to acquire the token lock
+            thread = threading.Thread(
+                target=lambda: locks_held.append(
+                    not session._token_lock.acquire(blocking=False)
+                )
+            )
+            thread.start()
+            thread.join()
+            locks_held.append(
+                mock_file_lock.__enter__.call_count
+                != mock_file_lock.__exit__.call_count
+            )
+            session._session_data = SessionData(
+                username="test_username",
+                access_token="new_access_token",
+                refresh_token="new_refresh_token",
+                timestamp_to_refresh=float("inf"),
+            )
+
+        session.attempt_login = MagicMock(side_effect=attempt_login)
 
+        # CALL
+        with patch.object(Path, "is_file") as mock_is_file:
+            mock_is_file.return_value = False
+            session._refresh_tokens(session._session_data.access_token)
+
+        # ASSERT
+        session.attempt_login.assert_called_once_with()
+        self.assertEqual(locks_held, [False, False])
+        self.assertEqual(session._session_data.access_token, "new_access_token")
+
+    def test_refresh_expiry_skips_login_when_already_logged_in(self):
+        """Tests that the user isn't asked to login again when another thread
+        logged in while waiting to do so"""
+
+        # SETUP
+        session = self.create_mock_session(True)
+        session.attempt_login = MagicMock()
+        self.mock_requests.post.return_value = (
+            create_mock_refresh_token_expiry_response()
+        )
+        new_session_data = SessionData(
+            username="test_username",
+            access_token="new_access_token",
+            refresh_token="new_refresh_token",
+            timestamp_to_refresh=float("inf"),
+        )
+
+        # Replace the tokens once this thread is waiting to login
+        def acquire_login_lock(*args, **kwargs):
+            session._session_data = new_session_data
+            return login_lock.acquire(*args, **kwargs)
+
+        login_lock = threading.Lock()
+        session._login_lock = MagicMock()
+        session._login_lock.__enter__.side_effect = acquire_login_lock
+        session._login_lock.__exit__.side_effect = lambda *args: login_lock.release()
+
+        # CALL
+        session._refresh_tokens(TEST_ACCESS_TOKEN)
+
+        # ASSERT
+        session.attempt_login.assert_not_called()
+        self.assertEqual(session._session_data, new_session_data)
+
+    def test_token_refresher_refreshes_when_due(self):
+        """Tests that the token refresher refreshes the tokens once they are
+        due to be refreshed, without allowing the user to login again"""
+
+        # SETUP
+        session = self.create_mock_session(True)
+        session._session_data.timestamp_to_refresh = 0
+        stop = threading.Event()
+        session._refresh_tokens = MagicMock(
+            side_effect=lambda *args, **kwargs: stop.set()
+        )
+
+        # CALL
+        session._run_token_refresher(stop)
+
+        # ASSERT
+        session._refresh_tokens.assert_called_once_with(
+            TEST_ACCESS_TOKEN, allow_login=False
+        )
+
+    def test_token_refresher_waits_until_due(self):
+        """Tests that the token refresher waits until the tokens are due to be
+        refreshed, checking again at least every TOKEN_REFRESH_CHECK_INTERVAL"""
+
+        # SETUP
+        session = self.create_mock_session(True)
+        session._session_data.timestamp_to_refresh = float("inf")
+        session._refresh_tokens = MagicMock()
+        stop = MagicMock()
+        stop.is_set.return_value = False
+        stop.wait.side_effect = lambda timeout: stop.is_set.configure_mock(
+            return_value=True
+        )
+
+        # CALL
+        session._run_token_refresher(stop)
+
+        # ASSERT
+        stop.wait.assert_called_once_with(TOKEN_REFRESH_CHECK_INTERVAL)
+        session._refresh_tokens.assert_not_called()
+
+    def test_token_refresher_retries_after_request_error(self):
+        """Tests that the token refresher tries again after failing to
+        refresh the tokens due to a request error"""
+
+        # SETUP
+        session = self.create_mock_session(True)
+        session._session_data.timestamp_to_refresh = 0
+        stop = MagicMock()
+        stop.is_set.side_effect = [False, False, True]
+        session._refresh_tokens = MagicMock(
+            side_effect=[requests.ConnectionError(), None]
+        )
+
+        # CALL
+        session._run_token_refresher(stop)
+
+        # ASSERT
+        self.assertEqual(session._refresh_tokens.call_count, 2)
+        stop.wait.assert_called_once_with(TOKEN_REFRESH_RETRY_WAIT)
+
+    def test_token_refresher_retries_after_unexpected_error(self):
+        """Tests that the token refresher tries again rather than dying after
+        failing to refresh the tokens due to any other error"""
+
+        # SETUP
+        session = self.create_mock_session(True)
+        session._session_data.timestamp_to_refresh = 0
+        stop = MagicMock()
+        stop.is_set.side_effect = [False, False, False, True]
+        session._refresh_tokens = MagicMock(
+            side_effect=[ValueError("Invalid JSON"), KeyError("error"), None]
+        )
+
+        # CALL
+        session._run_token_refresher(stop)
+
+        # ASSERT
+        self.assertEqual(session._refresh_tokens.call_count, 3)
+        self.assertEqual(stop.wait.call_args_list, [call(TOKEN_REFRESH_RETRY_WAIT)] * 2)
+
+    def test_token_refresher_stops_on_login_error(self):
+        """Tests that the token refresher stops when the tokens can't be
+        refreshed without the user logging in again"""
+
+        # SETUP
+        session = self.create_mock_session(True)
+        session._session_data.timestamp_to_refresh = 0
+        stop = threading.Event()
+        session._refresh_tokens = MagicMock(side_effect=LoginError("Some error"))
+
+        # CALL
+        session._run_token_refresher(stop)
+
+        # ASSERT
+        session._refresh_tokens.assert_called_once()
+
+    @patch.object(DAFNISession, "_run_token_refresher")
+    def test_keep_tokens_refreshed(self, mock_run_token_refresher):
+        """Tests that keep_tokens_refreshed runs a single token refresher
+        until all uses of it have exited"""
+
+        # SETUP
+        session = self.create_mock_session(True)
+
+        # CALL
+        with session.keep_tokens_refreshed():
+            with session.keep_tokens_refreshed():
+                pass
+            stop = mock_run_token_refresher.call_args.args[0]
+
+            # ASSERT
+            mock_run_token_refresher.assert_called_once()
+            self.assertFalse(stop.is_set())
+        self.assertTrue(stop.is_set())
+        self.assertIsNone(session._token_refresher)
+
+    @patch.object(DAFNISession, "_run_token_refresher")
+    def test_close_stops_token_refresher(self, mock_run_token_refresher):
+        """Tests that closing the session stops the token refresher"""
+
+        # SETUP
+        session = self.create_mock_session(True)
+        session._start_token_refresher()
+        stop = mock_run_token_refresher.call_args.args[0]
+
+        # CALL
+        session.close()
+
+        # ASSERT
+        self.assertTrue(stop.is_set())
+        self.assertIsNone(session._token_refresher)
+
+    @patch("dafni_cli.api.retry_policy.random")
     @patch("dafni_cli.api.session.time")
-    def test_retry_on_error(self, mock_time):
+    def test_retry_on_error(self, mock_time, mock_random):
         """Tests that when requests raises an error the request is retired
-        multiple times while waiting in between before finally giving a
-        RuntimeError"""
+        multiple times while waiting an increasing time in between before
+        finally giving a RuntimeError"""
 
         # SETUP
         session = self.create_mock_session(True)
 
         retry_callback = MagicMock()
+        mock_random.uniform.side_effect = lambda a, b: b / 2
 
         # Here will test only on the get request as the logic is handled by
         # the base function called by all requests anyway
@@ -1236,7 +1875,7 @@ class TestDAFNISession(TestCase):
 
         # 3 retries = 4 attempts
         expected_number_of_attempts = REQUEST_ERROR_RETRY_ATTEMPTS + 1
-        self.mock_requests.request.side_effect = [requests.exceptions.SSLError] * (
+        self.mock_http_session.request.side_effect = [requests.exceptions.SSLError] * (
             expected_number_of_attempts
         )
 
@@ -1248,13 +1887,308 @@ class TestDAFNISession(TestCase):
             )
 
         self.assertEqual(
-            self.mock_requests.request.call_count, expected_number_of_attempts
+            self.mock_http_session.request.call_count, expected_number_of_attempts
+        )
+        # Exponential backoff with jitter
+        self.assertEqual(
+            mock_random.uniform.call_args_list,
+            [
+                call(0, REQUEST_ERROR_RETRY_WAIT * 2**retries)
+                for retries in range(REQUEST_ERROR_RETRY_ATTEMPTS)
+            ],
         )
         self.assertEqual(
             mock_time.sleep.call_args_list,
-            [call(REQUEST_ERROR_RETRY_WAIT)] * REQUEST_ERROR_RETRY_ATTEMPTS,
+            [
+                call(REQUEST_ERROR_RETRY_WAIT * 2**retries / 2)
+                for retries in range(REQUEST_ERROR_RETRY_ATTEMPTS)
+            ],
         )
+        self.assertEqual(retry_callback.call_count, REQUEST_ERROR_RETRY_ATTEMPTS)
         self.assertEqual(
             str(err.exception),
             f"Could not connect due to an error after retrying {REQUEST_ERROR_RETRY_ATTEMPTS} times",
         )
+
+    @patch("dafni_cli.api.session.time")
+    def test_retry_on_status_code_with_retry_after(self, mock_time):
+        """Tests that when a response has a status code that should be
+        retried, the request is retried after the time given by its
+        Retry-After header"""
+
+        # SETUP
+        session = self.create_mock_session(True)
+
+        unavailable_response = create_mock_response(503)
+        unavailable_response.headers = {"Retry-After": "7"}
+        success_response = create_mock_success_response()
+        self.mock_http_session.request.side_effect = [
+            unavailable_response,
+            success_response,
+        ]
+
+        # CALL
+        result = session.get_request(url="some_test_url")
+
+        # ASSERT
+        self.assertEqual(self.mock_http_session.request.call_count, 2)
+        unavailable_response.close.assert_called_once()
+        mock_time.sleep.assert_called_once_with(7)
+        self.assertEqual(result, success_response.json.return_value)
+
+    @patch("dafni_cli.api.session.time")
+    def test_post_not_retried_on_bad_gateway(self, mock_time):
+        """Tests that a POST request isn't retried after a response that
+        doesn't say whether it was processed, as it may have been"""
+
+        # SETUP
+        session = self.create_mock_session(True)
+
+        bad_gateway_response = create_mock_response(502, {"error": "Error"})
+        bad_gateway_response.headers = {}
+        self.mock_http_session.request.return_value = bad_gateway_response
+
+        # CALL
+        with self.assertRaises(DAFNIError):
+            session.post_request(url="some_test_url", json={})
+
+        # ASSERT
+        self.mock_http_session.request.assert_called_once()
+        mock_time.sleep.assert_not_called()
+
+    @patch("dafni_cli.api.session.time")
+    def test_post_retried_on_service_unavailable(self, mock_time):
+        """Tests that a POST request is retried after a response saying it
+        wasn't processed"""
+
+        # SETUP
+        session = self.create_mock_session(True)
+
+        unavailable_response = create_mock_response(503)
+        unavailable_response.headers = {"Retry-After": "7"}
+        success_response = create_mock_success_response()
+        self.mock_http_session.request.side_effect = [
+            unavailable_response,
+            success_response,
+        ]
+
+        # CALL
+        result = session.post_request(url="some_test_url", json={})
+
+        # ASSERT
+        self.assertEqual(self.mock_http_session.request.call_count, 2)
+        mock_time.sleep.assert_called_once_with(7)
+        self.assertEqual(result, success_response.json.return_value)
+
+    @patch("dafni_cli.api.session.time")
+    def test_retry_on_status_code_returns_last_response(self, mock_time):
+        """Tests that when a response with a status code that should be
+        retried is received after running out of retries, the error is
+        raised as normal"""
+
+        # SETUP
+        session = self.create_mock_session(True)
+        session._retry_policy = RetryPolicy(max_retries=1, base_wait=0)
+
+        unavailable_response = create_mock_response(429, {"error": "Error"})
+        unavailable_response.headers = {}
+        self.mock_http_session.request.return_value = unavailable_response
+
+        # CALL
+        with self.assertRaises(DAFNIError):
+            session.get_request(url="some_test_url")
+
+        # ASSERT
+        self.assertEqual(self.mock_http_session.request.call_count, 2)
+        mock_time.sleep.assert_called_once_with(0)
+
+    @patch("dafni_cli.api.session.time")
+    def test_retry_budget_limits_retries(self, mock_time):
+        """Tests that no more retries are made once the retry budget has run
+        out"""
+
+        # SETUP
+        session = self.create_mock_session(True)
+        session._retry_policy = RetryPolicy(
+            base_wait=0, budget=RetryBudget(ratio=0.5, reserve=1)
+        )
+
+        # Unpatch this to avoid TypeError in except block
+        self.mock_requests.exceptions.SSLError = requests.exceptions.SSLError
+        self.mock_http_session.request.side_effect = requests.exceptions.SSLError
+
+        # CALL & ASSERT
+        with self.assertRaises(RuntimeError) as err:
+            session.get_request(url="some_test_url")
+
+        # Only 1 retry available in the budget
+        self.assertEqual(self.mock_http_session.request.call_count, 2)
+        self.assertEqual(
+            str(err.exception),
+            "Could not connect due to an error after retrying 1 times",
+        )
+
+
+class TestBlocksizeHTTPAdapter(TestCase):
+    """Tests the BlocksizeHTTPAdapter class"""
+
+    def test_blocksize_given_to_connections(self):
+        """Tests the blocksize is passed to the connections created by the
+        adapter"""
+
+        # CALL
+        adapter = BlocksizeHTTPAdapter(blocksize=4096, pool_maxsize=5)
+
+        # ASSERT
+        self.assertEqual(adapter.poolmanager.connection_pool_kw["blocksize"], 4096)
+        self.assertEqual(adapter.poolmanager.connection_pool_kw["maxsize"], 5)
+
+    def test_blocksize_given_to_proxy_connections(self):
+        """Tests the blocksize is passed to the connections created by the
+        adapter when using a proxy"""
+
+        # CALL
+        adapter = BlocksizeHTTPAdapter(blocksize=4096)
+        proxy_manager = adapter.proxy_manager_for("http://proxy.example.com:8080")
+
+        # ASSERT
+        self.assertEqual(proxy_manager.connection_pool_kw["blocksize"], 4096)
+
+
+class StubETagHandler(BaseHTTPRequestHandler):
+    """Handler for a stub server returning a JSON body with an ETag, or a
+    304 when the request's If-None-Match header matches it"""
+
+    protocol_version = "HTTP/1.1"
+
+    # Body and ETag currently returned, and the headers of each request
+    # received (assigned by the test)
+    body: bytes
+    etag: str
+    request_headers: list
+
+    def do_GET(self):
+        self.request_headers.append(dict(self.headers))
+        if self.headers.get("If-None-Match") == self.etag:
+            self.send_response(304)
+            self.send_header("ETag", self.etag)
+            self.end_headers()
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(self.body)))
+        self.send_header("ETag", self.etag)
+        self.end_headers()
+        self.wfile.write(self.body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestDAFNISessionConditionalRequests(TestCase):
+    """Tests DAFNISession revalidates expired cached responses using
+    conditional requests against a local stub server"""
+
+    def setUp(self) -> None:
+        super().setUp()
+
+        StubETagHandler.body = b'[{"id": 1}]'
+        StubETagHandler.etag = '"v1"'
+        StubETagHandler.request_headers = []
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), StubETagHandler)
+        threading.Thread(
+            target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+        ).start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        self.url = f"http://127.0.0.1:{server.server_port}/models/"
+
+        temp_dir = TemporaryDirectory("test")
+        self.addCleanup(temp_dir.cleanup)
+
+        self.session = DAFNISession(TEST_SESSION_DATA)
+        self.session._response_cache = ResponseCache(Path(temp_dir.name))
+        self.addCleanup(self.session.close)
+
+    def test_not_modified_served_from_cache(self):
+        """Tests that a 304 response returns the cached response"""
+
+        # CALL
+        # (A ttl of 0 means the response needs revalidating every time)
+        results = [self.session.get_request(self.url, cache_ttl=0) for _ in range(3)]
+
+        # ASSERT
+        self.assertEqual(results, [[{"id": 1}]] * 3)
+        self.assertEqual(
+            [
+                headers.get("If-None-Match")
+                for headers in StubETagHandler.request_headers
+            ],
+            [None, '"v1"', '"v1"'],
+        )
+
+    def test_modified_replaces_cached_response(self):
+        """Tests that a changed response replaces the cached one"""
+
+        # SETUP
+        first_result = self.session.get_request(self.url, cache_ttl=0)
+        StubETagHandler.body = b'[{"id": 2}]'
+        StubETagHandler.etag = '"v2"'
+
+        # CALL
+        results = [self.session.get_request(self.url, cache_ttl=0) for _ in range(2)]
+
+        # ASSERT
+        self.assertEqual(first_result, [{"id": 1}])
+        self.assertEqual(results, [[{"id": 2}]] * 2)
+        self.assertEqual(
+            [
+                headers.get("If-None-Match")
+                for headers in StubETagHandler.request_headers
+            ],
+            [None, '"v1"', '"v2"'],
+        )
+
+    def test_unexpired_response_revalidated_when_requested(self):
+        """Tests that a session created with revalidate_response_cache
+        revalidates cached responses that haven't expired yet, so never uses
+        one that has since changed"""
+
+        # SETUP
+        first_result = self.session.get_request(self.url, cache_ttl=60)
+        StubETagHandler.body = b'[{"id": 2}]'
+        StubETagHandler.etag = '"v2"'
+        revalidating_session = DAFNISession(
+            TEST_SESSION_DATA, revalidate_response_cache=True
+        )
+        revalidating_session._response_cache = self.session._response_cache
+        self.addCleanup(revalidating_session.close)
+
+        # CALL
+        results = [
+            revalidating_session.get_request(self.url, cache_ttl=60) for _ in range(2)
+        ]
+
+        # ASSERT
+        self.assertEqual(first_result, [{"id": 1}])
+        self.assertEqual(results, [[{"id": 2}]] * 2)
+        self.assertEqual(
+            [
+                headers.get("If-None-Match")
+                for headers in StubETagHandler.request_headers
+            ],
+            [None, '"v1"', '"v2"'],
+        )
+
+    def test_unexpired_response_not_revalidated(self):
+        """Tests that no request is sent while a cached response hasn't
+        expired"""
+
+        # CALL
+        results = [self.session.get_request(self.url, cache_ttl=60) for _ in range(3)]
+
+        # ASSERT
+        self.assertEqual(results, [[{"id": 1}]] * 3)
+        self.assertEqual(len(StubETagHandler.request_headers), 1)
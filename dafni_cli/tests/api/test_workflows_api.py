@@ -11,7 +11,12 @@ from dafni_cli.api.exceptions import (
     ResourceNotFoundError,
     ValidationError,
 )
-from dafni_cli.consts import NIMS_API_URL
+from dafni_cli.consts import (
+    JSON_STREAM_CHUNK_SIZE,
+    NIMS_API_URL,
+    RESPONSE_CACHE_TTL,
+    WORKFLOWS_CACHE_GROUP,
+)
 from dafni_cli.tests.fixtures.session import (
     create_mock_error_response,
     create_mock_response,
@@ -34,9 +39,30 @@ class TestWorkflowsAPI(TestCase):
         # ASSERT
         session.get_request.assert_called_once_with(
             f"{NIMS_API_URL}/workflows/",
+            cache_ttl=RESPONSE_CACHE_TTL,
+            cache_group=WORKFLOWS_CACHE_GROUP,
         )
         self.assertEqual(result, session.get_request.return_value)
 
+    def test_iter_all_workflows(self):
+        """Tests that iter_all_workflows parses the workflows as the response
+        is streamed"""
+
+        # SETUP
+        session = MagicMock()
+        response = session.get_request.return_value.__enter__.return_value
+        response.iter_content.return_value = [b'[{"id": "work', b'flow-1"}, {"id": 2}]']
+
+        # CALL
+        result = list(workflows_api.iter_all_workflows(session))
+
+        # ASSERT
+        session.get_request.assert_called_once_with(
+            f"{NIMS_API_URL}/workflows/", stream=True
+        )
+        response.iter_content.assert_called_once_with(chunk_size=JSON_STREAM_CHUNK_SIZE)
+        self.assertEqual(result, [{"id": "workflow-1"}, {"id": 2}])
+
     def test_get_workflow(self):
         """Tests that get_workflow works as expected"""
 
@@ -50,6 +76,8 @@ class TestWorkflowsAPI(TestCase):
         # ASSERT
         session.get_request.assert_called_once_with(
             f"{NIMS_API_URL}/workflows/{version_id}/",
+            cache_ttl=RESPONSE_CACHE_TTL,
+            cache_group=WORKFLOWS_CACHE_GROUP,
         )
         self.assertEqual(result, session.get_request.return_value)
 
@@ -144,6 +172,7 @@ class TestWorkflowsAPI(TestCase):
                     "test_data": "test_data",
                 },
             },
+            invalidate_cache_group=WORKFLOWS_CACHE_GROUP,
         )
         self.assertEqual(result, session.post_request.return_value)
 
@@ -184,6 +213,7 @@ class TestWorkflowsAPI(TestCase):
                     "test_data": "test_data",
                 },
             },
+            invalidate_cache_group=WORKFLOWS_CACHE_GROUP,
         )
         self.assertEqual(result, session.post_request.return_value)
 
@@ -200,6 +230,7 @@ class TestWorkflowsAPI(TestCase):
         # ASSERT
         session.delete_request.assert_called_once_with(
             f"{NIMS_API_URL}/workflows/{version_id}/",
+            invalidate_cache_group=WORKFLOWS_CACHE_GROUP,
         )
         self.assertEqual(result, session.delete_request.return_value)
 
@@ -362,4 +393,5 @@ class TestWorkflowsAPI(TestCase):
             url=f"{NIMS_API_URL}/workflows/parameter-set/upload/",
             data=open(parameter_set_definition_path, "rb"),
             error_message_func=mock_error_message_func.return_value,
+            invalidate_cache_group=WORKFLOWS_CACHE_GROUP,
         )
@@ -3,16 +3,18 @@ from unittest.mock import MagicMock, call, patch
 
 from click.testing import CliRunner
 
+from dafni_cli.api.exceptions import DAFNIError, LoginError
 from dafni_cli.commands import delete
+from dafni_cli.consts import PARALLEL_REQUESTS
 
 
-@patch("dafni_cli.commands.delete.cli_get_model")
+@patch("dafni_cli.commands.delete.cli_get_models")
 @patch("dafni_cli.commands.delete.parse_model")
 class TestCollateModelVersionDetails(TestCase):
     """Test class to test the collate_model_version_details function"""
 
     def test_single_model_with_valid_permissions_returns_single_model_details(
-        self, mock_parse_model, mock_cli_get_model
+        self, mock_parse_model, mock_cli_get_models
     ):
         """Tests collate_model_version_details works correctly for a single
         model with delete permissions"""
@@ -21,6 +23,8 @@ class TestCollateModelVersionDetails(TestCase):
         session = MagicMock()
         version_id = "version-id"
         version_ids = (version_id,)
+        model_dict = MagicMock()
+        mock_cli_get_models.return_value = [model_dict] * len(version_ids)
 
         model_mock = MagicMock()
         model_mock.auth.destroy = True
@@ -31,13 +35,15 @@ class TestCollateModelVersionDetails(TestCase):
         result = delete.collate_model_version_details(session, version_ids)
 
         # ASSERT
-        mock_cli_get_model.assert_called_once_with(session, version_id)
-        mock_parse_model.assert_called_once_with(mock_cli_get_model.return_value)
+        mock_cli_get_models.assert_called_once_with(
+            session, version_ids, PARALLEL_REQUESTS
+        )
+        mock_parse_model.assert_called_once_with(model_dict)
         self.assertEqual(result, [model_mock.get_version_details.return_value])
 
     @patch("dafni_cli.commands.delete.click")
     def test_single_model_without_valid_permissions_exits(
-        self, mock_click, mock_parse_model, mock_cli_get_model
+        self, mock_click, mock_parse_model, mock_cli_get_models
     ):
         """Tests collate_model_version_details works correctly for a single
         model without delete permissions"""
@@ -46,6 +52,8 @@ class TestCollateModelVersionDetails(TestCase):
         session = MagicMock()
         version_id = "version-id"
         version_ids = (version_id,)
+        model_dict = MagicMock()
+        mock_cli_get_models.return_value = [model_dict] * len(version_ids)
 
         model_mock = MagicMock()
         model_mock.auth.destroy = False
@@ -57,8 +65,10 @@ class TestCollateModelVersionDetails(TestCase):
             delete.collate_model_version_details(session, version_ids)
 
         # ASSERT
-        mock_cli_get_model.assert_called_once_with(session, version_id)
-        mock_parse_model.assert_called_once_with(mock_cli_get_model.return_value)
+        mock_cli_get_models.assert_called_once_with(
+            session, version_ids, PARALLEL_REQUESTS
+        )
+        mock_parse_model.assert_called_once_with(model_dict)
         mock_click.echo.assert_has_calls(
             [
                 call("You do not have sufficient permissions to delete model version:"),
@@ -67,7 +77,7 @@ class TestCollateModelVersionDetails(TestCase):
         )
 
     def test_multiple_models_with_valid_permissions_returns_multiple_model_details(
-        self, mock_parse_model, mock_cli_get_model
+        self, mock_parse_model, mock_cli_get_models
     ):
         """Tests collate_model_version_details works correctly for a list
         of models with delete permissions"""
@@ -77,6 +87,8 @@ class TestCollateModelVersionDetails(TestCase):
         version_id1 = "version-id-1"
         version_id2 = "version-id-2"
         version_ids = (version_id1, version_id2)
+        model_dict = MagicMock()
+        mock_cli_get_models.return_value = [model_dict] * len(version_ids)
 
         model_mock1 = MagicMock()
         model_mock1.auth.destroy = True
@@ -89,13 +101,13 @@ class TestCollateModelVersionDetails(TestCase):
         result = delete.collate_model_version_details(session, version_ids)
 
         # ASSERT
-        mock_cli_get_model.assert_has_calls(
-            [call(session, version_id1), call(session, version_id2)]
+        mock_cli_get_models.assert_called_once_with(
+            session, version_ids, PARALLEL_REQUESTS
         )
         mock_parse_model.assert_has_calls(
             [
-                call(mock_cli_get_model.return_value),
-                call(mock_cli_get_model.return_value),
+                call(model_dict),
+                call(model_dict),
             ]
         )
         self.assertEqual(
@@ -108,7 +120,7 @@ class TestCollateModelVersionDetails(TestCase):
 
     @patch("dafni_cli.commands.delete.click")
     def test_first_model_with_permissions_but_second_without_exits_and_shows_model_without_permissions(
-        self, mock_click, mock_parse_model, mock_cli_get_model
+        self, mock_click, mock_parse_model, mock_cli_get_models
     ):
         """Tests collate_model_version_details works correctly for a list
         of models where the first has delete permissions and the second does not"""
@@ -118,6 +130,8 @@ class TestCollateModelVersionDetails(TestCase):
         version_id1 = "version-id-1"
         version_id2 = "version-id-2"
         version_ids = [version_id1, version_id2]
+        model_dict = MagicMock()
+        mock_cli_get_models.return_value = [model_dict] * len(version_ids)
 
         model_mock1 = MagicMock()
         model_mock1.auth.destroy = True
@@ -131,13 +145,13 @@ class TestCollateModelVersionDetails(TestCase):
             delete.collate_model_version_details(session, version_ids)
 
         # ASSERT
-        mock_cli_get_model.assert_has_calls(
-            [call(session, version_id1), call(session, version_id2)]
+        mock_cli_get_models.assert_called_once_with(
+            session, version_ids, PARALLEL_REQUESTS
         )
         mock_parse_model.assert_has_calls(
             [
-                call(mock_cli_get_model.return_value),
-                call(mock_cli_get_model.return_value),
+                call(model_dict),
+                call(model_dict),
             ]
         )
         self.assertEqual(
@@ -149,13 +163,13 @@ class TestCollateModelVersionDetails(TestCase):
         )
 
 
-@patch("dafni_cli.commands.delete.cli_get_latest_dataset_metadata")
+@patch("dafni_cli.commands.delete.cli_get_latest_datasets_metadata")
 @patch("dafni_cli.commands.delete.parse_dataset_metadata")
 class TestCollateDatasetDetails(TestCase):
     """Test class to test the collate_dataset_details function"""
 
     def test_single_dataset_with_valid_permissions_returns_single_dataset_details(
-        self, mock_parse_dataset_metadata, mock_cli_get_latest_dataset_metadata
+        self, mock_parse_dataset_metadata, mock_cli_get_latest_datasets_metadata
     ):
         """Tests collate_dataset_details works correctly for a single dataset
         with delete permissions"""
@@ -164,6 +178,10 @@ class TestCollateDatasetDetails(TestCase):
         session = MagicMock()
         version_id = "version-id"
         version_ids = (version_id,)
+        metadata = MagicMock()
+        mock_cli_get_latest_datasets_metadata.return_value = [metadata] * len(
+            version_ids
+        )
 
         dataset_mock = MagicMock()
         dataset_mock.dataset_id = "dataset-id"
@@ -175,12 +193,10 @@ class TestCollateDatasetDetails(TestCase):
         result = delete.collate_dataset_details(session, version_ids)
 
         # ASSERT
-        mock_cli_get_latest_dataset_metadata.assert_called_once_with(
-            session, version_id
-        )
-        mock_parse_dataset_metadata.assert_called_once_with(
-            mock_cli_get_latest_dataset_metadata.return_value
+        mock_cli_get_latest_datasets_metadata.assert_called_once_with(
+            session, version_ids, PARALLEL_REQUESTS
         )
+        mock_parse_dataset_metadata.assert_called_once_with(metadata)
         self.assertEqual(
             result,
             (
@@ -194,7 +210,7 @@ class TestCollateDatasetDetails(TestCase):
         self,
         mock_click,
         mock_parse_dataset_metadata,
-        mock_cli_get_latest_dataset_metadata,
+        mock_cli_get_latest_datasets_metadata,
     ):
         """Tests collate_dataset_details works correctly for a single dataset
         without delete permissions"""
@@ -203,6 +219,10 @@ class TestCollateDatasetDetails(TestCase):
         session = MagicMock()
         version_id = "version-id"
         version_ids = (version_id,)
+        metadata = MagicMock()
+        mock_cli_get_latest_datasets_metadata.return_value = [metadata] * len(
+            version_ids
+        )
 
         dataset_mock = MagicMock()
         dataset_mock.dataset_id = "dataset-id"
@@ -215,12 +235,10 @@ class TestCollateDatasetDetails(TestCase):
             delete.collate_dataset_details(session, version_ids)
 
         # ASSERT
-        mock_cli_get_latest_dataset_metadata.assert_called_once_with(
-            session, version_id
-        )
-        mock_parse_dataset_metadata.assert_called_once_with(
-            mock_cli_get_latest_dataset_metadata.return_value
+        mock_cli_get_latest_datasets_metadata.assert_called_once_with(
+            session, version_ids, PARALLEL_REQUESTS
         )
+        mock_parse_dataset_metadata.assert_called_once_with(metadata)
         mock_click.echo.assert_has_calls(
             [
                 call("You do not have sufficient permissions to delete dataset:"),
@@ -229,7 +247,7 @@ class TestCollateDatasetDetails(TestCase):
         )
 
     def test_multiple_datasets_with_valid_permissions_returns_multiple_dataset_details(
-        self, mock_parse_dataset_metadata, mock_cli_get_latest_dataset_metadata
+        self, mock_parse_dataset_metadata, mock_cli_get_latest_datasets_metadata
     ):
         """Tests collate_dataset_details works correctly for a list
         of datasets with delete permissions"""
@@ -239,6 +257,10 @@ class TestCollateDatasetDetails(TestCase):
         version_id1 = "version-id-1"
         version_id2 = "version-id-2"
         version_ids = (version_id1, version_id2)
+        metadata = MagicMock()
+        mock_cli_get_latest_datasets_metadata.return_value = [metadata] * len(
+            version_ids
+        )
 
         dataset_mock1 = MagicMock()
         dataset_mock1.dataset_id = "dataset-id-1"
@@ -253,13 +275,13 @@ class TestCollateDatasetDetails(TestCase):
         result = delete.collate_dataset_details(session, version_ids)
 
         # ASSERT
-        mock_cli_get_latest_dataset_metadata.assert_has_calls(
-            [call(session, version_id1), call(session, version_id2)]
+        mock_cli_get_latest_datasets_metadata.assert_called_once_with(
+            session, version_ids, PARALLEL_REQUESTS
         )
         mock_parse_dataset_metadata.assert_has_calls(
             [
-                call(mock_cli_get_latest_dataset_metadata.return_value),
-                call(mock_cli_get_latest_dataset_metadata.return_value),
+                call(metadata),
+                call(metadata),
             ]
         )
         self.assertEqual(
@@ -278,7 +300,7 @@ class TestCollateDatasetDetails(TestCase):
         self,
         mock_click,
         mock_parse_dataset_metadata,
-        mock_cli_get_latest_dataset_metadata,
+        mock_cli_get_latest_datasets_metadata,
     ):
         """Tests collate_dataset_details works correctly for a list of
         datasets where the first has delete permissions and the second does
@@ -289,6 +311,10 @@ class TestCollateDatasetDetails(TestCase):
         version_id1 = "version-id-1"
         version_id2 = "version-id-2"
         version_ids = (version_id1, version_id2)
+        metadata = MagicMock()
+        mock_cli_get_latest_datasets_metadata.return_value = [metadata] * len(
+            version_ids
+        )
 
         dataset_mock1 = MagicMock()
         dataset_mock1.dataset_id = "dataset-id-1"
@@ -304,13 +330,13 @@ class TestCollateDatasetDetails(TestCase):
             delete.collate_dataset_details(session, version_ids)
 
         # ASSERT
-        mock_cli_get_latest_dataset_metadata.assert_has_calls(
-            [call(session, version_id1), call(session, version_id2)]
+        mock_cli_get_latest_datasets_metadata.assert_called_once_with(
+            session, version_ids, PARALLEL_REQUESTS
         )
         mock_parse_dataset_metadata.assert_has_calls(
             [
-                call(mock_cli_get_latest_dataset_metadata.return_value),
-                call(mock_cli_get_latest_dataset_metadata.return_value),
+                call(metadata),
+                call(metadata),
             ]
         )
         self.assertEqual(
@@ -322,13 +348,13 @@ class TestCollateDatasetDetails(TestCase):
         )
 
 
-@patch("dafni_cli.commands.delete.cli_get_latest_dataset_metadata")
+@patch("dafni_cli.commands.delete.cli_get_latest_datasets_metadata")
 @patch("dafni_cli.commands.delete.parse_dataset_metadata")
 class TestCollateDatasetVersionDetails(TestCase):
     """Test class to test the collate_dataset_version_details function"""
 
     def test_single_dataset_version_with_valid_permissions_returns_single_dataset_details(
-        self, mock_parse_dataset_metadata, mock_cli_get_latest_dataset_metadata
+        self, mock_parse_dataset_metadata, mock_cli_get_latest_datasets_metadata
     ):
         """Tests collate_dataset_version_details works correctly for a single
         dataset version with delete permissions"""
@@ -337,6 +363,10 @@ class TestCollateDatasetVersionDetails(TestCase):
         session = MagicMock()
         version_id = "version-id"
         version_ids = (version_id,)
+        metadata = MagicMock()
+        mock_cli_get_latest_datasets_metadata.return_value = [metadata] * len(
+            version_ids
+        )
 
         dataset_mock = MagicMock()
         dataset_mock.dataset_id = "dataset-id"
@@ -348,12 +378,10 @@ class TestCollateDatasetVersionDetails(TestCase):
         result = delete.collate_dataset_version_details(session, version_ids)
 
         # ASSERT
-        mock_cli_get_latest_dataset_metadata.assert_called_once_with(
-            session, version_id
-        )
-        mock_parse_dataset_metadata.assert_called_once_with(
-            mock_cli_get_latest_dataset_metadata.return_value
+        mock_cli_get_latest_datasets_metadata.assert_called_once_with(
+            session, version_ids, PARALLEL_REQUESTS
         )
+        mock_parse_dataset_metadata.assert_called_once_with(metadata)
         self.assertEqual(
             result,
             (
@@ -367,7 +395,7 @@ class TestCollateDatasetVersionDetails(TestCase):
         self,
         mock_click,
         mock_parse_dataset_metadata,
-        mock_cli_get_latest_dataset_metadata,
+        mock_cli_get_latest_datasets_metadata,
     ):
         """Tests collate_dataset_version_details works correctly for a single
         dataset without delete permissions"""
@@ -376,6 +404,10 @@ class TestCollateDatasetVersionDetails(TestCase):
         session = MagicMock()
         version_id = "version-id"
         version_ids = (version_id,)
+        metadata = MagicMock()
+        mock_cli_get_latest_datasets_metadata.return_value = [metadata] * len(
+            version_ids
+        )
 
         dataset_mock = MagicMock()
         dataset_mock.dataset_id = "dataset-id"
@@ -388,12 +420,10 @@ class TestCollateDatasetVersionDetails(TestCase):
             delete.collate_dataset_version_details(session, version_ids)
 
         # ASSERT
-        mock_cli_get_latest_dataset_metadata.assert_called_once_with(
-            session, version_id
-        )
-        mock_parse_dataset_metadata.assert_called_once_with(
-            mock_cli_get_latest_dataset_metadata.return_value
+        mock_cli_get_latest_datasets_metadata.assert_called_once_with(
+            session, version_ids, PARALLEL_REQUESTS
         )
+        mock_parse_dataset_metadata.assert_called_once_with(metadata)
         mock_click.echo.assert_has_calls(
             [
                 call(
@@ -404,7 +434,7 @@ class TestCollateDatasetVersionDetails(TestCase):
         )
 
     def test_multiple_dataset_versions_with_valid_permissions_returns_multiple_dataset_details(
-        self, mock_parse_dataset_metadata, mock_cli_get_latest_dataset_metadata
+        self, mock_parse_dataset_metadata, mock_cli_get_latest_datasets_metadata
     ):
         """Tests collate_dataset_version_details works correctly for a list
         of dataset versions with delete permissions"""
@@ -414,6 +444,10 @@ class TestCollateDatasetVersionDetails(TestCase):
         version_id1 = "version-id-1"
         version_id2 = "version-id-2"
         version_ids = (version_id1, version_id2)
+        metadata = MagicMock()
+        mock_cli_get_latest_datasets_metadata.return_value = [metadata] * len(
+            version_ids
+        )
 
         dataset_mock1 = MagicMock()
         dataset_mock1.dataset_id = "dataset-id-1"
@@ -428,13 +462,13 @@ class TestCollateDatasetVersionDetails(TestCase):
         result = delete.collate_dataset_version_details(session, version_ids)
 
         # ASSERT
-        mock_cli_get_latest_dataset_metadata.assert_has_calls(
-            [call(session, version_id1), call(session, version_id2)]
+        mock_cli_get_latest_datasets_metadata.assert_called_once_with(
+            session, version_ids, PARALLEL_REQUESTS
         )
         mock_parse_dataset_metadata.assert_has_calls(
             [
-                call(mock_cli_get_latest_dataset_metadata.return_value),
-                call(mock_cli_get_latest_dataset_metadata.return_value),
+                call(metadata),
+                call(metadata),
             ]
         )
         self.assertEqual(
@@ -453,7 +487,7 @@ class TestCollateDatasetVersionDetails(TestCase):
         self,
         mock_click,
         mock_parse_dataset_metadata,
-        mock_cli_get_latest_dataset_metadata,
+        mock_cli_get_latest_datasets_metadata,
     ):
         """Tests collate_dataset_version_details works correctly for a list of
         dataset versions where the first has delete permissions and the second
@@ -464,6 +498,10 @@ class TestCollateDatasetVersionDetails(TestCase):
         version_id1 = "version-id-1"
         version_id2 = "version-id-2"
         version_ids = (version_id1, version_id2)
+        metadata = MagicMock()
+        mock_cli_get_latest_datasets_metadata.return_value = [metadata] * len(
+            version_ids
+        )
 
         dataset_mock1 = MagicMock()
         dataset_mock1.dataset_id = "dataset-id-1"
@@ -479,13 +517,13 @@ class TestCollateDatasetVersionDetails(TestCase):
             delete.collate_dataset_version_details(session, version_ids)
 
         # ASSERT
-        mock_cli_get_latest_dataset_metadata.assert_has_calls(
-            [call(session, version_id1), call(session, version_id2)]
+        mock_cli_get_latest_datasets_metadata.assert_called_once_with(
+            session, version_ids, PARALLEL_REQUESTS
         )
         mock_parse_dataset_metadata.assert_has_calls(
             [
-                call(mock_cli_get_latest_dataset_metadata.return_value),
-                call(mock_cli_get_latest_dataset_metadata.return_value),
+                call(metadata),
+                call(metadata),
             ]
         )
         self.assertEqual(
@@ -499,13 +537,13 @@ class TestCollateDatasetVersionDetails(TestCase):
         )
 
 
-@patch("dafni_cli.commands.delete.cli_get_workflow")
+@patch("dafni_cli.commands.delete.cli_get_workflows")
 @patch("dafni_cli.commands.delete.parse_workflow")
 class TestCollateWorkflowVersionDetails(TestCase):
     """Test class to test the collate_workflow_version_details function"""
 
     def test_single_workflow_with_valid_permissions_returns_single_model_details(
-        self, mock_parse_workflow, mock_cli_get_workflow
+        self, mock_parse_workflow, mock_cli_get_workflows
     ):
         """Tests collate_workflow_version_details works correctly for a single
         workflow with delete permissions"""
@@ -514,6 +552,8 @@ class TestCollateWorkflowVersionDetails(TestCase):
         session = MagicMock()
         version_id = "version-id"
         version_ids = (version_id,)
+        workflow_dict = MagicMock()
+        mock_cli_get_workflows.return_value = [workflow_dict] * len(version_ids)
 
         workflow_mock = MagicMock()
         workflow_mock.auth.destroy = True
@@ -524,13 +564,15 @@ class TestCollateWorkflowVersionDetails(TestCase):
         result = delete.collate_workflow_version_details(session, version_ids)
 
         # ASSERT
-        mock_cli_get_workflow.assert_called_once_with(session, version_id)
-        mock_parse_workflow.assert_called_once_with(mock_cli_get_workflow.return_value)
+        mock_cli_get_workflows.assert_called_once_with(
+            session, version_ids, PARALLEL_REQUESTS
+        )
+        mock_parse_workflow.assert_called_once_with(workflow_dict)
         self.assertEqual(result, [workflow_mock.get_version_details.return_value])
 
     @patch("dafni_cli.commands.delete.click")
     def test_single_workflow_without_valid_permissions_exits(
-        self, mock_click, mock_parse_workflow, mock_cli_get_workflow
+        self, mock_click, mock_parse_workflow, mock_cli_get_workflows
     ):
         """Tests collate_workflow_version_details works correctly for a single
         model without delete permissions"""
@@ -539,6 +581,8 @@ class TestCollateWorkflowVersionDetails(TestCase):
         session = MagicMock()
         version_id = "version-id"
         version_ids = (version_id,)
+        workflow_dict = MagicMock()
+        mock_cli_get_workflows.return_value = [workflow_dict] * len(version_ids)
 
         workflow_mock = MagicMock()
         workflow_mock.auth.destroy = False
@@ -550,8 +594,10 @@ class TestCollateWorkflowVersionDetails(TestCase):
             delete.collate_workflow_version_details(session, version_ids)
 
         # ASSERT
-        mock_cli_get_workflow.assert_called_once_with(session, version_id)
-        mock_parse_workflow.assert_called_once_with(mock_cli_get_workflow.return_value)
+        mock_cli_get_workflows.assert_called_once_with(
+            session, version_ids, PARALLEL_REQUESTS
+        )
+        mock_parse_workflow.assert_called_once_with(workflow_dict)
         mock_click.echo.assert_has_calls(
             [
                 call(
@@ -562,7 +608,7 @@ class TestCollateWorkflowVersionDetails(TestCase):
         )
 
     def test_multiple_workflow_with_valid_permissions_returns_multiple_workflow_details(
-        self, mock_parse_workflow, mock_cli_get_workflow
+        self, mock_parse_workflow, mock_cli_get_workflows
     ):
         """Tests collate_model_version_details works correctly for a list
         of models with delete permissions"""
@@ -572,6 +618,8 @@ class TestCollateWorkflowVersionDetails(TestCase):
         version_id1 = "version-id-1"
         version_id2 = "version-id-2"
         version_ids = (version_id1, version_id2)
+        workflow_dict = MagicMock()
+        mock_cli_get_workflows.return_value = [workflow_dict] * len(version_ids)
 
         workflow_mock1 = MagicMock()
         workflow_mock1.auth.destroy = True
@@ -584,13 +632,13 @@ class TestCollateWorkflowVersionDetails(TestCase):
         result = delete.collate_workflow_version_details(session, version_ids)
 
         # ASSERT
-        mock_cli_get_workflow.assert_has_calls(
-            [call(session, version_id1), call(session, version_id2)]
+        mock_cli_get_workflows.assert_called_once_with(
+            session, version_ids, PARALLEL_REQUESTS
         )
         mock_parse_workflow.assert_has_calls(
             [
-                call(mock_cli_get_workflow.return_value),
-                call(mock_cli_get_workflow.return_value),
+                call(workflow_dict),
+                call(workflow_dict),
             ]
         )
         self.assertEqual(
@@ -603,7 +651,7 @@ class TestCollateWorkflowVersionDetails(TestCase):
 
     @patch("dafni_cli.commands.delete.click")
     def test_first_workflow_with_permissions_but_second_without_exits_and_shows_workflow_without_permissions(
-        self, mock_click, mock_parse_workflow, mock_cli_get_workflow
+        self, mock_click, mock_parse_workflow, mock_cli_get_workflows
     ):
         """Tests collate_workflow_version_details works correctly for a list
         of workflows where the first has delete permissions and the second does not"""
@@ -613,6 +661,8 @@ class TestCollateWorkflowVersionDetails(TestCase):
         version_id1 = "version-id-1"
         version_id2 = "version-id-2"
         version_ids = (version_id1, version_id2)
+        workflow_dict = MagicMock()
+        mock_cli_get_workflows.return_value = [workflow_dict] * len(version_ids)
 
         workflow_mock1 = MagicMock()
         workflow_mock1.auth.destroy = True
@@ -626,13 +676,13 @@ class TestCollateWorkflowVersionDetails(TestCase):
             delete.collate_workflow_version_details(session, version_ids)
 
         # ASSERT
-        mock_cli_get_workflow.assert_has_calls(
-            [call(session, version_id1), call(session, version_id2)]
+        mock_cli_get_workflows.assert_called_once_with(
+            session, version_ids, PARALLEL_REQUESTS
         )
         mock_parse_workflow.assert_has_calls(
             [
-                call(mock_cli_get_workflow.return_value),
-                call(mock_cli_get_workflow.return_value),
+                call(workflow_dict),
+                call(workflow_dict),
             ]
         )
         self.assertEqual(
@@ -665,7 +715,10 @@ class TestDelete(TestCase):
         )
 
         # ASSERT
-        mock_DAFNISession.assert_called_once()
+        # Shouldn't use cached responses without checking they are current
+        mock_DAFNISession.assert_called_once_with(
+            use_response_cache=True, revalidate_response_cache=True
+        )
 
         self.assertEqual(ctx["session"], session)
         self.assertEqual(result.exit_code, 0)
@@ -697,7 +750,9 @@ class TestDelete(TestCase):
 
         # ASSERT
         mock_DAFNISession.assert_called_once()
-        mock_collate_model_version_details.assert_called_once_with(session, version_ids)
+        mock_collate_model_version_details.assert_called_once_with(
+            session, version_ids, max_workers=PARALLEL_REQUESTS
+        )
         mock_delete_model_version.assert_called_with(session, version_ids[0])
 
         self.assertEqual(
@@ -734,8 +789,10 @@ class TestDelete(TestCase):
 
         # ASSERT
         mock_DAFNISession.assert_called_once()
-        mock_collate_model_version_details.assert_called_once_with(session, version_ids)
-        self.assertEqual(
+        mock_collate_model_version_details.assert_called_once_with(
+            session, version_ids, max_workers=PARALLEL_REQUESTS
+        )
+        self.assertCountEqual(
             mock_delete_model_version.call_args_list,
             [call(session, version_ids[0]), call(session, version_ids[1])],
         )
@@ -771,7 +828,9 @@ class TestDelete(TestCase):
 
         # ASSERT
         mock_DAFNISession.assert_called_once()
-        mock_collate_model_version_details.assert_called_once_with(session, version_ids)
+        mock_collate_model_version_details.assert_called_once_with(
+            session, version_ids, max_workers=PARALLEL_REQUESTS
+        )
         mock_delete_model_version.assert_not_called()
 
         self.assertEqual(
@@ -780,6 +839,162 @@ class TestDelete(TestCase):
         )
         self.assertEqual(result.exit_code, 1)
 
+    @patch("dafni_cli.commands.delete.collate_model_version_details")
+    @patch("dafni_cli.commands.delete.delete_model_version")
+    def test_delete_model_multiple_versions_summarises_failures(
+        self,
+        mock_delete_model_version,
+        mock_collate_model_version_details,
+        mock_DAFNISession,
+    ):
+        """Tests that the 'delete model-version' command attempts to delete
+        every version when some fail and then summarises the failures"""
+        # SETUP
+        session = MagicMock()
+        mock_DAFNISession.return_value = session
+        runner = CliRunner()
+        ctx = {}
+        version_ids = ("version-id-1", "version-id-2", "version-id-3")
+        mock_collate_model_version_details.return_value = [
+            "Model 1 details",
+            "Model 2 details",
+            "Model 3 details",
+        ]
+
+        def delete_model_version(session, version_id):
+            if version_id != "version-id-2":
+                raise DAFNIError(f"Some error deleting {version_id}")
+
+        mock_delete_model_version.side_effect = delete_model_version
+
+        # CALL
+        result = runner.invoke(
+            delete.delete,
+            ["model-version"] + list(version_ids) + ["--parallel", "2"],
+            input="y",
+            obj=ctx,
+        )
+
+        # ASSERT
+        mock_collate_model_version_details.assert_called_once_with(
+            session, version_ids, max_workers=2
+        )
+        self.assertCountEqual(
+            mock_delete_model_version.call_args_list,
+            [call(session, version_id) for version_id in version_ids],
+        )
+
+        self.assertEqual(
+            result.output,
+            "Model 1 details\nModel 2 details\nModel 3 details\n"
+            "Confirm deletion of model versions? [y/N]: y\n"
+            "Model versions deleted: 1, failed: 2\n"
+            "Failed to delete 'version-id-1': Some error deleting version-id-1\n"
+            "Failed to delete 'version-id-3': Some error deleting version-id-3\n",
+        )
+        self.assertEqual(result.exit_code, 1)
+
+    @patch("dafni_cli.commands.delete.collate_model_version_details")
+    @patch("dafni_cli.commands.delete.delete_model_version")
+    def test_delete_model_multiple_versions_summarises_any_error(
+        self,
+        mock_delete_model_version,
+        mock_collate_model_version_details,
+        mock_DAFNISession,
+    ):
+        """Tests that the 'delete model-version' command continues and
+        summarises failures for errors other than those returned by DAFNI,
+        and only deletes each version once"""
+        # SETUP
+        session = MagicMock()
+        mock_DAFNISession.return_value = session
+        runner = CliRunner()
+        ctx = {}
+        version_ids = ("version-id-1", "version-id-2", "version-id-1", "version-id-3")
+        mock_collate_model_version_details.return_value = ["Model details"]
+
+        def delete_model_version(session, version_id):
+            if version_id == "version-id-1":
+                raise RuntimeError("Out of retries")
+            if version_id == "version-id-3":
+                raise LoginError("Unable to login")
+
+        mock_delete_model_version.side_effect = delete_model_version
+
+        # CALL
+        result = runner.invoke(
+            delete.delete,
+            ["model-version"] + list(version_ids) + ["--parallel", "1"],
+            input="y",
+            obj=ctx,
+        )
+
+        # ASSERT
+        self.assertEqual(
+            mock_delete_model_version.call_args_list,
+            [
+                call(session, "version-id-1"),
+                call(session, "version-id-2"),
+                call(session, "version-id-3"),
+            ],
+        )
+        self.assertEqual(
+            result.output,
+            "Model details\n"
+            "Confirm deletion of model versions? [y/N]: y\n"
+            "Model versions deleted: 1, failed: 2\n"
+            "Failed to delete 'version-id-1': Out of retries\n"
+            "Failed to delete 'version-id-3': Unable to login\n",
+        )
+        self.assertEqual(result.exit_code, 1)
+
+    @patch("dafni_cli.commands.delete.as_completed")
+    @patch("dafni_cli.commands.delete.collate_model_version_details")
+    @patch("dafni_cli.commands.delete.delete_model_version")
+    def test_delete_model_multiple_versions_summarises_when_interrupted(
+        self,
+        mock_delete_model_version,
+        mock_collate_model_version_details,
+        mock_as_completed,
+        mock_DAFNISession,
+    ):
+        """Tests that the 'delete model-version' command still summarises
+        what was deleted when interrupted"""
+        # SETUP
+        session = MagicMock()
+        mock_DAFNISession.return_value = session
+        runner = CliRunner()
+        ctx = {}
+        version_ids = ("version-id-1", "version-id-2", "version-id-3")
+        mock_collate_model_version_details.return_value = ["Model details"]
+
+        # Interrupt once the first version has been deleted
+        def interrupted_as_completed(futures):
+            first_future = next(iter(futures))
+            first_future.result()
+            yield first_future
+            raise KeyboardInterrupt
+
+        mock_as_completed.side_effect = interrupted_as_completed
+
+        # CALL
+        result = runner.invoke(
+            delete.delete,
+            ["model-version"] + list(version_ids) + ["--parallel", "1"],
+            input="y",
+            obj=ctx,
+        )
+
+        # ASSERT
+        self.assertEqual(
+            result.output,
+            "Model details\n"
+            "Confirm deletion of model versions? [y/N]: y\n"
+            "Model versions deleted: 1, failed: 0, interrupted: 2\n"
+            "\nAborted!\n",
+        )
+        self.assertNotEqual(result.exit_code, 0)
+
     # ----------------- DATASET
 
     @patch("dafni_cli.commands.delete.collate_dataset_details")
@@ -808,7 +1023,9 @@ class TestDelete(TestCase):
 
         # ASSERT
         mock_DAFNISession.assert_called_once()
-        mock_collate_dataset_details.assert_called_once_with(session, version_ids)
+        mock_collate_dataset_details.assert_called_once_with(
+            session, version_ids, max_workers=PARALLEL_REQUESTS
+        )
         mock_delete_dataset.assert_called_with(session, dataset_ids[0])
 
         self.assertEqual(
@@ -846,11 +1063,11 @@ class TestDelete(TestCase):
 
         # ASSERT
         mock_DAFNISession.assert_called_once()
-        mock_collate_dataset_details.assert_called_once_with(session, version_ids)
-        self.assertEqual(
-            mock_delete_dataset.call_args_list,
-            [call(session, dataset_ids[0]), call(session, dataset_ids[1])],
+        mock_collate_dataset_details.assert_called_once_with(
+            session, version_ids, max_workers=PARALLEL_REQUESTS
         )
+        # Both versions belong to the same dataset, so it's only deleted once
+        mock_delete_dataset.assert_called_once_with(session, dataset_ids[0])
 
         self.assertEqual(
             result.output,
@@ -884,7 +1101,9 @@ class TestDelete(TestCase):
 
         # ASSERT
         mock_DAFNISession.assert_called_once()
-        mock_collate_dataset_details.assert_called_once_with(session, version_ids)
+        mock_collate_dataset_details.assert_called_once_with(
+            session, version_ids, max_workers=PARALLEL_REQUESTS
+        )
         mock_delete_dataset.assert_not_called()
 
         self.assertEqual(
@@ -925,7 +1144,7 @@ class TestDelete(TestCase):
         # ASSERT
         mock_DAFNISession.assert_called_once()
         mock_collate_dataset_version_details.assert_called_once_with(
-            session, version_ids
+            session, version_ids, max_workers=PARALLEL_REQUESTS
         )
         mock_delete_dataset_version.assert_called_with(
             session, version_id=version_ids[0]
@@ -970,9 +1189,9 @@ class TestDelete(TestCase):
         # ASSERT
         mock_DAFNISession.assert_called_once()
         mock_collate_dataset_version_details.assert_called_once_with(
-            session, version_ids
+            session, version_ids, max_workers=PARALLEL_REQUESTS
         )
-        self.assertEqual(
+        self.assertCountEqual(
             mock_delete_dataset_version.call_args_list,
             [
                 call(session, version_id=version_ids[0]),
@@ -1016,7 +1235,7 @@ class TestDelete(TestCase):
         # ASSERT
         mock_DAFNISession.assert_called_once()
         mock_collate_dataset_version_details.assert_called_once_with(
-            session, version_ids
+            session, version_ids, max_workers=PARALLEL_REQUESTS
         )
         mock_delete_dataset_version.assert_not_called()
 
@@ -1054,7 +1273,7 @@ class TestDelete(TestCase):
         # ASSERT
         mock_DAFNISession.assert_called_once()
         mock_collate_workflow_version_details.assert_called_once_with(
-            session, version_ids
+            session, version_ids, max_workers=PARALLEL_REQUESTS
         )
         mock_delete_workflow_version.assert_called_with(session, version_ids[0])
 
@@ -1093,9 +1312,9 @@ class TestDelete(TestCase):
         # ASSERT
         mock_DAFNISession.assert_called_once()
         mock_collate_workflow_version_details.assert_called_once_with(
-            session, version_ids
+            session, version_ids, max_workers=PARALLEL_REQUESTS
         )
-        self.assertEqual(
+        self.assertCountEqual(
             mock_delete_workflow_version.call_args_list,
             [call(session, version_ids[0]), call(session, version_ids[1])],
         )
@@ -1132,7 +1351,7 @@ class TestDelete(TestCase):
         # ASSERT
         mock_DAFNISession.assert_called_once()
         mock_collate_workflow_version_details.assert_called_once_with(
-            session, version_ids
+            session, version_ids, max_workers=PARALLEL_REQUESTS
         )
         mock_delete_workflow_version.assert_not_called()
 
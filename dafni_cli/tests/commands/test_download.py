@@ -78,6 +78,9 @@ class TestDownloadDataset(TestCase):
         self,
         directory: Optional[str],
         files: Optional[List[str]],
+        parallel: Optional[int] = None,
+        segments: Optional[int] = None,
+        sync: bool = False,
     ):
         """Executes the 'download dataset' command and returns the result"""
         runner = CliRunner()
@@ -89,6 +92,12 @@ class TestDownloadDataset(TestCase):
                 Path(directory).mkdir()
             if files:
                 args.extend([file_name for file_name in files])
+            if parallel:
+                args.extend(["--parallel", str(parallel)])
+            if segments:
+                args.extend(["--segments", str(segments)])
+            if sync:
+                args.append("--sync")
 
             result = runner.invoke(download.download, args)
 
@@ -119,6 +128,72 @@ class TestDownloadDataset(TestCase):
             self.mock_session,
             self.selected_dataset_files,
             None,
+            max_workers=1,
+            segments=1,
+            sync=False,
+        )
+
+        self.assertEqual(result.exit_code, 0)
+
+    def test_download_dataset_in_parallel(
+        self,
+    ):
+        """Tests that the 'download dataset' command works correctly with
+        --parallel specified"""
+
+        # CALL
+        result = self._run_command(directory=None, files=None, parallel=4)
+
+        # ASSERT
+        self.mock_download_dataset.assert_called_once_with(
+            self.mock_session,
+            self.selected_dataset_files,
+            None,
+            max_workers=4,
+            segments=1,
+            sync=False,
+        )
+
+        self.assertEqual(result.exit_code, 0)
+
+    def test_download_dataset_in_segments(
+        self,
+    ):
+        """Tests that the 'download dataset' command works correctly with
+        --segments specified"""
+
+        # CALL
+        result = self._run_command(directory=None, files=None, segments=8)
+
+        # ASSERT
+        self.mock_download_dataset.assert_called_once_with(
+            self.mock_session,
+            self.selected_dataset_files,
+            None,
+            max_workers=1,
+            segments=8,
+            sync=False,
+        )
+
+        self.assertEqual(result.exit_code, 0)
+
+    def test_download_dataset_sync(
+        self,
+    ):
+        """Tests that the 'download dataset' command works correctly with
+        --sync specified"""
+
+        # CALL
+        result = self._run_command(directory=None, files=None, sync=True)
+
+        # ASSERT
+        self.mock_download_dataset.assert_called_once_with(
+            self.mock_session,
+            self.selected_dataset_files,
+            None,
+            max_workers=1,
+            segments=1,
+            sync=True,
         )
 
         self.assertEqual(result.exit_code, 0)
@@ -151,6 +226,9 @@ class TestDownloadDataset(TestCase):
             self.mock_session,
             self.selected_dataset_files,
             Path(directory),
+            max_workers=1,
+            segments=1,
+            sync=False,
         )
 
         self.assertEqual(result.exit_code, 0)
@@ -211,6 +289,9 @@ class TestDownloadDataset(TestCase):
             self.mock_session,
             self.selected_dataset_files,
             None,
+            max_workers=1,
+            segments=1,
+            sync=False,
         )
 
         self.assertEqual(result.exit_code, 0)
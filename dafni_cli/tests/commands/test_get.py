@@ -1,13 +1,21 @@
+import json
 from datetime import datetime
+from pathlib import Path
+from tempfile import TemporaryDirectory
 from typing import List
 from unittest import TestCase
-from unittest.mock import MagicMock, call, patch
+from unittest.mock import ANY, MagicMock, call, patch
 
 from click.testing import CliRunner
 
+from dafni_cli.api.datasets_api import DATASETS_PAGE_SIZE
+from dafni_cli.api.response_cache import ResponseCache
+from dafni_cli.api.session import DAFNISession
 from dafni_cli.commands import get
 from dafni_cli.consts import (
     DATE_INPUT_FORMAT,
+    PARALLEL_REQUESTS,
+    RESPONSE_CACHE_TTL,
     TABLE_ACCESS_HEADER,
     TABLE_DISPLAY_NAME_MAX_COLUMN_WIDTH,
     TABLE_FINISHED_HEADER,
@@ -17,12 +25,16 @@ from dafni_cli.consts import (
     TABLE_PUBLICATION_DATE_HEADER,
     TABLE_STARTED_HEADER,
     TABLE_STATUS_HEADER,
+    TABLE_STREAM_SAMPLE_SIZE,
     TABLE_SUMMARY_HEADER,
     TABLE_SUMMARY_MAX_COLUMN_WIDTH,
     TABLE_VERSION_ID_HEADER,
     TABLE_WORKFLOW_VERSION_ID_HEADER,
 )
 from dafni_cli.tests.fixtures.dataset_metadata import TEST_DATASET_METADATA
+from dafni_cli.tests.fixtures.session import TEST_SESSION_DATA, create_mock_response
+from dafni_cli.tests.fixtures.workflow_instance import TEST_WORKFLOW_INSTANCE_LIST
+from dafni_cli.tests.fixtures.workflows import TEST_WORKFLOW
 
 
 @patch("dafni_cli.commands.get.DAFNISession")
@@ -72,7 +84,12 @@ class TestGetModels(TestCase):
             "dafni_cli.commands.get.filter_multiple"
         ).start()
         self.mock_click = patch("dafni_cli.commands.get.click").start()
-        self.mock_format_table = patch("dafni_cli.commands.get.format_table").start()
+        self.mock_print_table = patch("dafni_cli.commands.get.print_table").start()
+        # Consume the rows as they may be given as a generator
+        self.printed_rows = []
+        self.mock_print_table.side_effect = lambda rows, **kwargs: (
+            self.printed_rows.extend(rows)
+        )
 
         self.addCleanup(patch.stopall)
 
@@ -107,17 +124,15 @@ class TestGetModels(TestCase):
         # ASSERT
         self.mock_DAFNISession.assert_called_once()
         self.mock_get_all_models.assert_called_with(session)
-        self.mock_parse_models.assert_called_once_with(model_dicts)
-        self.mock_filter_multiple.assert_called_once_with(
-            expected_filters, models, model_dicts
-        )
+        self.mock_parse_models.assert_called_once_with(model_dicts, lazy=True)
+        self.mock_filter_multiple.assert_called_once_with(expected_filters, models)
 
         # Different outputs depending on json flag
         if json:
             self.mock_print_json.assert_called_with([model_dicts[0]])
             for model in models:
                 model.get_brief_details.assert_not_called()
-            self.mock_format_table.assert_not_called()
+            self.mock_print_table.assert_not_called()
             self.mock_click.echo.assert_not_called()
         else:
             self.mock_print_json.assert_not_called()
@@ -125,7 +140,7 @@ class TestGetModels(TestCase):
             models[0].get_brief_details.assert_called_once()
             models[1].get_brief_details.assert_not_called()
 
-            self.mock_format_table.assert_called_once_with(
+            self.mock_print_table.assert_called_once_with(
                 headers=[
                     TABLE_NAME_HEADER,
                     TABLE_VERSION_ID_HEADER,
@@ -134,7 +149,7 @@ class TestGetModels(TestCase):
                     TABLE_PUBLICATION_DATE_HEADER,
                     TABLE_SUMMARY_HEADER,
                 ],
-                rows=[models[0].get_brief_details.return_value],
+                rows=ANY,
                 max_column_widths=[
                     TABLE_DISPLAY_NAME_MAX_COLUMN_WIDTH,
                     None,
@@ -143,9 +158,12 @@ class TestGetModels(TestCase):
                     None,
                     TABLE_SUMMARY_MAX_COLUMN_WIDTH,
                 ],
+                wrap=True,
+                sample_size=None,
             )
-            self.mock_click.echo.assert_called_once_with(
-                self.mock_format_table.return_value
+            self.assertEqual(
+                self.printed_rows,
+                [models[0].get_brief_details.return_value],
             )
 
         self.assertEqual(result.exit_code, 0)
@@ -166,6 +184,21 @@ class TestGetModels(TestCase):
             filter_arguments=[], expected_filters=[], json=True
         )
 
+    def test_get_models_no_wrap(self):
+        """Tests that the 'get models' command prints the table without
+        wrapping when given --no-wrap"""
+
+        # SETUP
+        runner = CliRunner()
+        self.mock_filter_multiple.return_value = ([], [])
+
+        # CALL
+        result = runner.invoke(get.get, ["models", "--no-wrap"])
+
+        # ASSERT
+        self.assertFalse(self.mock_print_table.call_args.kwargs["wrap"])
+        self.assertEqual(result.exit_code, 0)
+
     def test_get_models_with_text_filter(
         self,
     ):
@@ -268,16 +301,108 @@ class TestGetModels(TestCase):
             json=True,
         )
 
+    @patch("dafni_cli.commands.get.print_json_list")
+    @patch("dafni_cli.commands.get.filter_multiple_iter")
+    @patch("dafni_cli.commands.get.parse_model")
+    @patch("dafni_cli.commands.get.iter_all_models")
+    def _test_get_models_stream(
+        self,
+        mock_iter_all_models,
+        mock_parse_model,
+        mock_filter_multiple_iter,
+        mock_print_json_list,
+        json: bool,
+    ):
+        """Helper method for testing that the 'get models' command works
+        correctly with --stream"""
+
+        # SETUP
+        session = MagicMock()
+        self.mock_DAFNISession.return_value = session
+        runner = CliRunner()
+        model_dicts = [MagicMock(), MagicMock()]
+        models = [MagicMock(), MagicMock()]
+        mock_filter_multiple_iter.return_value = iter(zip(models, model_dicts))
+        printed = []
+        mock_print_json_list.side_effect = lambda dictionaries: printed.extend(
+            dictionaries
+        )
+
+        # CALL
+        options = ["models", "--stream", "--search", "Test"]
+        if json:
+            options.append("--json")
+        result = runner.invoke(get.get, options)
+
+        # ASSERT
+        self.mock_get_all_models.assert_not_called()
+        self.mock_filter_multiple.assert_not_called()
+        mock_iter_all_models.assert_called_once_with(session)
+        mock_filter_multiple_iter.assert_called_once_with(
+            [self.mock_text_filter.return_value],
+            mock_iter_all_models.return_value,
+            ANY,
+        )
+        parse_function = mock_filter_multiple_iter.call_args[0][2]
+        self.assertEqual(parse_function.func, mock_parse_model)
+        self.assertEqual(parse_function.keywords, {"lazy": True, "keep_dict": False})
+
+        if json:
+            self.assertEqual(printed, model_dicts)
+            self.mock_print_json.assert_not_called()
+            self.mock_print_table.assert_not_called()
+        else:
+            mock_print_json_list.assert_not_called()
+            self.mock_print_table.assert_called_once_with(
+                headers=[
+                    TABLE_NAME_HEADER,
+                    TABLE_VERSION_ID_HEADER,
+                    TABLE_STATUS_HEADER,
+                    TABLE_ACCESS_HEADER,
+                    TABLE_PUBLICATION_DATE_HEADER,
+                    TABLE_SUMMARY_HEADER,
+                ],
+                rows=ANY,
+                max_column_widths=[
+                    TABLE_DISPLAY_NAME_MAX_COLUMN_WIDTH,
+                    None,
+                    None,
+                    None,
+                    None,
+                    TABLE_SUMMARY_MAX_COLUMN_WIDTH,
+                ],
+                wrap=True,
+                sample_size=TABLE_STREAM_SAMPLE_SIZE,
+            )
+            self.assertEqual(
+                self.printed_rows,
+                [model.get_brief_details.return_value for model in models],
+            )
+
+        self.assertEqual(result.exit_code, 0)
+
+    def test_get_models_stream(self):
+        """Tests that the 'get models' command works correctly with
+        --stream"""
+
+        self._test_get_models_stream(json=False)
+
+    def test_get_models_stream_json(self):
+        """Tests that the 'get models' command works correctly with
+        --stream and --json"""
+
+        self._test_get_models_stream(json=True)
+
 
 @patch("dafni_cli.commands.get.DAFNISession")
-@patch("dafni_cli.commands.get.cli_get_model")
+@patch("dafni_cli.commands.get.cli_get_models")
 @patch("dafni_cli.commands.get.parse_model")
 @patch("dafni_cli.commands.get.print_json")
 class TestGetModel(TestCase):
     """Test class to test the get model command"""
 
     def test_get_model(
-        self, mock_print_json, mock_parse_model, mock_cli_get_model, mock_DAFNISession
+        self, mock_print_json, mock_parse_model, mock_cli_get_models, mock_DAFNISession
     ):
         """Tests that the 'get model' command works correctly (with no
         optional arguments)"""
@@ -287,7 +412,7 @@ class TestGetModel(TestCase):
         mock_DAFNISession.return_value = session
         runner = CliRunner()
         model = MagicMock()
-        mock_cli_get_model.return_value = model
+        mock_cli_get_models.return_value = [model]
         mock_parse_model.return_value = model
 
         # CALL
@@ -295,14 +420,16 @@ class TestGetModel(TestCase):
 
         # ASSERT
         mock_DAFNISession.assert_called_once()
-        mock_cli_get_model.assert_called_with(session, "some_version_id")
+        mock_cli_get_models.assert_called_once_with(
+            session, ("some_version_id",), max_workers=PARALLEL_REQUESTS
+        )
         model.output_details.assert_called_once()
         mock_print_json.assert_not_called()
 
         self.assertEqual(result.exit_code, 0)
 
     def test_get_model_json(
-        self, mock_print_json, mock_parse_model, mock_cli_get_model, mock_DAFNISession
+        self, mock_print_json, mock_parse_model, mock_cli_get_models, mock_DAFNISession
     ):
         """Tests that the 'get model' command works correctly (with --json)"""
 
@@ -311,7 +438,7 @@ class TestGetModel(TestCase):
         mock_DAFNISession.return_value = session
         runner = CliRunner()
         model = MagicMock()
-        mock_cli_get_model.return_value = model
+        mock_cli_get_models.return_value = [model]
         mock_parse_model.return_value = model
 
         # CALL
@@ -319,14 +446,16 @@ class TestGetModel(TestCase):
 
         # ASSERT
         mock_DAFNISession.assert_called_once()
-        mock_cli_get_model.assert_called_with(session, "some_version_id")
+        mock_cli_get_models.assert_called_once_with(
+            session, ("some_version_id",), max_workers=PARALLEL_REQUESTS
+        )
         model.output_details.assert_not_called()
         mock_print_json.assert_called_once_with(model)
 
         self.assertEqual(result.exit_code, 0)
 
     def test_get_model_version_history(
-        self, mock_print_json, mock_parse_model, mock_cli_get_model, mock_DAFNISession
+        self, mock_print_json, mock_parse_model, mock_cli_get_models, mock_DAFNISession
     ):
         """Tests that the 'get model' command works correctly (with
         --version-history)"""
@@ -336,7 +465,7 @@ class TestGetModel(TestCase):
         mock_DAFNISession.return_value = session
         runner = CliRunner()
         model = MagicMock()
-        mock_cli_get_model.return_value = model
+        mock_cli_get_models.return_value = [model]
         mock_parse_model.return_value = model
 
         # CALL
@@ -346,14 +475,16 @@ class TestGetModel(TestCase):
 
         # ASSERT
         mock_DAFNISession.assert_called_once()
-        mock_cli_get_model.assert_called_with(session, "some_version_id")
+        mock_cli_get_models.assert_called_once_with(
+            session, ("some_version_id",), max_workers=PARALLEL_REQUESTS
+        )
         model.output_version_history.assert_called_once()
         mock_print_json.assert_not_called()
 
         self.assertEqual(result.exit_code, 0)
 
     def test_get_model_version_history_json(
-        self, mock_print_json, mock_parse_model, mock_cli_get_model, mock_DAFNISession
+        self, mock_print_json, mock_parse_model, mock_cli_get_models, mock_DAFNISession
     ):
         """Tests that the 'get model' command works correctly (with --json
         and --version-history)"""
@@ -364,7 +495,7 @@ class TestGetModel(TestCase):
         runner = CliRunner()
         model = MagicMock()
         version_history = MagicMock()
-        mock_cli_get_model.return_value = {"version_history": [version_history]}
+        mock_cli_get_models.return_value = [{"version_history": [version_history]}]
         mock_parse_model.return_value = model
 
         # CALL
@@ -374,12 +505,47 @@ class TestGetModel(TestCase):
 
         # ASSERT
         mock_DAFNISession.assert_called_once()
-        mock_cli_get_model.assert_called_with(session, "some_version_id")
+        mock_cli_get_models.assert_called_once_with(
+            session, ("some_version_id",), max_workers=PARALLEL_REQUESTS
+        )
         model.output_version_history.assert_not_called()
         mock_print_json.assert_called_once_with(version_history)
 
         self.assertEqual(result.exit_code, 0)
 
+    def test_get_model_multiple_version_ids(
+        self, mock_print_json, mock_parse_model, mock_cli_get_models, mock_DAFNISession
+    ):
+        """Tests that the 'get model' command works correctly when given
+        several version ids (with --parallel)"""
+
+        # SETUP
+        session = MagicMock()
+        mock_DAFNISession.return_value = session
+        runner = CliRunner()
+        model_dicts = [MagicMock(), MagicMock()]
+        models = [MagicMock(), MagicMock()]
+        mock_cli_get_models.return_value = model_dicts
+        mock_parse_model.side_effect = models
+
+        # CALL
+        result = runner.invoke(
+            get.get, ["model", "version_id_1", "version_id_2", "--parallel", "5"]
+        )
+
+        # ASSERT
+        mock_cli_get_models.assert_called_once_with(
+            session, ("version_id_1", "version_id_2"), max_workers=5
+        )
+        self.assertEqual(
+            mock_parse_model.call_args_list,
+            [call(model_dicts[0]), call(model_dicts[1])],
+        )
+        for model in models:
+            model.output_details.assert_called_once()
+
+        self.assertEqual(result.exit_code, 0)
+
 
 class TestGetDatasets(TestCase):
     """Test class to test the get datasets command"""
@@ -393,6 +559,9 @@ class TestGetDatasets(TestCase):
         self.mock_get_all_datasets = patch(
             "dafni_cli.commands.get.get_all_datasets"
         ).start()
+        self.mock_iter_dataset_pages = patch(
+            "dafni_cli.commands.get.iter_dataset_pages"
+        ).start()
         self.mock_parse_datasets = patch(
             "dafni_cli.commands.get.parse_datasets"
         ).start()
@@ -410,22 +579,50 @@ class TestGetDatasets(TestCase):
         session = MagicMock()
         self.mock_DAFNISession.return_value = session
         runner = CliRunner()
-        datasets = [MagicMock(), MagicMock()]
-        self.mock_get_all_datasets.return_value = datasets
-        self.mock_parse_datasets.return_value = datasets
+        pages = [MagicMock(), MagicMock()]
+        datasets = [[MagicMock(), MagicMock()], [MagicMock()]]
+        self.mock_iter_dataset_pages.return_value = iter(pages)
+        self.mock_parse_datasets.side_effect = datasets
 
         # CALL
         result = runner.invoke(get.get, ["datasets"])
 
         # ASSERT
         self.mock_DAFNISession.assert_called_once()
-        self.mock_get_all_datasets.assert_called_with(session, {})
-        for dataset in datasets:
-            dataset.output_brief_details.assert_called_once()
+        self.mock_iter_dataset_pages.assert_called_with(
+            session, {}, page_size=DATASETS_PAGE_SIZE
+        )
+        self.assertEqual(
+            self.mock_parse_datasets.call_args_list, [call(page) for page in pages]
+        )
+        for page_datasets in datasets:
+            for dataset in page_datasets:
+                dataset.output_brief_details.assert_called_once()
+        self.mock_get_all_datasets.assert_not_called()
         self.mock_print_json.assert_not_called()
 
         self.assertEqual(result.exit_code, 0)
 
+    def test_get_datasets_with_page_size(
+        self,
+    ):
+        """Tests that the 'get datasets' command works correctly when given
+        a page size"""
+
+        # SETUP
+        session = MagicMock()
+        self.mock_DAFNISession.return_value = session
+        runner = CliRunner()
+        self.mock_iter_dataset_pages.return_value = iter([MagicMock()])
+
+        # CALL
+        result = runner.invoke(get.get, ["datasets", "--page-size", "50"])
+
+        # ASSERT
+        self.mock_iter_dataset_pages.assert_called_with(session, {}, page_size=50)
+
+        self.assertEqual(result.exit_code, 0)
+
     def test_get_datasets_json(
         self,
     ):
@@ -445,7 +642,9 @@ class TestGetDatasets(TestCase):
 
         # ASSERT
         self.mock_DAFNISession.assert_called_once()
-        self.mock_get_all_datasets.assert_called_with(session, {})
+        self.mock_get_all_datasets.assert_called_with(
+            session, {}, page_size=DATASETS_PAGE_SIZE
+        )
         for dataset in datasets:
             dataset.output_details.assert_not_called()
         self.mock_print_json.assert_called_with(datasets)
@@ -465,7 +664,7 @@ class TestGetDatasets(TestCase):
         runner = CliRunner()
         datasets = [MagicMock(), MagicMock()]
 
-        self.mock_get_all_datasets.return_value = datasets
+        self.mock_iter_dataset_pages.return_value = iter([MagicMock()])
         self.mock_parse_datasets.return_value = datasets
 
         # CALL
@@ -474,7 +673,9 @@ class TestGetDatasets(TestCase):
 
         # ASSERT
         self.mock_DAFNISession.assert_called_once()
-        self.mock_get_all_datasets.assert_called_with(session, date_filter_options[1])
+        self.mock_iter_dataset_pages.assert_called_with(
+            session, date_filter_options[1], page_size=DATASETS_PAGE_SIZE
+        )
         datasets[0].output_brief_details.assert_called_once()
         datasets[1].output_brief_details.assert_called_once()
         self.mock_print_json.assert_not_called()
@@ -685,7 +886,12 @@ class TestGetWorkflows(TestCase):
             "dafni_cli.commands.get.filter_multiple"
         ).start()
         self.mock_click = patch("dafni_cli.commands.get.click").start()
-        self.mock_format_table = patch("dafni_cli.commands.get.format_table").start()
+        self.mock_print_table = patch("dafni_cli.commands.get.print_table").start()
+        # Consume the rows as they may be given as a generator
+        self.printed_rows = []
+        self.mock_print_table.side_effect = lambda rows, **kwargs: (
+            self.printed_rows.extend(rows)
+        )
 
         self.addCleanup(patch.stopall)
 
@@ -725,19 +931,15 @@ class TestGetWorkflows(TestCase):
         # ASSERT
         self.mock_DAFNISession.assert_called_once()
         self.mock_get_all_workflows.assert_called_with(session)
-        self.mock_parse_workflows.assert_called_once_with(workflow_dicts)
-        self.mock_filter_multiple.assert_called_once_with(
-            expected_filters,
-            workflows,
-            workflow_dicts,
-        )
+        self.mock_parse_workflows.assert_called_once_with(workflow_dicts, lazy=True)
+        self.mock_filter_multiple.assert_called_once_with(expected_filters, workflows)
 
         # Different outputs depending on json flag
         if json:
             self.mock_print_json.assert_called_once_with([workflow_dicts[0]])
             for workflow_instance in workflows:
                 workflow_instance.get_brief_details.assert_not_called()
-            self.mock_format_table.assert_not_called()
+            self.mock_print_table.assert_not_called()
             self.mock_click.echo.assert_not_called()
         else:
             self.mock_print_json.assert_not_called()
@@ -745,23 +947,26 @@ class TestGetWorkflows(TestCase):
             workflows[0].get_brief_details.assert_called_once()
             workflows[1].get_brief_details.assert_not_called()
 
-            self.mock_format_table.assert_called_once_with(
+            self.mock_print_table.assert_called_once_with(
                 headers=[
                     TABLE_NAME_HEADER,
                     TABLE_VERSION_ID_HEADER,
                     TABLE_PUBLICATION_DATE_HEADER,
                     TABLE_SUMMARY_HEADER,
                 ],
-                rows=[workflows[0].get_brief_details.return_value],
+                rows=ANY,
                 max_column_widths=[
                     TABLE_DISPLAY_NAME_MAX_COLUMN_WIDTH,
                     None,
                     None,
                     TABLE_SUMMARY_MAX_COLUMN_WIDTH,
                 ],
+                wrap=True,
+                sample_size=None,
             )
-            self.mock_click.echo.assert_called_once_with(
-                self.mock_format_table.return_value
+            self.assertEqual(
+                self.printed_rows,
+                [workflows[0].get_brief_details.return_value],
             )
 
         self.assertEqual(result.exit_code, 0)
@@ -915,9 +1120,97 @@ class TestGetWorkflows(TestCase):
             json=False,
         )
 
+    @patch("dafni_cli.commands.get.print_json_list")
+    @patch("dafni_cli.commands.get.filter_multiple_iter")
+    @patch("dafni_cli.commands.get.parse_workflow")
+    @patch("dafni_cli.commands.get.iter_all_workflows")
+    def _test_get_workflows_stream(
+        self,
+        mock_iter_all_workflows,
+        mock_parse_workflow,
+        mock_filter_multiple_iter,
+        mock_print_json_list,
+        json: bool,
+    ):
+        """Helper method for testing that the 'get workflows' command works
+        correctly with --stream"""
+
+        # SETUP
+        session = MagicMock()
+        self.mock_DAFNISession.return_value = session
+        runner = CliRunner()
+        workflow_dicts = [MagicMock(), MagicMock()]
+        workflows = [MagicMock(), MagicMock()]
+        mock_filter_multiple_iter.return_value = iter(zip(workflows, workflow_dicts))
+        printed = []
+        mock_print_json_list.side_effect = lambda dictionaries: printed.extend(
+            dictionaries
+        )
+
+        # CALL
+        options = ["workflows", "--stream", "--search", "Test"]
+        if json:
+            options.append("--json")
+        result = runner.invoke(get.get, options)
+
+        # ASSERT
+        self.mock_get_all_workflows.assert_not_called()
+        self.mock_filter_multiple.assert_not_called()
+        mock_iter_all_workflows.assert_called_once_with(session)
+        mock_filter_multiple_iter.assert_called_once_with(
+            [self.mock_text_filter.return_value],
+            mock_iter_all_workflows.return_value,
+            ANY,
+        )
+        parse_function = mock_filter_multiple_iter.call_args[0][2]
+        self.assertEqual(parse_function.func, mock_parse_workflow)
+        self.assertEqual(parse_function.keywords, {"lazy": True, "keep_dict": False})
+
+        if json:
+            self.assertEqual(printed, workflow_dicts)
+            self.mock_print_json.assert_not_called()
+            self.mock_print_table.assert_not_called()
+        else:
+            mock_print_json_list.assert_not_called()
+            self.mock_print_table.assert_called_once_with(
+                headers=[
+                    TABLE_NAME_HEADER,
+                    TABLE_VERSION_ID_HEADER,
+                    TABLE_PUBLICATION_DATE_HEADER,
+                    TABLE_SUMMARY_HEADER,
+                ],
+                rows=ANY,
+                max_column_widths=[
+                    TABLE_DISPLAY_NAME_MAX_COLUMN_WIDTH,
+                    None,
+                    None,
+                    TABLE_SUMMARY_MAX_COLUMN_WIDTH,
+                ],
+                wrap=True,
+                sample_size=TABLE_STREAM_SAMPLE_SIZE,
+            )
+            self.assertEqual(
+                self.printed_rows,
+                [workflow.get_brief_details.return_value for workflow in workflows],
+            )
+
+        self.assertEqual(result.exit_code, 0)
+
+    def test_get_workflows_stream(self):
+        """Tests that the 'get workflows' command works correctly with
+        --stream"""
+
+        self._test_get_workflows_stream(json=False)
+
+    def test_get_workflows_stream_json(self):
+        """Tests that the 'get workflows' command works correctly with
+        --stream and --json"""
+
+        self._test_get_workflows_stream(json=True)
+
 
 @patch("dafni_cli.commands.get.DAFNISession")
-@patch("dafni_cli.commands.get.cli_get_workflow")
+@patch("dafni_cli.commands.get.cli_get_workflows")
 @patch("dafni_cli.commands.get.parse_workflow")
 @patch("dafni_cli.commands.get.print_json")
 class TestGetWorkflow(TestCase):
@@ -927,7 +1220,7 @@ class TestGetWorkflow(TestCase):
         self,
         mock_print_json,
         mock_parse_workflow,
-        mock_cli_get_workflow,
+        mock_cli_get_workflows,
         mock_DAFNISession,
     ):
         """Tests that the 'get workflow' command works correctly (with no
@@ -938,7 +1231,7 @@ class TestGetWorkflow(TestCase):
         mock_DAFNISession.return_value = session
         runner = CliRunner()
         workflow = MagicMock()
-        mock_cli_get_workflow.return_value = workflow
+        mock_cli_get_workflows.return_value = [workflow]
         mock_parse_workflow.return_value = workflow
 
         # CALL
@@ -946,7 +1239,9 @@ class TestGetWorkflow(TestCase):
 
         # ASSERT
         mock_DAFNISession.assert_called_once()
-        mock_cli_get_workflow.assert_called_with(session, "some_version_id")
+        mock_cli_get_workflows.assert_called_once_with(
+            session, ("some_version_id",), max_workers=PARALLEL_REQUESTS
+        )
         workflow.output_details.assert_called_once()
         mock_print_json.assert_not_called()
 
@@ -956,7 +1251,7 @@ class TestGetWorkflow(TestCase):
         self,
         mock_print_json,
         mock_parse_workflow,
-        mock_cli_get_workflow,
+        mock_cli_get_workflows,
         mock_DAFNISession,
     ):
         """Tests that the 'get workflow' command works correctly (with --json)"""
@@ -966,7 +1261,7 @@ class TestGetWorkflow(TestCase):
         mock_DAFNISession.return_value = session
         runner = CliRunner()
         workflow = MagicMock()
-        mock_cli_get_workflow.return_value = workflow
+        mock_cli_get_workflows.return_value = [workflow]
         mock_parse_workflow.return_value = workflow
 
         # CALL
@@ -974,7 +1269,9 @@ class TestGetWorkflow(TestCase):
 
         # ASSERT
         mock_DAFNISession.assert_called_once()
-        mock_cli_get_workflow.assert_called_with(session, "some_version_id")
+        mock_cli_get_workflows.assert_called_once_with(
+            session, ("some_version_id",), max_workers=PARALLEL_REQUESTS
+        )
         workflow.output_details.assert_not_called()
         mock_print_json.assert_called_once_with(workflow)
 
@@ -984,7 +1281,7 @@ class TestGetWorkflow(TestCase):
         self,
         mock_print_json,
         mock_parse_workflow,
-        mock_cli_get_workflow,
+        mock_cli_get_workflows,
         mock_DAFNISession,
     ):
         """Tests that the 'get workflow' command works correctly (with
@@ -995,7 +1292,7 @@ class TestGetWorkflow(TestCase):
         mock_DAFNISession.return_value = session
         runner = CliRunner()
         workflow = MagicMock()
-        mock_cli_get_workflow.return_value = workflow
+        mock_cli_get_workflows.return_value = [workflow]
         mock_parse_workflow.return_value = workflow
 
         # CALL
@@ -1005,7 +1302,9 @@ class TestGetWorkflow(TestCase):
 
         # ASSERT
         mock_DAFNISession.assert_called_once()
-        mock_cli_get_workflow.assert_called_with(session, "some_version_id")
+        mock_cli_get_workflows.assert_called_once_with(
+            session, ("some_version_id",), max_workers=PARALLEL_REQUESTS
+        )
         workflow.output_version_history.assert_called_once()
         mock_print_json.assert_not_called()
 
@@ -1015,7 +1314,7 @@ class TestGetWorkflow(TestCase):
         self,
         mock_print_json,
         mock_parse_workflow,
-        mock_cli_get_workflow,
+        mock_cli_get_workflows,
         mock_DAFNISession,
     ):
         """Tests that the 'get workflow' command works correctly (with --json
@@ -1027,7 +1326,7 @@ class TestGetWorkflow(TestCase):
         runner = CliRunner()
         workflow = MagicMock()
         version_history = MagicMock()
-        mock_cli_get_workflow.return_value = {"version_history": [version_history]}
+        mock_cli_get_workflows.return_value = [{"version_history": [version_history]}]
         mock_parse_workflow.return_value = workflow
 
         # CALL
@@ -1037,7 +1336,9 @@ class TestGetWorkflow(TestCase):
 
         # ASSERT
         mock_DAFNISession.assert_called_once()
-        mock_cli_get_workflow.assert_called_with(session, "some_version_id")
+        mock_cli_get_workflows.assert_called_once_with(
+            session, ("some_version_id",), max_workers=PARALLEL_REQUESTS
+        )
         workflow.output_version_history.assert_not_called()
         mock_print_json.assert_called_once_with(version_history)
 
@@ -1067,7 +1368,12 @@ class TestGetWorkflowInstances(TestCase):
         ).start()
         self.mock_print_json = patch("dafni_cli.commands.get.print_json").start()
         self.mock_click = patch("dafni_cli.commands.get.click").start()
-        self.mock_format_table = patch("dafni_cli.commands.get.format_table").start()
+        self.mock_print_table = patch("dafni_cli.commands.get.print_table").start()
+        # Consume the rows as they may be given as a generator
+        self.printed_rows = []
+        self.mock_print_table.side_effect = lambda rows, **kwargs: (
+            self.printed_rows.extend(rows)
+        )
 
         self.addCleanup(patch.stopall)
 
@@ -1118,9 +1424,7 @@ class TestGetWorkflowInstances(TestCase):
         self.mock_cli_get_workflow.assert_called_once_with(session, version_id)
         self.mock_parse_workflow.assert_called_once_with(workflow_dict)
         self.mock_filter_multiple.assert_called_once_with(
-            expected_filters,
-            workflow_instances,
-            workflow_instance_dicts,
+            expected_filters, workflow_instances
         )
 
         # Different outputs depending on json flag
@@ -1130,7 +1434,7 @@ class TestGetWorkflowInstances(TestCase):
             )
             for workflow_instance in workflow_instances:
                 workflow_instance.get_brief_details.assert_not_called()
-            self.mock_format_table.assert_not_called()
+            self.mock_print_table.assert_not_called()
             self.mock_click.echo.assert_not_called()
         else:
             self.mock_print_json.assert_not_called()
@@ -1140,7 +1444,7 @@ class TestGetWorkflowInstances(TestCase):
             workflow_instances[2].get_brief_details.assert_called_once()
             workflow_instances[3].get_brief_details.assert_not_called()
 
-            self.mock_format_table.assert_called_once_with(
+            self.mock_print_table.assert_called_once_with(
                 headers=[
                     TABLE_ID_HEADER,
                     TABLE_WORKFLOW_VERSION_ID_HEADER,
@@ -1149,16 +1453,18 @@ class TestGetWorkflowInstances(TestCase):
                     TABLE_FINISHED_HEADER,
                     TABLE_STATUS_HEADER,
                 ],
-                rows=[
+                rows=ANY,
+                wrap=True,
+            )
+            self.assertEqual(
+                self.printed_rows,
+                [
                     # Should have been sorted
                     workflow_instances[1].get_brief_details.return_value,
                     workflow_instances[2].get_brief_details.return_value,
                     workflow_instances[0].get_brief_details.return_value,
                 ],
             )
-            self.mock_click.echo.assert_called_once_with(
-                self.mock_format_table.return_value
-            )
 
         self.assertEqual(result.exit_code, 0)
 
@@ -1170,6 +1476,23 @@ class TestGetWorkflowInstances(TestCase):
             filter_arguments=[], expected_filters=[], json=False
         )
 
+    def test_get_workflow_instances_no_wrap(self):
+        """Tests that the 'get workflow-instances' command prints the table
+        without wrapping when given --no-wrap"""
+
+        # SETUP
+        runner = CliRunner()
+        self.mock_filter_multiple.return_value = ([], [])
+
+        # CALL
+        result = runner.invoke(
+            get.get, ["workflow-instances", "version_id", "--no-wrap"]
+        )
+
+        # ASSERT
+        self.assertFalse(self.mock_print_table.call_args.kwargs["wrap"])
+        self.assertEqual(result.exit_code, 0)
+
     def test_get_workflow_instances_with_json_true(
         self,
     ):
@@ -1386,6 +1709,83 @@ class TestGetWorkflowInstances(TestCase):
         )
 
 
+class TestGetWorkflowInstancesCached(TestCase):
+    """Test class to test the get workflow-instances command with a response
+    cache"""
+
+    def setUp(self) -> None:
+        super().setUp()
+
+        temp_dir = TemporaryDirectory("test")
+        self.addCleanup(temp_dir.cleanup)
+
+        self.session = DAFNISession(TEST_SESSION_DATA)
+        self.session._response_cache = ResponseCache(Path(temp_dir.name))
+        self.addCleanup(self.session.close)
+
+        patch("dafni_cli.commands.get.DAFNISession", return_value=self.session).start()
+        self.mock_authenticated_request = patch.object(
+            self.session, "_authenticated_request"
+        ).start()
+        self.mock_time = patch("dafni_cli.api.response_cache.time.time").start()
+        self.mock_time.return_value = 0
+
+        self.addCleanup(patch.stopall)
+
+    def _create_workflow_response(self, instances: List[dict], etag: str):
+        """Returns a mock response for a workflow with the given instances"""
+        response = create_mock_response(200, {**TEST_WORKFLOW, "instances": instances})
+        response.headers = {"ETag": etag}
+        return response
+
+    def test_get_workflow_instances_picks_up_new_instances(self):
+        """Tests that the 'get workflow-instances' command picks up
+        instances created since the workflow was cached"""
+
+        # SETUP
+        runner = CliRunner()
+        version_id = TEST_WORKFLOW["id"]
+        new_instance = {
+            **TEST_WORKFLOW_INSTANCE_LIST,
+            "instance_id": "0a0a0a0a-0a00-0a00-a000-0a0a0000000d",
+        }
+        self.mock_authenticated_request.side_effect = [
+            self._create_workflow_response([TEST_WORKFLOW_INSTANCE_LIST], '"v1"'),
+            self._create_workflow_response(
+                [TEST_WORKFLOW_INSTANCE_LIST, new_instance], '"v2"'
+            ),
+        ]
+
+        # CALL
+        first_result = runner.invoke(
+            get.get, ["workflow-instances", version_id, "--json"]
+        )
+        # Use the cached response until it expires
+        cached_result = runner.invoke(
+            get.get, ["workflow-instances", version_id, "--json"]
+        )
+        self.mock_time.return_value = RESPONSE_CACHE_TTL
+        second_result = runner.invoke(
+            get.get, ["workflow-instances", version_id, "--json"]
+        )
+
+        # ASSERT
+        self.assertEqual(json.loads(first_result.output), [TEST_WORKFLOW_INSTANCE_LIST])
+        self.assertEqual(cached_result.output, first_result.output)
+        self.assertEqual(
+            json.loads(second_result.output),
+            [TEST_WORKFLOW_INSTANCE_LIST, new_instance],
+        )
+        self.assertEqual(self.mock_authenticated_request.call_count, 2)
+        # The expired response should have been revalidated
+        self.assertEqual(
+            self.mock_authenticated_request.call_args.kwargs["headers"][
+                "If-None-Match"
+            ],
+            '"v1"',
+        )
+
+
 @patch("dafni_cli.commands.get.DAFNISession")
 @patch("dafni_cli.commands.get.cli_get_workflow_instance")
 @patch("dafni_cli.commands.get.parse_workflow_instance")
@@ -1,3 +1,4 @@
+import time
 from unittest import TestCase
 from unittest.mock import MagicMock, call, patch
 
@@ -46,6 +47,80 @@ class TestCliGetModel(TestCase):
         self.assertEqual(err.exception.code, 1)
 
 
+@patch("dafni_cli.commands.helpers.get_model")
+@patch("dafni_cli.commands.helpers.click")
+class TestCliGetModels(TestCase):
+    """Test class to test cli_get_models"""
+
+    def test_returns_correctly(self, mock_click, mock_get_model):
+        """Tests the function returns the models in the order of the given
+        version ids, even when they are received in a different order"""
+        # SETUP
+        mock_session = MagicMock()
+        version_ids = ["version_id_1", "version_id_2", "version_id_3"]
+        delays = {"version_id_1": 0.05, "version_id_2": 0.0, "version_id_3": 0.02}
+
+        def get_model(session, version_id):
+            time.sleep(delays[version_id])
+            return {"version_id": version_id}
+
+        mock_get_model.side_effect = get_model
+
+        # CALL
+        result = list(helpers.cli_get_models(mock_session, version_ids, max_workers=3))
+
+        # ASSERT
+        mock_get_model.assert_has_calls(
+            [call(mock_session, version_id) for version_id in version_ids],
+            any_order=True,
+        )
+        self.assertEqual(
+            result, [{"version_id": version_id} for version_id in version_ids]
+        )
+        mock_click.echo.assert_not_called()
+
+    def test_resource_not_found(self, mock_click, mock_get_model):
+        """Tests the function returns the models that are found and then
+        prints an error message for each that isn't"""
+        # SETUP
+        mock_session = MagicMock()
+        version_ids = ["version_id_1", "version_id_2", "version_id_3"]
+        error_1 = ResourceNotFoundError("Some error message 1")
+        error_3 = ResourceNotFoundError("Some error message 3")
+        model_dict = MagicMock()
+        mock_get_model.side_effect = [error_1, model_dict, error_3]
+
+        # CALL
+        result = []
+        with self.assertRaises(SystemExit) as err:
+            for model in helpers.cli_get_models(
+                mock_session, version_ids, max_workers=1
+            ):
+                result.append(model)
+
+        # ASSERT
+        self.assertEqual(result, [model_dict])
+        self.assertEqual(mock_click.echo.call_args_list, [call(error_1), call(error_3)])
+        self.assertEqual(err.exception.code, 1)
+
+    def test_other_errors_raised(self, mock_click, mock_get_model):
+        """Tests the function raises any other errors immediately"""
+        # SETUP
+        mock_session = MagicMock()
+        mock_get_model.side_effect = ValueError("Some error message")
+
+        # CALL
+        with self.assertRaises(ValueError):
+            list(
+                helpers.cli_get_models(
+                    mock_session, ["version_id_1", "version_id_2"], max_workers=1
+                )
+            )
+
+        # ASSERT
+        mock_click.echo.assert_not_called()
+
+
 @patch("dafni_cli.commands.helpers.get_latest_dataset_metadata")
 @patch("dafni_cli.commands.helpers.click")
 class TestCliGetLatestDatasetMetadata(TestCase):
@@ -90,6 +165,55 @@ class TestCliGetLatestDatasetMetadata(TestCase):
         self.assertEqual(err.exception.code, 1)
 
 
+@patch("dafni_cli.commands.helpers.get_latest_dataset_metadata")
+@patch("dafni_cli.commands.helpers.click")
+class TestCliGetLatestDatasetsMetadata(TestCase):
+    """Test class to test cli_get_latest_datasets_metadata"""
+
+    def test_returns_correctly(self, mock_click, mock_get_latest_dataset_metadata):
+        """Tests the function returns the metadata of each dataset in the
+        order of the given version ids"""
+        # SETUP
+        mock_session = MagicMock()
+        metadata = [MagicMock(), MagicMock()]
+        mock_get_latest_dataset_metadata.side_effect = metadata
+
+        # CALL
+        result = list(
+            helpers.cli_get_latest_datasets_metadata(
+                mock_session, ["version_id_1", "version_id_2"], max_workers=1
+            )
+        )
+
+        # ASSERT
+        self.assertEqual(
+            mock_get_latest_dataset_metadata.call_args_list,
+            [call(mock_session, "version_id_1"), call(mock_session, "version_id_2")],
+        )
+        self.assertEqual(result, metadata)
+        mock_click.echo.assert_not_called()
+
+    def test_resource_not_found(self, mock_click, mock_get_latest_dataset_metadata):
+        """Tests the function prints an error message for each dataset that
+        isn't found"""
+        # SETUP
+        mock_session = MagicMock()
+        error = ResourceNotFoundError("Some error message")
+        mock_get_latest_dataset_metadata.side_effect = error
+
+        # CALL
+        with self.assertRaises(SystemExit) as err:
+            list(
+                helpers.cli_get_latest_datasets_metadata(
+                    mock_session, ["version_id"], 1
+                )
+            )
+
+        # ASSERT
+        mock_click.echo.assert_called_once_with(error)
+        self.assertEqual(err.exception.code, 1)
+
+
 class TestCliSelectDatasetFiles(TestCase):
     """Test class to test cli_select_dataset_files"""
 
@@ -190,6 +314,51 @@ class TestCliGetWorkflow(TestCase):
         self.assertEqual(err.exception.code, 1)
 
 
+@patch("dafni_cli.commands.helpers.get_workflow")
+@patch("dafni_cli.commands.helpers.click")
+class TestCliGetWorkflows(TestCase):
+    """Test class to test cli_get_workflows"""
+
+    def test_returns_correctly(self, mock_click, mock_get_workflow):
+        """Tests the function returns the workflows in the order of the
+        given version ids"""
+        # SETUP
+        mock_session = MagicMock()
+        workflow_dicts = [MagicMock(), MagicMock()]
+        mock_get_workflow.side_effect = workflow_dicts
+
+        # CALL
+        result = list(
+            helpers.cli_get_workflows(
+                mock_session, ["version_id_1", "version_id_2"], max_workers=1
+            )
+        )
+
+        # ASSERT
+        self.assertEqual(
+            mock_get_workflow.call_args_list,
+            [call(mock_session, "version_id_1"), call(mock_session, "version_id_2")],
+        )
+        self.assertEqual(result, workflow_dicts)
+        mock_click.echo.assert_not_called()
+
+    def test_resource_not_found(self, mock_click, mock_get_workflow):
+        """Tests the function prints an error message for each workflow
+        that isn't found"""
+        # SETUP
+        mock_session = MagicMock()
+        error = ResourceNotFoundError("Some error message")
+        mock_get_workflow.side_effect = error
+
+        # CALL
+        with self.assertRaises(SystemExit) as err:
+            list(helpers.cli_get_workflows(mock_session, ["version_id"], 1))
+
+        # ASSERT
+        mock_click.echo.assert_called_once_with(error)
+        self.assertEqual(err.exception.code, 1)
+
+
 @patch("dafni_cli.commands.helpers.get_workflow_instance")
 @patch("dafni_cli.commands.helpers.click")
 class TestCliGetWorkflowInstance(TestCase):
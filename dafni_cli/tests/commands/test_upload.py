@@ -40,7 +40,10 @@ class TestUpload(TestCase):
             )
 
         # ASSERT
-        mock_DAFNISession.assert_called_once()
+        # Shouldn't use cached responses without checking they are current
+        mock_DAFNISession.assert_called_once_with(
+            use_response_cache=True, revalidate_response_cache=True
+        )
 
         self.assertEqual(ctx["session"], session)
         self.assertEqual(result.exit_code, 0)
@@ -263,6 +266,7 @@ class TestUploadDataset(TestCase):
         file_paths: List[str],
         additional_args: Optional[List[str]] = None,
         input: Optional[str] = None,
+        journal_path: Optional[str] = None,
     ) -> Result:
         """Invokes the upload dataset command with most required arguments provided
 
@@ -273,6 +277,8 @@ class TestUploadDataset(TestCase):
             additional_args (Optional[List[str]]): Any additional parameters to
                                                    add
             input (Optional[str]): 'input' to pass to CliRunner's invoke function
+            journal_path (Optional[str]): Path of an upload journal to create
+                                          (Not added to command parameters)
         """
         if additional_args is None:
             additional_args = []
@@ -282,6 +288,9 @@ class TestUploadDataset(TestCase):
         with runner.isolated_filesystem():
             with open(self.metadata_path, "w", encoding="utf-8") as file:
                 file.write("{}")
+            if journal_path is not None:
+                with open(journal_path, "w", encoding="utf-8") as file:
+                    file.write("{}")
             for file_path in file_paths:
                 with open(file_path, "w", encoding="utf-8") as file:
                     file.write("test dataset file")
@@ -311,7 +320,13 @@ class TestUploadDataset(TestCase):
         # ASSERT
         self.mock_DAFNISession.assert_called_once()
         self.mock_upload_dataset.assert_called_once_with(
-            self.mock_session, {}, (Path(dataset_file_path),), json=False
+            self.mock_session,
+            {},
+            (Path(dataset_file_path),),
+            json=False,
+            max_workers=1,
+            journal_path=None,
+            resume=False,
         )
 
         self.assertEqual(
@@ -341,6 +356,9 @@ class TestUploadDataset(TestCase):
             {},
             (Path(dataset_file_paths[0]), Path(dataset_file_paths[1])),
             json=False,
+            max_workers=1,
+            journal_path=None,
+            resume=False,
         )
 
         self.assertEqual(
@@ -369,7 +387,13 @@ class TestUploadDataset(TestCase):
         # ASSERT
         self.mock_DAFNISession.assert_called_once()
         self.mock_upload_dataset.assert_called_once_with(
-            self.mock_session, {}, (Path(dataset_file_path),), json=False
+            self.mock_session,
+            {},
+            (Path(dataset_file_path),),
+            json=False,
+            max_workers=1,
+            journal_path=None,
+            resume=False,
         )
 
         self.assertEqual(result.output, "")
@@ -392,12 +416,153 @@ class TestUploadDataset(TestCase):
         # ASSERT
         self.mock_DAFNISession.assert_called_once()
         self.mock_upload_dataset.assert_called_once_with(
-            self.mock_session, {}, (Path(dataset_file_path),), json=True
+            self.mock_session,
+            {},
+            (Path(dataset_file_path),),
+            json=True,
+            max_workers=1,
+            journal_path=None,
+            resume=False,
+        )
+
+        self.assertEqual(result.output, "")
+        self.assertEqual(result.exit_code, 0)
+
+    def test_upload_dataset_parallel(
+        self,
+    ):
+        """Tests that the 'upload dataset' command works correctly when given
+        a --parallel option"""
+
+        # SETUP
+        dataset_file_path = "test_dataset.txt"
+
+        # CALL
+        result = self.invoke_command(
+            file_paths=[dataset_file_path], additional_args=["--parallel", "4", "-y"]
+        )
+
+        # ASSERT
+        self.mock_DAFNISession.assert_called_once()
+        self.mock_upload_dataset.assert_called_once_with(
+            self.mock_session,
+            {},
+            (Path(dataset_file_path),),
+            json=False,
+            max_workers=4,
+            journal_path=None,
+            resume=False,
         )
 
         self.assertEqual(result.output, "")
         self.assertEqual(result.exit_code, 0)
 
+    def test_upload_dataset_with_journal(
+        self,
+    ):
+        """Tests that the 'upload dataset' command works correctly when given
+        a --journal option"""
+
+        # SETUP
+        dataset_file_path = "test_dataset.txt"
+
+        # CALL
+        result = self.invoke_command(
+            file_paths=[dataset_file_path],
+            additional_args=["--journal", "journal.json", "-y"],
+        )
+
+        # ASSERT
+        self.mock_upload_dataset.assert_called_once_with(
+            self.mock_session,
+            {},
+            (Path(dataset_file_path),),
+            json=False,
+            max_workers=1,
+            journal_path=Path("journal.json"),
+            resume=False,
+        )
+
+        self.assertEqual(result.output, "")
+        self.assertEqual(result.exit_code, 0)
+
+    def test_upload_dataset_resume(
+        self,
+    ):
+        """Tests that the 'upload dataset' command works correctly when given
+        a --resume option"""
+
+        # SETUP
+        dataset_file_path = "test_dataset.txt"
+
+        # CALL
+        result = self.invoke_command(
+            file_paths=[dataset_file_path],
+            additional_args=["--resume", "journal.json"],
+            input="y",
+            journal_path="journal.json",
+        )
+
+        # ASSERT
+        self.mock_upload_dataset.assert_called_once_with(
+            self.mock_session,
+            {},
+            (Path(dataset_file_path),),
+            json=False,
+            max_workers=1,
+            journal_path=Path("journal.json"),
+            resume=True,
+        )
+
+        self.assertEqual(
+            result.output,
+            f"Dataset metadata file path: {self.metadata_path}\n"
+            f"Dataset file name: {dataset_file_path}\n"
+            "Resuming from journal: journal.json\n"
+            "Confirm dataset upload? [y/N]: y\n",
+        )
+        self.assertEqual(result.exit_code, 0)
+
+    def test_upload_dataset_journal_and_resume_invalid(
+        self,
+    ):
+        """Tests that the 'upload dataset' command fails when given both
+        --journal and --resume"""
+
+        # CALL
+        result = self.invoke_command(
+            file_paths=["test_dataset.txt"],
+            additional_args=["--journal", "new.json", "--resume", "journal.json"],
+            journal_path="journal.json",
+        )
+
+        # ASSERT
+        self.mock_upload_dataset.assert_not_called()
+        self.assertIn("Only one of --journal and --resume may be given", result.output)
+        self.assertEqual(result.exit_code, 2)
+
+    def test_upload_dataset_existing_journal_invalid(
+        self,
+    ):
+        """Tests that the 'upload dataset' command fails when given an
+        existing file for --journal"""
+
+        # CALL
+        result = self.invoke_command(
+            file_paths=["test_dataset.txt"],
+            additional_args=["--journal", "journal.json", "-y"],
+            journal_path="journal.json",
+        )
+
+        # ASSERT
+        self.mock_upload_dataset.assert_not_called()
+        self.assertIn(
+            "The journal 'journal.json' already exists, use --resume to resume "
+            "the upload it records",
+            result.output,
+        )
+        self.assertEqual(result.exit_code, 2)
+
     def test_upload_dataset_cancel(
         self,
     ):
@@ -546,6 +711,7 @@ class TestUploadDatasetVersion(TestCase):
             metadata=self.mock_modify_dataset_metadata_for_upload.return_value,
             paths=(Path(dataset_file_path),),
             json=False,
+            max_workers=1,
         )
 
         self.assertEqual(
@@ -558,6 +724,169 @@ class TestUploadDatasetVersion(TestCase):
         )
         self.assertEqual(result.exit_code, 0)
 
+    @patch("dafni_cli.commands.upload.print_dataset_version_diff")
+    @patch("dafni_cli.commands.upload.diff_dataset_files")
+    def test_upload_dataset_version_with_diff(
+        self, mock_diff_dataset_files, mock_print_dataset_version_diff
+    ):
+        """Tests that the 'upload dataset-version' command works correctly
+        when given --diff and the files have changed"""
+
+        # SETUP
+        dataset_file_path = "test_dataset.txt"
+        self.mock_cli_get_latest_dataset_metadata.return_value = TEST_DATASET_METADATA
+        metadata = parse_dataset_metadata(TEST_DATASET_METADATA)
+        mock_diff_dataset_files.return_value.has_changes = True
+
+        # CALL
+        result, _ = self.invoke_command(
+            file_paths=[dataset_file_path],
+            additional_args=[dataset_file_path, "--diff"],
+            input="y",
+        )
+
+        # ASSERT
+        mock_diff_dataset_files.assert_called_once_with(
+            metadata.files, {dataset_file_path: Path(dataset_file_path)}
+        )
+        mock_print_dataset_version_diff.assert_called_once_with(
+            mock_diff_dataset_files.return_value
+        )
+        self.mock_upload_dataset.assert_called_once_with(
+            self.mock_session,
+            dataset_id=metadata.dataset_id,
+            metadata=self.mock_modify_dataset_metadata_for_upload.return_value,
+            paths=(Path(dataset_file_path),),
+            json=False,
+            max_workers=1,
+        )
+
+        # Changes are displayed in place of each file name
+        self.assertEqual(
+            result.output,
+            f"Dataset Title: {metadata.title}\n"
+            f"Dataset ID: {metadata.dataset_id}\n"
+            f"Dataset Version ID: {metadata.version_id}\n"
+            "Confirm dataset upload? [y/N]: y\n",
+        )
+        self.assertEqual(result.exit_code, 0)
+
+    @patch("dafni_cli.commands.upload.print_dataset_version_diff")
+    @patch("dafni_cli.commands.upload.diff_dataset_files")
+    def test_upload_dataset_version_with_diff_and_no_changes(
+        self, mock_diff_dataset_files, mock_print_dataset_version_diff
+    ):
+        """Tests that the 'upload dataset-version' command doesn't upload
+        anything when given --diff and neither the files nor the metadata
+        have changed"""
+
+        # SETUP
+        dataset_file_path = "test_dataset.txt"
+        self.mock_cli_get_latest_dataset_metadata.return_value = TEST_DATASET_METADATA
+        mock_diff_dataset_files.return_value.has_changes = False
+
+        # CALL
+        result, _ = self.invoke_command(
+            file_paths=[dataset_file_path],
+            additional_args=[dataset_file_path, "--diff"],
+        )
+
+        # ASSERT
+        mock_print_dataset_version_diff.assert_called_once_with(
+            mock_diff_dataset_files.return_value
+        )
+        # Should compare against the existing metadata without modifications
+        self.mock_modify_dataset_metadata_for_upload.assert_called_with(
+            existing_metadata=TEST_DATASET_METADATA
+        )
+        self.mock_upload_dataset.assert_not_called()
+        self.assertEqual(
+            result.output,
+            "The files and metadata are the same as those in the existing "
+            "version, so no new version has been uploaded\n",
+        )
+        self.assertEqual(result.exit_code, 0)
+
+    @patch("dafni_cli.commands.upload.print_dataset_version_diff")
+    @patch("dafni_cli.commands.upload.diff_dataset_files")
+    def test_upload_dataset_version_with_diff_and_no_changes_json(
+        self, mock_diff_dataset_files, mock_print_dataset_version_diff
+    ):
+        """Tests that the 'upload dataset-version' command only writes to
+        stderr when given --diff and --json and nothing has changed"""
+
+        # SETUP
+        dataset_file_path = "test_dataset.txt"
+        self.mock_cli_get_latest_dataset_metadata.return_value = TEST_DATASET_METADATA
+        mock_diff_dataset_files.return_value.has_changes = False
+
+        # CALL
+        result, _ = self.invoke_command(
+            file_paths=[dataset_file_path],
+            additional_args=[dataset_file_path, "--diff", "--json"],
+        )
+
+        # ASSERT
+        mock_print_dataset_version_diff.assert_not_called()
+        self.mock_upload_dataset.assert_not_called()
+        self.assertEqual(result.stdout, "")
+        self.assertEqual(
+            result.stderr,
+            "The files and metadata are the same as those in the existing "
+            "version, so no new version has been uploaded\n",
+        )
+        self.assertEqual(result.exit_code, 0)
+
+    @patch("dafni_cli.commands.upload.print_dataset_version_diff")
+    @patch("dafni_cli.commands.upload.diff_dataset_files")
+    def test_upload_dataset_version_with_diff_and_only_metadata_changes(
+        self, mock_diff_dataset_files, mock_print_dataset_version_diff
+    ):
+        """Tests that the 'upload dataset-version' command still uploads a
+        new version when given --diff and only the metadata has changed"""
+
+        # SETUP
+        dataset_file_path = "test_dataset.txt"
+        self.mock_cli_get_latest_dataset_metadata.return_value = TEST_DATASET_METADATA
+        metadata = parse_dataset_metadata(TEST_DATASET_METADATA)
+        mock_diff_dataset_files.return_value.has_changes = False
+        modified_metadata = {"dct:title": "New title"}
+        self.mock_modify_dataset_metadata_for_upload.side_effect = [
+            modified_metadata,
+            {"dct:title": "Old title"},
+        ]
+
+        # CALL
+        result, _ = self.invoke_command(
+            file_paths=[dataset_file_path],
+            additional_args=[dataset_file_path, "--diff", "--title", "New title"],
+            input="y",
+        )
+
+        # ASSERT
+        mock_print_dataset_version_diff.assert_called_once_with(
+            mock_diff_dataset_files.return_value
+        )
+        self.mock_upload_dataset.assert_called_once_with(
+            self.mock_session,
+            dataset_id=metadata.dataset_id,
+            metadata=modified_metadata,
+            paths=(Path(dataset_file_path),),
+            json=False,
+            max_workers=1,
+        )
+        self.assertEqual(
+            result.output,
+            "Only the metadata has changed, but all of the files will still be "
+            "uploaded. To update just the metadata use 'dafni upload "
+            "dataset-metadata' instead.\n"
+            f"Dataset Title: {metadata.title}\n"
+            f"Dataset ID: {metadata.dataset_id}\n"
+            f"Dataset Version ID: {metadata.version_id}\n"
+            "Confirm dataset upload? [y/N]: y\n",
+        )
+        self.assertEqual(result.exit_code, 0)
+
     def test_upload_dataset_version_with_multiple_files(
         self,
     ):
@@ -614,6 +943,7 @@ class TestUploadDatasetVersion(TestCase):
             metadata=self.mock_modify_dataset_metadata_for_upload.return_value,
             paths=(Path(dataset_file_paths[0]), Path(dataset_file_paths[1])),
             json=False,
+            max_workers=1,
         )
 
         self.assertEqual(
@@ -746,6 +1076,7 @@ class TestUploadDatasetVersion(TestCase):
             metadata=self.mock_modify_dataset_metadata_for_upload.return_value,
             paths=(Path(dataset_file_path),),
             json=False,
+            max_workers=1,
         )
 
         self.assertEqual(result.output, "")
@@ -806,6 +1137,7 @@ class TestUploadDatasetVersion(TestCase):
             metadata=self.mock_modify_dataset_metadata_for_upload.return_value,
             paths=(Path(dataset_file_path),),
             json=True,
+            max_workers=1,
         )
 
         self.assertEqual(result.output, "")
@@ -948,6 +1280,7 @@ class TestUploadDatasetVersion(TestCase):
             metadata=self.mock_modify_dataset_metadata_for_upload.return_value,
             paths=(Path(dataset_file_path),),
             json=False,
+            max_workers=1,
         )
 
         self.assertEqual(
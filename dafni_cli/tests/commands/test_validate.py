@@ -34,7 +34,10 @@ class TestValidate(TestCase):
             )
 
         # ASSERT
-        mock_DAFNISession.assert_called_once()
+        # Shouldn't use cached responses without checking they are current
+        mock_DAFNISession.assert_called_once_with(
+            use_response_cache=True, revalidate_response_cache=True
+        )
 
         self.assertEqual(ctx["session"], session)
         self.assertEqual(result.exit_code, 0)
@@ -1,13 +1,41 @@
+import hashlib
+import json
+import math
+from contextlib import nullcontext
 from pathlib import Path
+from tempfile import TemporaryDirectory
 from typing import Optional
 from unittest import TestCase
-from unittest.mock import MagicMock, call, mock_open, patch
+from unittest.mock import MagicMock, call, patch
+
+from requests import HTTPError
 
 import dafni_cli.datasets.dataset_download as dataset_download
+from dafni_cli.api.exceptions import DAFNIError
 from dafni_cli.api.parser import ParserBaseObject
 from dafni_cli.consts import DOWNLOAD_CHUNK_SIZE
 from dafni_cli.datasets.dataset_metadata import DataFile
-from dafni_cli.tests.fixtures.dataset_metadata import TEST_DATASET_METADATA_DATAFILE
+from dafni_cli.tests.fixtures.dataset_metadata import (
+    TEST_DATASET_METADATA_DATAFILE,
+    TEST_DATASET_METADATA_DATAFILE_WITH_CHECKSUM,
+)
+from dafni_cli.utils import format_file_size
+
+
+def create_mock_download_response(
+    chunks: list, status_code: int = 200, etag: Optional[str] = '"etag"'
+) -> MagicMock:
+    """Returns a mock streamed response for a file download containing the
+    given chunks"""
+    mock_download_response = MagicMock()
+    mock_download_response.status_code = status_code
+    mock_download_response.headers = {
+        "content-length": str(sum(len(chunk) for chunk in chunks))
+    }
+    if etag is not None:
+        mock_download_response.headers["ETag"] = etag
+    mock_download_response.iter_content.return_value = chunks
+    return mock_download_response
 
 
 class TestDownloadDataset(TestCase):
@@ -23,14 +51,18 @@ class TestDownloadDataset(TestCase):
         self.mock_minio_get_request = patch(
             "dafni_cli.datasets.dataset_download.minio_get_request"
         ).start()
-        self.open_mock = patch("builtins.open", new_callable=mock_open).start()
         self.mock_tqdm = patch("dafni_cli.datasets.dataset_download.tqdm").start()
+        # Write directly to the file while still recording the progress bar
+        self.mock_tqdm.wrapattr.side_effect = lambda file, *args, **kwargs: (
+            nullcontext(file)
+        )
+        self.mock_cwd = patch("dafni_cli.datasets.dataset_download.Path.cwd").start()
 
         self.addCleanup(patch.stopall)
 
-    def _test_download_dataset(self, directory: Optional[Path]):
+    def _test_download_dataset(self, directory: Optional[str], max_workers: int = 1):
         """Tests that download_dataset works as expected when given a
-        particular value of 'directory'"""
+        particular value of 'directory' and 'max_workers'"""
 
         # SETUP
         session = MagicMock()
@@ -39,66 +71,98 @@ class TestDownloadDataset(TestCase):
             ParserBaseObject.parse_from_dict(DataFile, TEST_DATASET_METADATA_DATAFILE),
         ]
         # Ensure second file has a different name
-        files[1].name = "test.csv"
-
-        mock_file_size = files[0].size
-        mock_download_response = MagicMock()
-        mock_download_response.headers.get = MagicMock(return_value=mock_file_size)
-        mock_download_response_chunks = [MagicMock(), MagicMock()]
-        mock_download_response.iter_content.return_value = mock_download_response_chunks
+        files[1].name = "folder/test.csv"
 
+        mock_download_response_chunks = [b"chunk1", b"chunk2"]
+        expected_content = b"".join(mock_download_response_chunks)
         self.mock_minio_get_request.return_value.__enter__.return_value = (
-            mock_download_response
+            create_mock_download_response(mock_download_response_chunks)
         )
 
         expected_total_file_size = sum(file.size for file in files)
-        if directory is None:
-            expected_directory = Path.cwd()
-        else:
-            expected_directory = directory
 
-        # CALL
-        dataset_download.download_dataset(
-            session=session, files=files, directory=directory
-        )
+        with TemporaryDirectory("test") as temp_dir:
+            self.mock_cwd.return_value = Path(temp_dir)
+            if directory is None:
+                expected_directory = Path(temp_dir)
+            else:
+                directory = Path(temp_dir) / directory
+                expected_directory = directory
+
+            # CALL
+            dataset_download.download_dataset(
+                session=session,
+                files=files,
+                directory=directory,
+                max_workers=max_workers,
+            )
+
+            # ASSERT
+            for file in files:
+                self.assertEqual(
+                    (expected_directory / file.name).read_bytes(), expected_content
+                )
+            # Nothing should be left over from the download
+            self.assertCountEqual(
+                [
+                    path.relative_to(expected_directory).as_posix()
+                    for path in expected_directory.rglob("*")
+                    if path.is_file()
+                ],
+                [file.name for file in files],
+            )
 
-        # ASSERT
         self.mock_OverallFileProgressBar.assert_called_once_with(
             len(files), expected_total_file_size
         )
         self.mock_OverallFileProgressBar.return_value.__enter__.assert_called_once()
-        self.assertEqual(
+        self.assertCountEqual(
             self.mock_minio_get_request.call_args_list,
-            [call(session, file.download_url, stream=True) for file in files],
-        )
-        self.assertEqual(
-            mock_download_response.headers.get.call_args_list,
-            [call("content-length", 0) for file in files],
-        )
-        self.assertEqual(
-            self.open_mock.call_args_list,
-            [call(expected_directory / file.name, "wb") for file in files],
+            [
+                call(session, file.download_url, stream=True, headers={})
+                for file in files
+            ],
         )
-        self.assertEqual(
-            self.mock_tqdm.wrapattr.call_args_list,
+        # When downloading files at once each should be given its own line
+        # for its progress bar
+        if max_workers == 1:
+            expected_positions = {file.name: None for file in files}
+        else:
+            expected_positions = {
+                wrapattr_call.kwargs["desc"]: wrapattr_call.kwargs["position"]
+                for wrapattr_call in self.mock_tqdm.wrapattr.call_args_list
+            }
+            for position in expected_positions.values():
+                self.assertIn(position, range(1, max_workers + 1))
+        self.assertCountEqual(
             [
-                call(
-                    self.open_mock.return_value.__enter__.return_value,
-                    "write",
-                    desc=file.name,
-                    miniters=1,
-                    total=mock_file_size,
-                )
+                wrapattr_call.kwargs
+                for wrapattr_call in self.mock_tqdm.wrapattr.call_args_list
+            ],
+            [
+                {
+                    "desc": file.name,
+                    "miniters": 1,
+                    "total": len(expected_content),
+                    "initial": 0,
+                    "position": expected_positions[file.name],
+                    "leave": max_workers == 1,
+                }
                 for file in files
             ],
         )
         self.assertEqual(
-            mock_download_response.iter_content.call_args_list,
+            self.mock_minio_get_request.return_value.__enter__.return_value.iter_content.call_args_list,
             [call(chunk_size=DOWNLOAD_CHUNK_SIZE) for file in files],
         )
-        self.assertEqual(
-            self.mock_tqdm.wrapattr.return_value.__enter__.return_value.write.call_args_list,
-            [call(chunk) for file in files for chunk in mock_download_response_chunks],
+        # Overall progress should reflect the number of bytes actually
+        # downloaded
+        self.assertCountEqual(
+            self.mock_OverallFileProgressBar.return_value.__enter__.return_value.update.call_args_list,
+            [
+                call(len(expected_content), expected_file_size=file.size)
+                for file in files
+            ],
         )
         self.assertEqual(
             self.mock_click.echo.call_args_list,
@@ -118,4 +182,675 @@ class TestDownloadDataset(TestCase):
     def test_download_dataset_given_directory(self):
         """Tests that download_dataset works as expected when a directory is
         given"""
-        self._test_download_dataset(directory=Path("some/test/directory"))
+        self._test_download_dataset(directory="some/test/directory")
+
+    def test_download_dataset_in_parallel(self):
+        """Tests that download_dataset works as expected when downloading
+        multiple files at once"""
+        self._test_download_dataset(directory=None, max_workers=2)
+
+
+class TestDownloadDatasetSync(TestCase):
+    """Test class to test download_dataset only downloads files that are
+    missing or have changed when sync is True"""
+
+    def setUp(self) -> None:
+        super().setUp()
+
+        self.mock_click = patch("dafni_cli.datasets.dataset_download.click").start()
+        self.mock_OverallFileProgressBar = patch(
+            "dafni_cli.datasets.dataset_download.OverallFileProgressBar"
+        ).start()
+        self.mock_download_file = patch(
+            "dafni_cli.datasets.dataset_download._download_file"
+        ).start()
+
+        self.addCleanup(patch.stopall)
+
+        temp_dir = TemporaryDirectory("test")
+        self.addCleanup(temp_dir.cleanup)
+        self.directory = Path(temp_dir.name)
+
+        self.session = MagicMock()
+        self.content = b"some,data"
+
+    def _create_file(self, name: str, checksum: Optional[str]) -> DataFile:
+        """Returns a DataFile with the given name that has the same size as
+        self.content and the given sha256 checksum"""
+        file = ParserBaseObject.parse_from_dict(
+            DataFile, TEST_DATASET_METADATA_DATAFILE_WITH_CHECKSUM
+        )
+        file.name = name
+        file.size = len(self.content)
+        if checksum is None:
+            file.checksum = None
+        else:
+            file.checksum.value = checksum
+        return file
+
+    def test_download_dataset_sync(self):
+        """Tests that only missing or changed files are downloaded"""
+
+        # SETUP
+        correct_checksum = hashlib.sha256(self.content).hexdigest()
+        unchanged = self._create_file("unchanged.csv", correct_checksum.upper())
+        unchanged_no_checksum = self._create_file("no_checksum.csv", None)
+        missing = self._create_file("missing.csv", correct_checksum)
+        different_size = self._create_file("different_size.csv", None)
+        different_checksum = self._create_file("different_checksum.csv", "abc")
+
+        for file in [unchanged, unchanged_no_checksum, different_checksum]:
+            (self.directory / file.name).write_bytes(self.content)
+        (self.directory / different_size.name).write_bytes(self.content + b"!")
+
+        self.mock_download_file.return_value = len(self.content)
+
+        # CALL
+        dataset_download.download_dataset(
+            self.session,
+            [
+                unchanged,
+                unchanged_no_checksum,
+                missing,
+                different_size,
+                different_checksum,
+            ],
+            self.directory,
+            sync=True,
+        )
+
+        # ASSERT
+        self.assertEqual(
+            self.mock_download_file.call_args_list,
+            [
+                call(self.session, file, self.directory, progress_bar_position=None)
+                for file in [missing, different_size, different_checksum]
+            ],
+        )
+        self.mock_OverallFileProgressBar.assert_called_once_with(
+            3, 3 * len(self.content)
+        )
+        self.assertEqual(
+            self.mock_click.echo.call_args_list[0],
+            call(
+                "Skipping 2 unchanged file(s) "
+                f"({format_file_size(2 * len(self.content))})"
+            ),
+        )
+
+    def test_download_dataset_sync_when_up_to_date(self):
+        """Tests that nothing is downloaded when all files are unchanged"""
+
+        # SETUP
+        file = self._create_file("unchanged.csv", None)
+        (self.directory / file.name).write_bytes(self.content)
+
+        # CALL
+        dataset_download.download_dataset(
+            self.session, [file], self.directory, sync=True
+        )
+
+        # ASSERT
+        self.mock_download_file.assert_not_called()
+        self.mock_OverallFileProgressBar.assert_not_called()
+        self.assertEqual(
+            self.mock_click.echo.call_args_list,
+            [
+                call(
+                    "Skipping 1 unchanged file(s) "
+                    f"({format_file_size(len(self.content))})"
+                ),
+                call(f"All files in '{self.directory}' are already up to date"),
+            ],
+        )
+
+
+class TestDownloadFile(TestCase):
+    """Test class to test _download_file resumes interrupted downloads as
+    expected"""
+
+    def setUp(self) -> None:
+        super().setUp()
+
+        self.mock_minio_get_request = patch(
+            "dafni_cli.datasets.dataset_download.minio_get_request"
+        ).start()
+        self.mock_tqdm = patch("dafni_cli.datasets.dataset_download.tqdm").start()
+        self.mock_tqdm.wrapattr.side_effect = lambda file, *args, **kwargs: (
+            nullcontext(file)
+        )
+
+        self.addCleanup(patch.stopall)
+
+        self.session = MagicMock()
+        self.file = ParserBaseObject.parse_from_dict(
+            DataFile, TEST_DATASET_METADATA_DATAFILE
+        )
+
+        temp_dir = TemporaryDirectory("test")
+        self.addCleanup(temp_dir.cleanup)
+        self.directory = Path(temp_dir.name)
+
+        self.file_save_path = self.directory / self.file.name
+        self.part_path = self.directory / f"{self.file.name}.part"
+        self.state_path = self.directory / f"{self.file.name}.part.json"
+
+    def _create_interrupted_download(self, content: bytes, state: dict):
+        """Creates the files left behind by an interrupted download"""
+        self.part_path.write_bytes(content)
+        self.state_path.write_text(json.dumps(state), encoding="utf-8")
+
+    def _assert_download_complete(self, result: int, expected_content: bytes):
+        """Asserts the file has been downloaded and moved into place"""
+        self.assertEqual(result, len(expected_content))
+        self.assertEqual(self.file_save_path.read_bytes(), expected_content)
+        self.assertFalse(self.part_path.exists())
+        self.assertFalse(self.state_path.exists())
+
+    def test_download_file_saves_state_while_downloading(self):
+        """Tests that _download_file saves a state file that could be used
+        to resume the download before writing anything"""
+
+        # SETUP
+        mock_download_response = create_mock_download_response([b"chunk1"])
+        saved_states = []
+
+        def iter_content(chunk_size):
+            saved_states.append(json.loads(self.state_path.read_text()))
+            yield b"chunk1"
+
+        mock_download_response.iter_content.side_effect = iter_content
+        self.mock_minio_get_request.return_value.__enter__.return_value = (
+            mock_download_response
+        )
+
+        # CALL
+        result = dataset_download._download_file(
+            self.session, self.file, self.directory
+        )
+
+        # ASSERT
+        self.mock_minio_get_request.assert_called_once_with(
+            self.session, self.file.download_url, stream=True, headers={}
+        )
+        self.assertEqual(
+            saved_states, [{"name": self.file.name, "size": 6, "validator": '"etag"'}]
+        )
+        self._assert_download_complete(result, b"chunk1")
+
+    def test_download_file_resumes_download(self):
+        """Tests that _download_file continues an interrupted download using a
+        Range request"""
+
+        # SETUP
+        self._create_interrupted_download(
+            b"chunk1", {"name": self.file.name, "size": 12, "validator": '"etag"'}
+        )
+        self.mock_minio_get_request.return_value.__enter__.return_value = (
+            create_mock_download_response([b"chunk2"], status_code=206)
+        )
+
+        # CALL
+        result = dataset_download._download_file(
+            self.session, self.file, self.directory
+        )
+
+        # ASSERT
+        self.mock_minio_get_request.assert_called_once_with(
+            self.session,
+            self.file.download_url,
+            stream=True,
+            headers={"Range": "bytes=6-", "If-Range": '"etag"'},
+        )
+        self.assertEqual(self.mock_tqdm.wrapattr.call_args.kwargs["initial"], 6)
+        self.assertEqual(self.mock_tqdm.wrapattr.call_args.kwargs["total"], 12)
+        self._assert_download_complete(result, b"chunk1chunk2")
+
+    def test_download_file_resumes_download_without_validator(self):
+        """Tests that _download_file continues an interrupted download using a
+        Range request without an If-Range header when the server didn't give
+        an ETag or Last-Modified header"""
+
+        # SETUP
+        self._create_interrupted_download(
+            b"chunk1", {"name": self.file.name, "size": 12, "validator": None}
+        )
+        self.mock_minio_get_request.return_value.__enter__.return_value = (
+            create_mock_download_response([b"chunk2"], status_code=206, etag=None)
+        )
+
+        # CALL
+        result = dataset_download._download_file(
+            self.session, self.file, self.directory
+        )
+
+        # ASSERT
+        self.mock_minio_get_request.assert_called_once_with(
+            self.session,
+            self.file.download_url,
+            stream=True,
+            headers={"Range": "bytes=6-"},
+        )
+        self._assert_download_complete(result, b"chunk1chunk2")
+
+    def test_download_file_restarts_when_range_ignored(self):
+        """Tests that _download_file downloads the whole file again when the
+        server ignores the Range request (or the file has changed)"""
+
+        # SETUP
+        self._create_interrupted_download(
+            b"stale!", {"name": self.file.name, "size": 12, "validator": '"old"'}
+        )
+        self.mock_minio_get_request.return_value.__enter__.return_value = (
+            create_mock_download_response([b"chunk1", b"chunk2"], status_code=200)
+        )
+
+        # CALL
+        result = dataset_download._download_file(
+            self.session, self.file, self.directory
+        )
+
+        # ASSERT
+        self.assertEqual(self.mock_tqdm.wrapattr.call_args.kwargs["initial"], 0)
+        self._assert_download_complete(result, b"chunk1chunk2")
+
+    def test_download_file_restarts_when_range_not_satisfiable(self):
+        """Tests that _download_file discards what was downloaded before and
+        downloads the whole file again when the server can't return the
+        rest of it (416)"""
+
+        # SETUP
+        http_error = HTTPError(response=MagicMock(status_code=416))
+        # (DAFNIError's are raised from the HTTPError when DAFNI gives a
+        # message)
+        dafni_error = DAFNIError("Some error")
+        dafni_error.__cause__ = http_error
+        mock_full_response = MagicMock()
+        mock_full_response.__enter__.return_value = create_mock_download_response(
+            [b"chunk3"]
+        )
+
+        for error in [http_error, dafni_error]:
+            with self.subTest(error=error):
+                self._create_interrupted_download(
+                    b"chunk1",
+                    {"name": self.file.name, "size": 12, "validator": None},
+                )
+                self.mock_minio_get_request.reset_mock()
+                self.mock_minio_get_request.side_effect = [error, mock_full_response]
+
+                # CALL
+                result = dataset_download._download_file(
+                    self.session, self.file, self.directory
+                )
+
+                # ASSERT
+                self.assertEqual(
+                    self.mock_minio_get_request.call_args_list[1],
+                    call(self.session, self.file.download_url, stream=True, headers={}),
+                )
+                self._assert_download_complete(result, b"chunk3")
+
+    def test_download_file_keeps_part_on_other_errors(self):
+        """Tests that _download_file keeps what was downloaded before when
+        resuming fails for a reason other than the range requested"""
+
+        # SETUP
+        self._create_interrupted_download(
+            b"chunk1", {"name": self.file.name, "size": 12, "validator": None}
+        )
+        self.mock_minio_get_request.side_effect = HTTPError(
+            response=MagicMock(status_code=403)
+        )
+
+        # CALL
+        with self.assertRaises(HTTPError):
+            dataset_download._download_file(self.session, self.file, self.directory)
+
+        # ASSERT
+        self.mock_minio_get_request.assert_called_once()
+        self.assertEqual(self.part_path.read_bytes(), b"chunk1")
+        self.assertTrue(self.state_path.exists())
+
+    def test_download_file_restarts_when_part_larger_than_file(self):
+        """Tests that _download_file downloads the whole file again when what
+        was downloaded before is larger than the file"""
+
+        # SETUP
+        self._create_interrupted_download(
+            b"chunk1chunk2!", {"name": self.file.name, "size": 12, "validator": None}
+        )
+        self.mock_minio_get_request.return_value.__enter__.return_value = (
+            create_mock_download_response([b"chunk1", b"chunk2"])
+        )
+
+        # CALL
+        result = dataset_download._download_file(
+            self.session, self.file, self.directory
+        )
+
+        # ASSERT
+        self.mock_minio_get_request.assert_called_once_with(
+            self.session, self.file.download_url, stream=True, headers={}
+        )
+        self._assert_download_complete(result, b"chunk1chunk2")
+
+    def test_download_file_restarts_without_state(self):
+        """Tests that _download_file downloads the whole file again when
+        there is no state file for what was downloaded before"""
+
+        # SETUP
+        self.part_path.write_bytes(b"chunk1chunk2")
+        self.mock_minio_get_request.return_value.__enter__.return_value = (
+            create_mock_download_response([b"chunk3"])
+        )
+
+        # CALL
+        result = dataset_download._download_file(
+            self.session, self.file, self.directory
+        )
+
+        # ASSERT
+        self.mock_minio_get_request.assert_called_once_with(
+            self.session, self.file.download_url, stream=True, headers={}
+        )
+        self._assert_download_complete(result, b"chunk3")
+
+    def test_download_file_ignores_state_of_another_file(self):
+        """Tests that _download_file downloads the whole file when the state
+        file found belongs to a different file"""
+
+        # SETUP
+        self._create_interrupted_download(
+            b"chunk1", {"name": "other.csv", "size": 12, "validator": '"etag"'}
+        )
+        self.mock_minio_get_request.return_value.__enter__.return_value = (
+            create_mock_download_response([b"chunk1", b"chunk2"])
+        )
+
+        # CALL
+        result = dataset_download._download_file(
+            self.session, self.file, self.directory
+        )
+
+        # ASSERT
+        self.mock_minio_get_request.assert_called_once_with(
+            self.session, self.file.download_url, stream=True, headers={}
+        )
+        self._assert_download_complete(result, b"chunk1chunk2")
+
+    def test_download_file_when_already_downloaded(self):
+        """Tests that _download_file just moves the file into place when it
+        was fully downloaded before being interrupted"""
+
+        # SETUP
+        self._create_interrupted_download(
+            b"chunk1chunk2", {"name": self.file.name, "size": 12, "validator": None}
+        )
+
+        # CALL
+        result = dataset_download._download_file(
+            self.session, self.file, self.directory
+        )
+
+        # ASSERT
+        self.mock_minio_get_request.assert_not_called()
+        self._assert_download_complete(result, b"chunk1chunk2")
+
+
+class TestPlanSegments(TestCase):
+    """Test class to test _plan_segments works as expected"""
+
+    def test_plan_segments(self):
+        """Tests that _plan_segments splits a range into roughly equal
+        segments covering every byte"""
+        self.assertEqual(
+            dataset_download._plan_segments(0, 9, 3), [(0, 3), (4, 7), (8, 9)]
+        )
+        self.assertEqual(
+            dataset_download._plan_segments(10, 19, 2), [(10, 14), (15, 19)]
+        )
+
+    def test_plan_segments_more_segments_than_bytes(self):
+        """Tests that _plan_segments doesn't return empty segments"""
+        self.assertEqual(dataset_download._plan_segments(0, 1, 4), [(0, 0), (1, 1)])
+
+
+class TestDownloadFileSegmented(TestCase):
+    """Test class to test _download_file_segmented works as expected"""
+
+    def setUp(self) -> None:
+        super().setUp()
+
+        self.mock_minio_get_request = patch(
+            "dafni_cli.datasets.dataset_download.minio_get_request"
+        ).start()
+        self.mock_create_file_progress_bar = patch(
+            "dafni_cli.datasets.dataset_download.create_file_progress_bar"
+        ).start()
+        self.mock_tqdm = patch("dafni_cli.datasets.dataset_download.tqdm").start()
+
+        self.addCleanup(patch.stopall)
+
+        self.session = MagicMock()
+        self.file = ParserBaseObject.parse_from_dict(
+            DataFile, TEST_DATASET_METADATA_DATAFILE
+        )
+
+        temp_dir = TemporaryDirectory("test")
+        self.addCleanup(temp_dir.cleanup)
+        self.directory = Path(temp_dir.name)
+
+    def _mock_range_requests(self, content: bytes):
+        """Makes minio_get_request return the requested range of 'content'"""
+
+        def minio_get_request(session, url, stream, headers):
+            start, end = (
+                int(value) for value in headers["Range"].split("=")[1].split("-")
+            )
+            end = min(end, len(content) - 1)
+            mock_download_response = create_mock_download_response(
+                [content[start : end + 1]], status_code=206
+            )
+            mock_download_response.headers["Content-Range"] = (
+                f"bytes {start}-{end}/{len(content)}"
+            )
+            return nullcontext(mock_download_response)
+
+        self.mock_minio_get_request.side_effect = minio_get_request
+
+    def test_download_file_segmented(self):
+        """Tests that _download_file_segmented downloads each range of the
+        file and writes them into place"""
+
+        # SETUP
+        content = bytes(range(256)) * 40
+        # Size in the metadata is only approximate
+        self.assertNotEqual(self.file.size, len(content))
+        self._mock_range_requests(content)
+
+        # CALL
+        result = dataset_download._download_file_segmented(
+            self.session, self.file, self.directory, segments=4
+        )
+
+        # ASSERT
+        self.assertEqual(result, len(content))
+        self.assertEqual((self.directory / self.file.name).read_bytes(), content)
+        self.assertEqual(
+            [path.name for path in self.directory.iterdir()], [self.file.name]
+        )
+
+        # First range planned from the metadata, the rest from the actual size
+        first_end = math.ceil(self.file.size / 4) - 1
+        expected_ranges = [(0, first_end)] + dataset_download._plan_segments(
+            first_end + 1, len(content) - 1, 3
+        )
+        self.assertCountEqual(
+            self.mock_minio_get_request.call_args_list,
+            [
+                call(
+                    self.session,
+                    self.file.download_url,
+                    stream=True,
+                    headers={"Range": f"bytes={start}-{end}"},
+                )
+                for start, end in expected_ranges
+            ],
+        )
+        self.mock_create_file_progress_bar.assert_called_once_with(
+            description=self.file.name, total=len(content), position=None
+        )
+        mock_progress_bar = (
+            self.mock_create_file_progress_bar.return_value.__enter__.return_value
+        )
+        self.assertEqual(
+            sum(
+                update_call.args[0]
+                for update_call in mock_progress_bar.update.call_args_list
+            ),
+            len(content),
+        )
+        self.mock_tqdm.write.assert_called_once()
+
+    @patch("dafni_cli.datasets.dataset_download._download_file")
+    def test_download_file_segmented_when_range_unsupported(self, mock_download_file):
+        """Tests that _download_file_segmented falls back to _download_file
+        when the server ignores the Range request"""
+
+        # SETUP
+        self.mock_minio_get_request.return_value.__enter__.return_value = (
+            create_mock_download_response([b"chunk1"], status_code=200)
+        )
+
+        # CALL
+        result = dataset_download._download_file_segmented(
+            self.session, self.file, self.directory, segments=4, progress_bar_position=2
+        )
+
+        # ASSERT
+        self.mock_minio_get_request.assert_called_once()
+        mock_download_file.assert_called_once_with(
+            self.session, self.file, self.directory, progress_bar_position=2
+        )
+        self.assertEqual(result, mock_download_file.return_value)
+
+    @patch("dafni_cli.datasets.dataset_download._download_file")
+    def test_download_file_segmented_continues_interrupted_download(
+        self, mock_download_file
+    ):
+        """Tests that _download_file_segmented leaves a previously
+        interrupted download that wasn't segmented to _download_file to
+        continue rather than discarding it"""
+
+        # SETUP
+        part_path, state_path = dataset_download._get_download_state_paths(
+            self.directory / self.file.name
+        )
+        part_path.write_bytes(b"partial")
+        state_path.write_text(
+            json.dumps({"name": self.file.name, "size": 100, "validator": None}),
+            encoding="utf-8",
+        )
+
+        # CALL
+        result = dataset_download._download_file_segmented(
+            self.session, self.file, self.directory, segments=4, progress_bar_position=2
+        )
+
+        # ASSERT
+        self.mock_minio_get_request.assert_not_called()
+        mock_download_file.assert_called_once_with(
+            self.session, self.file, self.directory, progress_bar_position=2
+        )
+        self.assertEqual(result, mock_download_file.return_value)
+        self.assertEqual(part_path.read_bytes(), b"partial")
+
+    @patch("dafni_cli.datasets.dataset_download.DOWNLOAD_SEGMENT_MIN_SIZE", 1000)
+    @patch("dafni_cli.datasets.dataset_download._download_file_segmented")
+    @patch("dafni_cli.datasets.dataset_download._download_file")
+    @patch("dafni_cli.datasets.dataset_download.OverallFileProgressBar")
+    @patch("dafni_cli.datasets.dataset_download.click")
+    def test_download_dataset_uses_segments_for_large_files(
+        self,
+        mock_click,
+        mock_OverallFileProgressBar,
+        mock_download_file,
+        mock_download_file_segmented,
+    ):
+        """Tests that download_dataset only splits files into as many
+        ranges as they are large enough for"""
+
+        # SETUP
+        files = [
+            ParserBaseObject.parse_from_dict(DataFile, TEST_DATASET_METADATA_DATAFILE)
+            for _ in range(3)
+        ]
+        files[0].size = 1999
+        files[1].size = 2000
+        files[2].size = 100000
+
+        # CALL
+        dataset_download.download_dataset(
+            self.session, files, self.directory, segments=4
+        )
+
+        # ASSERT
+        mock_download_file.assert_called_once_with(
+            self.session, files[0], self.directory, progress_bar_position=None
+        )
+        self.assertEqual(
+            mock_download_file_segmented.call_args_list,
+            [
+                call(
+                    self.session,
+                    files[1],
+                    self.directory,
+                    2,
+                    progress_bar_position=None,
+                ),
+                call(
+                    self.session,
+                    files[2],
+                    self.directory,
+                    4,
+                    progress_bar_position=None,
+                ),
+            ],
+        )
+
+    @patch("dafni_cli.datasets.dataset_download.DOWNLOAD_MAX_CONNECTIONS", 8)
+    @patch("dafni_cli.datasets.dataset_download.DOWNLOAD_SEGMENT_MIN_SIZE", 1000)
+    @patch("dafni_cli.datasets.dataset_download._download_file_segmented")
+    @patch("dafni_cli.datasets.dataset_download.OverallFileProgressBar")
+    @patch("dafni_cli.datasets.dataset_download.click")
+    def test_download_dataset_limits_connections(
+        self,
+        mock_click,
+        mock_OverallFileProgressBar,
+        mock_download_file_segmented,
+    ):
+        """Tests that download_dataset reduces the number of ranges each
+        file is split into to stay within DOWNLOAD_MAX_CONNECTIONS, and sizes
+        the session's connection pool to match"""
+
+        # SETUP
+        file = ParserBaseObject.parse_from_dict(
+            DataFile, TEST_DATASET_METADATA_DATAFILE
+        )
+        file.size = 100000
+
+        # CALL
+        dataset_download.download_dataset(
+            self.session, [file], self.directory, max_workers=2, segments=6
+        )
+
+        # ASSERT
+        self.session.ensure_pool_maxsize.assert_called_once_with(8)
+        mock_download_file_segmented.assert_called_once_with(
+            self.session, file, self.directory, 4, progress_bar_position=1
+        )
+        mock_click.echo.assert_any_call(
+            "Downloading at most 2 file(s) in 4 range(s) at once to stay within "
+            "8 connections"
+        )
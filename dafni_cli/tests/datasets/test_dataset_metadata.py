@@ -1,4 +1,7 @@
+import hashlib
 from datetime import datetime
+from pathlib import Path
+from tempfile import TemporaryDirectory
 from unittest import TestCase
 from unittest.mock import call, patch
 
@@ -17,6 +20,7 @@ from dafni_cli.datasets.dataset_metadata import (
     Contact,
     Creator,
     DataFile,
+    DataFileChecksum,
     DatasetMetadata,
     DatasetVersion,
     Location,
@@ -32,6 +36,7 @@ from dafni_cli.tests.fixtures.dataset_metadata import (
     TEST_DATASET_METADATA_CREATOR_DEFAULT,
     TEST_DATASET_METADATA_DATAFILE,
     TEST_DATASET_METADATA_DATAFILE_DEFAULT,
+    TEST_DATASET_METADATA_DATAFILE_WITH_CHECKSUM,
     TEST_DATASET_METADATA_DEFAULT,
     TEST_DATASET_METADATA_LOCATION,
     TEST_DATASET_METADATA_LOCATION_DEFAULT,
@@ -65,6 +70,28 @@ class TestDataFile(TestCase):
         self.assertEqual(
             datafile.download_url, TEST_DATASET_METADATA_DATAFILE["dcat:downloadURL"]
         )
+        self.assertEqual(datafile.checksum, None)
+
+    def test_parse_with_checksum(self):
+        """Tests parsing of data files that have a checksum"""
+
+        datafile: DataFile = ParserBaseObject.parse_from_dict(
+            DataFile, TEST_DATASET_METADATA_DATAFILE_WITH_CHECKSUM
+        )
+
+        self.assertEqual(type(datafile.checksum), DataFileChecksum)
+        self.assertEqual(
+            datafile.checksum.algorithm,
+            TEST_DATASET_METADATA_DATAFILE_WITH_CHECKSUM["spdx:checksum"][
+                "spdx:algorithm"
+            ],
+        )
+        self.assertEqual(
+            datafile.checksum.value,
+            TEST_DATASET_METADATA_DATAFILE_WITH_CHECKSUM["spdx:checksum"][
+                "spdx:checksumValue"
+            ],
+        )
 
     def test_parse_default(self):
         """Tests parsing of data files"""
@@ -85,6 +112,61 @@ class TestDataFile(TestCase):
             None,
         )
         self.assertEqual(datafile.download_url, None)
+        self.assertEqual(datafile.checksum, None)
+
+    def test_matches_file(self):
+        """Tests that matches_file compares the size and (when known) the
+        checksum of a local file"""
+
+        # SETUP
+        content = b"some,data"
+        sha256 = hashlib.sha256(content).hexdigest()
+        datafile: DataFile = ParserBaseObject.parse_from_dict(
+            DataFile, TEST_DATASET_METADATA_DATAFILE_WITH_CHECKSUM
+        )
+        datafile.size = len(content)
+
+        with TemporaryDirectory("test") as temp_dir:
+            path = Path(temp_dir) / "file.csv"
+
+            for file_content, checksum, expected in [
+                (None, None, False),
+                (content, None, True),
+                (content + b"!", None, False),
+                (content, sha256, True),
+                (content, sha256.upper(), True),
+                (content, "abc", False),
+            ]:
+                with self.subTest(file_content=file_content, checksum=checksum):
+                    if file_content is not None:
+                        path.write_bytes(file_content)
+                    datafile.checksum = (
+                        None
+                        if checksum is None
+                        else DataFileChecksum(
+                            algorithm="spdx:checksumAlgorithm_sha256",
+                            value=checksum,
+                        )
+                    )
+
+                    # CALL & ASSERT
+                    self.assertEqual(datafile.matches_file(path), expected)
+
+
+class TestDataFileChecksum(TestCase):
+    """Tests the DataFileChecksum dataclass"""
+
+    def test_hashlib_name(self):
+        """Tests the hashlib_name property for a range of algorithm names"""
+        for algorithm, expected in [
+            ("spdx:checksumAlgorithm_sha256", "sha256"),
+            ("spdx:checksumAlgorithm_md5", "md5"),
+            ("SHA-1", "sha1"),
+            ("spdx:checksumAlgorithm_unknown", None),
+        ]:
+            with self.subTest(algorithm=algorithm):
+                checksum = DataFileChecksum(algorithm=algorithm, value="value")
+                self.assertEqual(checksum.hashlib_name, expected)
 
 
 class TestCreator(TestCase):
@@ -1,21 +1,24 @@
 import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
 from datetime import datetime
 from pathlib import Path
 from tempfile import TemporaryDirectory
 from unittest import TestCase
-from unittest.mock import MagicMock, call, mock_open, patch
+from unittest.mock import ANY, MagicMock, call, mock_open, patch
 
 from requests import HTTPError
 
 from dafni_cli.api.exceptions import DAFNIError, ValidationError
-from dafni_cli.consts import DATASET_UPLOAD_FILE_RETRY_ATTEMPTS
+from dafni_cli.consts import DATASET_UPLOAD_FILE_RETRY_ATTEMPTS, TAB_SPACE
 from dafni_cli.datasets import dataset_upload
 from dafni_cli.datasets.dataset_metadata import (
     DATASET_METADATA_LANGUAGES,
     DATASET_METADATA_SUBJECTS,
     DATASET_METADATA_THEMES,
     DATASET_METADATA_UPDATE_FREQUENCIES,
+    DataFile,
 )
 from dafni_cli.tests.fixtures.dataset_metadata import TEST_DATASET_METADATA
 
@@ -60,6 +63,96 @@ class TestParseFilenamesFromPaths(TestCase):
             self.assertDictEqual(result, expected_dict)
 
 
+class TestDiffDatasetFiles(TestCase):
+    """Test class to test the diff_dataset_files function"""
+
+    def test_diff_dataset_files(self):
+        """Tests that local files are correctly compared against those in an
+        existing version"""
+
+        # SETUP
+        existing_files = [
+            DataFile(name="unchanged.csv", size=9),
+            DataFile(name="changed.csv", size=9),
+            DataFile(name="folder/removed.csv", size=9),
+        ]
+
+        with TemporaryDirectory("test") as temp_dir:
+            directory = Path(temp_dir)
+            (directory / "unchanged.csv").write_bytes(b"some,data")
+            (directory / "changed.csv").write_bytes(b"some,other,data")
+            (directory / "new.csv").write_bytes(b"some,data")
+            file_names_and_paths = {
+                name: directory / name
+                for name in ["unchanged.csv", "changed.csv", "new.csv"]
+            }
+
+            # CALL
+            result = dataset_upload.diff_dataset_files(
+                existing_files, file_names_and_paths
+            )
+
+        # ASSERT
+        self.assertEqual(
+            result,
+            dataset_upload.DatasetVersionDiff(
+                new=["new.csv"],
+                changed=["changed.csv"],
+                unchanged=["unchanged.csv"],
+                removed=["folder/removed.csv"],
+            ),
+        )
+        self.assertTrue(result.has_changes)
+
+    def test_diff_dataset_files_no_changes(self):
+        """Tests that has_changes is False when the local files match the
+        existing version"""
+
+        # SETUP
+        existing_files = [DataFile(name="unchanged.csv", size=9)]
+
+        with TemporaryDirectory("test") as temp_dir:
+            path = Path(temp_dir) / "unchanged.csv"
+            path.write_bytes(b"some,data")
+
+            # CALL
+            result = dataset_upload.diff_dataset_files(
+                existing_files, {"unchanged.csv": path}
+            )
+
+        # ASSERT
+        self.assertEqual(result.unchanged, ["unchanged.csv"])
+        self.assertFalse(result.has_changes)
+
+    @patch("dafni_cli.datasets.dataset_upload.click")
+    def test_print_dataset_version_diff(self, mock_click):
+        """Tests that print_dataset_version_diff works as expected"""
+
+        # SETUP
+        diff = dataset_upload.DatasetVersionDiff(
+            new=["new.csv"],
+            changed=["changed1.csv", "changed2.csv"],
+            unchanged=["unchanged1.csv", "unchanged2.csv"],
+            removed=["removed.csv"],
+        )
+
+        # CALL
+        dataset_upload.print_dataset_version_diff(diff)
+
+        # ASSERT
+        self.assertEqual(
+            mock_click.echo.call_args_list,
+            [
+                call("Changes compared to the existing version:"),
+                call(f"{TAB_SPACE}New: new.csv"),
+                call(f"{TAB_SPACE}Changed: changed1.csv"),
+                call(f"{TAB_SPACE}Changed: changed2.csv"),
+                call(f"{TAB_SPACE}Removed: removed.csv"),
+                call(f"{TAB_SPACE}Unchanged: 2 file(s)"),
+            ],
+        )
+
+
 class TestRemoveDatasetMetadataInvalidForUpload(TestCase):
     """Test class to test remove_dataset_metadata_invalid_for_upload works as
     expected"""
@@ -447,6 +540,7 @@ class TestDatasetUpload(TestCase):
                     file_paths[idx],
                     file_name=file_paths[idx].name,
                     progress_bar=not json,
+                    progress_bar_position=None,
                 )
                 for idx, url in enumerate(urls)
             ]
@@ -506,7 +600,12 @@ class TestDatasetUpload(TestCase):
         self.mock_upload_file_to_minio.assert_has_calls(
             [
                 call(
-                    session, url, file_path, file_name=file_path.name, progress_bar=True
+                    session,
+                    url,
+                    file_path,
+                    file_name=file_path.name,
+                    progress_bar=True,
+                    progress_bar_position=None,
                 )
                 for url in urls
             ]
@@ -563,7 +662,12 @@ class TestDatasetUpload(TestCase):
         self.mock_upload_file_to_minio.assert_has_calls(
             [
                 call(
-                    session, url, file_path, file_name=file_path.name, progress_bar=True
+                    session,
+                    url,
+                    file_path,
+                    file_name=file_path.name,
+                    progress_bar=True,
+                    progress_bar_position=None,
                 )
                 for url in urls
             ]
@@ -582,6 +686,99 @@ class TestDatasetUpload(TestCase):
             f"Attempted to upload file {DATASET_UPLOAD_FILE_RETRY_ATTEMPTS} times but failed repeatedly",
         )
 
+    def test_upload_files_in_parallel_refreshes_urls_of_failed_files_only(self):
+        """Tests that upload_files works as expected when uploading multiple
+        files at once, and only requests new upload URLs for those that fail"""
+        # SETUP
+        session = MagicMock()
+        temp_bucket_id = "some-temp-bucket"
+        file_size = 1000
+        file_paths = [
+            MagicMock(
+                name=f"file_{i}.txt",
+                stat=lambda: MagicMock(st_size=file_size),
+                is_dir=MagicMock(return_value=False),
+            )
+            for i in range(3)
+        ]
+        file_names = [file_path.name for file_path in file_paths]
+
+        self.mock_get_data_upload_urls.side_effect = [
+            {
+                "urls": {
+                    file_name: f"upload/url/{file_name}" for file_name in file_names
+                }
+            },
+            {"urls": {file_names[1]: "upload/new-url"}},
+        ]
+        mock_overall_progress_bar = MagicMock()
+        self.mock_OverallFileProgressBar.return_value.__enter__.return_value = (
+            mock_overall_progress_bar
+        )
+
+        # Fail the first attempt at uploading the second file only
+        def upload_file_to_minio_side_effect(session, url, file_path, **kwargs):
+            if url == f"upload/url/{file_names[1]}":
+                raise RuntimeError
+
+        self.mock_upload_file_to_minio.side_effect = upload_file_to_minio_side_effect
+
+        # CALL
+        dataset_upload.upload_files(
+            session, temp_bucket_id, file_paths, json=True, max_workers=3
+        )
+
+        # ASSERT
+        self.assertEqual(
+            self.mock_get_data_upload_urls.call_args_list,
+            [
+                call(session, temp_bucket_id, file_names),
+                call(session, temp_bucket_id, [file_names[1]]),
+            ],
+        )
+        self.mock_OverallFileProgressBar.assert_called_once_with(
+            len(file_paths), file_size * len(file_paths)
+        )
+        self.assertEqual(
+            mock_overall_progress_bar.update.call_args_list,
+            [call(file_size)] * len(file_paths),
+        )
+        self.assertEqual(self.mock_upload_file_to_minio.call_count, 4)
+        self.mock_upload_file_to_minio.assert_any_call(
+            session,
+            "upload/new-url",
+            file_paths[1],
+            file_name=file_names[1],
+            progress_bar=False,
+            progress_bar_position=ANY,
+        )
+        for upload_call in self.mock_upload_file_to_minio.call_args_list:
+            self.assertIn(upload_call.kwargs["progress_bar_position"], [1, 2, 3])
+
+    def test_upload_files_in_parallel_sizes_connection_pool(self):
+        """Tests that upload_files ensures the session can keep a connection
+        alive for each file being uploaded at once"""
+        # SETUP
+        session = MagicMock()
+        file_paths = [
+            MagicMock(
+                name="file.txt",
+                stat=lambda: MagicMock(st_size=1000),
+                is_dir=MagicMock(return_value=False),
+            )
+        ]
+        self.mock_get_data_upload_urls.return_value = {
+            "urls": {file_paths[0].name: "upload/url"}
+        }
+
+        # CALL
+        dataset_upload.upload_files(
+            session, "some-temp-bucket", file_paths, json=True, max_workers=16
+        )
+
+        # ASSERT
+        session.ensure_pool_maxsize.assert_called_once_with(16)
+
     def test_upload_files(self):
         """Tests that upload_files works as expected with json = False"""
         self._test_upload_files(False)
@@ -725,7 +922,12 @@ class TestDatasetUpload(TestCase):
             # ASSERT
             self.mock_create_temp_bucket.assert_called_once_with(session)
             mock_upload_files.assert_called_once_with(
-                session, temp_bucket_id, file_paths, json=json
+                session,
+                temp_bucket_id,
+                file_paths,
+                json=json,
+                max_workers=1,
+                journal=None,
             )
             mock_commit_metadata.assert_called_once_with(
                 session, metadata, temp_bucket_id, dataset_id=dataset_id, json=json
@@ -805,7 +1007,12 @@ class TestDatasetUpload(TestCase):
             # ASSERT
             self.mock_create_temp_bucket.assert_called_once_with(session)
             mock_upload_files.assert_called_once_with(
-                session, temp_bucket_id, file_paths, json=json
+                session,
+                temp_bucket_id,
+                file_paths,
+                json=json,
+                max_workers=1,
+                journal=None,
             )
             mock_commit_metadata.assert_called_once_with(
                 session, metadata, temp_bucket_id, dataset_id=None, json=json
@@ -866,7 +1073,12 @@ class TestDatasetUpload(TestCase):
             # ASSERT
             self.mock_create_temp_bucket.assert_called_once_with(session)
             mock_upload_files.assert_called_once_with(
-                session, temp_bucket_id, file_paths, json=False
+                session,
+                temp_bucket_id,
+                file_paths,
+                json=False,
+                max_workers=1,
+                journal=None,
             )
             mock_commit_metadata.assert_called_once_with(
                 session, metadata, temp_bucket_id, dataset_id=None, json=False
@@ -885,6 +1097,338 @@ class TestDatasetUpload(TestCase):
                 ],
             )
 
+    def test_upload_files_with_journal(self):
+        """Tests that upload_files skips files the journal shows have already
+        been uploaded and records the rest"""
+        # SETUP
+        session = MagicMock()
+        temp_bucket_id = "some-temp-bucket"
+        file_paths = [
+            MagicMock(
+                name=f"file_{index}.txt",
+                stat=MagicMock(return_value=MagicMock(st_size=1000)),
+                is_dir=MagicMock(return_value=False),
+            )
+            for index in range(3)
+        ]
+        file_names = [file_path.name for file_path in file_paths]
+        journal = MagicMock()
+        journal.is_uploaded.side_effect = (
+            lambda file_name, file_path: file_name == file_names[1]
+        )
+        self.mock_get_data_upload_urls.return_value = {
+            "urls": {file_names[0]: "url/0", file_names[2]: "url/2"}
+        }
+
+        # CALL
+        dataset_upload.upload_files(
+            session, temp_bucket_id, file_paths, journal=journal
+        )
+
+        # ASSERT
+        self.mock_get_data_upload_urls.assert_called_once_with(
+            session, temp_bucket_id, [file_names[0], file_names[2]]
+        )
+        self.mock_OverallFileProgressBar.assert_called_once_with(2, 2000)
+        self.assertEqual(
+            [
+                upload_call.args[1]
+                for upload_call in self.mock_upload_file_to_minio.call_args_list
+            ],
+            ["url/0", "url/2"],
+        )
+        # Should record the status of each file from before it was uploaded
+        self.assertEqual(
+            journal.record_upload.call_args_list,
+            [
+                call(file_names[0], file_paths[0].stat.return_value),
+                call(file_names[2], file_paths[2].stat.return_value),
+            ],
+        )
+        for index in [0, 2]:
+            file_paths[index].stat.assert_called_once_with()
+        self.assertEqual(
+            self.mock_optional_echo.call_args_list,
+            [
+                call("Skipping 1 file(s) already uploaded", False),
+                call("Uploading files", False),
+            ],
+        )
+
+    @patch("dafni_cli.datasets.dataset_upload._upload_file_with_retries")
+    def test_upload_files_with_journal_records_uploads_finishing_after_error(
+        self, mock_upload_file_with_retries
+    ):
+        """Tests that upload_files still records files in the journal that
+        finish uploading after another has failed"""
+        # SETUP
+        session = MagicMock()
+        temp_bucket_id = "some-temp-bucket"
+        file_paths = [
+            MagicMock(
+                name=f"file_{index}.txt",
+                stat=MagicMock(return_value=MagicMock(st_size=1000)),
+                is_dir=MagicMock(return_value=False),
+            )
+            for index in range(2)
+        ]
+        file_names = [file_path.name for file_path in file_paths]
+        journal = MagicMock()
+        journal.is_uploaded.return_value = False
+        self.mock_get_data_upload_urls.return_value = {
+            "urls": {file_name: f"url/{file_name}" for file_name in file_names}
+        }
+
+        # Only fail uploading the first file once the second has started,
+        # and only finish the second once the failure has stopped any others
+        # being started
+        started = threading.Event()
+        shut_down = threading.Event()
+        original_shutdown = ThreadPoolExecutor.shutdown
+
+        def shutdown(executor, *args, **kwargs):
+            shut_down.set()
+            original_shutdown(executor, *args, **kwargs)
+
+        def upload_file_with_retries(
+            session, temp_bucket_id, file_name, *args, **kwargs
+        ):
+            if file_name == file_names[0]:
+                started.wait(timeout=5)
+                raise RuntimeError("Failed to upload")
+            started.set()
+            shut_down.wait(timeout=5)
+
+        mock_upload_file_with_retries.side_effect = upload_file_with_retries
+
+        # CALL
+        with patch.object(ThreadPoolExecutor, "shutdown", shutdown):
+            with self.assertRaises(RuntimeError):
+                dataset_upload.upload_files(
+                    session, temp_bucket_id, file_paths, max_workers=2, journal=journal
+                )
+
+        # ASSERT
+        self.assertTrue(shut_down.is_set())
+        journal.record_upload.assert_called_once_with(
+            file_names[1], file_paths[1].stat.return_value
+        )
+
+    def test_upload_files_with_journal_when_all_uploaded(self):
+        """Tests that upload_files doesn't attempt to upload anything when
+        the journal shows every file has already been uploaded"""
+        # SETUP
+        session = MagicMock()
+        temp_bucket_id = "some-temp-bucket"
+        file_paths = [
+            MagicMock(
+                name=f"file_{index}.txt",
+                stat=MagicMock(return_value=MagicMock(st_size=1000)),
+                is_dir=MagicMock(return_value=False),
+            )
+            for index in range(2)
+        ]
+        journal = MagicMock()
+        journal.is_uploaded.return_value = True
+
+        # CALL
+        dataset_upload.upload_files(
+            session, temp_bucket_id, file_paths, journal=journal
+        )
+
+        # ASSERT
+        self.mock_get_data_upload_urls.assert_not_called()
+        self.mock_OverallFileProgressBar.assert_not_called()
+        self.mock_upload_file_to_minio.assert_not_called()
+        journal.record_upload.assert_not_called()
+        self.assertEqual(
+            self.mock_optional_echo.call_args_list,
+            [call("Skipping 2 file(s) already uploaded", False)],
+        )
+
+    @patch("dafni_cli.datasets.dataset_upload.parse_file_names_from_paths")
+    @patch("dafni_cli.datasets.dataset_upload.DatasetUploadJournal")
+    def test_upload_dataset_with_new_journal_keeps_bucket_on_error(
+        self, mock_DatasetUploadJournal, mock_parse_file_names_from_paths
+    ):
+        """Tests that upload_dataset creates a new journal when given a
+        journal_path that doesn't exist yet, and keeps the temporary bucket
+        when an error occurs"""
+
+        # Additionally patch these functions in the same file
+        with (
+            patch(
+                "dafni_cli.datasets.dataset_upload._commit_metadata"
+            ) as mock_commit_metadata,
+            patch(
+                "dafni_cli.datasets.dataset_upload.upload_files"
+            ) as mock_upload_files,
+        ):
+            # SETUP
+            session = MagicMock()
+            metadata = MagicMock()
+            file_paths = ["file_1.txt", "file_2.txt"]
+            temp_bucket_id = "some-temp-bucket"
+            journal_path = MagicMock()
+            mock_parse_file_names_from_paths.return_value = {
+                "file_1.txt": Path("file_1.txt"),
+                "file_2.txt": Path("file_2.txt"),
+            }
+
+            self.mock_create_temp_bucket.return_value = temp_bucket_id
+            mock_upload_files.side_effect = RuntimeError
+
+            # CALL
+            with self.assertRaises(RuntimeError):
+                dataset_upload.upload_dataset(
+                    session, metadata, file_paths, journal_path=journal_path
+                )
+
+            # ASSERT
+            self.mock_create_temp_bucket.assert_called_once_with(session)
+            mock_DatasetUploadJournal.assert_called_once_with(
+                path=journal_path,
+                temp_bucket_id=temp_bucket_id,
+                file_names=["file_1.txt", "file_2.txt"],
+            )
+            mock_journal = mock_DatasetUploadJournal.return_value
+            mock_journal.save.assert_called_once_with()
+            mock_upload_files.assert_called_once_with(
+                session,
+                temp_bucket_id,
+                file_paths,
+                json=False,
+                max_workers=1,
+                journal=mock_journal,
+            )
+            mock_commit_metadata.assert_not_called()
+            self.mock_delete_temp_bucket.assert_not_called()
+            journal_path.unlink.assert_not_called()
+            self.mock_click.echo.assert_called_once_with(
+                "\nUpload failed. The files uploaded so far have been kept and "
+                f"the upload may be resumed using --resume {journal_path}"
+            )
+
+    @patch("dafni_cli.datasets.dataset_upload.parse_file_names_from_paths")
+    @patch("dafni_cli.datasets.dataset_upload.DatasetUploadJournal")
+    def test_upload_dataset_resumes_from_journal(
+        self, mock_DatasetUploadJournal, mock_parse_file_names_from_paths
+    ):
+        """Tests that upload_dataset resumes uploading to the temporary bucket
+        in an existing journal and removes the journal once complete"""
+
+        # Additionally patch these functions in the same file
+        with (
+            patch(
+                "dafni_cli.datasets.dataset_upload._commit_metadata"
+            ) as mock_commit_metadata,
+            patch(
+                "dafni_cli.datasets.dataset_upload.upload_files"
+            ) as mock_upload_files,
+        ):
+            # SETUP
+            session = MagicMock()
+            metadata = MagicMock()
+            file_paths = ["file_1.txt", "file_2.txt"]
+            journal_path = MagicMock()
+            mock_journal = mock_DatasetUploadJournal.load.return_value
+            mock_journal.temp_bucket_id = "existing-temp-bucket"
+            mock_journal.matches.return_value = True
+
+            # CALL
+            dataset_upload.upload_dataset(
+                session,
+                metadata,
+                file_paths,
+                journal_path=journal_path,
+                resume=True,
+                json=True,
+            )
+
+            # ASSERT
+            mock_DatasetUploadJournal.load.assert_called_once_with(journal_path)
+            mock_parse_file_names_from_paths.assert_called_once_with(file_paths)
+            mock_journal.matches.assert_called_once_with(
+                list(mock_parse_file_names_from_paths.return_value.keys())
+            )
+            self.mock_create_temp_bucket.assert_not_called()
+            mock_upload_files.assert_called_once_with(
+                session,
+                "existing-temp-bucket",
+                file_paths,
+                json=True,
+                max_workers=1,
+                journal=mock_journal,
+            )
+            mock_commit_metadata.assert_called_once_with(
+                session, metadata, "existing-temp-bucket", dataset_id=None, json=True
+            )
+            journal_path.unlink.assert_called_once_with(missing_ok=True)
+            self.mock_optional_echo.assert_has_calls(
+                [
+                    call(
+                        "\nResuming upload to temporary bucket existing-temp-bucket",
+                        True,
+                    )
+                ]
+            )
+
+    @patch("dafni_cli.datasets.dataset_upload.DatasetUploadJournal")
+    def test_upload_dataset_with_invalid_journal(self, mock_DatasetUploadJournal):
+        """Tests that upload_dataset exits when given an invalid journal"""
+
+        # SETUP
+        session = MagicMock()
+        journal_path = MagicMock()
+        mock_DatasetUploadJournal.load.side_effect = ValueError("Invalid journal")
+
+        # CALL
+        with self.assertRaises(SystemExit):
+            dataset_upload.upload_dataset(
+                session,
+                MagicMock(),
+                ["file_1.txt"],
+                journal_path=journal_path,
+                resume=True,
+            )
+
+        # ASSERT
+        self.mock_create_temp_bucket.assert_not_called()
+        self.mock_click.echo.assert_called_once_with(
+            mock_DatasetUploadJournal.load.side_effect
+        )
+
+    @patch("dafni_cli.datasets.dataset_upload.parse_file_names_from_paths")
+    @patch("dafni_cli.datasets.dataset_upload.DatasetUploadJournal")
+    def test_upload_dataset_with_journal_for_other_files(
+        self, mock_DatasetUploadJournal, mock_parse_file_names_from_paths
+    ):
+        """Tests that upload_dataset exits when resuming from a journal
+        recording the upload of different files"""
+
+        # SETUP
+        session = MagicMock()
+        journal_path = MagicMock()
+        mock_DatasetUploadJournal.load.return_value.matches.return_value = False
+
+        # CALL
+        with self.assertRaises(SystemExit):
+            dataset_upload.upload_dataset(
+                session,
+                MagicMock(),
+                ["file_1.txt"],
+                journal_path=journal_path,
+                resume=True,
+            )
+
+        # ASSERT
+        self.mock_create_temp_bucket.assert_not_called()
+        self.mock_upload_file_to_minio.assert_not_called()
+        self.mock_click.echo.assert_called_once_with(
+            "The files given don't match those being uploaded in the journal "
+            f"'{journal_path}'"
+        )
+
     def _test_upload_dataset_metadata_version(self, json: bool):
         """Tests that upload_dataset_metadata_version works as expected with
         the given value of json"""
@@ -0,0 +1,165 @@
+import json
+import os
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from dafni_cli.datasets.dataset_upload_journal import DatasetUploadJournal
+
+
+class TestDatasetUploadJournal(TestCase):
+    """Test class to test the DatasetUploadJournal class"""
+
+    def setUp(self) -> None:
+        super().setUp()
+
+        temp_dir = TemporaryDirectory("test")
+        self.addCleanup(temp_dir.cleanup)
+        self.directory = Path(temp_dir.name)
+
+        self.journal_path = self.directory / "journal.json"
+        self.file_path = self.directory / "file.csv"
+        self.file_path.write_bytes(b"some,data")
+
+    def test_save_and_load(self):
+        """Tests that a saved journal can be loaded again"""
+
+        # SETUP
+        journal = DatasetUploadJournal(
+            path=self.journal_path,
+            temp_bucket_id="temp-bucket-id",
+            file_names=["file.csv", "other.csv"],
+        )
+        journal.save()
+        journal.record_upload("file.csv", self.file_path.stat())
+
+        # CALL
+        result = DatasetUploadJournal.load(self.journal_path)
+
+        # ASSERT
+        self.assertEqual(result, journal)
+        self.assertEqual(
+            result.files,
+            {
+                "file.csv": {
+                    "size": 9,
+                    "mtime": self.file_path.stat().st_mtime_ns,
+                }
+            },
+        )
+        # Temporary file used while saving should have been replaced
+        self.assertCountEqual(
+            list(self.directory.iterdir()), [self.journal_path, self.file_path]
+        )
+
+    def test_record_upload_appends(self):
+        """Tests that recording an upload only appends a line to the saved
+        journal"""
+
+        # SETUP
+        journal = DatasetUploadJournal(
+            path=self.journal_path,
+            temp_bucket_id="temp-bucket-id",
+            file_names=["file.csv", "other.csv"],
+        )
+        journal.save()
+        header = self.journal_path.read_text(encoding="utf-8")
+        stat = self.file_path.stat()
+
+        # CALL
+        journal.record_upload("file.csv", stat)
+        journal.record_upload("other.csv", stat)
+
+        # ASSERT
+        lines = self.journal_path.read_text(encoding="utf-8").splitlines()
+        self.assertEqual(lines[0] + "\n", header)
+        self.assertEqual(
+            [json.loads(line) for line in lines[1:]],
+            [
+                {"file_name": "file.csv", "size": 9, "mtime": stat.st_mtime_ns},
+                {"file_name": "other.csv", "size": 9, "mtime": stat.st_mtime_ns},
+            ],
+        )
+
+    def test_load_ignores_partially_recorded_upload(self):
+        """Tests that a final line left partially written when an upload was
+        interrupted is ignored"""
+
+        # SETUP
+        journal = DatasetUploadJournal(
+            path=self.journal_path,
+            temp_bucket_id="temp-bucket-id",
+            file_names=["file.csv", "other.csv"],
+        )
+        journal.save()
+        journal.record_upload("file.csv", self.file_path.stat())
+        with open(self.journal_path, "a", encoding="utf-8") as file:
+            file.write('{"file_name": "other.csv", "si')
+
+        # CALL
+        result = DatasetUploadJournal.load(self.journal_path)
+
+        # ASSERT
+        self.assertEqual(result, journal)
+
+    def test_load_invalid_journal(self):
+        """Tests that loading a file that isn't a journal raises a
+        ValueError"""
+
+        header = json.dumps({"temp_bucket_id": "id", "file_names": ["file.csv"]})
+        for content in [
+            "",
+            "not json",
+            json.dumps({"files": {}}),
+            json.dumps([]),
+            f"{header}\nnot json\n{header}",
+            f"{header}\n{json.dumps({'file_name': 'file.csv'})}",
+        ]:
+            with self.subTest(content=content):
+                # SETUP
+                self.journal_path.write_text(content, encoding="utf-8")
+
+                # CALL & ASSERT
+                with self.assertRaises(ValueError):
+                    DatasetUploadJournal.load(self.journal_path)
+
+    def test_matches(self):
+        """Tests that matches only returns True for the same files in any
+        order"""
+
+        # SETUP
+        journal = DatasetUploadJournal(
+            path=self.journal_path,
+            temp_bucket_id="temp-bucket-id",
+            file_names=["file.csv", "other.csv"],
+        )
+
+        # CALL & ASSERT
+        self.assertTrue(journal.matches(["other.csv", "file.csv"]))
+        self.assertFalse(journal.matches(["file.csv"]))
+        self.assertFalse(journal.matches(["file.csv", "other.csv", "new.csv"]))
+
+    def test_is_uploaded(self):
+        """Tests that is_uploaded only returns True for files that have been
+        recorded and haven't been modified since"""
+
+        # SETUP
+        journal = DatasetUploadJournal(
+            path=self.journal_path,
+            temp_bucket_id="temp-bucket-id",
+            file_names=["file.csv"],
+        )
+
+        # CALL & ASSERT
+        self.assertFalse(journal.is_uploaded("file.csv", self.file_path))
+
+        journal.record_upload("file.csv", self.file_path.stat())
+        self.assertTrue(journal.is_uploaded("file.csv", self.file_path))
+        self.assertFalse(journal.is_uploaded("other.csv", self.file_path))
+
+        # Modified since being uploaded
+        stat = self.file_path.stat()
+        os.utime(
+            self.file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000)
+        )
+        self.assertFalse(journal.is_uploaded("file.csv", self.file_path))
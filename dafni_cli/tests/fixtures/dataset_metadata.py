@@ -9,6 +9,17 @@ TEST_DATASET_METADATA_DATAFILE: dict = {
     "dcat:downloadURL": "url/to/file",
 }
 
+TEST_DATASET_METADATA_DATAFILE_WITH_CHECKSUM: dict = {
+    "spdx:fileName": "workflow_def.csv",
+    "dcat:byteSize": 6720,
+    "dcat:mediaType": "text/csv",
+    "dcat:downloadURL": "url/to/file",
+    "spdx:checksum": {
+        "spdx:algorithm": "spdx:checksumAlgorithm_sha256",
+        "spdx:checksumValue": "5b3a36c27eb5a1d6d8e8c19f5a3b7ac76b2bd1c6e1bb5ba9d8d5d0e0a8b8a2f1",
+    },
+}
+
 TEST_DATASET_METADATA_DATAFILE_DEFAULT: dict = {
     "spdx:fileName": "workflow_def.csv",
     "dcat:byteSize": 6720,
@@ -0,0 +1,74 @@
+import threading
+import time
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from dafni_cli.file_lock import FileLock
+
+
+class TestFileLock(TestCase):
+    """Test class to test the FileLock class"""
+
+    def setUp(self) -> None:
+        temp_dir = TemporaryDirectory("test")
+        self.addCleanup(temp_dir.cleanup)
+        self.lock_path = Path(temp_dir.name) / "test.lock"
+
+    def test_creates_lock_file(self):
+        """Tests that the lock file is created when first acquired"""
+
+        # SETUP
+        lock = FileLock(self.lock_path)
+
+        # CALL
+        with lock:
+            # ASSERT
+            self.assertTrue(self.lock_path.is_file())
+
+    def test_re_entrant(self):
+        """Tests that the thread holding the lock may acquire it again"""
+
+        # SETUP
+        lock = FileLock(self.lock_path)
+
+        # CALL
+        with lock:
+            with lock:
+                pass
+
+            # ASSERT
+            self.assertIsNotNone(lock._file_descriptor)
+        self.assertIsNone(lock._file_descriptor)
+
+    def test_blocks_other_threads(self):
+        """Tests that only one thread holds the lock at once, including
+        between separate FileLock instances for the same file"""
+
+        # SETUP
+        locks = [FileLock(self.lock_path), FileLock(self.lock_path)]
+        counter_lock = threading.Lock()
+        holding = 0
+        max_holding = 0
+
+        def hold_lock(lock: FileLock):
+            nonlocal holding, max_holding
+            with lock:
+                with counter_lock:
+                    holding += 1
+                    max_holding = max(max_holding, holding)
+                time.sleep(0.01)
+                with counter_lock:
+                    holding -= 1
+
+        # CALL
+        threads = [
+            threading.Thread(target=hold_lock, args=(locks[i % 2],)) for i in range(6)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # ASSERT
+        self.assertEqual(max_holding, 1)
@@ -2,7 +2,7 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional
 from unittest import TestCase
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, call
 
 from dateutil.tz import tzutc
 
@@ -124,6 +124,58 @@ class TestFiltering(TestCase):
             [self.TEST_DICTIONARIES[0], self.TEST_DICTIONARIES[2]],
         )
 
+    def test_filter_multiple_without_dictionaries(self):
+        """Tests filter_multiple uses the dictionary of each instance when
+        not given the dictionaries separately"""
+
+        # SETUP
+        def simple_filter(instance: MagicMock):
+            return instance.name == "Value2"
+
+        instances = [MagicMock(), MagicMock()]
+        instances[0].name = "Value1"
+        instances[1].name = "Value2"
+
+        # CALL
+        filtered_instances, filtered_dictionaries = filtering.filter_multiple(
+            [simple_filter], instances
+        )
+
+        # ASSERT
+        self.assertEqual(filtered_instances, [instances[1]])
+        self.assertEqual(filtered_dictionaries, [instances[1].dictionary])
+
+    def test_filter_multiple_iter(self):
+        """Tests filter_multiple_iter parses each dictionary and yields only
+        those passing all the filters"""
+
+        # SETUP
+        def filter1(instance: TestDataclass):
+            return "Description" in instance.description
+
+        def filter2(instance: TestDataclass):
+            return "object" in instance.description
+
+        parse_function = MagicMock(side_effect=self.TEST_INSTANCES)
+
+        # CALL
+        result = filtering.filter_multiple_iter(
+            [filter1, filter2], iter(self.TEST_DICTIONARIES), parse_function
+        )
+
+        # ASSERT
+        self.assertEqual(
+            list(result),
+            [
+                (self.TEST_INSTANCES[0], self.TEST_DICTIONARIES[0]),
+                (self.TEST_INSTANCES[2], self.TEST_DICTIONARIES[2]),
+            ],
+        )
+        self.assertEqual(
+            parse_function.call_args_list,
+            [call(dictionary) for dictionary in self.TEST_DICTIONARIES],
+        )
+
     def test_creation_date_filter(self):
         """Tests creation_date_filter works correctly"""
         # CALL
@@ -237,6 +237,39 @@ class TestPrintJSON(TestCase):
         mock_click.echo.assert_called_once_with(mock_json.dumps.return_value)
 
 
+class TestPrintJSONList(TestCase):
+    """Test class to test the print_json_list function"""
+
+    def test_print_json_list_matches_print_json(self):
+        """Tests print_json_list prints the same as print_json for the whole
+        list"""
+
+        for dictionaries in [
+            [],
+            [{"some": "test"}],
+            [{"some": "test", "data": {"hello": [30, 40]}}, {"other": None}],
+        ]:
+            with self.subTest(dictionaries=dictionaries):
+                # CALL
+                with patch("dafni_cli.utils.click.echo") as mock_echo:
+                    utils.print_json(dictionaries)
+                    expected = "".join(
+                        call_args.args[0] + "\n"
+                        for call_args in mock_echo.call_args_list
+                    )
+                    mock_echo.reset_mock()
+
+                    utils.print_json_list(iter(dictionaries))
+
+                # ASSERT
+                result = "".join(
+                    call_args.args[0]
+                    + ("" if call_args.kwargs.get("nl") is False else "\n")
+                    for call_args in mock_echo.call_args_list
+                )
+                self.assertEqual(result, expected)
+
+
 class TestDataclassFromDict(TestCase):
     """Test class to test the dataclass_from_dict function"""
 
@@ -405,6 +438,122 @@ class TestFormatTable(TestCase):
         self.assertEqual(mock_tabulate.return_value, result)
 
 
+class TestIterTable(TestCase):
+    """Test class to test the iter_table and print_table functions"""
+
+    def test_iter_table_matches_format_table(self):
+        """Tests iter_table gives the same table as format_table"""
+
+        # SETUP
+        headers = ["Header 1", "Header 2", "Header 3"]
+        rows = [
+            ["Row 1 Header 1", "Row 1 Header 2", None],
+            ["Row 2 Header 1", "A longer value that will be wrapped", "Two\nlines"],
+            ["", "Wide 表格 value", 10],
+        ]
+        max_column_widths = [None, 20, None]
+
+        for column_widths in [None, max_column_widths]:
+            with self.subTest(max_column_widths=column_widths):
+                # CALL
+                result = utils.iter_table(headers, iter(rows), column_widths)
+
+                # ASSERT
+                self.assertEqual(
+                    "\n".join(result),
+                    utils.format_table(headers, rows, column_widths),
+                )
+
+    def test_iter_table_matches_format_table_with_empty_values(self):
+        """Tests iter_table gives the same table as format_table when values
+        are empty or only whitespace, whether or not any span multiple
+        lines"""
+
+        # SETUP
+        headers = ["Header 1", "Header 2"]
+        rows = [
+            ["", None],
+            ["Value\n", " "],
+            ["  ", "\n"],
+            ["\nValue", "Other value"],
+        ]
+
+        for table_rows in [rows, [row[:1] * 2 for row in rows[:2]], [rows[0]]]:
+            for column_widths in [None, [None, 5]]:
+                with self.subTest(rows=table_rows, max_column_widths=column_widths):
+                    # CALL
+                    result = utils.iter_table(headers, iter(table_rows), column_widths)
+
+                    # ASSERT
+                    self.assertEqual(
+                        "\n".join(result),
+                        utils.format_table(headers, table_rows, column_widths),
+                    )
+
+    def test_iter_table_without_wrap(self):
+        """Tests iter_table keeps each value on a single line when wrap is
+        False"""
+
+        # SETUP
+        headers = ["Name", "Summary"]
+        rows = [["Row 1", "A longer value that won't be wrapped"]]
+
+        # CALL
+        result = utils.iter_table(headers, rows, [None, 10], wrap=False)
+
+        # ASSERT
+        self.assertEqual(
+            list(result),
+            [
+                "Name    Summary",
+                "------  ------------------------------------",
+                "Row 1   A longer value that won't be wrapped",
+            ],
+        )
+
+    def test_iter_table_with_sample_size(self):
+        """Tests iter_table finds the column widths from only the first
+        'sample_size' rows, wrapping later values to them"""
+
+        # SETUP
+        headers = ["Name", "Summary"]
+        rows = [["a", "short"], ["b", "a much longer summary text"]]
+
+        # CALL
+        result = utils.iter_table(headers, rows, [None, 40], sample_size=1)
+
+        # ASSERT
+        self.assertEqual(
+            list(result),
+            [
+                "Name    Summary",
+                "------  ---------",
+                "a       short",
+                "b       a much",
+                "        longer",
+                "        summary",
+                "        text",
+            ],
+        )
+
+    @patch("dafni_cli.utils.click")
+    def test_print_table(self, mock_click):
+        """Tests print_table prints each line of the table"""
+
+        # SETUP
+        headers = ["Name", "Summary"]
+        rows = [["a", "short"]]
+
+        # CALL
+        utils.print_table(headers, rows)
+
+        # ASSERT
+        self.assertEqual(
+            mock_click.echo.call_args_list,
+            [call(line) for line in utils.iter_table(headers, rows)],
+        )
+
+
 class TestFormatDatetime(TestCase):
     """Test class to test the format_datetime function"""
 
@@ -588,6 +737,8 @@ class TestCreateFileProgressBar(TestCase):
             unit_scale=True,
             unit_divisor=1024,
             disable=disable,
+            position=None,
+            leave=True,
         )
         self.assertEqual(result, mock_tqdm.return_value)
 
@@ -630,6 +781,49 @@ class TestOverallFileProgressBar(TestCase):
 
         mock_progress_bar.close.assert_called_once()
 
+    def test_overall_file_progress_bar_corrects_total(
+        self, mock_create_file_progress_bar
+    ):
+        """Tests that the OverallFileProgressBar corrects its total when
+        given an expected_file_size that differs from the actual size"""
+
+        # SETUP
+        mock_progress_bar = MagicMock()
+        mock_progress_bar.total = 300
+        mock_create_file_progress_bar.return_value = mock_progress_bar
+
+        # CALL
+        with utils.OverallFileProgressBar(
+            total_files=2, total_size=300
+        ) as overall_progress_bar:
+            overall_progress_bar.update(120, expected_file_size=100)
+            overall_progress_bar.update(200, expected_file_size=200)
+
+        # ASSERT
+        self.assertEqual(mock_progress_bar.total, 320)
+        self.assertEqual(
+            mock_progress_bar.update.call_args_list, [call(120), call(200)]
+        )
+
+
+class TestProgressBarPositions(TestCase):
+    """Test class to test the ProgressBarPositions class functions
+    correctly"""
+
+    def test_progress_bar_positions(self):
+        """Tests that positions are handed out without overlap and are
+        reused once released"""
+
+        # SETUP
+        positions = utils.ProgressBarPositions(2)
+
+        # CALL & ASSERT
+        with positions.acquire() as position_1:
+            with positions.acquire() as position_2:
+                self.assertEqual((position_1, position_2), (1, 2))
+            with positions.acquire() as position_3:
+                self.assertEqual(position_3, 2)
+
 
 class TestIsValidDefinitionFile(TestCase):
     def test_true_returned_if_correct_definition_file_type(self):
@@ -1,11 +1,24 @@
-import copy
 import json
+import queue
 import re
 import textwrap
+import threading
+from contextlib import contextmanager
 from dataclasses import fields
 from datetime import datetime
+from itertools import islice
 from pathlib import Path
-from typing import Any, List, Optional, Tuple, Type, Union
+from typing import (
+    Any,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+)
 from urllib.parse import urlparse
 
 import click
@@ -20,6 +33,17 @@ from dafni_cli.consts import (
     TABULATE_ARGS,
 )
 
+# Like tabulate, measure the width of wide characters (e.g. CJK) when
+# wcwidth is available
+try:
+    from wcwidth import wcswidth
+except ImportError:  # pragma: no cover
+    wcswidth = None
+
+# Layout of the tables printed by iter_table, matching TABULATE_ARGS
+TABLE_COLUMN_SEPARATOR = "  "
+TABLE_HEADER_PADDING = 2
+
 
 def prose_print(prose: str, width: int):
     """Prints string as separate paragraphs with appropriate line breaks at
@@ -102,6 +126,25 @@ def print_json(response: Union[dict, List[dict]]) -> None:
     click.echo(json.dumps(response, indent=2, sort_keys=True))
 
 
+def print_json_list(dictionaries: Iterable[dict]) -> None:
+    """Pretty prints dictionaries to command line as a list one at a time as
+    they are obtained, giving the same output as print_json would for the
+    whole list
+
+    Args:
+        dictionaries (Iterable[dict]): Dictionaries to pretty print
+    """
+    empty = True
+    for dictionary in dictionaries:
+        click.echo("[" if empty else ",")
+        click.echo(
+            textwrap.indent(json.dumps(dictionary, indent=2, sort_keys=True), "  "),
+            nl=False,
+        )
+        empty = False
+    click.echo("[]" if empty else "\n]")
+
+
 def dataclass_from_dict(class_type: Type, dictionary: dict):
     """Converts a dictionary of values into a particular dataclass type
 
@@ -135,20 +178,159 @@ def format_table(
                     within the column. (Useful for columns that may be
                     extremely long)
     """
-    # Apply text wrapping if needed
+    # Apply text wrapping if needed (to new rows, so those passed in aren't
+    # modified)
     if max_column_widths:
-        # Don't modify the rows passed in by accident
-        rows = copy.deepcopy(rows)
-
-        for row in rows:
-            for value_idx, max_column_width in enumerate(max_column_widths):
-                if max_column_width and row[value_idx]:
-                    wrapped_values = textwrap.wrap(row[value_idx], max_column_width)
-                    row[value_idx] = "\n".join(wrapped_values)
+        rows = [
+            [
+                (
+                    "\n".join(textwrap.wrap(value, max_column_width))
+                    if max_column_width and value
+                    else value
+                )
+                for value, max_column_width in zip(row, max_column_widths)
+            ]
+            for row in rows
+        ]
 
     return tabulate(rows, headers, **TABULATE_ARGS)
 
 
+def _text_width(text: str) -> int:
+    """Returns the number of columns a string occupies when printed"""
+    if text.isascii() or wcswidth is None:
+        return len(text)
+    width = wcswidth(text)
+    # Negative when there are non-printable characters
+    return width if width >= 0 else len(text)
+
+
+def _split_table_row(
+    row: Sequence[Any], wrap_widths: Sequence[Optional[int]]
+) -> Tuple[Tuple[List[str], ...], bool]:
+    """Returns the lines of each value in a table row, wrapping those in
+    columns with a width to wrap them to, and whether tabulate would treat
+    any of them as spanning multiple lines"""
+    cells = []
+    multiline = False
+    for value, wrap_width in zip(row, wrap_widths):
+        if value is None:
+            value = ""
+        elif not isinstance(value, str):
+            value = str(value)
+
+        if wrap_width and value:
+            value = "\n".join(textwrap.wrap(value, wrap_width))
+        multiline = multiline or "\n" in value or "\r" in value
+        # Surrounding whitespace (including blank lines) is removed as
+        # tabulate does
+        cells.append(value.strip().splitlines())
+    return tuple(cells), multiline
+
+
+def _format_table_row(
+    cells: Sequence[Sequence[str]], column_widths: Sequence[int], multiline: bool
+) -> Iterator[str]:
+    """Yields the lines of a table row given the lines of each of its values
+
+    As with tabulate, a row whose values are all empty is left out entirely
+    when the table has values spanning multiple lines, and is otherwise a
+    blank line.
+    """
+    height = max([0 if multiline else 1] + [len(lines) for lines in cells])
+    for line_idx in range(height):
+        yield TABLE_COLUMN_SEPARATOR.join(
+            _pad_table_value(lines[line_idx] if line_idx < len(lines) else "", width)
+            for lines, width in zip(cells, column_widths)
+        ).rstrip()
+
+
+def _pad_table_value(value: str, width: int) -> str:
+    """Pads a value with spaces to fill a column of the given width"""
+    return value + " " * (width - _text_width(value))
+
+
+def iter_table(
+    headers: List[str],
+    rows: Iterable[Sequence[Any]],
+    max_column_widths: Optional[List[Optional[int]]] = None,
+    wrap: bool = True,
+    sample_size: Optional[int] = None,
+) -> Iterator[str]:
+    """Yields the lines of a table one at a time, giving the same output as
+    format_table without needing all of the rows at once
+
+    The width of each column is found from the first 'sample_size' rows (or
+    all of them when None), which are kept until printed. Any rows after
+    these are formatted as they are read. As they weren't used to find the
+    widths, their values are wrapped to the width of their column when it has
+    a maximum width, and may otherwise overflow it. Whether rows with no
+    values are left out (see _format_table_row) is also only known from the
+    rows read so far.
+
+    Args:
+        headers (List[str]): List of headers of the table
+        rows (Iterable[Sequence[Any]]): Rows in the table. Each row is a
+                    sequence of values and there should be one for each
+                    header.
+        max_column_widths (Optional[List[Optional[int]]]): List of maximum
+                    widths for each column to wrap their values to (see
+                    format_table)
+        wrap (bool): Whether to wrap the values in columns with a maximum
+                     width. When False each value is kept on a single line.
+        sample_size (Optional[int]): Number of rows to find the widths of the
+                    columns from, or None to use all of them
+    """
+    if not wrap or not max_column_widths:
+        max_column_widths = [None] * len(headers)
+
+    rows = iter(rows)
+    sample = [
+        _split_table_row(row, max_column_widths) for row in islice(rows, sample_size)
+    ]
+    multiline = any(row_multiline for _, row_multiline in sample)
+
+    column_widths = [_text_width(header) + TABLE_HEADER_PADDING for header in headers]
+    for cells, _ in sample:
+        for column_idx, lines in enumerate(cells):
+            for line in lines:
+                column_widths[column_idx] = max(
+                    column_widths[column_idx], _text_width(line)
+                )
+
+    yield from _format_table_row(
+        [[header] for header in headers], column_widths, multiline
+    )
+    yield TABLE_COLUMN_SEPARATOR.join("-" * width for width in column_widths)
+
+    # Release the sample as it is printed
+    sample.reverse()
+    while sample:
+        yield from _format_table_row(sample.pop()[0], column_widths, multiline)
+
+    wrap_widths = [
+        column_width if max_column_width else None
+        for column_width, max_column_width in zip(column_widths, max_column_widths)
+    ]
+    for row in rows:
+        cells, row_multiline = _split_table_row(row, wrap_widths)
+        multiline = multiline or row_multiline
+        yield from _format_table_row(cells, column_widths, multiline)
+
+
+def print_table(
+    headers: List[str],
+    rows: Iterable[Sequence[Any]],
+    max_column_widths: Optional[List[Optional[int]]] = None,
+    wrap: bool = True,
+    sample_size: Optional[int] = None,
+) -> None:
+    """Prints a table to command line one line at a time (see iter_table for
+    the arguments)"""
+    for line in iter_table(headers, rows, max_column_widths, wrap, sample_size):
+        click.echo(line)
+
+
 def format_datetime(value: Optional[datetime], include_time: bool) -> str:
     """Returns a string representation of a datetime object for output
 
@@ -243,7 +425,12 @@ def optional_echo(string: str, should_not_print: bool):
         click.echo(string)
 
 
-def create_file_progress_bar(description: str, total: int, disable: bool = False):
+def create_file_progress_bar(
+    description: str,
+    total: int,
+    disable: bool = False,
+    position: Optional[int] = None,
+):
     """Creates a progress bar intended for file operations
 
     Args:
@@ -251,6 +438,10 @@ def create_file_progress_bar(description: str, total: int, disable: bool = False
                            file name)
         total (int): Total file size
         disable (bool): 'disable' parameter to pass through to tqdm
+        position (Optional[int]): Line to display the bar on when there are
+                           multiple at once (see ProgressBarPositions). When
+                           given the bar will be cleared once closed so the
+                           line can be reused.
     """
     return tqdm(
         desc=description,
@@ -260,9 +451,39 @@ def create_file_progress_bar(description: str, total: int, disable: bool = False
         unit_scale=True,
         unit_divisor=1024,
         disable=disable,
+        position=position,
+        leave=position is None,
     )
 
 
+class ProgressBarPositions:
+    """Hands out the lines that progress bars for concurrent file operations
+    should be displayed on, so that each one only ever draws on a line no
+    other running operation is using"""
+
+    def __init__(self, count: int, offset: int = 1):
+        """
+        Args:
+            count (int): Maximum number of progress bars displayed at once
+                         (usually the number of workers)
+            offset (int): First line to use (line 0 is left for any
+                          OverallFileProgressBar)
+        """
+        self._free_positions = queue.SimpleQueue()
+        for position in range(offset, offset + count):
+            self._free_positions.put(position)
+
+    @contextmanager
+    def acquire(self) -> Iterator[int]:
+        """Context manager returning a free position, which is released
+        again on exit"""
+        position = self._free_positions.get()
+        try:
+            yield position
+        finally:
+            self._free_positions.put(position)
+
+
 class OverallFileProgressBar:
     """A progress bar that displays an overall status of an operation involving
     multiple files"""
@@ -279,6 +500,8 @@ class OverallFileProgressBar:
         self._disable = disable
         self._current_file = 0
         self._progress_bar = None
+        # Allows updates from multiple threads at once
+        self._lock = threading.Lock()
 
     def _get_description(self):
         return f"Overall progress {self._current_file}/{self._total_files}"
@@ -294,15 +517,24 @@ class OverallFileProgressBar:
     def __exit__(self, exc_type, exc_value, traceback):
         self._progress_bar.close()
 
-    def update(self, file_size: int):
+    def update(self, file_size: int, expected_file_size: Optional[int] = None):
         """Should be called after an operation on a file has completed, will then
         update the status of the loading bar
 
         Args:
-            file_size (int): Size of the file that just finished uploading"""
-        self._current_file += 1
-        self._progress_bar.set_description(self._get_description())
-        self._progress_bar.update(file_size)
+            file_size (int): Size of the file that just finished uploading
+            expected_file_size (Optional[int]): Size of the file that was
+                        included in the total_size when it differs from the
+                        actual size e.g. when only approximate. When given the
+                        total will be corrected by the difference.
+        """
+        with self._lock:
+            if expected_file_size is not None and expected_file_size != file_size:
+                self._progress_bar.total += file_size - expected_file_size
+                self._progress_bar.refresh()
+            self._current_file += 1
+            self._progress_bar.set_description(self._get_description())
+            self._progress_bar.update(file_size)
 
 
 def is_valid_definition_file(file_name: Path):
@@ -27,7 +27,7 @@ from dafni_cli.workflows.specification import (
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkflowInstanceListParameterSet(ParserBaseObject):
     """Dataclass representing the information gathered about the parameter set
        a workflow instance was executed with
@@ -46,7 +46,7 @@ class WorkflowInstanceListParameterSet(ParserBaseObject):
     ]
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkflowInstanceListWorkflowVersion(ParserBaseObject):
     """Dataclass representing the information gathered about the workflow
        version a workflow instance was executed with
@@ -65,7 +65,7 @@ class WorkflowInstanceListWorkflowVersion(ParserBaseObject):
     ]
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkflowInstanceList(ParserBaseObject):
     """Dataclass representing a workflow instance (an execution of a DAFNI
        workflow) as returned when getting a Workflow
@@ -121,7 +121,7 @@ class WorkflowInstanceList(ParserBaseObject):
         ]
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkflowInstanceStepStatus(ParserBaseObject):
     """Dataclass containing information on a workflow step's status
 
@@ -142,7 +142,7 @@ class WorkflowInstanceStepStatus(ParserBaseObject):
     ]
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkflowInstanceProducedAsset(ParserBaseObject):
     """Dataclass containing information on a workflow's produced asset
 
@@ -166,7 +166,7 @@ class WorkflowInstanceProducedAsset(ParserBaseObject):
     ]
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkflowInstanceWorkflowVersion(ParserBaseObject):
     """Dataclass containing information on a Workflow version as found in the
     get workflow instance endpoint
@@ -219,7 +219,7 @@ class WorkflowInstanceWorkflowVersion(ParserBaseObject):
     ]
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkflowInstance(ParserBaseObject):
     """Dataclass representing a workflow instance (an execution of a DAFNI
     workflow)
@@ -4,7 +4,7 @@ from typing import ClassVar, List, Optional
 from dafni_cli.api.parser import ParserBaseObject, ParserParam
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkflowMetadata(ParserBaseObject):
     """Dataclass representing a DAFNI workflows's metadata
 
@@ -30,7 +30,7 @@ from dafni_cli.workflows.specification import (
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkflowParameterSetMetadata(ParserBaseObject):
     """Dataclass representing the metadata of a parameter set in a DAFNI
        workflow
@@ -59,7 +59,7 @@ class WorkflowParameterSetMetadata(ParserBaseObject):
     ]
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkflowParameterSetSpecDataslot(ParserBaseObject):
     """Dataclass representing a step dataslot as it appears in a workflow
     parameters specification
@@ -98,7 +98,7 @@ class WorkflowParameterSetSpecDataslot(ParserBaseObject):
     ]
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkflowParameterSetSpecParameter(ParserBaseObject):
     """Dataclass representing a step parameter as it appears in a workflow
     parameters specification
@@ -136,7 +136,7 @@ class WorkflowParameterSetSpecParameter(ParserBaseObject):
     ]
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkflowParameterSetSpecStep(ParserBaseObject):
     """Dataclass representing a step as it appears in a workflow parameters
     specification
@@ -252,7 +252,7 @@ class WorkflowParameterSetSpecStep(ParserBaseObject):
             )
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkflowParameterSet(ParserBaseObject):
     """Dataclass representing a parameter set of a DAFNI workflow
 
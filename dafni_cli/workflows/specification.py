@@ -8,7 +8,7 @@ from dafni_cli.api.parser import (
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkflowSpecificationStep(ParserBaseObject):
     """Dataclass representing a step as it appears in a workflow's
     specification
@@ -63,7 +63,7 @@ class WorkflowSpecificationStep(ParserBaseObject):
     ]
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkflowSpecification(ParserBaseObject):
     """Dataclass representing Workflows's specification
 
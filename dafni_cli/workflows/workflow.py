@@ -32,7 +32,7 @@ from dafni_cli.workflows.specification import WorkflowSpecification
 
 
 # TODO: Unify with ModelVersion
-@dataclass
+@dataclass(slots=True)
 class WorkflowVersion(ParserBaseObject):
     """Dataclass containing information on a historic version of a workflow
 
@@ -56,7 +56,7 @@ class WorkflowVersion(ParserBaseObject):
     ]
 
 
-@dataclass
+@dataclass(slots=True)
 class Workflow(ParserBaseObject):
     """Dataclass representing a DAFNI workflow
 
@@ -345,12 +345,20 @@ class Workflow(ParserBaseObject):
 
 # The following methods mostly exists to get round current python limitations
 # with typing (see https://stackoverflow.com/questions/33533148/how-do-i-type-hint-a-method-with-the-type-of-the-enclosing-class)
-def parse_workflows(workflow_dictionary_list: List[dict]) -> List[Workflow]:
+def parse_workflows(
+    workflow_dictionary_list: List[dict], lazy: bool = False
+) -> List[Workflow]:
     """Parses the output of get_all_workflows and returns a list of Workflow
     instances"""
-    return ParserBaseObject.parse_from_dict_list(Workflow, workflow_dictionary_list)
+    return ParserBaseObject.parse_from_dict_list(
+        Workflow, workflow_dictionary_list, lazy
+    )
 
 
-def parse_workflow(workflow_dictionary: dict) -> Workflow:
+def parse_workflow(
+    workflow_dictionary: dict, lazy: bool = False, keep_dict: bool = True
+) -> Workflow:
     """Parses the output of get_workflow and returns Workflow instance"""
-    return ParserBaseObject.parse_from_dict(Workflow, workflow_dictionary)
+    return ParserBaseObject.parse_from_dict(
+        Workflow, workflow_dictionary, lazy, keep_dict
+    )
@@ -0,0 +1,102 @@
+"""
+Script for benchmarking the number of connections opened by DAFNISession
+against a local stub server
+
+Compares sending requests individually through requests.request (as
+DAFNISession did previously) against the pooled keep-alive transport now
+used by DAFNISession.
+
+Notes on usage:
+    - Run on python command line e.g.
+      python ./scripts/benchmark_connection_pooling.py --requests 500
+"""
+
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import click
+import requests
+
+from dafni_cli.api.session import DAFNISession, SessionData
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Handler returning a small JSON body over a keep-alive connection"""
+
+    protocol_version = "HTTP/1.1"
+    # Avoids delayed ACKs dominating the timings as headers and body are
+    # written separately
+    disable_nagle_algorithm = True
+
+    def setup(self):
+        super().setup()
+        # Called once for each new TCP connection
+        with self.server.lock:
+            self.server.connections_opened += 1
+
+    def do_GET(self):
+        body = b'{"id": "stub"}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_stub_server() -> ThreadingHTTPServer:
+    """Starts a stub server on a free local port in a background thread"""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    server.lock = threading.Lock()
+    server.connections_opened = 0
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def run_benchmark(name: str, server: ThreadingHTTPServer, url: str, send, count: int):
+    """Sends 'count' requests using 'send' and prints the number of
+    connections the server saw being opened"""
+    server.connections_opened = 0
+    start = time.perf_counter()
+    for _ in range(count):
+        send(url)
+    elapsed = time.perf_counter() - start
+    click.echo(
+        f"{name:<24} requests: {count:<6} connections opened: "
+        f"{server.connections_opened:<6} time: {elapsed:.3f}s"
+    )
+
+
+@click.command()
+@click.option("--requests", "count", default=200, help="Number of requests to send")
+def main(count: int):
+    server = start_stub_server()
+    url = f"http://127.0.0.1:{server.server_port}/models/"
+
+    session = DAFNISession(
+        SessionData(
+            username="benchmark",
+            access_token="token",
+            refresh_token="token",
+            timestamp_to_refresh=float("inf"),
+        )
+    )
+
+    run_benchmark(
+        "requests.request",
+        server,
+        url,
+        lambda url: requests.request("get", url, timeout=10).json(),
+        count,
+    )
+    run_benchmark("DAFNISession (pooled)", server, url, session.get_request, count)
+
+    session.close()
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""
+Script for benchmarking the time taken to parse the timestamps found in
+DAFNI objects
+
+Timestamps are generated in each of the formats found in the test fixtures,
+and then parsed using dateutil's isoparse (as parse_datetime did previously),
+datetime.fromisoformat alone and the memoised parse_datetime. This is
+done both for a listing where every timestamp differs and one where only
+some of them do.
+
+Notes on usage:
+    - Run on python command line e.g.
+      python ./scripts/benchmark_parse_datetime.py --entries 100000
+"""
+
+import glob
+import os
+import re
+import time
+from datetime import timedelta
+from typing import Callable, List
+
+import click
+from dateutil.parser import isoparse
+
+from dafni_cli.api.parser import parse_datetime
+
+FIXTURES_PATH = os.path.join(
+    os.path.dirname(__file__), "..", "dafni_cli", "tests", "fixtures", "*.py"
+)
+
+
+def load_fixture_timestamps() -> List[str]:
+    """Returns the distinct timestamps found in the test fixtures"""
+    timestamps = set()
+    for path in glob.glob(FIXTURES_PATH):
+        with open(path, "r", encoding="utf-8") as file:
+            timestamps.update(re.findall(r'"(\d{4}-\d{2}-\d{2}T[^"]+)"', file.read()))
+    return sorted(timestamps)
+
+
+def create_timestamps(templates: List[str], count: int, distinct: int) -> List[str]:
+    """Returns 'count' timestamps each in the same format as one of the
+    templates, with at most 'distinct' different ones"""
+    timestamps = []
+    for index in range(count):
+        index %= distinct
+        template = templates[index % len(templates)]
+        value = isoparse(template) + timedelta(seconds=index)
+        # Keep the format of the template e.g. "Z" or "+00:00" and the number
+        # of decimal places
+        timestamp = value.isoformat()
+        if "." in template:
+            decimal_places = len(re.search(r"\.(\d+)", template).group(1))
+            timestamp = value.isoformat(timespec="microseconds")
+            timestamp = re.sub(
+                r"\.(\d+)",
+                lambda match: "." + match.group(1)[:decimal_places],
+                timestamp,
+            )
+        if template.endswith("Z"):
+            timestamp = timestamp.replace("+00:00", "Z")
+        timestamps.append(timestamp)
+    return timestamps
+
+
+def run_benchmark(
+    name: str, parse: Callable[[str], object], timestamps: List[str], repeats: int
+):
+    """Parses the timestamps 'repeats' times printing the fastest time taken"""
+    times = []
+    for _ in range(repeats):
+        parse_datetime.cache_clear()
+        start = time.perf_counter()
+        for timestamp in timestamps:
+            parse(timestamp)
+        times.append(time.perf_counter() - start)
+    click.echo(f"{name:<40} best: {min(times):.3f}s")
+
+
+@click.command()
+@click.option("--entries", default=100000, help="Number of timestamps to parse")
+@click.option(
+    "--distinct",
+    default=1000,
+    help="Number of distinct timestamps in the listing with repeats",
+)
+@click.option("--repeats", default=5, help="Number of times to parse them")
+def main(entries: int, distinct: int, repeats: int):
+    templates = load_fixture_timestamps()
+    click.echo(f"Timestamp formats from {len(templates)} fixture timestamps")
+
+    for listing, count in [
+        ("all distinct", entries),
+        (f"{distinct} distinct", distinct),
+    ]:
+        timestamps = create_timestamps(templates, entries, count)
+        for timestamp in timestamps[:10000]:
+            assert parse_datetime(timestamp) == isoparse(timestamp), timestamp
+
+        click.echo(f"\n{entries} timestamps, {listing}")
+        run_benchmark("isoparse", isoparse, timestamps, repeats)
+        run_benchmark(
+            "fromisoformat (not memoised)",
+            parse_datetime.__wrapped__,
+            timestamps,
+            repeats,
+        )
+        run_benchmark("parse_datetime", parse_datetime, timestamps, repeats)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""
+Script for benchmarking the time taken to parse long lists of models and
+workflows into their dataclasses
+
+Compares interpreting each class's _parser_params for every object parsed
+(as ParserBaseObject.parse_from_dict did previously) against the parse
+functions now compiled once for each class, and against parsing lazily
+while only accessing the fields shown when listing them.
+
+Notes on usage:
+    - Run on python command line e.g.
+      python ./scripts/benchmark_parser.py --entries 10000
+"""
+
+import copy
+import time
+from typing import Callable, List
+
+import click
+
+from dafni_cli.api.parser import ParserBaseObject
+from dafni_cli.models.model import Model
+from dafni_cli.tests.fixtures.models import TEST_MODELS
+from dafni_cli.tests.fixtures.workflows import TEST_WORKFLOWS
+from dafni_cli.workflows.workflow import Workflow
+
+
+def parse_from_dict_interpreted(dataclass_type: type, dictionary: dict):
+    """Previous implementation of ParserBaseObject.parse_from_dict"""
+    parsed_params = {}
+    for param in dataclass_type._parser_params:
+        if isinstance(param.keys, list):
+            parsed_param = dictionary
+            for key in param.keys:
+                parsed_param = parsed_param.get(key)
+                if parsed_param is None:
+                    break
+        else:
+            parsed_param = dictionary.get(param.keys)
+
+        if parsed_param is not None:
+            if param.datatype is not None:
+                if isinstance(param.datatype, type) and issubclass(
+                    param.datatype, ParserBaseObject
+                ):
+                    if isinstance(parsed_param, list):
+                        parsed_param = [
+                            parse_from_dict_interpreted(param.datatype, value)
+                            for value in parsed_param
+                        ]
+                    else:
+                        parsed_param = parse_from_dict_interpreted(
+                            param.datatype, parsed_param
+                        )
+                else:
+                    parsed_param = param.datatype(parsed_param)
+
+            parsed_params[param.name] = parsed_param
+
+    parsed_obj = dataclass_type(**parsed_params)
+    parsed_obj._dict = dictionary
+    return parsed_obj
+
+
+def create_entries(template: dict, count: int) -> List[dict]:
+    """Returns 'count' copies of a fixture, each with its own ID"""
+    entries = []
+    for index in range(count):
+        entry = copy.deepcopy(template)
+        entry["id"] = f"{template['id']}-{index}"
+        entries.append(entry)
+    return entries
+
+
+def run_benchmark(name: str, parse: Callable[[], List], repeats: int) -> List:
+    """Parses the entries 'repeats' times printing the fastest time taken,
+    and returns the objects parsed"""
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        parsed = parse()
+        times.append(time.perf_counter() - start)
+    click.echo(f"{name:<28} best: {min(times):.3f}s")
+    return parsed
+
+
+@click.command()
+@click.option("--entries", default=10000, help="Number of entries to parse")
+@click.option("--repeats", default=5, help="Number of times to parse them")
+def main(entries: int, repeats: int):
+    for dataclass_type, template in [
+        (Model, TEST_MODELS[0]),
+        (Workflow, TEST_WORKFLOWS[0]),
+    ]:
+        dictionaries = create_entries(template, entries)
+        name = dataclass_type.__name__
+
+        interpreted = run_benchmark(
+            f"{name} (interpreted)",
+            lambda: [
+                parse_from_dict_interpreted(dataclass_type, dictionary)
+                for dictionary in dictionaries
+            ],
+            repeats,
+        )
+        compiled = run_benchmark(
+            f"{name} (compiled)",
+            lambda: ParserBaseObject.parse_from_dict_list(dataclass_type, dictionaries),
+            repeats,
+        )
+        assert interpreted == compiled
+
+        run_benchmark(
+            f"{name} (lazy, listed)",
+            lambda: [
+                (parsed_obj.metadata.display_name, parsed_obj.creation_date)
+                for parsed_obj in ParserBaseObject.parse_from_dict_list(
+                    dataclass_type, dictionaries, lazy=True
+                )
+            ],
+            repeats,
+        )
+
+
+if __name__ == "__main__":
+    main()
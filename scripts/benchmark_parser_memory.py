@@ -0,0 +1,99 @@
+"""
+Script for measuring the peak memory (RSS) and time used when parsing a long
+listing of models
+
+Each listing is read one entry at a time, keeping every parsed entry in one
+of the following modes:
+    - dicts: Only the decoded JSON dictionaries
+    - eager: Models parsed from the dictionaries, keeping them in '_dict'
+    - compact: Models parsed from the dictionaries without keeping them
+    - lazy: Models parsed lazily, so only the dictionaries are decoded
+
+Lazily parsed models still reference their dictionary, so they need slightly
+more memory than the dictionaries alone. They save the time spent parsing
+fields that are never accessed instead.
+
+Each mode is measured in a separate process so that the peak of one doesn't
+hide the others.
+
+Notes on usage:
+    - Run on python command line e.g.
+      python ./scripts/benchmark_parser_memory.py --entries 100000
+    - Uses the resource module so is only available on Unix
+"""
+
+import json
+import resource
+import subprocess
+import sys
+import time
+from typing import Iterator, List
+
+import click
+
+from dafni_cli.models.model import parse_model
+from dafni_cli.tests.fixtures.models import TEST_MODELS
+
+MODES = ["dicts", "eager", "compact", "lazy"]
+
+
+def iter_entries(count: int) -> Iterator[dict]:
+    """Yields 'count' copies of a model fixture each with its own ID, decoded
+    from JSON so that (as when listing models) none of their values are
+    shared"""
+    template = dict(TEST_MODELS[0])
+    for index in range(count):
+        template["id"] = f"{TEST_MODELS[0]['id']}-{index}"
+        yield json.loads(json.dumps(template))
+
+
+def load_entries(mode: str, count: int) -> List:
+    """Reads 'count' entries keeping what is needed in the given mode"""
+    if mode == "dicts":
+        return list(iter_entries(count))
+    if mode == "eager":
+        return [parse_model(entry) for entry in iter_entries(count)]
+    if mode == "compact":
+        return [parse_model(entry, keep_dict=False) for entry in iter_entries(count)]
+    return [parse_model(entry, lazy=True) for entry in iter_entries(count)]
+
+
+def peak_rss_mb() -> float:
+    """Returns the peak RSS of this process in MB"""
+    # ru_maxrss is in kilobytes on Linux but bytes on macOS
+    scale = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / scale
+
+
+@click.command()
+@click.option("--entries", default=100000, help="Number of models to parse")
+@click.option("--mode", type=click.Choice(MODES), help="Only measure this mode")
+def main(entries: int, mode: str):
+    if mode is not None:
+        baseline = peak_rss_mb()
+        start = time.perf_counter()
+        entries_loaded = load_entries(mode, entries)
+        elapsed = time.perf_counter() - start
+        click.echo(
+            f"{mode:<10} peak RSS: {peak_rss_mb():8.1f}MB "
+            f"({peak_rss_mb() - baseline:.1f}MB for {len(entries_loaded)} entries) "
+            f"in {elapsed:.2f}s"
+        )
+        return
+
+    for mode_to_run in MODES:
+        subprocess.run(
+            [
+                sys.executable,
+                __file__,
+                "--entries",
+                str(entries),
+                "--mode",
+                mode_to_run,
+            ],
+            check=True,
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""
+Script for benchmarking the time taken to print the table of 'get models'
+for a long list of models
+
+Compares format_table (which wraps a copy of every row and formats the whole
+table with tabulate before anything is printed) against iter_table with and
+without wrapping, reporting the time until the first line is available as
+well as the total.
+
+Notes on usage:
+    - Run on python command line e.g.
+      python ./scripts/benchmark_table.py --entries 10000
+"""
+
+import copy
+import time
+from typing import Callable, Iterable, List
+
+import click
+
+from dafni_cli.consts import (
+    TABLE_ACCESS_HEADER,
+    TABLE_DISPLAY_NAME_MAX_COLUMN_WIDTH,
+    TABLE_NAME_HEADER,
+    TABLE_PUBLICATION_DATE_HEADER,
+    TABLE_STATUS_HEADER,
+    TABLE_SUMMARY_HEADER,
+    TABLE_SUMMARY_MAX_COLUMN_WIDTH,
+    TABLE_VERSION_ID_HEADER,
+)
+from dafni_cli.models.model import parse_models
+from dafni_cli.tests.fixtures.models import TEST_MODELS
+from dafni_cli.utils import format_table, iter_table
+
+HEADERS = [
+    TABLE_NAME_HEADER,
+    TABLE_VERSION_ID_HEADER,
+    TABLE_STATUS_HEADER,
+    TABLE_ACCESS_HEADER,
+    TABLE_PUBLICATION_DATE_HEADER,
+    TABLE_SUMMARY_HEADER,
+]
+MAX_COLUMN_WIDTHS = [
+    TABLE_DISPLAY_NAME_MAX_COLUMN_WIDTH,
+    None,
+    None,
+    None,
+    None,
+    TABLE_SUMMARY_MAX_COLUMN_WIDTH,
+]
+
+
+def create_rows(count: int) -> List[List[str]]:
+    """Returns the rows of the 'get models' table for 'count' copies of a
+    model fixture, each with its own ID and a long summary"""
+    entries = []
+    for index in range(count):
+        entry = copy.deepcopy(TEST_MODELS[0])
+        entry["id"] = f"{entry['id']}-{index}"
+        entry["summary"] = f"Summary of model {index} " * 8
+        entries.append(entry)
+    return [model.get_brief_details() for model in parse_models(entries)]
+
+
+def run_benchmark(name: str, get_lines: Callable[[], Iterable[str]], repeats: int):
+    """Reads all the lines of a table 'repeats' times printing the fastest
+    time until the first line and in total"""
+    first_times = []
+    total_times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        lines = iter(get_lines())
+        next(lines)
+        first_times.append(time.perf_counter() - start)
+        for _ in lines:
+            pass
+        total_times.append(time.perf_counter() - start)
+    click.echo(
+        f"{name:<28} first line: {min(first_times):.3f}s  "
+        f"total: {min(total_times):.3f}s"
+    )
+
+
+@click.command()
+@click.option("--entries", default=10000, help="Number of rows in the table")
+@click.option("--repeats", default=5, help="Number of times to format it")
+def main(entries: int, repeats: int):
+    rows = create_rows(entries)
+    assert "\n".join(iter_table(HEADERS, rows, MAX_COLUMN_WIDTHS)) == format_table(
+        HEADERS, rows, MAX_COLUMN_WIDTHS
+    )
+
+    run_benchmark(
+        "format_table",
+        lambda: format_table(HEADERS, rows, MAX_COLUMN_WIDTHS).split("\n"),
+        repeats,
+    )
+    run_benchmark(
+        "iter_table",
+        lambda: iter_table(HEADERS, rows, MAX_COLUMN_WIDTHS),
+        repeats,
+    )
+    run_benchmark(
+        "iter_table (--stream)",
+        lambda: iter_table(HEADERS, rows, MAX_COLUMN_WIDTHS, sample_size=1000),
+        repeats,
+    )
+    run_benchmark(
+        "iter_table (--no-wrap)",
+        lambda: iter_table(HEADERS, rows, MAX_COLUMN_WIDTHS, wrap=False),
+        repeats,
+    )
+
+
+if __name__ == "__main__":
+    main()
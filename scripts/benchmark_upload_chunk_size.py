@@ -0,0 +1,97 @@
+"""
+Script for benchmarking the time taken to upload a file through
+upload_file_to_minio against a local stub server using different upload
+chunk sizes
+
+Compares the 16 KB blocks urllib3 uses by default against larger sizes such
+as UPLOAD_CHUNK_SIZE.
+
+Notes on usage:
+    - Run on python command line e.g.
+      python ./scripts/benchmark_upload_chunk_size.py --size 1024
+"""
+
+import os
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import click
+
+from dafni_cli.api.minio_api import upload_file_to_minio
+from dafni_cli.api.session import DAFNISession, SessionData
+from dafni_cli.consts import UPLOAD_CHUNK_SIZE
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Handler that reads and discards the body of any PUT request"""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_PUT(self):
+        remaining = int(self.headers["Content-Length"])
+        while remaining > 0:
+            remaining -= len(self.rfile.read(min(remaining, 1024 * 1024)))
+        self.send_response(200)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_stub_server() -> ThreadingHTTPServer:
+    """Starts a stub server on a free local port in a background thread"""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def run_benchmark(url: str, file_path: Path, chunk_size: int, progress_bar: bool):
+    """Uploads the file using a session with the given chunk size and prints
+    the time taken"""
+    session = DAFNISession(
+        SessionData(
+            username="benchmark",
+            access_token="token",
+            refresh_token="token",
+            timestamp_to_refresh=float("inf"),
+        ),
+        upload_chunk_size=chunk_size,
+    )
+
+    start = time.perf_counter()
+    upload_file_to_minio(session, url, file_path, progress_bar=progress_bar)
+    elapsed = time.perf_counter() - start
+    session.close()
+
+    size = file_path.stat().st_size / (1024 * 1024)
+    click.echo(
+        f"chunk size: {chunk_size // 1024:>6} KB  time: {elapsed:.3f}s  "
+        f"throughput: {size / elapsed:.1f} MB/s"
+    )
+
+
+@click.command()
+@click.option("--size", default=512, help="Size of the file to upload in MB")
+@click.option("--progress-bar", is_flag=True, help="Display upload progress bars")
+def main(size: int, progress_bar: bool):
+    server = start_stub_server()
+    url = f"http://127.0.0.1:{server.server_port}/upload"
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        file_path = Path(temp_dir) / "upload.bin"
+        with open(file_path, "wb") as file:
+            for _ in range(size):
+                file.write(os.urandom(1024 * 1024))
+
+        for chunk_size in [16 * 1024, 256 * 1024, UPLOAD_CHUNK_SIZE]:
+            run_benchmark(url, file_path, chunk_size, progress_bar)
+
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()